@@ -0,0 +1,96 @@
+"""Throughput and memory of EVENT lifecycles, pydantic vs compact events.
+
+    IS_TEST=1 python benchmarks/events.py [--events 10000] [--batch 20]
+
+Parses `--events` device events in batches of `--batch`, as SmartThings
+delivers them, and reports events per second and retained bytes per event.
+"""
+import os
+import sys
+import time
+import uuid
+import argparse
+import tracemalloc
+
+os.environ.setdefault('IS_TEST', '1')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import smartapp
+from smartapp.api import models
+
+CAPABILITIES = (
+    ('switch', 'switch', 'on', 'string', None),
+    ('switchLevel', 'level', 80, 'number', '%'),
+    ('temperatureMeasurement', 'temperature', 21.5, 'number', 'C'),
+    ('motionSensor', 'motion', 'active', 'string', None),
+)
+
+
+def batch(size, devices):
+    events = []
+    for idx in range(size):
+        capability, attribute, value, value_type, unit = CAPABILITIES[idx % len(CAPABILITIES)]
+        events.append({
+            'eventType': 'DEVICE_EVENT',
+            'deviceEvent': {
+                'eventId': str(uuid.uuid4()),
+                'locationId': 'location-1',
+                'ownerId': 'location-1',
+                'ownerType': 'LOCATION',
+                'deviceId': devices[idx % len(devices)],
+                'componentId': 'main',
+                'capability': capability,
+                'attribute': attribute,
+                'value': value,
+                'valueType': value_type,
+                'unit': unit,
+                'stateChange': True,
+                'subscriptionName': capability + '_subscription',
+            }
+        })
+    return {
+        'authToken': 'token',
+        'installedApp': {'installedAppId': str(uuid.uuid4()), 'locationId': 'location-1', 'config': {}},
+        'events': events,
+    }
+
+
+def throughput(parse, batches):
+    start = time.perf_counter()
+    for data in batches:
+        parse(data)
+    return time.perf_counter() - start
+
+
+def retained(parse, batches):
+    tracemalloc.start()
+    kept = [parse(data) for data in batches]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--batch', type=int, default=20)
+    args = parser.parse_args()
+
+    devices = [str(uuid.uuid4()) for _ in range(50)]
+    batches = [batch(args.batch, devices) for _ in range(max(1, args.events // args.batch))]
+    count = len(batches) * args.batch
+    parsers = {
+        'pydantic': models.smartapp.EventData.parse_obj,
+        'compact':  models.CompactEventData.parse_obj,
+    }
+    print('{:<10}{:>14}{:>16}'.format('events', 'events/s', 'bytes/event'))
+    for name, parse in parsers.items():
+        parse(batches[0])
+        elapsed = throughput(parse, batches)
+        size = retained(parse, batches)
+        print('{:<10}{:>14.0f}{:>16.0f}'.format(name, count / elapsed, size / count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Cold start benchmark: time `import smartapp` in fresh interpreters.
+
+    IS_TEST=1 python benchmarks/import_time.py [--runs 5] [--budget 2000]
+
+Fails when the median import time exceeds the budget (milliseconds), or
+when models which are only needed on demand were imported eagerly.
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+LAZY = (
+    'smartapp.api.models.smartthings.weather',
+    'smartapp.api.models.smartthings.presentation',
+)
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import smartapp
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(' '.join(sorted(m for m in sys.modules if m.startswith('smartapp.'))))
+"""
+
+
+def measure():
+    env = dict(os.environ, IS_TEST=os.environ.get('IS_TEST', '1'))
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE], env=env, check=True,
+        capture_output=True, text=True
+    ).stdout.splitlines()
+    return float(out[0]), set(out[1].split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=2000.0, help='milliseconds')
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.runs):
+        elapsed, modules = measure()
+        timings.append(elapsed)
+    median = statistics.median(timings)
+    print('import smartapp: median {:.1f}ms, min {:.1f}ms, max {:.1f}ms over {} runs'.format(
+        median, min(timings), max(timings), args.runs
+    ))
+
+    failed = False
+    eager = [name for name in LAZY if name in modules]
+    if eager:
+        print('eagerly imported: {}'.format(', '.join(eager)))
+        failed = True
+    if median > args.budget:
+        print('over budget: {:.1f}ms > {:.1f}ms'.format(median, args.budget))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
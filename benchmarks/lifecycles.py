@@ -0,0 +1,297 @@
+"""Lifecycle throughput and latency of `smartapp.main.app`.
+
+    IS_TEST=1 python benchmarks/lifecycles.py [--scenario all] [--requests 400]
+        [--concurrency 20] [--batch 20] [--latency 0.02] [--uvicorn]
+        [--save] [--tolerance 0.3]
+
+Requests are sent in-process through the ASGI interface, or over HTTP to
+a uvicorn server started in this process with `--uvicorn`.  Outbound
+SmartThings calls go to `smartapp.simulator.Simulator`, with `--latency`
+seconds per call, and redislite stands in for Redis.
+
+Scenarios:
+  configuration   INITIALIZE and PAGE phases of CONFIGURATION
+  install         bursts of INSTALL then UPDATE, each one subscribing
+  events          EVENT batches of `--batch` device events, each batch
+                  sending a device command
+
+The latency of each request (p50/p95/p99) and the throughput, including
+the time to complete the work dispatched by the requests, are compared to
+`baselines.json`; the run fails when p95 or the throughput regressed by
+more than `--tolerance`.  `--save` records the results as the baselines,
+which are only meaningful for the machine they were recorded on.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import types
+import asyncio
+import argparse
+import statistics
+
+os.environ.setdefault('IS_TEST', '1')
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..'))
+
+import httpx
+import redislite
+from redis import UnixDomainSocketConnection
+
+import smartapp
+from smartapp import api, logger, main, simulator
+from smartapp.api import models
+
+BASELINES = os.path.join(HERE, 'baselines.json')
+LOCATION  = 'location-1'
+DEVICES   = ['device-{}'.format(idx) for idx in range(50)]
+
+
+class BenchApp(api.SmartApp):
+
+    async def lifecycle_install(self, data):
+        await super().lifecycle_install(data)
+        await self.subscribe(models.SubscriptionType.DEVICE, {
+            'deviceId': DEVICES[0], 'componentId': 'main',
+            'capability': 'switch', 'attribute': 'switch', 'value': '*',
+        })
+
+    async def handle_event(self, data, device_id=None):
+        events = [item.deviceEvent for item in data.events or [] if item.deviceEvent]
+        if events:
+            await api.Device(session=self.session).command(events[0].deviceId, {
+                'component': 'main', 'capability': 'switch', 'command': 'on', 'arguments': [],
+            })
+
+
+def new_app(cls=BenchApp):
+    app = cls('BenchApp', 'bench-app')\
+        .grant(scopes=['r:devices:*', 'x:devices:*'])
+    page = app.page('Devices')
+    page.section('Switches')\
+        .setting(name='Switches', id='switches', type=api.SettingType.DEVICE)\
+        .has_multiple(True)\
+        .with_capabilities(['switch'])
+    return app
+
+
+def installed_app(app_id):
+    return {'installedAppId': app_id, 'locationId': LOCATION, 'config': {}}
+
+
+def configuration(app_id, idx):
+    phase = 'INITIALIZE' if idx % 2 else 'PAGE'
+    return {
+        'lifecycle': 'CONFIGURATION', 'executionId': str(uuid.uuid4()),
+        'configurationData': {
+            'installedAppId': app_id, 'phase': phase, 'pageId': '0' if phase == 'PAGE' else '',
+            'previousPageId': '', 'config': {},
+        },
+    }
+
+
+def install(app_id, idx):
+    kind = 'INSTALL' if idx % 2 == 0 else 'UPDATE'
+    data = {'authToken': 'token', 'refreshToken': 'refresh', 'installedApp': installed_app(app_id)}
+    key = 'installData' if kind == 'INSTALL' else 'updateData'
+    return {'lifecycle': kind, 'executionId': str(uuid.uuid4()), key: data}
+
+
+def event(app_id, idx, size):
+    events = []
+    for pos in range(size):
+        device = DEVICES[(idx * size + pos) % len(DEVICES)]
+        events.append({'eventType': 'DEVICE_EVENT', 'deviceEvent': {
+            'eventId': str(uuid.uuid4()), 'locationId': LOCATION, 'deviceId': device,
+            'componentId': 'main', 'capability': 'switch', 'attribute': 'switch',
+            'value': 'on' if pos % 2 else 'off', 'valueType': 'string', 'stateChange': True,
+        }})
+    return {
+        'lifecycle': 'EVENT', 'executionId': str(uuid.uuid4()),
+        'eventData': {'authToken': 'token', 'installedApp': installed_app(app_id), 'events': events},
+    }
+
+
+def percentile(quantiles, pct):
+    return quantiles[pct - 1] * 1000
+
+
+async def settle():
+    while api.TaskSupervisor.size():
+        await asyncio.sleep(0.001)
+
+
+async def run_scenario(client, bodies, concurrency):
+    latencies = []
+    queue = asyncio.Queue()
+    for body in bodies:
+        queue.put_nowait(json.dumps(body))
+
+    async def worker():
+        while not queue.empty():
+            body = queue.get_nowait()
+            start = time.perf_counter()
+            resp = await client.post('/', content=body,
+                                     headers={'Content-Type': 'application/json'})
+            latencies.append(time.perf_counter() - start)
+            if resp.status_code != 200:
+                raise RuntimeError('{}: {}'.format(resp.status_code, resp.text))
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    await settle()
+    elapsed = time.perf_counter() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        'requests':   len(latencies),
+        'throughput': len(latencies) / elapsed,
+        'p50_ms':     percentile(quantiles, 50),
+        'p95_ms':     percentile(quantiles, 95),
+        'p99_ms':     percentile(quantiles, 99),
+    }
+
+
+def scenarios(args, apps):
+    count = args.requests
+    return {
+        'configuration': [configuration(apps[idx % len(apps)], idx) for idx in range(count)],
+        'install':       [install(str(uuid.uuid4()) if idx % 2 == 0 else None, idx)
+                          for idx in range(count)],
+        'events':        [event(apps[idx % len(apps)], idx, args.batch) for idx in range(count)],
+    }
+
+
+def pair_updates(bodies):
+    """UPDATE right after the INSTALL of the same installed app"""
+    for idx in range(1, len(bodies), 2):
+        installed = bodies[idx - 1]['installData']['installedApp']
+        bodies[idx]['updateData']['installedApp'] = installed
+    return bodies
+
+
+def configure(port, factory=new_app):
+    server = redislite.Redis()
+    config = types.SimpleNamespace(
+        smartthings={'api': {'scheme': 'http', 'host': '127.0.0.1:{}'.format(port),
+                             'base': '', 'token': 'bench'}},
+        redis={'connection_class': UnixDomainSocketConnection, 'path': server.socket_file},
+    )
+    smartapp.init(factory, config)
+    main.include_routes()
+    return server
+
+
+async def serve(app):
+    import uvicorn
+    server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=0, log_level='warning'))
+    task = asyncio.ensure_future(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, 'http://127.0.0.1:{}'.format(port)
+
+
+async def close_sessions():
+    for app in list(api.AppContext._instances.values()):
+        if app.ctx._session:
+            await app.ctx._session.close()
+    await asyncio.sleep(0)
+
+
+def compare(results, baselines, tolerance):
+    failures = []
+    for name, result in results.items():
+        base = baselines.get(name)
+        if not base:
+            continue
+        if result['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+            failures.append('{}: p95 {:.2f}ms > baseline {:.2f}ms'.format(
+                name, result['p95_ms'], base['p95_ms']))
+        if result['throughput'] < base['throughput'] * (1 - tolerance):
+            failures.append('{}: throughput {:.0f}/s < baseline {:.0f}/s'.format(
+                name, result['throughput'], base['throughput']))
+    return failures
+
+
+async def bench(args):
+    sim = simulator.Simulator()
+    for device_id in DEVICES:
+        sim.add_device(device_id=device_id)
+    sim.faults.delay(args.latency, args.latency / 4)
+    port = await sim.start()
+    server = configure(port)
+    apps = [str(uuid.uuid4()) for _ in range(args.apps)]
+    bodies = scenarios(args, apps)
+    bodies['install'] = pair_updates(bodies['install'])
+    names = list(bodies) if args.scenario == 'all' else [args.scenario]
+
+    uvicorn_server = None
+    if args.uvicorn:
+        uvicorn_server, task, url = await serve(main.app)
+        client = httpx.AsyncClient(base_url=url, timeout=60.0)
+    else:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app),
+                                   base_url='http://smartapp', timeout=60.0)
+    results = {}
+    try:
+        async with client:
+            # warm up: install the apps the events are sent to
+            await run_scenario(client, [install(app_id, 0) for app_id in apps], args.concurrency)
+            sim.calls.clear()
+            for name in names:
+                results[name] = await run_scenario(client, bodies[name], args.concurrency)
+                results[name]['outbound'] = sum(sim.calls.values())
+                sim.calls.clear()
+    finally:
+        if uvicorn_server:
+            uvicorn_server.should_exit = True
+            await task
+        await api.TaskSupervisor.drain(grace=5.0)
+        await close_sessions()
+        await sim.stop()
+        server.shutdown()
+    return results
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenario', default='all',
+                        choices=['all', 'configuration', 'install', 'events'])
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--batch', type=int, default=20, help='events per EVENT lifecycle')
+    parser.add_argument('--apps', type=int, default=20, help='installed apps receiving events')
+    parser.add_argument('--latency', type=float, default=0.02, help='seconds per outbound call')
+    parser.add_argument('--uvicorn', action='store_true', help='serve over HTTP with uvicorn')
+    parser.add_argument('--save', action='store_true', help='record the results as baselines')
+    parser.add_argument('--tolerance', type=float, default=0.3)
+    args = parser.parse_args()
+
+    logger.configure(level='WARNING', background=True)
+    results = asyncio.run(bench(args))
+
+    print('{:<14} {:>8} {:>10} {:>9} {:>9} {:>9} {:>9}'.format(
+        'scenario', 'requests', 'req/s', 'p50 ms', 'p95 ms', 'p99 ms', 'outbound'))
+    for name, result in results.items():
+        print('{:<14} {requests:>8} {throughput:>10.0f} {p50_ms:>9.2f} {p95_ms:>9.2f} '
+              '{p99_ms:>9.2f} {outbound:>9}'.format(name, **result))
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as fp:
+            baselines = json.load(fp)
+    if args.save:
+        baselines.update(results)
+        with open(BASELINES, 'w') as fp:
+            json.dump(baselines, fp, indent=2, sort_keys=True)
+        print('baselines saved to {}'.format(BASELINES))
+        return 0
+    failures = compare(results, baselines, args.tolerance)
+    for failure in failures:
+        print('REGRESSION {}'.format(failure))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main_())
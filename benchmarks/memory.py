@@ -0,0 +1,141 @@
+"""Memory held per installed app.
+
+    IS_TEST=1 python benchmarks/memory.py [--apps 1000] [--steps 4] [--no-routes]
+
+Installs `--apps` synthetic apps through the lifecycle endpoint, in
+`--steps` rounds.  After each round it reports:
+- the resident memory growth per app;
+- the tracemalloc growth per app, grouped by the package which
+  allocated it (smartapp, aiohttp sessions, fastapi/starlette routes,
+  pydantic models, ...);
+- the runtime estimate of `smartapp.monitor.footprint()`, per kind of
+  object.
+
+A growing per app figure means a cost which is not linear in the number
+of installed apps.
+"""
+import gc
+import os
+import sys
+import asyncio
+import argparse
+import tracemalloc
+import uuid
+
+os.environ.setdefault('IS_TEST', '1')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import lifecycles
+
+import httpx
+
+from smartapp import api, logger, main, monitor, simulator
+
+# allocating file path fragment -> group, first match wins
+GROUPS = (
+    ('/smartapp/', 'smartapp'),
+    ('/aiohttp/', 'aiohttp'),
+    ('/starlette/', 'routes'),
+    ('/fastapi/', 'routes'),
+    ('/pydantic/', 'pydantic'),
+    ('/redis/', 'redis'),
+)
+
+
+class RoutedApp(lifecycles.BenchApp):
+
+    async def status(self):
+        return {'app_id': self.app_id}
+
+
+def routed_app():
+    app = lifecycles.new_app(RoutedApp)
+    app.route('GET', '/status', 'status')
+    return app
+
+
+def group(filename):
+    filename = filename.replace(os.sep, '/')
+    for fragment, name in GROUPS:
+        if fragment in filename:
+            return name
+    return 'other'
+
+
+def allocated(snapshot, baseline):
+    groups = {}
+    for stat in snapshot.compare_to(baseline, 'filename'):
+        name = group(stat.traceback[0].filename)
+        groups[name] = groups.get(name, 0) + stat.size_diff
+    return groups
+
+
+async def bench(args):
+    sim = simulator.Simulator()
+    for device_id in lifecycles.DEVICES:
+        sim.add_device(device_id=device_id)
+    port = await sim.start()
+    server = lifecycles.configure(port, lifecycles.new_app if args.no_routes else routed_app)
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app),
+                               base_url='http://smartapp', timeout=60.0)
+    per_step = max(1, args.apps // args.steps)
+    rows = []
+    try:
+        async with client:
+            # one app first, so that the shared state exists in the baseline
+            await lifecycles.run_scenario(client, [lifecycles.install(str(uuid.uuid4()), 0)
+                                                   for _ in range(2)], 1)
+            gc.collect()
+            tracemalloc.start()
+            baseline = tracemalloc.take_snapshot()
+            rss = monitor.memory.resident()
+            installed = 0
+            for _ in range(args.steps):
+                bodies = [lifecycles.install(str(uuid.uuid4()), 0) for _ in range(per_step)]
+                await lifecycles.run_scenario(client, bodies, args.concurrency)
+                installed += per_step
+                gc.collect()
+                groups = allocated(tracemalloc.take_snapshot(), baseline)
+                footprint = monitor.footprint(args.sample)
+                rows.append((installed, (monitor.memory.resident() - rss) / installed,
+                             {name: size / installed for name, size in groups.items()},
+                             footprint))
+    finally:
+        tracemalloc.stop()
+        await api.TaskSupervisor.drain(grace=5.0)
+        await lifecycles.close_sessions()
+        await sim.stop()
+        server.shutdown()
+    return rows
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--apps', type=int, default=1000)
+    parser.add_argument('--steps', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--sample', type=int, default=50, help='apps walked by footprint()')
+    parser.add_argument('--no-routes', action='store_true', help='apps without routes')
+    args = parser.parse_args()
+
+    logger.configure(level='WARNING', background=True)
+    rows = asyncio.run(bench(args))
+
+    names = sorted({name for row in rows for name in row[2]})
+    print('bytes per installed app')
+    print('{:>6} {:>9} {:>9}  '.format('apps', 'rss', 'traced') +
+          ' '.join('{:>9}'.format(name) for name in names))
+    for installed, rss, groups, _ in rows:
+        print('{:>6} {:>9.0f} {:>9.0f}  '.format(installed, rss, sum(groups.values())) +
+              ' '.join('{:>9.0f}'.format(groups.get(name, 0)) for name in names))
+
+    kinds = list(rows[-1][3]['breakdown'])
+    print('\nmonitor.footprint(), bytes per installed app')
+    print('{:>6} {:>9}  '.format('apps', 'total') + ' '.join('{:>9}'.format(kind) for kind in kinds))
+    for installed, _, _, footprint in rows:
+        print('{:>6} {:>9}  '.format(footprint['apps'], footprint['bytes_per_app']) +
+              ' '.join('{:>9}'.format(footprint['breakdown'][kind]) for kind in kinds))
+
+
+if __name__ == '__main__':
+    main_()
@@ -0,0 +1,132 @@
+"""Parse cost of SmartThings responses under each validation policy.
+
+    IS_TEST=1 python benchmarks/validation.py [--items 200] [--runs 100]
+
+Prints, per resource, the mean time to build the response model with
+`full`, `sampled` (default rate) and `trusted` policies.
+"""
+import os
+import sys
+import time
+import uuid
+import argparse
+
+os.environ.setdefault('IS_TEST', '1')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import smartapp
+from smartapp.api import models
+from smartapp.api.smartthings import validation
+
+CAPABILITIES = ('switch', 'switchLevel', 'temperatureMeasurement', 'battery', 'refresh')
+
+
+def device():
+    return {
+        'deviceId': str(uuid.uuid4()),
+        'name': 'dimmer',
+        'label': 'Kitchen dimmer',
+        'manufacturerName': 'SmartThingsCommunity',
+        'presentationId': 'SmartThings-smartthings-Dimmer',
+        'locationId': str(uuid.uuid4()),
+        'ownerId': str(uuid.uuid4()),
+        'roomId': str(uuid.uuid4()),
+        'components': [{
+            'id': 'main',
+            'label': 'main',
+            'capabilities': [{'id': cap, 'version': 1} for cap in CAPABILITIES],
+            'categories': [{'name': 'Light', 'categoryType': 'manufacturer'}],
+        }],
+        'createTime': '2023-01-01T00:00:00.000Z',
+        'profile': {'id': str(uuid.uuid4())},
+        'type': 'ZIGBEE',
+        'restrictionTier': 0,
+        'allowed': [],
+    }
+
+
+def status():
+    return {
+        'components': {
+            'main': {
+                'switch': {'switch': {'value': 'on', 'timestamp': '2023-01-01T00:00:00.000Z'}},
+                'switchLevel': {'level': {'value': 80, 'unit': '%'}},
+                'temperatureMeasurement': {'temperature': {'value': 21.5, 'unit': 'C'}},
+                'battery': {'battery': {'value': 90, 'unit': '%'}},
+            }
+        },
+        'healthState': {'state': 'ONLINE', 'lastUpdatedDate': '2023-01-01T00:00:00.000Z'},
+    }
+
+
+def rule(idx):
+    return {
+        'id': str(uuid.uuid4()),
+        'name': 'rule {}'.format(idx),
+        'ownerId': str(uuid.uuid4()),
+        'ownerType': 'Location',
+        'dateCreated': '2023-01-01T00:00:00.000Z',
+        'dateUpdated': '2023-01-01T00:00:00.000Z',
+        'actions': [{
+            'if': {
+                'equals': {
+                    'left': {'device': {'devices': [str(uuid.uuid4())], 'component': 'main',
+                                        'capability': 'switch', 'attribute': 'switch'}},
+                    'right': {'string': 'on'},
+                },
+                'then': [{'command': {'devices': [str(uuid.uuid4())], 'commands': [
+                    {'component': 'main', 'capability': 'switch', 'command': 'on'}
+                ]}}],
+            }
+        }],
+    }
+
+
+def scene(idx):
+    return {
+        'sceneId': str(uuid.uuid4()),
+        'sceneName': 'scene {}'.format(idx),
+        'locationId': str(uuid.uuid4()),
+        'createdBy': str(uuid.uuid4()),
+        'createdDate': 1672531200000,
+        'editable': True,
+        'apiVersion': '20200501',
+    }
+
+
+def resources(items):
+    return {
+        'devices':     (models.DeviceCollection, {'items': [device() for _ in range(items)]}),
+        'device':      (models.smartthings.Device, device()),
+        'status':      (models.smartthings.DeviceStatus, status()),
+        'rules':       (models.smartthings.PagedRules, {'items': [rule(i) for i in range(items)]}),
+        'scenes':      (models.SceneCollection, {'items': [scene(i) for i in range(items)]}),
+    }
+
+
+def bench(validator, model, data, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        validator.parse(model, data)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--items', type=int, default=200, help='items per list response')
+    parser.add_argument('--runs', type=int, default=100)
+    args = parser.parse_args()
+
+    policies = list(validation.Policy)
+    print('{:<10}'.format('resource') + ''.join('{:>12}'.format(p.value) for p in policies))
+    for name, (model, data) in resources(args.items).items():
+        row = []
+        for policy in policies:
+            validator = validation.Validator(policy)
+            validator.parse(model, data)
+            row.append(bench(validator, model, data, args.runs) * 1000)
+        print('{:<10}'.format(name) + ''.join('{:>10.3f}ms'.format(ms) for ms in row))
+
+
+if __name__ == '__main__':
+    main()
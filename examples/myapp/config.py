@@ -6,6 +6,14 @@ smartthings = \
             'base': '/v1',
             'token': 'smart-app-owner-pat-token'
         },
+        'validation': {
+            'default': 'full',
+            'devices': 'sampled',
+            'rules': 'trusted',
+            'scenes': 'trusted',
+            'sample_rate': 100
+        },
+        'compact_events': False,
         'oauth': {
             'host': 'api.smartthings.com',
             'base': '/oauth',
@@ -20,3 +28,74 @@ redis = \
         'host': 'redis.your.domain',
         'auth': 'your-redis-auth-key'
     }
+
+tasks = \
+    {
+        'lanes': 'app',
+        'concurrency': 64,
+        'reserved': 8,
+        'per_app': 8,
+        'grace': 30.0,
+        'processes': 2,
+        'start_method': 'spawn'
+    }
+
+scheduler = \
+    {
+        'poll': 1.0,
+        'lease': 60.0,
+        'batch': 100
+    }
+
+logging = \
+    {
+        'level': 'INFO',
+        'json': False,
+        'background': True,
+        'rate_limit': 50,
+        'rate_period': 1.0,
+        'sample': {'lifecycle: request': 100}
+    }
+
+tracing = \
+    {
+        'enabled': False,
+        'rate': 0.1,
+        'exporter': 'file',
+        'path': '/tmp/smartapp-traces.jsonl'
+    }
+
+recorder = \
+    {
+        'enabled': False,
+        'path': '/tmp/smartapp-traffic.jsonl.gz',
+        'outbound': True
+    }
+
+history = \
+    {
+        'attributes': [],
+        'capacity': 1024
+    }
+
+snapshot = \
+    {
+        'enabled': False,
+        'path': '/var/lib/smartapp/snapshot.bin',
+        'interval': 60.0,
+        'max_age': 3600.0
+    }
+
+monitor = \
+    {
+        'enabled': False,
+        'interval': 0.1,
+        'threshold': 0.1,
+        'samples': 50
+    }
+
+admin = \
+    {
+        'secret': None,
+        'profile_max': 30.0
+    }
@@ -48,7 +48,10 @@ try:
         'python-dateutil==2.*',
         'aiohttp==3.*',
         'redis==4.*',
-        ]
+        ],
+        extras_require={
+        'history': ['numpy'],
+        }
     )
 finally:
     reset_version()
@@ -11,6 +11,11 @@ from smartapp import api
 from smartapp import main
 from smartapp import rest
 from smartapp import controllers
+from smartapp import scheduler
+from smartapp import tracing
+from smartapp import monitor
+from smartapp import recorder
+from smartapp import state
 
 config = None
 
@@ -18,19 +23,38 @@ class AppRouter(object):
 
     @staticmethod
     def add_route(*args, **kwargs):
-        rest.smartapp.add_route(*args, **kwargs)
+        # straight to the application, including the lifecycle router
+        # again for every installed app would copy all the routes
+        main.app.router.add_api_route(*args, tags=['SmartApp'], **kwargs)
 
     @staticmethod
     def reload():
-        main.app.include_router(rest.smartapp.router)
+        main.app.openapi_schema = None
 
 controllers.smartapp.app_ctx = api.smartapp.AppContext
 api.smartapp.configuration.router = AppRouter
 
+async def start():
+    state.Snapshot.start()
+    api.AppTask(controllers.smartapp.app_ctx.init, timeout=None)
+    scheduler.Scheduler.start()
+    monitor.LoopMonitor.start()
+
 def init(app, config):
     smartapp.config = config
+    if getattr(config, 'logging', None):
+        logger.configure(**config.logging)
+    if getattr(config, 'tracing', None):
+        tracing.configure(**config.tracing)
+    if getattr(config, 'recorder', None):
+        recorder.configure(**config.recorder)
+    if getattr(config, 'history', None):
+        state.History.configure(**config.history)
+    if getattr(config, 'snapshot', None):
+        state.Snapshot.configure(**config.snapshot)
     api.smartapp.AppContext.new_app = app
-    api.AppTask(controllers.smartapp.app_ctx.init)
+    api.smartapp.AppContext._template = None
+    main.app.add_event_handler('startup', start)
     return main.app
 
 
@@ -42,14 +66,18 @@ __pdoc__.update({'smartapp.redis': False})
 __pdoc__.update({'smartapp.version': False})
 __pdoc__.update({'smartapp.init': False})
 __pdoc__.update({'smartapp.AppRouter': False})
+__pdoc__.update({'smartapp.start': False})
 __pdoc__.update({'smartapp.api.models.smartthings': False})
 __pdoc__.update({'smartapp.api.http': False})
 __pdoc__.update({'smartapp.api.smartthings.oauth': False})
 __pdoc__.update({'smartapp.api.smartapp.task.AppTask.done': False})
-__pdoc__.update({'smartapp.api.smartapp.task.AppTask.loop': False})
 __pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.pageId': False})
 __pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.load_routes': False})
 __pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.initialize': False})
+__pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.initialize_data': False})
+__pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.initialize_response': False})
+__pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.page_response': False})
+__pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.serialized': False})
 __pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.token': False})
 __pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.refresh_token': False})
 __pdoc__.update({'smartapp.api.smartapp.smartapp.SmartApp.renew_token': False})
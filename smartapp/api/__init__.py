@@ -1,22 +1,27 @@
 from smartapp.api import \
     smartapp, smartthings, models, types
 
-AppCtx        = types.AppCtx
-AppCtxError   = types.AppCtxError
-AppHTTPError  = types.AppHTTPError
-AuthInvalid   = types.AuthInvalid
+AppCtx           = types.AppCtx
+AppCtxError      = types.AppCtxError
+AppHTTPError     = types.AppHTTPError
+AuthInvalid      = types.AuthInvalid
 
-SmartApp      = smartapp.SmartApp
-AppTask       = smartapp.AppTask
-AppContext    = smartapp.AppContext
+SmartApp         = smartapp.SmartApp
+AppTask          = smartapp.AppTask
+ProcessPool      = smartapp.ProcessPool
+TaskSupervisor   = smartapp.TaskSupervisor
+KeyedExecutor    = smartapp.KeyedExecutor
+Priority         = smartapp.Priority
+AppContext       = smartapp.AppContext
 
-APIClient     = smartthings.APIClient
-InstalledApp  = smartthings.InstalledApp
-Device        = smartthings.Device
-Scene         = smartthings.Scene
-Notification  = smartthings.Notification
-Rule          = smartthings.Rule
+APIClient        = smartthings.APIClient
+ValidationPolicy = smartthings.ValidationPolicy
+InstalledApp     = smartthings.InstalledApp
+Device           = smartthings.Device
+Scene            = smartthings.Scene
+Notification     = smartthings.Notification
+Rule             = smartthings.Rule
 
-UpdateEvent   = models.smartapp.UpdateEvent
-SettingType   = models.smartapp.SettingType
-RequestStatus = models.smartapp.RequestStatus
+UpdateEvent      = models.smartapp.UpdateEvent
+SettingType      = models.smartapp.SettingType
+RequestStatus    = models.smartapp.RequestStatus
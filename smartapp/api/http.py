@@ -1,9 +1,10 @@
+import time
 import aiohttp
 import traceback
 
 import smartapp
 
-from smartapp import api
+from smartapp import api, metrics, tracing, recorder
 from smartapp.api import types
 
 from smartapp import logger
@@ -11,6 +12,10 @@ log = logger.get()
 
 SCHEME = 'https'
 
+LATENCY = metrics.Histogram('smartapp_http_client_seconds',
+                            'SmartThings API request latency',
+                            ['resource', 'verb', 'status'])
+
 
 class RESTMeta(type):
 
@@ -21,7 +26,9 @@ class RESTMeta(type):
 
 class RESTClient(metaclass=RESTMeta):
 
-    def __init__(self, host, base, resource=str(), token=None, basic=None, session=None):
+    def __init__(self, host, base, resource=str(), token=None, basic=None, session=None,
+                       scheme=None):
+        self.scheme   = scheme or SCHEME
         self.host     = host
         self.base     = base
         self.resource = resource
@@ -31,40 +38,55 @@ class RESTClient(metaclass=RESTMeta):
 
     async def do(self, verb, endpoint, body=None, text=None, params=None):
         url = '{}:////{}{}/{}{}'.format(
-            SCHEME, self.host, self.base, self.resource, endpoint
+            self.scheme, self.host, self.base, self.resource, endpoint
         ).replace('//','/')
         log.info("%s: %s", verb, url)
-        try:
-            if self.basic:
-                session = aiohttp.ClientSession(headers={
-                    'Authorization': 'Basic {}'.format(self.basic)
-                })
-            elif not self.session:
-                session = api.AppContext.new_session(self.token)
-            else:
-                session = self.session
-            async with session.request(verb, url, json=body,
-                                       data=text, params=params) as resp:
-                if resp.status == 401:
+        with tracing.span('http', verb=verb, resource=self.resource) as span:
+            start = time.perf_counter()
+            status = 'error'
+            response = None
+            try:
+                if self.basic:
+                    session = aiohttp.ClientSession(headers={
+                        'Authorization': 'Basic {}'.format(self.basic)
+                    })
+                elif not self.session:
+                    session = api.AppContext.new_session(self.token)
+                else:
+                    session = self.session
+                async with session.request(verb, url, json=body,
+                                           data=text, params=params) as resp:
+                    status = resp.status
+                    if resp.status == 401:
+                        raise types.AuthInvalid()
+                    if resp.status < 200 or resp.status > 299:
+                        log.error("response: code: %s / body: %s", resp.status, await resp.text())
+                        log.error("body sent: %s", body or text)
+                        raise types.AppHTTPError(status_code=resp.status)
+                    if text:
+                        response = await resp.text()
+                    else:
+                        response = await resp.json()
+                    return response
+            except aiohttp.ContentTypeError as e:
+                log.error(e)
+                response = await resp.text()
+                return response
+            except aiohttp.ClientResponseError as e:
+                if e.status == 401:
                     raise types.AuthInvalid()
-                if resp.status < 200 or resp.status > 299:
-                    log.error("response: code: %s / body: %s", resp.status, await resp.text())
-                    log.error("body sent: %s", body or text)
-                    raise types.AppHTTPError(status_code=resp.status)
-                if text:
-                    return await resp.text()
-                return await resp.json()
-        except aiohttp.ContentTypeError as e:
-            log.error(e)
-            return await resp.text()
-        except aiohttp.ClientResponseError as e:
-            if e.status == 401:
-                raise types.AuthInvalid()
-            raise types.AppHTTPError(status_code=resp.status)
-        except (types.AuthInvalid, types.AppHTTPError) as e:
-            raise e
-        except Exception:
-            log.error(traceback.format_exc())
-        finally:
-            if not self.session:
-                await session.close()
+                raise types.AppHTTPError(status_code=resp.status)
+            except (types.AuthInvalid, types.AppHTTPError) as e:
+                raise e
+            except Exception as e:
+                span.record(e)
+                log.error(traceback.format_exc())
+            finally:
+                span.set('status', status)
+                elapsed = time.perf_counter() - start
+                LATENCY.labels(self.resource or 'none', verb, str(status)).observe(elapsed)
+                if recorder.Recorder.writer:
+                    recorder.Recorder.exchange(self.resource, verb, url, params, body or text,
+                                               status, response, elapsed)
+                if not self.session:
+                    await session.close()
@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
-from smartapp.api.models import smartthings, smartapp
+from smartapp.api.models import smartthings, smartapp, events
 
 LifecycleBase     = smartapp.LifecycleBase
 Install           = smartapp.Install
@@ -16,6 +16,7 @@ Event             = smartapp.Event
 EventType         = smartapp.EventType
 LifecycleResponse = smartapp.LifecycleResponse
 SubscriptionType  = smartapp.SubscriptionType
+CompactEventData  = events.CompactEventData
 
 class AuthToken(BaseModel):
     access_token:      Optional[str]
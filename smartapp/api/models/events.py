@@ -0,0 +1,136 @@
+from __future__ import annotations
+import sys
+from typing import Any, Dict, Iterable
+
+from smartapp.api.models import smartthings, smartapp
+
+# device event fields repeated across events, stored once per process
+INTERNED = ('componentId', 'capability', 'attribute', 'valueType', 'unit')
+
+
+class Compact(object):
+    """Read-only slotted record, converted to its pydantic model on demand"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError('{} is read-only'.format(self.__class__.__name__))
+
+    def __delattr__(self, name: str):
+        raise AttributeError('{} is read-only'.format(self.__class__.__name__))
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(self.__class__.__name__, ', '.join(
+            '{}={!r}'.format(name, getattr(self, name)) for name in self.__slots__
+        ))
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None
+
+    def dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__
+                if getattr(self, name) is not None}
+
+
+class CompactDeviceEvent(Compact):
+    """Lean `smartapp.api.models.smartthings.DeviceEvent`: values are kept
+    as received and component, capability, attribute, value type and unit
+    strings are interned"""
+
+    __slots__ = tuple(smartthings.DeviceEvent.__fields__)
+
+    def __init__(self, data: Dict[str, Any]):
+        setter = object.__setattr__
+        for name in self.__slots__:
+            setter(self, name, data.get(name))
+        for name in INTERNED:
+            value = data.get(name)
+            if value.__class__ is str:
+                setter(self, name, sys.intern(value))
+
+    def __reduce__(self):
+        return self.__class__, (self.dict(),)
+
+    def model(self) -> smartthings.DeviceEvent:
+        return smartthings.DeviceEvent.parse_obj(self.dict())
+
+
+class CompactEvent(Compact):
+    """Lean `smartapp.api.models.smartapp.Event`, only device events are
+    compact; the other event kinds are kept raw and parsed when accessed"""
+
+    __slots__ = ('eventType', 'deviceEvent', 'other')
+
+    def __init__(self, data: Dict[str, Any]):
+        setter = object.__setattr__
+        device = data.get('deviceEvent')
+        other = {key: value for key, value in data.items()
+                 if key not in ('eventType', 'deviceEvent')}
+        setter(self, 'eventType', smartthings.EventType(data['eventType']))
+        setter(self, 'deviceEvent', CompactDeviceEvent(device) if device else None)
+        setter(self, 'other', other or None)
+
+    def __getattr__(self, name: str) -> Any:
+        field = smartapp.Event.__fields__.get(name)
+        if not field:
+            raise AttributeError(name)
+        value = (self.other or {}).get(name)
+        return None if value is None else field.type_.parse_obj(value)
+
+    def __reduce__(self):
+        return self.__class__, (self.dict(),)
+
+    def dict(self) -> Dict[str, Any]:
+        data = dict(self.other or {}, eventType=self.eventType.value)
+        if self.deviceEvent:
+            data['deviceEvent'] = self.deviceEvent.dict()
+        return data
+
+    def model(self) -> smartapp.Event:
+        return smartapp.Event.parse_obj(self.dict())
+
+
+class CompactEventData(Compact):
+    """Lean `smartapp.api.models.smartapp.EventData`, handed to
+    `handle_event` when `smartthings['compact_events']` is set"""
+
+    __slots__ = ('authToken', 'installedApp', 'events')
+
+    def __init__(self, authToken: str=None, installedApp: smartapp.InstalledApp=None,
+                       events: Iterable[CompactEvent]=()):
+        setter = object.__setattr__
+        setter(self, 'authToken', authToken)
+        setter(self, 'installedApp', installedApp)
+        setter(self, 'events', tuple(events))
+
+    @classmethod
+    def parse_obj(cls, data: Dict[str, Any]) -> CompactEventData:
+        installed = data.get('installedApp')
+        return cls(
+            data.get('authToken'),
+            smartapp.InstalledApp.parse_obj(installed) if installed else None,
+            [CompactEvent(event) for event in data.get('events') or ()]
+        )
+
+    def __reduce__(self):
+        return self.__class__, (self.authToken, self.installedApp, self.events)
+
+    def copy(self, update: Dict[str, Any]=None) -> CompactEventData:
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(update or {})
+        return self.__class__(**fields)
+
+    def dict(self) -> Dict[str, Any]:
+        return {
+            'authToken':    self.authToken,
+            'installedApp': self.installedApp.dict() if self.installedApp else None,
+            'events':       [event.dict() for event in self.events],
+        }
+
+    def model(self) -> smartapp.EventData:
+        return smartapp.EventData.parse_obj(self.dict())
+
@@ -155,11 +155,13 @@ class UpdateData(BaseModel):
     previousPermissions: Optional[Permissions]
 
 class Event(BaseModel):
-    eventType:        smartthings.EventType
-    deviceEvent:      Optional[smartthings.DeviceEvent]
-    modeEvent:        Optional[smartthings.ModeEvent]
-    deviceLifecycle:  Optional[smartthings.DeviceLifecycleEvent]
-    sceneLifecycle:   Optional[smartthings.SceneLifecycleEvent]
+    eventType:         smartthings.EventType
+    deviceEvent:       Optional[smartthings.DeviceEvent]
+    modeEvent:         Optional[smartthings.ModeEvent]
+    deviceLifecycle:   Optional[smartthings.DeviceLifecycleEvent]
+    sceneLifecycle:    Optional[smartthings.SceneLifecycleEvent]
+    deviceHealthEvent: Optional[smartthings.DeviceHealthEvent]
+    hubHealthEvent:    Optional[smartthings.HubHealthEvent]
 
 class EventData(BaseModel):
     authToken:           Optional[str]
@@ -0,0 +1,301 @@
+"""SmartThings API models, generated from the SmartThings OpenAPI definition.
+
+The models are split in domain submodules, a submodule is only imported
+the first time one of its models is accessed as an attribute of this
+package, e.g. `smartthings.Device` imports `smartthings.devices`.
+"""
+import importlib
+
+MODULES = {
+    'common': (
+        'SmartThings', 'Link', 'Links', 'Error', 'OwnerType', 'Owner', 'Tags',
+        'BaseCapabilityReference', 'LocaleTag', 'StringType', 'Status2',
+        'StandardSuccessResponse', 'Value', 'Type1', 'Unit', 'Type2', 'Data',
+        'I18n', 'I18n1', 'Arguments', 'ValueType1', 'ErrorResponse',
+    ),
+    'capabilities': (
+        'CapabilityReference', 'CapabilityStatus',
+        'CapabilitySubscriptionDetail', 'Status3', 'CapabilitySummary',
+        'Status4', 'EnumCommand', 'Type', 'AdditionalProperties',
+        'RequiredEnum', 'AttributeProperties', 'Argument', 'Attributes',
+        'Commands', 'CapabilityLocalization', 'DeleteNamespaceResponse',
+        'OwnerType2', 'Namespace', 'Capability1', 'LocaleReference',
+        'PagedCapabilities', 'AttributeSchema', 'CapabilityCommand',
+        'CapabilityLocaleLocalizations', 'CapabilityAttribute',
+        'CreateCapabilityRequest', 'UpdateCapabilityRequest', 'Capability',
+    ),
+    'locations': (
+        'HubId', 'UpdateLocationRequest', 'DeleteLocationResponse',
+        'LocationParentTypes', 'Room', 'CreateRoomRequest', 'UpdateRoomRequest',
+        'DeleteRoomResponse', 'Mode', 'LocationParent', 'PagedRooms',
+        'PagedLocation', 'Location', 'CreateLocationRequest', 'PagedLocations',
+    ),
+    'drivers': (
+        'DriverId', 'DriverVersion', 'PermissionAttributes',
+        'DeviceIntegrationProfileKey', 'PackageKey', 'DriverName',
+        'FingerprintId', 'FingerprintType', 'FingerprintDeviceLabel',
+        'ZigbeeProfiles', 'ZigbeeManufacturer', 'ZigbeeModel',
+        'ZigbeeManufacturerFingerprint', 'ZWaveManufacturerId',
+        'ZWaveProductId', 'ZWaveProductType', 'ZWaveGenericType',
+        'ZWaveSpecificType', 'CommandClasses', 'ClientClusters',
+        'ServerClusters', 'DeviceIdentifiers', 'ChannelType', 'ChannelId',
+        'DetailedChannel', 'PagedDetailedChannels', 'PatchChannel',
+        'DriverRevision', 'DriverChannel', 'PagedDriverChannels',
+        'UpdateDriverChannel', 'DriverPermission',
+        'ZWaveManufacturerFingerprint', 'ZWaveGenericFingerprint', 'Clusters',
+        'BasicChannel', 'DriverPermissions', 'ZigbeeGenericFingerprint',
+        'PagedDriver', 'DriverFingerprint', 'PagedDrivers', 'Driver',
+    ),
+    'devices': (
+        'CategoryType', 'DeviceCategory', 'DeviceCommand', 'State',
+        'HealthState', 'ComponentStatus', 'AttributeState', 'DeviceStateEvent',
+        'App', 'DeviceInstallRequest', 'FunctionCodes', 'IrDeviceDetails',
+        'BleDeviceDetails', 'BleD2DDeviceDetails', 'ViperDeviceDetails',
+        'OcfDeviceDetails', 'DeviceProfileReference', 'DeviceIntegrationType',
+        'CreateDeviceEventsResponse', 'CommandStatus',
+        'DeleteDeviceCommandsResponse', 'UpdateDeviceComponent',
+        'UpdateDeviceRequest', 'DeviceNetworkSecurityLevel', 'ExecutingLocally',
+        'DeviceEui', 'DeviceNetworkId', 'DeviceId', 'DeviceNetworkType',
+        'ProvisioningState', 'Restriction', 'DeviceProfileMetadata',
+        'DeleteDeviceProfileResponse', 'DeviceProfileStatus',
+        'ComponentTranslations', 'Definition', 'PreferenceType',
+        'DeviceGroupType', 'DeviceGroupCapability', 'Component', 'Device1',
+        'DeviceGroupResponse', 'DeviceGroupCommand', 'DeviceActivity',
+        'DeviceComponent', 'DeviceCommandsRequest', 'DeviceStatus',
+        'DeviceEventsRequest', 'AppDeviceDetails', 'DthDeviceDetails',
+        'CommandResult', 'LanDeviceDetails', 'ZigbeeDeviceDetails',
+        'ZwaveDeviceDetails', 'MatterDeviceDetails', 'DeviceComponentReference',
+        'PreferenceRequest', 'PreferenceResponse', 'PagedPreferences', 'Device',
+        'PagedDevices', 'DeviceCommandsResponse', 'DeviceProfileResponse',
+        'PagedDeviceProfiles', 'UpdateDeviceProfileRequest',
+        'CreateDeviceProfileRequest',
+    ),
+    'apps': (
+        'IconImageModel', 'AppType', 'AppClassification', 'AppRegisterRequest',
+        'AppRegisterResponse', 'LambdaSmartApp', 'AppOAuth',
+        'CreateOrUpdateLambdaSmartAppRequest',
+        'CreateOrUpdateWebhookSmartAppRequest', 'UpdateAppOAuthRequest',
+        'GenerateAppOAuthRequest', 'DeleteAppResponse',
+        'UpdateAppSettingsRequest', 'UpdateAppSettingsResponse',
+        'UpdateSignatureTypeResponse', 'GetAppSettingsResponse',
+        'GenerateAppOAuthResponse', 'SignatureType', 'PrincipalTypeModel',
+        'AppUISettings', 'AppTargetStatus', 'PagedApp', 'WebhookSmartApp',
+        'CreateAppRequest', 'UpdateAppRequest', 'UpdateSignatureTypeRequest',
+        'PagedApps', 'App1', 'CreateAppResponse',
+    ),
+    'installedapps': (
+        'SmartAppEventRequest', 'DashboardCardLifecycle', 'Ui', 'IconImage',
+        'Classification', 'PrincipalType', 'StringConfig', 'DeviceConfig',
+        'PermissionConfig', 'ModeConfig', 'SceneConfig', 'MessageConfig',
+        'ValueType', 'ConfigEntry', 'ConfigEntries', 'ConfigMap',
+        'InstalledAppType', 'InstallConfigurationStatus', 'InstalledAppStatus',
+        'DeleteInstalledAppResponse', 'CreateInstalledAppEventsResponse',
+        'NoticeCode', 'NoticeAction', 'OnceSchedule', 'CronSchedule',
+        'ScheduleRequest', 'Schedule', 'PagedSchedules',
+        'DeleteScheduleResponse', 'SubscriptionSource',
+        'DeviceSubscriptionDetail', 'SubscriptionDelete',
+        'ModeSubscriptionDetail', 'DeviceLifecycleDetail', 'DeviceHealthDetail',
+        'SecurityArmStateDetail', 'HubHealthDetail', 'SceneLifecycleDetail',
+        'SubscriptionId', 'SubscriptionFilterTypes', 'SubscriptionFilterValues',
+        'SubscriptionFilterEventTypes', 'SubscriptionFilterAttributes',
+        'SubscriptionFilterCapabilities', 'SubscriptionFilterComponents',
+        'SubscriptionTargetValue', 'SmartAppDashboardCardEventRequest',
+        'InstallConfiguration', 'InstallConfigurationDetail',
+        'PagedInstallConfigurations', 'CreateInstalledAppEventsRequest',
+        'Notice', 'Subscription', 'SubscriptionRequest', 'PagedSubscriptions',
+        'SubscriptionFilter', 'SubscriptionTarget', 'InstalledApp',
+        'PagedInstalledApps', 'SubscriptionFilters',
+    ),
+    'notifications': (
+        'DeliveryType', 'AdhocMessageTemplate', 'LocaleVariables',
+        'MessageTemplate', 'MessageType', 'PagedMessageTemplate',
+        'PredefinedMessage', 'Delivery', 'AdhocMessage', 'Message',
+        'DeliveryMethods', 'NotificationType', 'NotificationRequest',
+    ),
+    'organizations': (
+        'EntityTypes', 'StatusTypes', 'PrincipalType1', 'OrganizationMember',
+        'Email', 'Role', 'Modification', 'Label', 'ManufacturerName', 'MnId',
+        'OrganizationName', 'WarehouseGroupId', 'OrganizationUpdateRequest',
+        'InviteRequestItem', 'InviteResponseItem', 'OrganizationMemberRole',
+        'ModifyMemberItem', 'OrganizationCreateRequest', 'Invitation',
+        'OrganizationResponse',
+    ),
+    'scenes': (
+        'SceneSummary', 'SceneMode', 'SceneModeRequest', 'Security',
+        'SceneSecurityModeRequest', 'SceneSleepRequest', 'Status1',
+        'SceneArgument', 'ScenePagedResult', 'SceneCommand', 'SceneCapability',
+        'SceneDeviceGroup', 'SceneDeviceGroupRequest', 'SceneComponent',
+        'SceneDevice', 'SceneDeviceRequest', 'SceneAction',
+        'SceneActionSequence', 'SceneRequest',
+    ),
+    'rules': (
+        'Status', 'ExecutionLocation', 'OwnerType1', 'LocationAction',
+        'MapOperand', 'ExecutionResult', 'IfExecutionResult',
+        'CommandExecutionResult', 'IfActionExecutionResult',
+        'CommandActionExecutionResult', 'LocationActionExecutionResult',
+        'SleepActionExecutionResult', 'ActionExecutionResult',
+        'RuleExecutionResponse', 'LocationAttribute', 'ArmState', 'DayOfWeek',
+        'DateReference', 'TimeReference', 'IntervalUnit', 'TriggerMode',
+        'OperandAggregationMode', 'ConditionAggregationMode', 'Sequence',
+        'ActionSequence', 'CommandSequence', 'IfActionSequence', 'Creator',
+        'Type5', 'IconUrl', 'Step', 'Range', 'Version', 'CapabilityKey',
+        'SupportedValues', 'DisplayType6', 'DisplayType7', 'Operator1',
+        'SupportedOperator', 'DisplayType8', 'ArgumentName', 'ValueModel',
+        'UnitModel', 'ValueTypeModel', 'ArgumentType', 'CommandAction',
+        'DateOperand', 'DeviceOperand', 'LocationOperand', 'AlternativeItem',
+        'NumberFieldForAutomationAction', 'NumberFieldForAutomationCondition',
+        'SliderBase', 'SliderForAutomationAction',
+        'SliderForAutomationCondition', 'TextFieldForAutomationAction',
+        'TextFieldForAutomationCondition', 'SliderForArgument',
+        'TextFieldForArgument', 'NumberFieldForArgument', 'Alternatives',
+        'ListBase', 'ListForAutomationAction', 'ListForAutomationCondition',
+        'EnumSliderForAutomationCondition', 'ListForArgument',
+        'AutomationCondition', 'Argument1', 'MultiArgCommand',
+        'AutomationAction', 'RuleRequest', 'Action', 'SleepAction',
+        'EveryAction', 'BasicCondition', 'Condition', 'SimpleCondition',
+        'BetweenCondition', 'Operand', 'ArrayOperand', 'DateTimeOperand',
+        'TimeOperand', 'Interval', 'PagedRules', 'Rule', 'ChangesCondition',
+        'RemainsCondition', 'WasCondition', 'IfAction', 'EqualsCondition',
+        'GreaterThanCondition', 'GreaterThanOrEqualsCondition',
+        'LessThanCondition', 'LessThanOrEqualsCondition',
+    ),
+    'presentation': (
+        'ComponentId', 'View', 'DeviceConfigView', 'Type3', 'DeviceConfigType',
+        'Type4', 'PoCodes', 'Os', 'DpInfoItem', 'DpInfo', 'Operator', 'Mnmn',
+        'Vid', 'Component1', 'FormattedLabel', 'DisplayType', 'DisplayType1',
+        'DisplayType2', 'DisplayType3', 'DisplayType4', 'DisplayType5', 'Group',
+        'FeatureItem', 'Feature', 'Button', 'ExcludeItemsCommand',
+        'ExcludeItemsCommands', 'ExcludeItemsAttribute',
+        'ExcludeItemsAttributes', 'Op', 'PatchItem', 'Idx', 'Composite',
+        'Type6', 'TimeFormat', 'GenerateConfigExclusion', 'LanguageItem',
+        'VisibleCondition', 'GroupVisibleConditions', 'NumberField',
+        'PushButton', 'Command1', 'Stepper', 'TextField', 'Command2',
+        'SwitchCommand', 'StatelessPowerToggleForDashboard', 'Command3',
+        'PlayPauseCommand', 'Command4', 'PlayStopCommand', 'TextButton',
+        'ExcludeItem', 'ExcludedConditionItem', 'ExcludeItem1',
+        'ExcludedActionItem', 'ExcludedConditionItemId', 'ExcludedActionItemId',
+        'DeviceConfigEntryBase', 'DeviceConfigEntryForDashboardAction',
+        'RemainingTime', 'Time', 'FormatInfoItem', 'FormatInfo', 'Language',
+        'BadgeItem', 'Icon', 'Icons', 'State2', 'StateItem', 'BasicPlusItem',
+        'Command', 'State5', 'ListForDetailView', 'State6', 'PlayPause',
+        'State7', 'PlayStop', 'Slider', 'StatesArrayItem', 'BasicPlusArrayItem',
+        'State8', 'SwitchState', 'State9', 'SwitchStateForDashboard',
+        'SwitchForDashboard', 'StandbyPowerSwitchForDashboard',
+        'CapabilityValueForDashboardState',
+        'DeviceConfigEntryForDashboardState', 'Dashboard', 'Dashboard1',
+        'CapabilityValue', 'Condition1', 'Switch', 'ToggleSwitch',
+        'AutomationListItem', 'ToggleSwitchForDashboard', 'DeviceConfigEntry',
+        'ExcludedDeviceActionConfigEntry', 'ExcludedDeviceConditionConfigEntry',
+        'ActionItem', 'Action1', 'AutomationForCapability',
+        'StandbyPowerSwitch', 'ActionsArrayItem', 'ActionListItem',
+        'Automation', 'CreateProfileDeviceConfigRequest', 'Automation1',
+        'DeviceConfiguration', 'PublicDeviceConfiguration', 'DashboardModel',
+        'DashboardForCapability', 'DetailViewForCapabilityItem',
+        'DetailViewForCapability', 'DetailViewItem', 'AutomationModel',
+        'DetailViewListItem', 'CreateDeviceConfigRequest',
+        'CapabilityPresentationForPUT', 'CapabilityPresentation', 'DetailView',
+        'CreateCapabilityPresentationRequest', 'DevicePresentation',
+        'DossierDevicePresentation',
+    ),
+    'events': (
+        'EventType', 'EventOwnerType', 'DeviceEvent', 'ModeEvent', 'TimerType',
+        'DeviceCommandsEventCommand', 'ArmState1', 'Status5', 'Reason',
+        'Status6', 'Reason1', 'HubHealthEvent', 'DeviceLifecycle', 'Category',
+        'DeviceLifecycleCreate', 'DeviceLifecycleDelete', 'LabelDiff',
+        'Category1', 'Capability2', 'Old', 'Category2', 'Capability3', 'New',
+        'ComponentDiff', 'DeviceLifecycleUpdate', 'DeviceLifecycleMove',
+        'DeviceLifecycleRoomMove', 'SimpleValue', 'SceneLifecycle',
+        'SceneLifecycleCreate', 'SceneLifecycleUpdate', 'SceneLifecycleDelete',
+        'SceneLifecycleCreateForBixby', 'SceneLifecycleUpdateForBixby',
+        'SceneLifecycleDeleteForBixby', 'InstalledAppLifecycle',
+        'InstalledAppLifecycleCreate', 'InstalledAppLifecycleUpdate',
+        'InstalledAppLifecycleDelete', 'InstalledAppLifecycleInstall',
+        'InstalledAppLifecycleOther', 'InstalledAppLifecycleError',
+        'DeviceEventSource', 'TimerEvent', 'DeviceCommandsEvent',
+        'DeviceLifecycleEvent', 'SecurityArmStateEvent', 'DeviceHealthEvent',
+        'SceneLifecycleEvent', 'InstalledAppLifecycleEvent',
+    ),
+    'services': (
+        'ServiceSubscriptionBody', 'ServiceNewSubscription',
+        'ServiceDeleteSubscription', 'ServiceCapability', 'ServiceCapabilities',
+        'AudioFormat', 'TtsProvider', 'Engine', 'SpeakingStyle', 'TTSBody',
+        'AudioFormat1', 'TtsProvider1', 'Engine1', 'SpeakingStyle1',
+        'PlaytextBody', 'ConvertedTTS', 'PlayedText', 'Gender',
+        'SupportedEngine', 'TTSProvider', 'SpeakingStyleEnum', 'Voice',
+        'TTSInfo', 'PartnerSTConnection', 'PartnerSTConnection1', 'IsaResults',
+        'DeviceResults', 'CommandArguments', 'PostReceipt',
+        'GenerateStOauthBody', 'ViperAppLinks', 'Subscription1',
+        'ServiceLocationInfo', 'Isa', 'LocationIsa', 'PostEndpointApp',
+        'EndpointApp', 'UserIdApp',
+    ),
+    'weather': (
+        'LastUpdateTime', 'HeadlineText', 'Severity', 'MessageType1',
+        'IssueTime', 'ExpireTime', 'AlertItem', 'LastUpdateTime1', 'Vendor',
+        'Version1', 'AirQualityIndex', 'O3Amount', 'O3Index', 'No2Amount',
+        'No2Index', 'So2Amount', 'So2Index', 'CoAmount', 'CoIndex',
+        'Pm10Amount', 'Pm10Index', 'Pm25Amount', 'Pm25Index', 'AirQuality',
+        'LastUpdateTime2', 'Vendor1', 'Version2', 'Precip1Hour',
+        'PrecipMin1Hour', 'PrecipMax1Hour', 'Precip2Hour', 'PrecipMin2Hour',
+        'PrecipMax2Hour', 'Precip3Hour', 'PrecipMin3Hour', 'PrecipMax3Hour',
+        'Precip4Hour', 'PrecipMin4Hour', 'PrecipMax4Hour', 'Precip5Hour',
+        'PrecipMin5Hour', 'PrecipMax5Hour', 'Precip6Hour', 'PrecipMin6Hour',
+        'PrecipMax6Hour', 'Precip7Hour', 'PrecipMin7Hour', 'PrecipMax7Hour',
+        'Precip8Hour', 'PrecipMin8Hour', 'PrecipMax8Hour', 'Precip9Hour',
+        'PrecipMin9Hour', 'PrecipMax9Hour', 'Precip10Hour', 'PrecipMin10Hour',
+        'PrecipMax10Hour', 'Precip11Hour', 'PrecipMin11Hour', 'PrecipMax11Hour',
+        'Precip12Hour', 'PrecipMin12Hour', 'PrecipMax12Hour', 'Precip24Hour',
+        'Snow1Hour', 'SnowMin1Hour', 'SnowMax1Hour', 'Snow2Hour',
+        'SnowMin2Hour', 'SnowMax2Hour', 'Snow3Hour', 'SnowMin3Hour',
+        'SnowMax3Hour', 'Snow4Hour', 'SnowMin4Hour', 'SnowMax4Hour',
+        'Snow5Hour', 'SnowMin5Hour', 'SnowMax5Hour', 'Snow6Hour',
+        'SnowMin6Hour', 'SnowMax6Hour', 'Snow7Hour', 'SnowMin7Hour',
+        'SnowMax7Hour', 'Snow8Hour', 'SnowMin8Hour', 'SnowMax8Hour',
+        'Snow9Hour', 'SnowMin9Hour', 'SnowMax9Hour', 'Snow10Hour',
+        'SnowMin10Hour', 'SnowMax10Hour', 'Snow11Hour', 'SnowMin11Hour',
+        'SnowMax11Hour', 'Snow12Hour', 'SnowMin12Hour', 'SnowMax12Hour',
+        'Snow24Hour', 'Temperature1Hour', 'Temperature2Hour',
+        'Temperature3Hour', 'Temperature4Hour', 'Temperature5Hour',
+        'Temperature6Hour', 'Temperature7Hour', 'Temperature8Hour',
+        'Temperature9Hour', 'Temperature10Hour', 'Temperature11Hour',
+        'Temperature12Hour', 'Forecast', 'LastUpdateTime3', 'Vendor2',
+        'Version3', 'Pm10Index1Hour', 'Pm10Index2Hour', 'Pm10Index3Hour',
+        'Pm10Index4Hour', 'Pm10Index5Hour', 'Pm10Index6Hour', 'Pm10Index7Hour',
+        'Pm10Index8Hour', 'Pm10Index9Hour', 'Pm10Index10Hour',
+        'Pm10Index11Hour', 'Pm10Index12Hour', 'Pm10Amount1Hour',
+        'Pm10Amount2Hour', 'Pm10Amount3Hour', 'Pm10Amount4Hour',
+        'Pm10Amount5Hour', 'Pm10Amount6Hour', 'Pm10Amount7Hour',
+        'Pm10Amount8Hour', 'Pm10Amount9Hour', 'Pm10Amount10Hour',
+        'Pm10Amount11Hour', 'Pm10Amount12Hour', 'Pm25Index1Hour',
+        'Pm25Index2Hour', 'Pm25Index3Hour', 'Pm25Index4Hour', 'Pm25Index5Hour',
+        'Pm25Index6Hour', 'Pm25Index7Hour', 'Pm25Index8Hour', 'Pm25Index9Hour',
+        'Pm25Index10Hour', 'Pm25Index11Hour', 'Pm25Index12Hour',
+        'Pm25Amount1Hour', 'Pm25Amount2Hour', 'Pm25Amount3Hour',
+        'Pm25Amount4Hour', 'Pm25Amount5Hour', 'Pm25Amount6Hour',
+        'Pm25Amount7Hour', 'Pm25Amount8Hour', 'Pm25Amount9Hour',
+        'Pm25Amount10Hour', 'Pm25Amount11Hour', 'Pm25Amount12Hour',
+        'AirQualityForecast', 'LastUpdateTime4', 'Vendor3', 'Version4',
+        'CloudCeiling', 'CloudCoverPhrase', 'IconCode', 'ConditionState',
+        'RelativeHumidity', 'SunriseTimeLocal', 'SunsetTimeLocal',
+        'Temperature', 'TemperatureFeelsLike', 'UvDescription', 'UvIndex',
+        'Visibility', 'WeatherDetailUrl', 'WindDirection',
+        'WindDirectionCardinal', 'WindGust', 'WindSpeed', 'WxPhraseLong',
+        'Weather', 'ServiceCapabilityData', 'ConditionState1', 'WeatherData',
+        'AirQualityData', 'Severity1', 'State1', 'SevereAlertData',
+        'WeatherEvent',
+    ),
+}
+
+INDEX = {name: module for module, names in MODULES.items() for name in names}
+
+
+def __getattr__(name):
+    module = INDEX.get(name)
+    if not module:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module('{}.{}'.format(__name__, module)), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(INDEX))
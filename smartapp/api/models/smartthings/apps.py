@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    Links,
+    Owner,
+)
+
+
+class IconImageModel(BaseModel):
+    url: Optional[AnyUrl] = Field(
+        None, description='A default icon image url for an app. https url required.\n'
+    )
+
+
+class AppType(Enum):
+    LAMBDA_SMART_APP = 'LAMBDA_SMART_APP'
+    WEBHOOK_SMART_APP = 'WEBHOOK_SMART_APP'
+
+
+class AppClassification(Enum):
+    AUTOMATION = 'AUTOMATION'
+    SERVICE = 'SERVICE'
+    DEVICE = 'DEVICE'
+    CONNECTED_SERVICE = 'CONNECTED_SERVICE'
+    HIDDEN = 'HIDDEN'
+    LABS = 'LABS'
+
+
+class AppRegisterRequest(BaseModel):
+    pass
+
+
+class AppRegisterResponse(BaseModel):
+    pass
+
+
+class LambdaSmartApp(BaseModel):
+    functions: Optional[List[str]] = Field(
+        None, description='A list of AWS arns referencing a Lambda function.'
+    )
+
+
+class AppOAuth(BaseModel):
+    clientName: Optional[str] = Field(
+        None, description='A name given to the OAuth Client.'
+    )
+    scope: Optional[List[str]] = Field(
+        None,
+        description='A list of SmartThings API OAuth scope identifiers that maybe required to execute your integration.',
+    )
+    redirectUris: Optional[List[AnyUrl]] = Field(
+        None, description='A list of redirect URIs.', max_items=10, min_items=0
+    )
+
+
+class CreateOrUpdateLambdaSmartAppRequest(BaseModel):
+    functions: List[str] = Field(
+        ..., description='A list of AWS arns referencing a Lambda function.'
+    )
+
+
+class CreateOrUpdateWebhookSmartAppRequest(BaseModel):
+    targetUrl: str = Field(
+        ..., description='A URL that should be invoked during execution.'
+    )
+
+
+class UpdateAppOAuthRequest(BaseModel):
+    clientName: str = Field(..., description='A name given to the OAuth Client.')
+    scope: List[str] = Field(
+        ...,
+        description='A list of SmartThings API OAuth scope identifiers that maybe required to execute your integration.',
+    )
+    redirectUris: List[AnyUrl] = Field(
+        ..., description='A list of redirect URIs.', max_items=10, min_items=0
+    )
+
+
+class GenerateAppOAuthRequest(BaseModel):
+    clientName: Optional[str] = Field(
+        None, description='A name given to the OAuth Client.'
+    )
+    scope: Optional[List[str]] = Field(
+        None,
+        description='A list of SmartThings API OAuth scope identifiers that maybe required to execute your integration.',
+    )
+
+
+class DeleteAppResponse(BaseModel):
+    pass
+
+
+class UpdateAppSettingsRequest(BaseModel):
+    settings: Optional[Dict[str, str]] = None
+
+
+class UpdateAppSettingsResponse(BaseModel):
+    settings: Optional[Dict[str, str]] = None
+
+
+class UpdateSignatureTypeResponse(BaseModel):
+    pass
+
+
+class GetAppSettingsResponse(BaseModel):
+    settings: Optional[Dict[str, str]] = None
+
+
+class GenerateAppOAuthResponse(BaseModel):
+    oauthClientDetails: Optional[AppOAuth] = None
+    oauthClientId: Optional[UUID] = Field(None, description='The OAuth Client ID.')
+    oauthClientSecret: Optional[UUID] = Field(
+        None, description='The OAuth Client Secret.'
+    )
+
+
+class SignatureType(Enum):
+    APP_RSA = 'APP_RSA'
+    ST_PADLOCK = 'ST_PADLOCK'
+
+
+class PrincipalTypeModel(Enum):
+    LOCATION = 'LOCATION'
+    USER_LEVEL = 'USER_LEVEL'
+
+
+class AppUISettings(BaseModel):
+    pluginId: Optional[str] = None
+    pluginUri: Optional[AnyUrl] = None
+    dashboardCardsEnabled: bool
+    preInstallDashboardCardsEnabled: bool
+
+
+class AppTargetStatus(Enum):
+    PENDING = 'PENDING'
+    CONFIRMED = 'CONFIRMED'
+
+
+class PagedApp(BaseModel):
+    appName: Optional[str] = Field(
+        None,
+        description='A user defined unique identifier for an app.  It is alpha-numeric, may contain dashes,\nunderscores, periods, and be less then 250 characters long.  It must be unique within your account.\n',
+    )
+    appId: Optional[UUID] = Field(
+        None, description='A globally unique identifier for an app.'
+    )
+    appType: Optional[AppType] = None
+    classifications: Optional[List[str]] = Field(
+        None,
+        description='An App maybe associated to many classifications.  A classification drives how the integration is presented\nto the user in the SmartThings mobile clients.  These classifications include:\n* AUTOMATION - Denotes an integration that should display under the "Automation" tab in mobile clients.\n* SERVICE - Denotes an integration that is classified as a "Service".\n* DEVICE - Denotes an integration that should display under the "Device" tab in mobile clients.\n* CONNECTED_SERVICE - Denotes an integration that should display under the "Connected Services" menu in mobile clients.\n* HIDDEN - Denotes an integration that should not display in mobile clients\n',
+    )
+    displayName: Optional[constr(max_length=75)] = Field(
+        None, description='A default display name for an app.\n'
+    )
+    description: Optional[constr(max_length=250)] = Field(
+        None, description='A default description for an app.\n'
+    )
+    iconImage: Optional[IconImageModel] = None
+    owner: Optional[Owner] = None
+    createdDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+    lastUpdatedDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+
+
+class WebhookSmartApp(BaseModel):
+    targetUrl: Optional[str] = Field(
+        None, description='A URL that should be invoked during execution.'
+    )
+    targetStatus: Optional[AppTargetStatus] = None
+    publicKey: Optional[str] = Field(
+        None,
+        description='The public half of an RSA key pair.  Useful for verifying a Webhook execution request signature to\nensure it came from SmartThings.\n',
+    )
+    signatureType: Optional[SignatureType] = None
+
+
+class CreateAppRequest(BaseModel):
+    appName: str = Field(
+        ...,
+        description='A globally unique, developer-defined identifier for an app. It is alpha-numeric, may contain dashes,\nunderscores, periods, and must be less then 250 characters long.\n',
+    )
+    displayName: constr(max_length=75) = Field(
+        ..., description='A default display name for an app.\n'
+    )
+    description: constr(max_length=250) = Field(
+        ..., description='A default description for an app.\n'
+    )
+    singleInstance: Optional[bool] = Field(
+        False,
+        description="Inform the installation systems that a particular app can only be installed once within a user's account.\n",
+    )
+    iconImage: Optional[IconImageModel] = None
+    appType: str
+    principalType: Optional[PrincipalTypeModel] = None
+    classifications: List[str] = Field(
+        ...,
+        description='An App maybe associated to many classifications.  A classification drives how the integration is presented\nto the user in the SmartThings mobile clients.  These classifications include:\n* AUTOMATION - Denotes an integration that should display under the "Automation" tab in mobile clients.\n* SERVICE - Denotes an integration that is classified as a "Service".\n* DEVICE - Denotes an integration that should display under the "Device" tab in mobile clients.\n* CONNECTED_SERVICE - Denotes an integration that should display under the "Connected Services" menu in mobile clients.\n* HIDDEN - Denotes an integration that should not display in mobile clients\n',
+    )
+    lambdaSmartApp: Optional[CreateOrUpdateLambdaSmartAppRequest] = None
+    webhookSmartApp: Optional[CreateOrUpdateWebhookSmartAppRequest] = None
+    oauth: Optional[AppOAuth] = None
+    ui: Optional[AppUISettings] = None
+
+
+class UpdateAppRequest(BaseModel):
+    displayName: constr(max_length=75) = Field(
+        ..., description='A default display name for an app.\n'
+    )
+    description: constr(max_length=250) = Field(
+        ..., description='A default description for an app.\n'
+    )
+    singleInstance: Optional[bool] = Field(
+        False,
+        description="Inform the installation systems that a particular app can only be installed once within a user's account.\n",
+    )
+    iconImage: Optional[IconImageModel] = None
+    appType: AppType
+    classifications: List[AppClassification] = Field(
+        ...,
+        description='An App maybe associated to many classifications.  A classification drives how the integration is presented\nto the user in the SmartThings mobile clients.  These classifications include:\n* AUTOMATION - Denotes an integration that should display under the "Automation" tab in mobile clients.\n* SERVICE - Denotes an integration that is classified as a "Service".\n* DEVICE - Denotes an integration that should display under the "Device" tab in mobile clients.\n* CONNECTED_SERVICE - Denotes an integration that should display under the "Connected Services" menu in mobile clients.\n* HIDDEN - Denotes an integration that should not display in mobile clients\n',
+    )
+    lambdaSmartApp: Optional[CreateOrUpdateLambdaSmartAppRequest] = None
+    webhookSmartApp: Optional[CreateOrUpdateWebhookSmartAppRequest] = None
+    ui: Optional[AppUISettings] = None
+
+
+class UpdateSignatureTypeRequest(BaseModel):
+    signatureType: Optional[SignatureType] = None
+
+
+class PagedApps(BaseModel):
+    items: Optional[List[PagedApp]] = None
+    _links: Optional[Links] = None
+
+
+class App1(BaseModel):
+    appName: Optional[str] = Field(
+        None,
+        description='A user defined unique identifier for an app.  It is alpha-numeric, may contain dashes,\nunderscores, periods, and be less then 250 characters long.  It must be unique within your account.\n',
+    )
+    appId: Optional[UUID] = Field(
+        None, description='A globally unique identifier for an app.'
+    )
+    appType: Optional[AppType] = None
+    principalType: Optional[PrincipalTypeModel] = None
+    classifications: Optional[List[AppClassification]] = Field(
+        None,
+        description='An App maybe associated to many classifications.  A classification drives how the integration is presented\nto the user in the SmartThings mobile clients.  These classifications include:\n* AUTOMATION - Denotes an integration that should display under the "Automation" tab in mobile clients.\n* SERVICE - Denotes an integration that is classified as a "Service".\n* DEVICE - Denotes an integration that should display under the "Device" tab in mobile clients.\n* CONNECTED_SERVICE - Denotes an integration that should display under the "Connected Services" menu in mobile clients.\n* HIDDEN - Denotes an integration that should not display in mobile clients\n',
+    )
+    displayName: Optional[constr(max_length=75)] = Field(
+        None, description='A default display name for an app.\n'
+    )
+    description: Optional[constr(max_length=250)] = Field(
+        None, description='A default description for an app.\n'
+    )
+    singleInstance: Optional[bool] = Field(
+        False,
+        description="Inform the installation systems that a particular app can only be installed once within a user's account.\n",
+    )
+    iconImage: Optional[IconImageModel] = None
+    installMetadata: Optional[Dict[str, str]] = Field(
+        None,
+        description='System generated metadata that impacts eligibility requirements around installing an App.',
+    )
+    owner: Optional[Owner] = None
+    createdDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+    lastUpdatedDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+    lambdaSmartApp: Optional[LambdaSmartApp] = None
+    webhookSmartApp: Optional[WebhookSmartApp] = None
+    ui: Optional[AppUISettings] = None
+
+
+class CreateAppResponse(BaseModel):
+    app: Optional[App1] = None
+    oauthClientId: Optional[UUID] = Field(None, description='The OAuth Client ID.')
+    oauthClientSecret: Optional[UUID] = Field(
+        None, description='The OAuth Client Secret.'
+    )
@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    Arguments,
+    Data,
+    I18n,
+    Links,
+    LocaleTag,
+    Unit,
+    Value,
+)
+
+
+class CapabilityReference(BaseModel):
+    id: str = Field(..., example='switch')
+    version: Optional[int] = Field(None, example=1)
+
+
+class CapabilityStatus(BaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class CapabilitySubscriptionDetail(BaseModel):
+    locationId: str = Field(
+        ...,
+        description='The id of the location that both the app and source device are in.',
+    )
+    capability: constr(min_length=1, max_length=128) = Field(
+        ...,
+        description='Name of the capability that is subscribed to.',
+        example='switch',
+    )
+    attribute: Optional[constr(min_length=1, max_length=256)] = Field(
+        '*',
+        description='Name of the capabilities attribute or * for all.',
+        example='switch',
+    )
+    value: Optional[str] = Field(
+        '*',
+        description='A particular value for the attribute that will trigger the subscription or * for all.',
+        example=['*', 1, 'on', {'key': 30}],
+    )
+    stateChangeOnly: Optional[bool] = Field(
+        True,
+        description='Only execute the subscription if the subscribed event is a state change from previous events.',
+    )
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='A name for the subscription that will be passed to the installed app. Must be unique per installed app.',
+    )
+    modes: Optional[List[str]] = Field(
+        None,
+        description='List of modes that the subscription will execute for. If not provided then all modes will be supported.',
+    )
+
+
+class Status3(Enum):
+    proposed = 'proposed'
+    live = 'live'
+    deprecated = 'deprecated'
+    dead = 'dead'
+
+
+class CapabilitySummary(BaseModel):
+    id: str = Field(
+        ...,
+        description='A URL safe unique identifier for the capability.',
+        example='switch',
+    )
+    version: int = Field(
+        ..., description='The version number of the capability.', example=1
+    )
+    status: Status3 = Field(
+        ...,
+        description='The status of the capability.\n* __proposed__ - The capability is under a review and refinement process. The capability definition may go through changes, some of which may be breaking.\n* __live__ - The capability has been through review and the definition has been solidified. Live capabilities can no longer be altered.\n* __deprecated__ - The capability is marked for removal and should only be used during a period of migration to allow for existing integrations and automations to continue to work.\n* __dead__ - The usage of a deprecated capability has dropped to a sufficiently low level to warrant removal. The capability definition still exists but can no longer be used by automations or implemented by devices.\n',
+    )
+    ephemeral: Optional[bool] = Field(False, example=True)
+
+
+class Status4(Enum):
+    proposed = 'proposed'
+    live = 'live'
+    deprecated = 'deprecated'
+    dead = 'dead'
+
+
+class EnumCommand(BaseModel):
+    command: str = Field(
+        ..., description='the command that sets this attribute to the associated value'
+    )
+    value: str = Field(
+        ..., description='the value that this command will set the attribute to'
+    )
+
+
+class Type(Enum):
+    object = 'object'
+
+
+class AdditionalProperties(Enum):
+    boolean_False = False
+
+
+class RequiredEnum(Enum):
+    value = 'value'
+    unit = 'unit'
+    data = 'data'
+
+
+class AttributeProperties(BaseModel):
+    class Config:
+        extra = Extra.forbid
+
+    value: Value = Field(
+        ...,
+        description='Properties that describe the value of an attribute.',
+        example={'type': 'number', 'minimum': 0, 'maximum': 20},
+    )
+    unit: Optional[Unit] = Field(
+        None, description='The unit which describes the value of the attribute.'
+    )
+    data: Optional[Data] = Field(
+        None,
+        description='Special case details may be desired to describe the attribute that may not be used the same as a value. Some examples are a timeout or a lock code.',
+    )
+
+
+class Argument(BaseModel):
+    class Config:
+        extra = Extra.forbid
+
+    name: constr(regex=r'^[[a-z]*([A-Z][a-z]*)*]{1,36}$') = Field(
+        ...,
+        description='A name that is unique within the command. Used for i18n and named argument command execution.',
+    )
+    optional: Optional[bool] = Field(
+        False,
+        description='Whether or not the argument must be supplied.\nIf the argument is at the end of the arguments array then it can be completely ignored.\nIf the argument is followed by another argument `null` must be supplied.\n',
+    )
+    schema_: Dict[str, Any] = Field(
+        ...,
+        alias='schema',
+        description='[JSON schema](http://json-schema.org/specification-links.html#draft-4) for the argument. The API implements JSON schema version 4. For more info regarding JSON schema, please read [Understanding JSON Schema](https://json-schema.org/understanding-json-schema/index.html).\n',
+    )
+
+
+class Attributes(BaseModel):
+    label: Optional[str] = Field(
+        None,
+        description='The localized version of the label value',
+        example='Modo de ar condicionado',
+    )
+    description: Optional[str] = Field(
+        None,
+        description='A localized description of what the attribute represents',
+        example='Modo de ar condicionado',
+    )
+    displayTemplate: Optional[str] = Field(
+        None,
+        description='A template string for the text that will be displayed regarding the attribute state.',
+        example='é suposto {{device.label}} a palavra {{attribute}} igual a {{value}}.',
+    )
+    i18n: Optional[Dict[str, Dict[str, I18n]]] = Field(
+        None,
+        description='Map of state property (value, unit, etc..) to localization mapping',
+    )
+
+
+class Commands(BaseModel):
+    label: Optional[str] = None
+    description: Optional[str] = None
+    arguments: Optional[Dict[str, Arguments]] = Field(
+        None, description='Map of argument name to localizations'
+    )
+
+
+class CapabilityLocalization(BaseModel):
+    tag: LocaleTag
+    label: Optional[str] = Field(
+        None,
+        description='A localized label for the capability',
+        example='Modo de ar condicionado',
+    )
+    description: Optional[str] = Field(
+        None,
+        description='A localized description of the capability',
+        example='Modo de ar condicionado',
+    )
+    attributes: Optional[Dict[str, Attributes]] = Field(
+        None,
+        description='Map of attribute name to localizations',
+        example={
+            'airConditionerMode': {
+                'displayTemplate': 'é suposto {{device.label}} a palavra {{attribute}} igual a {{value}}.',
+                'label': 'Este é o modo de ar condicionado',
+                'i18n': {
+                    'value': {
+                        'auto': {
+                            'label': 'Auto',
+                            'description': 'Este é o modo automático',
+                        },
+                        'cool': {'label': 'Frio', 'description': 'Este é o modo frio'},
+                    }
+                },
+            }
+        },
+    )
+    commands: Optional[Dict[str, Commands]] = Field(
+        None,
+        description='Map of command name to localizations',
+        example={
+            'setAirConditionerMode': {
+                'arguments': {
+                    'mode': {
+                        'i18n': {'auto': {'label': 'Auto'}, 'cool': {'label': 'Frio'}}
+                    }
+                }
+            }
+        },
+    )
+
+
+class DeleteNamespaceResponse(BaseModel):
+    pass
+
+
+class OwnerType2(Enum):
+    user = 'user'
+    organization = 'organization'
+    system = 'system'
+
+
+class Namespace(BaseModel):
+    name: str = Field(
+        ...,
+        description='A URL safe globally unique namespace name (ascii letters and numbers only)',
+        example='companyx',
+    )
+    ownerType: OwnerType2 = Field(
+        ..., description='The type of owner of the namespace.'
+    )
+    ownerId: str = Field(
+        ...,
+        description='id of the owner (user, or in the future, organization)',
+        example='0c0b935d-0616-4441-a0bf-da7aeec3dc0a',
+    )
+
+
+class Capability1(Enum):
+    alert = 'alert'
+    weather = 'weather'
+    airQuality = 'airQuality'
+    forecast = 'forecast'
+    airQualityForecast = 'airQualityForecast'
+
+
+class LocaleReference(BaseModel):
+    tag: Optional[LocaleTag] = None
+
+
+class PagedCapabilities(BaseModel):
+    items: Optional[List[CapabilitySummary]] = None
+    _links: Optional[Links] = None
+
+
+class AttributeSchema(BaseModel):
+    class Config:
+        extra = Extra.forbid
+
+    title: Optional[str] = Field(None, description="The capability's name, no spaces.")
+    type: Optional[Type] = Field(
+        None,
+        description='For schema this will always be object and is the only allowed value.',
+    )
+    properties: AttributeProperties
+    additionalProperties: Optional[AdditionalProperties] = None
+    required: Optional[List[RequiredEnum]] = Field(
+        None, description='Provide requirement for `value`, `unit`, and `data` fields.'
+    )
+
+
+class CapabilityCommand(BaseModel):
+    name: constr(regex=r'^[[a-z]*([A-Z][a-z]*)*]{1,36}$') = Field(
+        ...,
+        description='The name of the command. Unique for the capability',
+        example='setTemperature',
+    )
+    arguments: Optional[List[Argument]] = Field(
+        None,
+        description='An array of argument definitions. The arguments must be supplied in the order specified.',
+    )
+
+
+class CapabilityLocaleLocalizations(BaseModel):
+    items: Optional[List[LocaleReference]] = None
+
+
+class CapabilityAttribute(BaseModel):
+    schema_: Optional[AttributeSchema] = Field(None, alias='schema', description='')
+    setter: Optional[str] = Field(
+        None,
+        description='The name of the command that sets this attribute',
+        example='setColor',
+    )
+    enumCommands: Optional[List[EnumCommand]] = Field(
+        None,
+        description='a list of objects that specify which commands set this attribute',
+        example=[{'command': 'on', 'value': 'on'}, {'command': 'off', 'value': 'off'}],
+    )
+
+
+class CreateCapabilityRequest(BaseModel):
+    name: constr(regex=r'^[a-zA-Z0-9][a-zA-Z0-9 ]{1,35}$') = Field(
+        ...,
+        description='An alphanumeric English language name for the capability.',
+        example='Color Temperature',
+    )
+    ephemeral: Optional[bool] = Field(False, example=True)
+    attributes: Optional[Dict[str, CapabilityAttribute]] = Field(
+        None,
+        description='A mapping of attribute names to their definitions. All attribute names are lower camelcase. Required if no commands are specified.',
+        example={
+            'colorTemperature': {
+                'schema': {
+                    'type': 'object',
+                    'properties': {
+                        'value': {'type': 'integer', 'minimum': 1, 'maximum': 30000},
+                        'unit': {'type': 'string', 'enum': ['K'], 'default': 'K'},
+                    },
+                    'additionalProperties': False,
+                },
+                'required': ['value'],
+            }
+        },
+    )
+    commands: Optional[Dict[str, CapabilityCommand]] = Field(
+        None,
+        description='A mapping of command names to their definitions. All command names are lower camelcase. Required if no attributes are specified.',
+        example={
+            'setColorTemperature': {
+                'arguments': [
+                    {
+                        'name': 'temperature',
+                        'optional': False,
+                        'schema': {'type': 'integer', 'minimum': 1, 'maximum': 30000},
+                    }
+                ]
+            }
+        },
+    )
+
+
+class UpdateCapabilityRequest(BaseModel):
+    attributes: Optional[Dict[str, CapabilityAttribute]] = Field(
+        None,
+        description='A mapping of attribute names to their definitions. All attribute names are lower camelcase.',
+        example={
+            'colorTemperature': {
+                'schema': {
+                    'type': 'object',
+                    'properties': {
+                        'value': {'type': 'integer', 'minimum': 1, 'maximum': 30000},
+                        'unit': {'type': 'string', 'enum': ['K'], 'default': 'K'},
+                    },
+                    'additionalProperties': False,
+                },
+                'required': ['value'],
+            }
+        },
+    )
+    commands: Optional[Dict[str, CapabilityCommand]] = Field(
+        None,
+        description='A mapping of command names to their definitions. All command names are lower camelcase.',
+        example={
+            'setColorTemperature': {
+                'arguments': [
+                    {
+                        'name': 'temperature',
+                        'optional': False,
+                        'schema': {'type': 'integer', 'minimum': 1, 'maximum': 30000},
+                    }
+                ]
+            }
+        },
+    )
+
+
+class Capability(BaseModel):
+    id: str = Field(
+        ...,
+        description='A URL safe unique identifier for the capability.',
+        example='namespace.colorTemperature',
+    )
+    version: int = Field(
+        ..., description='The version number of the capability.', example=1
+    )
+    status: Status4 = Field(
+        ...,
+        description='The status of the capability.\n* __proposed__ - The capability is currently under development / in review.  The capability definition may go through changes, some of which may currently not function properly.\n* __live__ - The capability has been through review and the definition has been codified.  Once a definition transitions from proposed to live, it cannot be altered.\n* __deprecated__ - The capability is marked for removal in future versions.  It should only be used during a short period of time to allow for existing integrations and automations to continue to work while the transition to a newer definition is made.\n* __dead__ - A previously deprecated definition is now ready for removal.  Usage of the deprecated definition had dropped to a sufficiently low enough level to warrant removal.  The dead definition still exists but it can no longer be used or implemented by devices.\n',
+    )
+    name: str = Field(
+        ...,
+        description='An alphanumeric English language name for the capability.',
+        example='Color Temperature',
+    )
+    ephemeral: Optional[bool] = Field(False, example=True)
+    attributes: Optional[Dict[str, CapabilityAttribute]] = Field(
+        None,
+        description='A mapping of attribute names to their definitions. All attribute names are lower camelcase.',
+        example={
+            'colorTemperature': {
+                'schema': {
+                    'type': 'object',
+                    'properties': {
+                        'value': {'type': 'integer', 'minimum': 1, 'maximum': 30000},
+                        'unit': {'type': 'string', 'enum': ['K'], 'default': 'K'},
+                        'required': ['value'],
+                    },
+                }
+            }
+        },
+    )
+    commands: Optional[Dict[str, CapabilityCommand]] = Field(
+        None,
+        description='A mapping of command names to their definitions. All command names are lower camelcase.',
+        example={
+            'setColorTemperature': {
+                'arguments': [
+                    {
+                        'name': 'temperature',
+                        'schema': {'type': 'integer', 'minimum': 1, 'maximum': 30000},
+                    }
+                ]
+            }
+        },
+    )
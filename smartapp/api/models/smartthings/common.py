@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+
+class SmartThings(BaseModel):
+    __root__: Any
+
+
+class Link(BaseModel):
+    href: Optional[str] = Field(
+        None,
+        description='An absolute URL linking to a resource.',
+        example='https://...',
+    )
+
+
+class Links(BaseModel):
+    next: Optional[Link] = None
+    previous: Optional[Link] = None
+
+
+class Error(BaseModel):
+    code: Optional[str] = Field(
+        None,
+        description='Machine-readable error code.',
+        example='ConstraintViolationError',
+    )
+    message: Optional[str] = Field(
+        None,
+        description='Human-readable error message.',
+        example='The request was malformed.',
+    )
+    target: Optional[str] = Field(
+        None,
+        description='Optional field used to point to a problamatic part of the request.',
+        example='31192dc9-eb45-4d90-b606-21e9b66d8c2b',
+    )
+    details: Optional[List[Error]] = None
+
+
+class OwnerType(Enum):
+    USER = 'USER'
+    SYSTEM = 'SYSTEM'
+    IMPLICIT = 'IMPLICIT'
+    ACCOUNT = 'ACCOUNT'
+
+
+class Owner(BaseModel):
+    ownerType: OwnerType = Field(
+        ...,
+        description='The type of owner that owns this entity. "Account" refers specifically to a coterie account ID.',
+    )
+    ownerId: str = Field(..., description='A global idenfifier for owner.')
+
+
+class Tags(BaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class BaseCapabilityReference(BaseModel):
+    id: str = Field(..., example='switch')
+    version: Optional[int] = Field(None, example=1)
+
+
+class LocaleTag(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='The tag of the locale as defined in [RFC bcp47](http://www.rfc-editor.org/rfc/bcp/bcp47.txt).',
+        example='en',
+    )
+
+
+class StringType(Enum):
+    text = 'text'
+    password = 'password'
+    paragraph = 'paragraph'
+
+
+class Status2(Enum):
+    success = 'success'
+
+
+class StandardSuccessResponse(BaseModel):
+    status: Optional[Status2] = 'success'
+
+
+class Value(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    type: Optional[str] = Field(None, description="Data type of the attribute's value.")
+    enum: Optional[List[str]] = Field(
+        None,
+        description='Array of possible values or a `minimum:` `maximum:` can be defined for `integer` type.',
+    )
+
+
+class Type1(Enum):
+    string = 'string'
+
+
+class Unit(BaseModel):
+    type: Optional[Type1] = Field(
+        'string',
+        description='Data type for the unit. This is defined by capability schema as a `string`.',
+    )
+    enum: Optional[List[str]] = Field(
+        None,
+        description='Array of all possible units for the attribute value.',
+        example=['mm', 'in'],
+    )
+    default: Optional[str] = Field(
+        None,
+        description='The default unit to be used for the attribute value.',
+        example='mm',
+    )
+
+
+class Type2(Enum):
+    object = 'object'
+
+
+class Data(BaseModel):
+    type: Type2 = Field(
+        ..., description='The data type for the `data` schema is object.'
+    )
+    additionalProperties: Optional[bool] = Field(
+        False,
+        description='Indicates if properties not explicitly defined by the schema are allowed. Default is false.',
+    )
+    required: Optional[List[str]] = Field(
+        None, description='An array of the properties the `data` schema requires.'
+    )
+    properties: Optional[Dict[str, Any]] = Field(
+        None,
+        description='Objects can be described in JSON schema for the `data` that should be stored on this attribute.',
+        example={'val': {'type': 'string'}},
+    )
+
+
+class I18n(BaseModel):
+    label: str = Field(
+        ..., description='The localized substitution for the property value'
+    )
+    description: Optional[str] = Field(None, description='A description of the value')
+
+
+class I18n1(BaseModel):
+    label: str = Field(
+        ..., description='The localized substitution for the argument value'
+    )
+
+
+class Arguments(BaseModel):
+    i18n: Optional[Dict[str, I18n1]] = Field(
+        None, description='Map of argument values to localizations'
+    )
+    label: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ValueType1(Enum):
+    NULL_VALUE = 'NULL_VALUE'
+    INT_VALUE = 'INT_VALUE'
+    DOUBLE_VALUE = 'DOUBLE_VALUE'
+    STRING_VALUE = 'STRING_VALUE'
+    BOOLEAN_VALUE = 'BOOLEAN_VALUE'
+
+
+class ErrorResponse(BaseModel):
+    requestId: Optional[str] = Field(
+        None,
+        description='A correlation id used for reference when contacting support.',
+        example='7b8514e6-230d-41cc-b3c2-512bca15abf0',
+    )
+    error: Optional[Error] = None
+
+
+Error.update_forward_refs()
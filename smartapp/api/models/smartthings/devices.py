@@ -0,0 +1,943 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    BaseCapabilityReference,
+    Links,
+    StringType,
+)
+
+from smartapp.api.models.smartthings.capabilities import (
+    CapabilityReference,
+)
+
+from smartapp.api.models.smartthings.locations import (
+    HubId,
+)
+
+from smartapp.api.models.smartthings.drivers import (
+    DriverId,
+)
+
+
+class CategoryType(Enum):
+    manufacturer = 'manufacturer'
+    user = 'user'
+
+
+class DeviceCategory(BaseModel):
+    name: str = Field(..., example='Light')
+    categoryType: CategoryType
+
+
+class DeviceCommand(BaseModel):
+    component: Optional[str] = Field(
+        'main',
+        description="The name of the component on this device, default is 'main'. The component must be valid for the device.",
+    )
+    capability: str = Field(
+        ...,
+        description='Capability that this command relates to. This must be a capability of the component.',
+    )
+    command: str = Field(
+        ..., description='Name of the command, this must be valid for the capability.'
+    )
+    arguments: Optional[List[Any]] = Field(
+        None,
+        description="Arguments of the command.\nAll the required arguments defined in the capability's command argument definition must be provided.\nThe type of the arguments are dependent on the type of the capability's command argument.\nPlease refer to the capabilities definition at https://smartthings.developer.samsung.com/develop/api-ref/capabilities.html\n",
+    )
+
+
+class State(Enum):
+    ONLINE = 'ONLINE'
+    OFFLINE = 'OFFLINE'
+
+
+class HealthState(BaseModel):
+    state: Optional[State] = Field(None, description='Current state of the device')
+    lastUpdatedDate: Optional[datetime] = Field(
+        None, description='Last reported date/time in UTC'
+    )
+
+
+class ComponentStatus(BaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class AttributeState(BaseModel):
+    value: Optional[Dict[str, Any]] = Field(None, example=0)
+    unit: Optional[str] = Field(None, example='°C')
+    data: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        example={
+            'method': 'manual',
+            'codeId': 1234,
+            'timeout': '2018-05-09T23:03:31+0000',
+        },
+    )
+    timestamp: Optional[datetime] = Field(
+        None,
+        description='Will always be 0 timezone offset',
+        example='2017-12-18T22:14:52.714Z',
+    )
+
+
+class DeviceStateEvent(BaseModel):
+    component: Optional[str] = Field(
+        None, description="The name of the component on this device, default is 'main'."
+    )
+    capability: Optional[str] = Field(
+        None, description='Capability that this event relates to.'
+    )
+    attribute: Optional[str] = Field(
+        None, description='Name of the capability attribute that this event relates to.'
+    )
+    value: Any = Field(
+        ...,
+        description='Value associated with the event. The valid value depends on the capability.',
+    )
+    unit: Optional[str] = Field(None, description='Unit of the value field.')
+    data: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        description='Key value pairs about the state of the device. Valid values depend on the capability.',
+    )
+
+
+class App(BaseModel):
+    profileId: str = Field(
+        ...,
+        description='The device profile Id',
+        example='6f5ea629-4c05-4a90-a244-cc129b0a80c3',
+    )
+    installedAppId: str = Field(
+        ...,
+        description='The ID of the installed application',
+        example='6f5ea629-4c05-4a90-a244-cc129b0a80c3',
+    )
+    externalId: Optional[constr(max_length=64)] = Field(
+        None,
+        description='A field to store an ID from a system external to SmartThings.',
+        example='Th13390',
+    )
+
+
+class DeviceInstallRequest(BaseModel):
+    label: Optional[str] = Field(
+        None, description='The label for the Device.', example='Living room light'
+    )
+    locationId: str = Field(
+        ...,
+        description='The ID of the Location with which the device is associated.',
+        example='0c0b935d-0616-4441-a0bf-da7aeec3dc0a',
+    )
+    roomId: Optional[str] = Field(
+        None,
+        description='The ID of the Room with which to associate the Device is associated.\nThe Room must be valid for the Location of the Device.\n',
+        example='0fd2b1ef-1b33-4a54-9153-65aca91e9660',
+    )
+    app: App
+
+
+class FunctionCodes(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    default: Optional[str] = None
+
+
+class IrDeviceDetails(BaseModel):
+    parentDeviceId: Optional[str] = Field(
+        None, description='The id of the Parent device.'
+    )
+    profileId: Optional[str] = Field(
+        None,
+        description='The id of the profile that describes the device components and capabilities.',
+        example='0c0b875r-0213-6479-a0bf-da7aeec3dc0a',
+    )
+    ocfDeviceType: Optional[str] = Field(
+        None, description='The OCF Device Type', example='oic.d.tv'
+    )
+    irCode: Optional[str] = Field(
+        None, description='The id of the ircode', example='006C'
+    )
+    functionCodes: Optional[FunctionCodes] = Field(
+        None,
+        description='List of IR function codes',
+        example={
+            'statelessPowerToggleButton.powerToggle': 'power',
+            'statelessAudioMuteButton.muteToggle': 'mute',
+            'statelessAudioVolumeButton.volumeUp': 'volume_up',
+            'statelessAudioVolumeButton.volumeDown': 'volume_down',
+            'statelessChannelButton.channelUp': 'channel_up',
+            'statelessChannelButton.channelDown': 'channel_down',
+            'statelessCustomButton.green': 'green',
+            'statelessCustomButton.right': 'right',
+            'statelessCustomButton.3': 3,
+            'statelessCustomButton.exit': 'exit',
+            'statelessCustomButton.playback': 'playback',
+        },
+    )
+    childDevices: Optional[List[IrDeviceDetails]] = Field(
+        None, description='list of child devices'
+    )
+    metadata: Optional[Dict[str, Any]] = Field(
+        None,
+        description='Key value pairs stored in the conductor for the device.\nUI Metadata information\n',
+    )
+
+
+class BleDeviceDetails(BaseModel):
+    pass
+
+    class Config:
+        extra = Extra.forbid
+
+
+class BleD2DDeviceDetails(BaseModel):
+    encryptionKey: Optional[str] = Field(
+        None,
+        description='Security encryption key.',
+        example='96012869B606355A1F843B1E19DC31B1',
+    )
+    cipher: Optional[str] = Field(
+        None, description='Key for the decrypt.', example='BMO_256-CBS-PKMS1Padding'
+    )
+    advertisingId: Optional[str] = Field(
+        None, description='BLE Advertising Id.', example='9C0D4219'
+    )
+    identifier: Optional[str] = Field(
+        None, description='Unique device identifier.', example='88-57-1d-0e-53-ab'
+    )
+    configurationVersion: Optional[str] = None
+    configurationUrl: Optional[str] = Field(
+        None,
+        example='https://apisa.samsungiots.com/v1/miniature/profile/e524ceba-93b9-499d-a90a-24214f7f01cb',
+    )
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class ViperDeviceDetails(BaseModel):
+    uniqueIdentifier: Optional[str] = Field(None, example='1a-74')
+    manufacturerName: Optional[str] = Field(None, example='TP-Link')
+    modelName: Optional[str] = Field(None, example='HS101')
+    swVersion: Optional[str] = Field(None, example='23.123.231')
+    hwVersion: Optional[str] = Field(None, example='v1 US bulb')
+
+
+class OcfDeviceDetails(BaseModel):
+    deviceId: Optional[str] = Field(None, description='ID of the device')
+    ocfDeviceType: Optional[str] = Field(None, description='OCF device type')
+    name: Optional[str] = Field(None, description='Name of the device')
+    specVersion: Optional[str] = Field(None, description='OCF spec version')
+    verticalDomainSpecVersion: Optional[str] = Field(
+        None, description='OCF vertical domain spec version'
+    )
+    manufacturerName: Optional[str] = Field(None, description='OCF manufacturer name')
+    modelNumber: Optional[str] = Field(None, description='OCF model number')
+    platformVersion: Optional[str] = Field(None, description='OCF platform version')
+    platformOS: Optional[str] = Field(None, description='OCF platform OS')
+    hwVersion: Optional[str] = Field(None, description='OCF platform H/W version')
+    firmwareVersion: Optional[str] = Field(None, description='OCF firmware version')
+    vendorId: Optional[str] = Field(None, description='OCF vendor ID')
+    vendorResourceClientServerVersion: Optional[str] = Field(
+        None, description='OCF vendor resource client/server version'
+    )
+    locale: Optional[str] = Field(None, description='Language code')
+    lastSignupTime: Optional[str] = Field(
+        None, description='The time when the device is signed up lastly'
+    )
+
+
+class DeviceProfileReference(BaseModel):
+    id: Optional[str] = Field(
+        None,
+        description='The device profile Id',
+        example='a7b3c264-2d22-416e-bca1-ca4b59a60aee',
+    )
+
+
+class DeviceIntegrationType(Enum):
+    BLE = 'BLE'
+    BLE_D2D = 'BLE_D2D'
+    DTH = 'DTH'
+    ENDPOINT_APP = 'ENDPOINT_APP'
+    HUB = 'HUB'
+    IR = 'IR'
+    IR_OCF = 'IR_OCF'
+    MQTT = 'MQTT'
+    OCF = 'OCF'
+    PENGYOU = 'PENGYOU'
+    VIDEO = 'VIDEO'
+    VIPER = 'VIPER'
+    WATCH = 'WATCH'
+    GROUP = 'GROUP'
+    LAN = 'LAN'
+    ZIGBEE = 'ZIGBEE'
+    ZWAVE = 'ZWAVE'
+    MATTER = 'MATTER'
+
+
+class CreateDeviceEventsResponse(BaseModel):
+    pass
+
+
+class CommandStatus(Enum):
+    ACCEPTED = 'ACCEPTED'
+    COMPLETED = 'COMPLETED'
+    FAILED = 'FAILED'
+
+
+class DeleteDeviceCommandsResponse(BaseModel):
+    pass
+
+
+class UpdateDeviceComponent(BaseModel):
+    id: str = Field(..., example='main')
+    icon: Optional[constr(min_length=1, max_length=255)] = Field(
+        None,
+        description='Identifier allowing the user to pick a custom icon for the device component.\nThe icon of the main component represents the device itself\n',
+    )
+    categories: List[str] = Field(
+        ...,
+        description='A case-sensitive string from the pre-defined list of valid categories [/devicecategories](#/operation/listCategories). Allows the user to redefine the category of the device from what the manufacturer set by default.',
+        max_items=1,
+        min_items=1,
+    )
+
+
+class UpdateDeviceRequest(BaseModel):
+    label: Optional[constr(min_length=1, max_length=255)] = Field(
+        None, description='The label for the Device.', example='Living room light'
+    )
+    locationId: Optional[str] = Field(
+        None,
+        description='The ID of the Location where the Device should be moved to.\nNot all Devices support Location moves.\nMoving between some Locations may be rejected depending on the data region used.\n',
+        example='0c0b935d-0616-4441-a0bf-da7aeec3dc0a',
+    )
+    roomId: Optional[str] = Field(
+        None,
+        description='The ID of the Room with which to associate the Device is associated.\nThe Room must be valid for the Location of the Device.\n',
+        example='0fd2b1ef-1b33-4a54-9153-65aca91e9660',
+    )
+    components: Optional[List[UpdateDeviceComponent]] = None
+
+
+class DeviceNetworkSecurityLevel(Enum):
+    UNKNOWN = 'UNKNOWN'
+    ZWAVE_LEGACY_NON_SECURE = 'ZWAVE_LEGACY_NON_SECURE'
+    ZWAVE_S0_LEGACY = 'ZWAVE_S0_LEGACY'
+    ZWAVE_S0_FALLBACK = 'ZWAVE_S0_FALLBACK'
+    ZWAVE_S2_UNAUTHENTICATED = 'ZWAVE_S2_UNAUTHENTICATED'
+    ZWAVE_S2_AUTHENTICATED = 'ZWAVE_S2_AUTHENTICATED'
+    ZWAVE_S2_ACCESS_CONTROL = 'ZWAVE_S2_ACCESS_CONTROL'
+    ZWAVE_S2_FAILED = 'ZWAVE_S2_FAILED'
+    ZWAVE_S0_FAILED = 'ZWAVE_S0_FAILED'
+    ZWAVE_S2_DOWNGRADE = 'ZWAVE_S2_DOWNGRADE'
+    ZWAVE_S0_DOWNGRADE = 'ZWAVE_S0_DOWNGRADE'
+
+
+class ExecutingLocally(BaseModel):
+    __root__: bool = Field(
+        ..., description='True if the device is executing locally on the hub'
+    )
+
+
+class DeviceEui(BaseModel):
+    __root__: str = Field(
+        ..., description='The EUID of the Zigbee device', example='24FD5B000105DB96'
+    )
+
+
+class DeviceNetworkId(BaseModel):
+    __root__: str = Field(
+        ..., description='The network-specific identifier of the device on the network'
+    )
+
+
+class DeviceId(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='The identifier for the Device instance.',
+        example='6f5ea629-4c05-4a90-a244-cc129b0a80c3',
+    )
+
+
+class DeviceNetworkType(BaseModel):
+    __root__: str = Field(..., description='The device network type.', example='ZIGBEE')
+
+
+class ProvisioningState(Enum):
+    PROVISIONED = 'PROVISIONED'
+    TYPED = 'TYPED'
+    DRIVER_SWITCH = 'DRIVER_SWITCH'
+    NONFUNCTIONAL = 'NONFUNCTIONAL'
+
+
+class Restriction(BaseModel):
+    tier: int = Field(
+        ...,
+        description='The restriction level of an entity to limit actions it can take.',
+    )
+    historyRetentionTTLDays: Optional[int] = Field(
+        None, description='The number of days to retain the state before deletion.'
+    )
+    visibleWhenRestricted: Optional[bool] = Field(
+        False,
+        description='Indicate whether or not the entity is visible when restricted.',
+    )
+
+
+class DeviceProfileMetadata(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    __root__: Any = Field(
+        ...,
+        description='Additional information about the device profile, limited to 10 entries.',
+        example={
+            'firmWareVersion': '0.2.123',
+            'manufacturerName': 'SmartThingsCommunity',
+        },
+    )
+
+
+class DeleteDeviceProfileResponse(BaseModel):
+    pass
+
+
+class DeviceProfileStatus(Enum):
+    DEVELOPMENT = 'DEVELOPMENT'
+    PUBLISHED = 'PUBLISHED'
+
+
+class ComponentTranslations(BaseModel):
+    label: Optional[constr(max_length=25)] = Field(
+        None,
+        description='Short UTF-8 text used when displaying the component.',
+        example='Main',
+    )
+    description: Optional[constr(max_length=255)] = Field(
+        None,
+        description='UTF-8 text describing the component.',
+        example='The main component of the device.',
+    )
+
+
+class Definition(BaseModel):
+    minimum: Optional[float] = Field(
+        None,
+        description='Minimum value a preference may be set to. Only valid for `integer` and `number` preference types.',
+    )
+    maximum: Optional[float] = Field(
+        None,
+        description='Maximum value a preference may be set to. Only valid for `integer` and `number` preference types.',
+    )
+    minLength: Optional[int] = Field(
+        None,
+        description='Minimum length a string may be set to. Only valid for `string` preference type.',
+    )
+    maxLength: Optional[int] = Field(
+        None,
+        description='Maximum length a string may be set to. Only valid for `string` preference type.',
+    )
+    default: Optional[Any] = Field(None, description='Default value for a preference.')
+    stringType: Optional[StringType] = Field(
+        None,
+        description='The type of a string preference. `text` is a normal preference, `password` encrypts the values, and `paragraph` is for documentation purposes.',
+    )
+    options: Optional[Dict[str, str]] = Field(
+        None, description='The available selections for an `enumeration` preference.'
+    )
+
+
+class PreferenceType(Enum):
+    integer = 'integer'
+    number = 'number'
+    boolean = 'boolean'
+    string = 'string'
+    enumeration = 'enumeration'
+
+
+class DeviceGroupType(Enum):
+    UNDETERMINED = 'UNDETERMINED'
+    GENERIC = 'GENERIC'
+    VIDEO_CAMERA = 'VIDEO_CAMERA'
+    LIGHTING = 'LIGHTING'
+
+
+class DeviceGroupCapability(BaseModel):
+    id: str = Field(..., example='switch')
+    version: Optional[int] = Field(None, example=1)
+
+
+class Component(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    id: Optional[str] = Field(None, example='main')
+
+
+class Device1(BaseModel):
+    deviceId: Optional[str] = Field(
+        None,
+        description='GUID representing the device',
+        example='30d3691f-2416-4cbc-b193-2329581f29d1',
+    )
+    components: Optional[List[Component]] = Field(
+        None, description='Components to add to the group'
+    )
+
+
+class DeviceGroupResponse(BaseModel):
+    groupName: str = Field(
+        ..., description='Name of the group created', example='helloWorldGroup'
+    )
+    groupType: DeviceGroupType
+    locationId: Optional[str] = Field(
+        None,
+        description='Location where this group is',
+        example='30d3691f-2416-4cbc-b193-2329581f29d1',
+    )
+    restrictionTier: Optional[int] = Field(
+        None, description='restriction tier of the device group'
+    )
+    devices: List[Device1] = Field(..., description='An array of devices in the group')
+    deviceGroupId: str = Field(
+        ...,
+        description='a GUID that identifies a group',
+        example='30d3691f-2416-4cbc-b193-2329581f29d1',
+    )
+    deviceGroupCapabilities: List[DeviceGroupCapability] = Field(
+        ...,
+        description='Lowest common denominator capability of all the devices in the group',
+    )
+    roomId: Optional[str] = None
+
+
+class DeviceGroupCommand(BaseModel):
+    capability: Optional[str] = None
+    command: Optional[str] = None
+    arguments: Optional[List[Dict[str, Any]]] = None
+
+
+class DeviceActivity(BaseModel):
+    deviceId: Optional[str] = Field(None, description='Device ID')
+    deviceName: Optional[str] = Field(
+        None, description='Device nick name', example='TV'
+    )
+    locationId: Optional[str] = Field(None, description='Location ID')
+    locationName: Optional[str] = Field(
+        None, description='Location name', example='Home'
+    )
+    time: Optional[datetime] = Field(
+        None,
+        description='The IS0-8601 date time strings in UTC of the activity',
+        example='2017-12-18T22:14:52Z',
+    )
+    text: Optional[str] = Field(
+        None,
+        description='Translated human readable string (localized)',
+        example='battery of Button is: 89%',
+    )
+    component: str = Field(
+        ..., description='device component ID. Not nullable.', example='main'
+    )
+    componentLabel: Optional[str] = Field(
+        None, description='device component label. Nullable.', example='left button'
+    )
+    capability: Optional[str] = Field(
+        None, description='capability name', example='battery'
+    )
+    attribute: Optional[str] = Field(
+        None, description='attribute name', example='battery'
+    )
+    value: Optional[Dict[str, Any]] = Field(
+        None, description='attribute value', example=0
+    )
+    unit: Optional[str] = Field(None, example='%')
+    data: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        example={
+            'method': 'manual',
+            'codeId': 1234,
+            'timeout': '2018-05-09T23:03:31+0000',
+        },
+    )
+    translatedAttributeName: Optional[str] = Field(
+        None,
+        description="translated attribute name based on 'Accept-Language' requested in header",
+        example='스위치',
+    )
+    translatedAttributeValue: Optional[str] = Field(
+        None,
+        description="translated attribute value based on 'Accept-Language' requested in header",
+        example='켜짐',
+    )
+
+
+class DeviceComponent(BaseModel):
+    id: str = Field(..., example='main')
+    label: Optional[str] = Field(None, description='UTF-8 label for the component.')
+    capabilities: List[CapabilityReference]
+    categories: List[DeviceCategory] = Field(
+        ...,
+        description='Defines the categories for the device. There can be up to 2, one defined by the manufacturer the other is a user selected value.\n',
+        max_items=2,
+    )
+    restrictions: Optional[Restriction] = None
+    icon: Optional[str] = Field(None, description='A user selected icon value\n')
+
+
+class DeviceCommandsRequest(BaseModel):
+    commands: Optional[List[DeviceCommand]] = Field(
+        None, description='An array of commands to execute on the Device.'
+    )
+
+
+class DeviceStatus(BaseModel):
+    components: Optional[Dict[str, ComponentStatus]] = Field(
+        None,
+        description='A map of componentId to Component status.',
+        example={
+            'main': {
+                'switch': {'switch': {'value': 'on'}},
+                'switchLevel': {'level': {'value': 90}},
+            }
+        },
+    )
+    healthState: Optional[HealthState] = None
+
+
+class DeviceEventsRequest(BaseModel):
+    deviceEvents: Optional[List[DeviceStateEvent]] = Field(
+        None,
+        description='An array of attribute state updates.',
+        max_items=8,
+        min_items=1,
+    )
+
+
+class AppDeviceDetails(BaseModel):
+    installedAppId: Optional[str] = Field(
+        None,
+        description='The ID of the installed app that integrates this device.',
+        example='0c0b935d-0616-4441-a0bf-da7aeec3dc0a',
+    )
+    externalId: Optional[constr(max_length=64)] = Field(
+        None,
+        description='A field to store an ID from a system external to SmartThings.',
+        example='Th13390',
+    )
+    profile: Optional[DeviceProfileReference] = None
+
+
+class DthDeviceDetails(BaseModel):
+    completedSetup: bool = Field(
+        ...,
+        description='True if the device setup has been completed so the device is ready to use.',
+    )
+    deviceNetworkType: Optional[DeviceNetworkType] = None
+    deviceTypeId: str = Field(
+        ...,
+        description="The identifier for the device's DeviceType.",
+        example='7b8514e6-230d-41cc-b3c2-512bca15abf0',
+    )
+    deviceTypeName: str = Field(
+        ...,
+        description="The name for the device's DeviceType.",
+        example='x.com.samsung.da.fridge',
+    )
+    executingLocally: Optional[ExecutingLocally] = None
+    hubId: Optional[HubId] = None
+    installedGroovyAppId: Optional[str] = Field(
+        None,
+        description='The ID of the installed groovy application',
+        example='8f5ra619-4c05-4a90-a245-cc129b0a8098',
+    )
+    networkSecurityLevel: Optional[DeviceNetworkSecurityLevel] = None
+
+
+class CommandResult(BaseModel):
+    id: Optional[UUID] = Field(
+        None, description='A UUID used for tracking the individual command.'
+    )
+    status: Optional[CommandStatus] = None
+
+
+class LanDeviceDetails(BaseModel):
+    networkId: Optional[DeviceNetworkId] = None
+    driverId: Optional[DriverId] = None
+    executingLocally: Optional[ExecutingLocally] = None
+    hubId: Optional[HubId] = None
+    provisioningState: Optional[ProvisioningState] = None
+
+
+class ZigbeeDeviceDetails(BaseModel):
+    eui: Optional[DeviceEui] = None
+    networkId: Optional[DeviceNetworkId] = None
+    driverId: Optional[DriverId] = None
+    executingLocally: Optional[ExecutingLocally] = None
+    hubId: Optional[HubId] = None
+    provisioningState: Optional[ProvisioningState] = None
+
+
+class ZwaveDeviceDetails(BaseModel):
+    networkId: Optional[DeviceNetworkId] = None
+    driverId: Optional[DriverId] = None
+    executingLocally: Optional[ExecutingLocally] = None
+    hubId: Optional[HubId] = None
+    networkSecurityLevel: Optional[DeviceNetworkSecurityLevel] = None
+    provisioningState: Optional[ProvisioningState] = None
+
+
+class MatterDeviceDetails(BaseModel):
+    driverId: Optional[DriverId] = None
+    hubId: Optional[HubId] = None
+    provisioningState: Optional[ProvisioningState] = None
+
+
+class DeviceComponentReference(BaseModel):
+    id: str = Field(..., example='main')
+    label: Optional[str] = Field(
+        None,
+        description='A default label that will be used for a component. If this is not provided, it defaults to the componentId.\nIf there are translations for this component, the label defined there will take preference over this default label.',
+        example='main',
+    )
+    capabilities: List[BaseCapabilityReference] = Field(
+        ...,
+        description='A list of `[ 1..20 ]` capabilities for this component.',
+        max_items=20,
+        min_items=1,
+    )
+    categories: Optional[List[DeviceCategory]] = None
+
+
+class PreferenceRequest(BaseModel):
+    preferenceId: Optional[str] = Field(None, description='The ID of the preference')
+    name: constr(regex=r'^[a-zA-Z0-9][a-zA-Z0-9 ]{1,35}$') = Field(
+        ...,
+        description='An alphanumeric English language name for this preference. Will be appended to a namespace to generate the full preference id.',
+        example='tempOffset',
+    )
+    title: str = Field(
+        ...,
+        description='A short description for this preference.',
+        example='Temperature Offset',
+    )
+    description: Optional[str] = Field(
+        None,
+        description='A long description for this preference.',
+        example='The offset for a particular temperature setting',
+    )
+    explicit: Optional[bool] = Field(
+        False,
+        description='A flag describing whether this preference is explicit, or inline.',
+    )
+    required: Optional[bool] = Field(
+        False, description='A flag describing whether this property is required or not.'
+    )
+    preferenceType: PreferenceType
+    definition: Definition = Field(
+        ..., description='The definition of this preference.'
+    )
+
+
+class PreferenceResponse(BaseModel):
+    preferenceId: Optional[str] = Field(None, description='The ID of the preference')
+    name: Optional[str] = Field(
+        None, description='An alphanumeric English language name for this preference.'
+    )
+    title: str = Field(
+        ...,
+        description='A short description for this preference.',
+        example='Temperature Offset',
+    )
+    description: Optional[str] = Field(
+        None,
+        description='A long description for this preference.',
+        example='The offset for a particular temperature setting',
+    )
+    required: Optional[bool] = Field(
+        False, description='A flag describing whether this property is required or not.'
+    )
+    preferenceType: PreferenceType
+
+
+class PagedPreferences(BaseModel):
+    items: Optional[List[PreferenceResponse]] = None
+    _links: Optional[Links] = None
+
+
+class Device(BaseModel):
+    deviceId: DeviceId
+    name: Optional[str] = Field(
+        None,
+        description='The name that the Device integration (Device Handler or SmartApp) defines for the Device.',
+        example='color.light.100x',
+    )
+    label: Optional[str] = Field(
+        None,
+        description='The name that a user chooses for the Device. This defaults to the same value as name.',
+        example='color.light.100x',
+    )
+    manufacturerName: str = Field(
+        ..., description='The Device manufacturer name.', example='SmartThings'
+    )
+    presentationId: str = Field(
+        ...,
+        description='A non-unique id that is used to help drive UI information.',
+        example='VD-STV_2018_K',
+    )
+    deviceManufacturerCode: Optional[str] = Field(
+        None, description='The Device manufacturer code.', example='010F-0B01-2002'
+    )
+    locationId: Optional[str] = Field(
+        None,
+        description='The ID of the Location with which the Device is associated.',
+        example='0c0b935d-0616-4441-a0bf-da7aeec3dc0a',
+    )
+    ownerId: Optional[str] = Field(
+        None,
+        description='The identifier for the owner of the Device instance.',
+        example='1c75f712-2c3e-4e51-970c-a42ae7aedbdc',
+    )
+    roomId: Optional[str] = Field(
+        None,
+        description='The ID of the Room with which the Device is associated. If the Device is not associated with any room, this field will be null.',
+        example='0fd2b1ef-1b33-4a54-9153-65aca91e9660',
+    )
+    deviceTypeId: Optional[str] = Field(
+        None,
+        description='Deprecated please look under "dth".',
+        example='Deprecated please look under "dth".',
+    )
+    deviceTypeName: Optional[str] = Field(
+        None,
+        description='Deprecated please look under "dth".',
+        example='Deprecated please look under "dth".',
+    )
+    deviceNetworkType: Optional[str] = Field(
+        None,
+        description='Deprecated please look under "dth".',
+        example='Deprecated please look under "dth".',
+    )
+    components: Optional[List[DeviceComponent]] = Field(
+        None, description='The IDs of all compenents on the Device.'
+    )
+    createTime: Optional[str] = Field(
+        None, description='The time when the device was created at.'
+    )
+    parentDeviceId: Optional[str] = Field(
+        None, description='The id of the Parent device.'
+    )
+    childDevices: Optional[List[Device]] = Field(
+        None, description='Device details for all child devices of the Device.'
+    )
+    profile: Optional[DeviceProfileReference] = None
+    app: Optional[AppDeviceDetails] = Field(
+        None,
+        description='Device Profile information for the SmartApp. This field will be empty if device type is not ENDPOINT_APP.',
+    )
+    ble: Optional[BleDeviceDetails] = Field(
+        None,
+        description='Bluetooth device information. This field will be empty if device type is not BLE.',
+    )
+    bleD2D: Optional[BleD2DDeviceDetails] = Field(
+        None,
+        description='Bluetooth device to device information. This field will be empty if device type is not BLE_D2D.',
+    )
+    dth: Optional[DthDeviceDetails] = Field(
+        None,
+        description='Device Profile information for DTH. This field will be empty if device type is not DTH.',
+    )
+    lan: Optional[LanDeviceDetails] = None
+    zigbee: Optional[ZigbeeDeviceDetails] = None
+    zwave: Optional[ZwaveDeviceDetails] = None
+    matter: Optional[MatterDeviceDetails] = None
+    ir: Optional[IrDeviceDetails] = Field(
+        None,
+        description='IR device information. This field will be empty if device type is not IR.',
+    )
+    irOcf: Optional[IrDeviceDetails] = Field(
+        None,
+        description='IR_OCF device information. This field will be empty if device type is not IR_OCF.',
+    )
+    ocf: Optional[OcfDeviceDetails] = Field(
+        None,
+        description='OCF device information. This field will be empty if device type is not OCF.',
+    )
+    viper: Optional[ViperDeviceDetails] = Field(
+        None,
+        description='Viper device information. This field will be empty if device type is not VIPER.',
+    )
+    type: DeviceIntegrationType
+    restrictionTier: int = Field(
+        ..., description='Restriction tier of the device, if any.'
+    )
+
+
+class PagedDevices(BaseModel):
+    items: Optional[List[Device]] = None
+    _links: Optional[Links] = None
+
+
+class DeviceCommandsResponse(BaseModel):
+    results: Optional[List[CommandResult]] = None
+
+
+class DeviceProfileResponse(BaseModel):
+    id: Optional[str] = Field(None, example='a362ddb6-349b-4650-9911-681b51069a57')
+    name: Optional[str] = Field(None, example='thermostat1.model1')
+    components: Optional[List[DeviceComponent]] = None
+    metadata: Optional[DeviceProfileMetadata] = None
+    status: Optional[DeviceProfileStatus] = None
+    preferences: Optional[List[PreferenceResponse]] = None
+
+
+class PagedDeviceProfiles(BaseModel):
+    items: Optional[List[DeviceProfileResponse]] = None
+    _links: Optional[Links] = None
+
+
+class UpdateDeviceProfileRequest(BaseModel):
+    components: Optional[List[DeviceComponentReference]] = Field(
+        None,
+        description='A list of `[ 1..20 ]` components for this profile.',
+        max_items=20,
+        min_items=1,
+    )
+    metadata: Optional[DeviceProfileMetadata] = None
+    preferences: Optional[List[PreferenceRequest]] = Field(
+        None,
+        description='A list of preferences for this profile, whether implicit or explicit.',
+    )
+
+
+class CreateDeviceProfileRequest(BaseModel):
+    name: constr(min_length=1, max_length=100) = Field(
+        ..., description='A name for the device profile.', example='thermostat1.model1'
+    )
+    components: List[DeviceComponentReference] = Field(
+        ...,
+        description='A list of components for this profile. Exactly 1 component ID must be `main`.',
+        max_items=20,
+        min_items=1,
+    )
+    preferences: Optional[List[PreferenceRequest]] = Field(
+        None,
+        description='A list of preferences for this profile, whether implicit or explicit.',
+    )
+    metadata: Optional[DeviceProfileMetadata] = None
+
+
+IrDeviceDetails.update_forward_refs()
+Device.update_forward_refs()
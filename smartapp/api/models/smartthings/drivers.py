@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    Links,
+)
+
+
+class DriverId(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='The ID of the Sprocket driver',
+        example='9314a926-528c-403f-ae56-4b0d059381dd',
+    )
+
+
+class DriverVersion(BaseModel):
+    __root__: str = Field(
+        ..., description='The version of the driver revision being returned'
+    )
+
+
+class PermissionAttributes(BaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class DeviceIntegrationProfileKey(BaseModel):
+    id: Optional[UUID] = Field(
+        None, description='Unique identifier for integration profile.'
+    )
+    majorVersion: Optional[int] = Field(
+        None, description='Major Version of the integration profile'
+    )
+
+
+class PackageKey(BaseModel):
+    __root__: constr(regex=r'^[a-zA-Z0-9 _/\\\-()\\[\\]{}\.]{1,36}$') = Field(
+        ...,
+        description="A user scoped package key that's used to lookup the respective driver record",
+        example='smartthings.zigbee.bulb-rgbw',
+    )
+
+
+class DriverName(BaseModel):
+    __root__: str = Field(
+        ..., description='The name of the driver', example='Generic Button'
+    )
+
+
+class FingerprintId(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='The identifier for the respective fingerprint, unique per driver',
+        example='smartthings.motion-v4',
+    )
+
+
+class FingerprintType(Enum):
+    DTH = 'DTH'
+    ZIGBEE_GENERIC = 'ZIGBEE_GENERIC'
+    ZIGBEE_MANUFACTURER = 'ZIGBEE_MANUFACTURER'
+    ZWAVE_MANUFACTURER = 'ZWAVE_MANUFACTURER'
+    ZWAVE_GENERIC = 'ZWAVE_GENERIC'
+
+
+class FingerprintDeviceLabel(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='Label assigned to device at join time. If this is not set the driver name is used.',
+        example='Motion Sensor',
+    )
+
+
+class ZigbeeProfiles(BaseModel):
+    __root__: List[int] = Field(
+        ...,
+        description='Device profiles associated with a generic zigbee fingerprint',
+        example=[260],
+    )
+
+
+class ZigbeeManufacturer(BaseModel):
+    __root__: constr(min_length=0, max_length=32) = Field(
+        ..., description='Reported manufacturer of the device', example='SmartThings'
+    )
+
+
+class ZigbeeModel(BaseModel):
+    __root__: constr(min_length=0, max_length=32) = Field(
+        ..., description='Reported model of the device', example='motionv4'
+    )
+
+
+class ZigbeeManufacturerFingerprint(BaseModel):
+    manufacturer: Optional[ZigbeeManufacturer] = None
+    model: Optional[ZigbeeModel] = None
+    deviceIntegrationProfileKey: Optional[DeviceIntegrationProfileKey] = None
+
+
+class ZWaveManufacturerId(BaseModel):
+    __root__: conint(ge=0, le=65535) = Field(
+        ...,
+        description='16-bit manufacturer identifier assigned by the Z-Wave Specification',
+        example=134,
+    )
+
+
+class ZWaveProductId(BaseModel):
+    __root__: conint(ge=0, le=65535) = Field(
+        ..., description='16-bit manufacturer defined product identifier', example=12336
+    )
+
+
+class ZWaveProductType(BaseModel):
+    __root__: conint(ge=0, le=65535) = Field(
+        ..., description='16-bit manufacturer defined product type', example=17488
+    )
+
+
+class ZWaveGenericType(BaseModel):
+    __root__: conint(ge=0, le=255) = Field(
+        ..., description='8-bit indicator for the generic type of the device', example=6
+    )
+
+
+class ZWaveSpecificType(BaseModel):
+    __root__: conint(ge=0, le=255) = Field(
+        ...,
+        description='8-bit indicator for the specific type of the device',
+        example=6,
+    )
+
+
+class CommandClasses(BaseModel):
+    either: Optional[List[conint(ge=0, le=255)]] = Field(
+        None,
+        description='List of 8-bit command class identifiers to match regardless of controlled or supported',
+    )
+    controlled: Optional[List[conint(ge=0, le=255)]] = Field(
+        None, description='List of 8-bit command class identifiers that are controlled'
+    )
+    supported: Optional[List[conint(ge=0, le=255)]] = Field(
+        None, description='List of 8-bit command class identifiers that are supported'
+    )
+
+
+class ClientClusters(BaseModel):
+    __root__: List[conint(ge=0, le=65535)] = Field(
+        ..., description='List of 16-bit cluster identifiers for client clusters'
+    )
+
+
+class ServerClusters(BaseModel):
+    __root__: List[conint(ge=0, le=65535)] = Field(
+        ..., description='List of 16-bit cluster identifiers for server clusters'
+    )
+
+
+class DeviceIdentifiers(BaseModel):
+    __root__: List[int] = Field(
+        ...,
+        description='Device Identifiers associated with a generic zigbee fingerprint',
+        example=[257],
+    )
+
+
+class ChannelType(Enum):
+    DRIVER = 'DRIVER'
+
+
+class ChannelId(BaseModel):
+    __root__: UUID = Field(
+        ...,
+        description='The identifier of the Sprocket channel',
+        example='9314a926-528c-403f-ae56-4b0d059381dd',
+    )
+
+
+class DetailedChannel(BaseModel):
+    channelId: Optional[ChannelId] = None
+    name: Optional[str] = Field(None, description='Name of the channel')
+    description: Optional[str] = Field(None, description='Description of the channel')
+    type: Optional[ChannelType] = None
+    termsOfServiceUrl: Optional[str] = Field(
+        None,
+        description='URL for a developer-provided Terms of Service agreement for the channel',
+    )
+    createdDate: Optional[str] = Field(
+        None,
+        description='The ISO-8601 formatted timestamp when the channel was created',
+    )
+    lastModifiedDate: Optional[str] = Field(
+        None,
+        description='The ISO-8601 formatted timestamp when the channel was last modified',
+    )
+
+
+class PagedDetailedChannels(BaseModel):
+    items: List[DetailedChannel]
+    _links: Optional[Links] = None
+
+
+class PatchChannel(BaseModel):
+    name: Optional[str] = Field(None, description='Name of the channel')
+    description: Optional[str] = Field(None, description='Description of the channel')
+    termsOfServiceUrl: Optional[str] = Field(
+        None,
+        description='URL for a developer-provided Terms of Service agreement for the channel',
+    )
+
+
+class DriverRevision(BaseModel):
+    driverId: Optional[DriverId] = None
+    version: Optional[DriverVersion] = None
+
+
+class DriverChannel(BaseModel):
+    channelId: Optional[ChannelId] = None
+    driverId: Optional[DriverId] = None
+    version: Optional[DriverVersion] = None
+    createdDate: Optional[str] = Field(
+        None,
+        description='The ISO-8601 formatted timestamp when the channel was created',
+    )
+    lastModifiedDate: Optional[str] = Field(
+        None,
+        description='The ISO-8601 formatted timestamp when the channel was last modified',
+    )
+
+
+class PagedDriverChannels(BaseModel):
+    items: List[DriverChannel]
+    _links: Optional[Links] = None
+
+
+class UpdateDriverChannel(BaseModel):
+    version: Optional[DriverVersion] = None
+
+
+class DriverPermission(BaseModel):
+    name: str = Field(..., description='Name of the permission')
+    attributes: PermissionAttributes
+
+
+class ZWaveManufacturerFingerprint(BaseModel):
+    manufacturerId: Optional[ZWaveManufacturerId] = None
+    productId: Optional[ZWaveProductId] = None
+    productType: ZWaveProductType
+    deviceIntegrationProfileKey: Optional[DeviceIntegrationProfileKey] = None
+
+
+class ZWaveGenericFingerprint(BaseModel):
+    genericType: Optional[ZWaveGenericType] = None
+    specificType: Optional[List[ZWaveSpecificType]] = Field(
+        None, description='List of reported command classes'
+    )
+    commandClasses: Optional[CommandClasses] = Field(
+        None, description='List of CommandClasses to match on'
+    )
+    deviceIntegrationProfileKey: Optional[DeviceIntegrationProfileKey] = None
+
+
+class Clusters(BaseModel):
+    client: Optional[ClientClusters] = None
+    server: Optional[ServerClusters] = None
+
+
+class BasicChannel(BaseModel):
+    name: Optional[str] = Field(None, description='Name of the channel')
+    description: Optional[str] = Field(None, description='Description of the channel')
+    type: Optional[ChannelType] = None
+    termsOfServiceUrl: Optional[str] = Field(
+        None,
+        description='URL for a developer-provided Terms of Service agreement for the channel',
+    )
+
+
+class DriverPermissions(BaseModel):
+    __root__: List[DriverPermission] = Field(..., max_items=100, min_items=0)
+
+
+class ZigbeeGenericFingerprint(BaseModel):
+    clusters: Optional[Clusters] = None
+    deviceIdentifiers: Optional[DeviceIdentifiers] = None
+    zigbeeProfiles: Optional[ZigbeeProfiles] = None
+    deviceIntegrationProfileKey: Optional[DeviceIntegrationProfileKey] = None
+
+
+class PagedDriver(BaseModel):
+    driverId: DriverId
+    name: DriverName
+    packageKey: PackageKey
+    deviceIntegrationProfiles: Optional[List[DeviceIntegrationProfileKey]] = Field(
+        None, max_items=100, min_items=0
+    )
+    permissions: Optional[DriverPermissions] = None
+    version: Optional[DriverVersion] = None
+
+
+class DriverFingerprint(BaseModel):
+    id: FingerprintId
+    type: FingerprintType
+    deviceLabel: Optional[FingerprintDeviceLabel] = None
+    zigbeeGeneric: Optional[ZigbeeGenericFingerprint] = None
+    zigbeeManfacturer: Optional[ZigbeeManufacturerFingerprint] = None
+    zwaveManufacturer: Optional[ZWaveManufacturerFingerprint] = None
+    zwaveGeneric: Optional[ZWaveGenericFingerprint] = None
+
+
+class PagedDrivers(BaseModel):
+    items: List[PagedDriver]
+    _links: Links
+
+
+class Driver(PagedDriver):
+    fingerprints: Optional[List[DriverFingerprint]] = Field(
+        None, max_items=100, min_items=0
+    )
+    permissions: Optional[List[DriverPermission]] = Field(
+        None, max_items=100, min_items=0
+    )
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    ValueType1,
+)
+
+
+class EventType(Enum):
+    DEVICE_COMMANDS_EVENT = 'DEVICE_COMMANDS_EVENT'
+    DEVICE_EVENT = 'DEVICE_EVENT'
+    DEVICE_HEALTH_EVENT = 'DEVICE_HEALTH_EVENT'
+    DEVICE_LIFECYCLE_EVENT = 'DEVICE_LIFECYCLE_EVENT'
+    HUB_HEALTH_EVENT = 'HUB_HEALTH_EVENT'
+    MODE_EVENT = 'MODE_EVENT'
+    SCENE_LIFECYCLE_EVENT = 'SCENE_LIFECYCLE_EVENT'
+    SECURITY_ARM_STATE_EVENT = 'SECURITY_ARM_STATE_EVENT'
+    TIMER_EVENT = 'TIMER_EVENT'
+    INSTALLED_APP_LIFECYCLE_EVENT = 'INSTALLED_APP_LIFECYCLE_EVENT'
+    WEATHER_EVENT = 'WEATHER_EVENT'
+
+
+class EventOwnerType(Enum):
+    LOCATION = 'LOCATION'
+    USER = 'USER'
+
+
+class DeviceEvent(BaseModel):
+    eventId: Optional[str] = Field(
+        None,
+        description='The ID of the event.',
+        example='736e3903-001c-4d40-b408-ff40d162a06b',
+    )
+    locationId: Optional[str] = Field(
+        None,
+        description='The id of the location in which the event was triggered.\n\nThis field is not used or populated for user-level events.\n\nLocation id may also be sent in `ownerId` with `ownerType` = `LOCATION`.\n',
+        example='499e28ba-b33b-49c9-a5a1-cce40e41f8a6',
+    )
+    ownerId: Optional[str] = Field(
+        None,
+        description='ID for what owns the device event. Works in tandem with `ownerType` as a composite identifier.',
+    )
+    ownerType: Optional[EventOwnerType] = None
+    deviceId: Optional[str] = Field(
+        None,
+        description='The ID of the device associated with the DEVICE_EVENT.',
+        example='6f5ea629-4c05-4a90-a244-cc129b0a80c3',
+    )
+    componentId: Optional[str] = Field(
+        None,
+        description='The name of the component on the device that the event is associated with.',
+        example='main',
+    )
+    capability: Optional[str] = Field(
+        None,
+        description='The name of the capability associated with the DEVICE_EVENT.',
+        example='motionSensor',
+    )
+    attribute: Optional[str] = Field(
+        None,
+        description='The name of the DEVICE_EVENT. This typically corresponds to an attribute name of the device-handler’s capabilities.',
+        example='motion',
+    )
+    value: Optional[str] = Field(
+        None,
+        description="The value of the event. The type of the value is dependent on the capability's attribute type.\n",
+        example='active',
+    )
+    valueType: Optional[str] = Field(
+        None,
+        description='The root level data type of the value field. The data types are representitive of standard JSON data types.\n',
+        example='number',
+    )
+    unit: Optional[str] = Field(
+        None, description='Unit of the value field.', example='°C'
+    )
+    stateChange: Optional[bool] = Field(
+        None,
+        description='Whether or not the state of the device has changed as a result of the DEVICE_EVENT.',
+    )
+    data: Optional[Dict[str, Any]] = Field(
+        None, description='json map as defined by capability data schema'
+    )
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='The name of subscription that caused delivery.',
+        example='motion_sensors',
+    )
+
+
+class ModeEvent(BaseModel):
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    locationId: Optional[str] = Field(
+        None, description='The id of the location in which the event was triggered.'
+    )
+    modeId: Optional[str] = Field(
+        None, description='The ID of the mode associated with a MODE_EVENT.'
+    )
+
+
+class TimerType(Enum):
+    CRON = 'CRON'
+    ONCE = 'ONCE'
+
+
+class DeviceCommandsEventCommand(BaseModel):
+    componentId: Optional[str] = Field(None, example='main')
+    capability: Optional[str] = Field(None, example='switch')
+    command: Optional[str] = Field(None, example='on')
+    arguments: Optional[List[Dict[str, Any]]] = Field(None, example=[])
+
+
+class ArmState1(Enum):
+    UNKNOWN = 'UNKNOWN'
+    ARMED_STAY = 'ARMED_STAY'
+    ARMED_AWAY = 'ARMED_AWAY'
+    DISARMED = 'DISARMED'
+
+
+class Status5(Enum):
+    OFFLINE = 'OFFLINE'
+    ONLINE = 'ONLINE'
+    UNHEALTHY = 'UNHEALTHY'
+
+
+class Reason(Enum):
+    NONE = 'NONE'
+    SERVICE_UNAVAILABLE = 'SERVICE_UNAVAILABLE'
+    HUB_OFFLINE = 'HUB_OFFLINE'
+    ZWAVE_OFFLINE = 'ZWAVE_OFFLINE'
+    ZIGBEE_OFFLINE = 'ZIGBEE_OFFLINE'
+    BLUETOOTH_OFFLINE = 'BLUETOOTH_OFFLINE'
+    HUB_DISCONNECTED = 'HUB_DISCONNECTED'
+
+
+class Status6(Enum):
+    OFFLINE = 'OFFLINE'
+    ONLINE = 'ONLINE'
+    ZWAVE_OFFLINE = 'ZWAVE_OFFLINE'
+    ZWAVE_ONLINE = 'ZWAVE_ONLINE'
+    ZIGBEE_OFFLINE = 'ZIGBEE_OFFLINE'
+    ZIGBEE_ONLINE = 'ZIGBEE_ONLINE'
+    BLUETOOTH_OFFLINE = 'BLUETOOTH_OFFLINE'
+    BLUETOOTH_ONLINE = 'BLUETOOTH_ONLINE'
+
+
+class Reason1(Enum):
+    NONE = 'NONE'
+    DISCONNECTED = 'DISCONNECTED'
+    INACTIVE = 'INACTIVE'
+
+
+class HubHealthEvent(BaseModel):
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    locationId: Optional[str] = Field(
+        None, description='The id of the location in which the event was triggered.'
+    )
+    hubId: Optional[str] = Field(None, description='The id of the hub.')
+    status: Optional[Status6] = Field(None, description='The status of the hub.\n')
+    reason: Optional[Reason1] = Field(
+        None, description='The reason the hub is offline.\n'
+    )
+
+
+class DeviceLifecycle(Enum):
+    CREATE = 'CREATE'
+    DELETE = 'DELETE'
+    UPDATE = 'UPDATE'
+    MOVE_FROM = 'MOVE_FROM'
+    MOVE_TO = 'MOVE_TO'
+    ROOM_MOVE = 'ROOM_MOVE'
+
+
+class Category(BaseModel):
+    name: Optional[str] = None
+
+
+class DeviceLifecycleCreate(BaseModel):
+    presentationId: Optional[str] = None
+    manufacturerName: Optional[str] = None
+    categories: Optional[List[Category]] = None
+    parentDeviceId: Optional[str] = None
+    hubId: Optional[str] = None
+
+
+class DeviceLifecycleDelete(BaseModel):
+    pass
+
+
+class LabelDiff(BaseModel):
+    old: Optional[str] = None
+    new: Optional[str] = None
+
+
+class Category1(BaseModel):
+    name: Optional[str] = None
+
+
+class Capability2(BaseModel):
+    id: Optional[str] = None
+    version: Optional[int] = None
+
+
+class Old(BaseModel):
+    id: Optional[str] = None
+    label: Optional[str] = None
+    categories: Optional[List[Category1]] = None
+    capabilities: Optional[List[Capability2]] = None
+
+
+class Category2(BaseModel):
+    name: Optional[str] = None
+
+
+class Capability3(BaseModel):
+    id: Optional[str] = None
+    version: Optional[int] = None
+
+
+class New(BaseModel):
+    id: Optional[str] = None
+    label: Optional[str] = None
+    categories: Optional[List[Category2]] = None
+    capabilities: Optional[List[Capability3]] = None
+
+
+class ComponentDiff(BaseModel):
+    old: Optional[Old] = None
+    new: Optional[New] = None
+
+
+class DeviceLifecycleUpdate(BaseModel):
+    labelDiff: Optional[LabelDiff] = None
+    componentDiff: Optional[ComponentDiff] = None
+
+
+class DeviceLifecycleMove(BaseModel):
+    locationId: Optional[str] = None
+
+
+class DeviceLifecycleRoomMove(BaseModel):
+    roomIdFrom: Optional[str] = None
+    roomIdTo: Optional[str] = None
+
+
+class SimpleValue(BaseModel):
+    valueType: Optional[ValueType1] = Field(
+        None, description='The type of the value.\n'
+    )
+    intValue: Optional[int] = None
+    doubleValue: Optional[float] = None
+    stringValue: Optional[str] = None
+    boolValue: Optional[bool] = None
+
+
+class SceneLifecycle(Enum):
+    CREATE = 'CREATE'
+    UPDATE = 'UPDATE'
+    DELETE = 'DELETE'
+    CREATEFORBIXBY = 'CREATEFORBIXBY'
+    UPDATEFORBIXBY = 'UPDATEFORBIXBY'
+    DELETEFORBIXBY = 'DELETEFORBIXBY'
+
+
+class SceneLifecycleCreate(BaseModel):
+    pass
+
+
+class SceneLifecycleUpdate(BaseModel):
+    pass
+
+
+class SceneLifecycleDelete(BaseModel):
+    pass
+
+
+class SceneLifecycleCreateForBixby(BaseModel):
+    pass
+
+
+class SceneLifecycleUpdateForBixby(BaseModel):
+    pass
+
+
+class SceneLifecycleDeleteForBixby(BaseModel):
+    pass
+
+
+class InstalledAppLifecycle(Enum):
+    CREATE = 'CREATE'
+    INSTALL = 'INSTALL'
+    UPDATE = 'UPDATE'
+    DELETE = 'DELETE'
+    OTHER = 'OTHER'
+
+
+class InstalledAppLifecycleCreate(BaseModel):
+    pass
+
+
+class InstalledAppLifecycleUpdate(BaseModel):
+    pass
+
+
+class InstalledAppLifecycleDelete(BaseModel):
+    pass
+
+
+class InstalledAppLifecycleInstall(BaseModel):
+    pass
+
+
+class InstalledAppLifecycleOther(BaseModel):
+    pass
+
+
+class InstalledAppLifecycleError(BaseModel):
+    code: Optional[str] = None
+    message: Optional[str] = None
+    target: Optional[str] = None
+    details: Optional[List[InstalledAppLifecycleError]] = None
+
+
+class DeviceEventSource(Enum):
+    OCFDEVICE = 'OCFDEVICE'
+    HUBDEVICE = 'HUBDEVICE'
+    HUB = 'HUB'
+    CLOUD = 'CLOUD'
+
+
+class TimerEvent(BaseModel):
+    eventId: Optional[str] = Field(None, description='The ID of the event.')
+    name: Optional[str] = Field(
+        None,
+        description='The name of the schedule that caused this event.',
+        example='lights_off_timeout',
+    )
+    type: Optional[TimerType] = None
+    time: Optional[datetime] = Field(
+        None,
+        description='The IS0-8601 date time strings in UTC that this event was scheduled for.',
+        example='2017-08-04T12:44:18Z',
+    )
+    expression: Optional[str] = Field(
+        None, description='The CRON expression if the schedule was of type CRON.'
+    )
+
+
+class DeviceCommandsEvent(BaseModel):
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    deviceId: Optional[str] = Field(
+        None, description='The guid of the device that the commands are for.'
+    )
+    profileId: Optional[str] = Field(
+        None, description='The device profile ID of the device instance.'
+    )
+    externalId: Optional[str] = Field(
+        None, description='The external ID that was set during install of a device.'
+    )
+    commands: Optional[List[DeviceCommandsEventCommand]] = None
+
+
+class DeviceLifecycleEvent(BaseModel):
+    lifecycle: Optional[DeviceLifecycle] = None
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    locationId: Optional[str] = Field(
+        None,
+        description='The id of the location in which the event was triggered.\n\nThis field is not used or populated for user-level events.\n\nLocation id may also be sent in `ownerId` with `ownerType` = `LOCATION`.\n',
+    )
+    ownerId: Optional[str] = Field(
+        None,
+        description='ID for what owns the device lifecyle event. Works in tandem with `ownerType` as a composite identifier.',
+    )
+    ownerType: Optional[EventOwnerType] = None
+    deviceId: Optional[str] = Field(None, description='The id of the device.')
+    deviceName: Optional[str] = Field(None, description='The name of the device')
+    principal: Optional[str] = Field(
+        None, description='The principal that made the change'
+    )
+    create: Optional[DeviceLifecycleCreate] = None
+    delete: Optional[DeviceLifecycleDelete] = None
+    update: Optional[DeviceLifecycleUpdate] = None
+    moveFrom: Optional[DeviceLifecycleMove] = None
+    moveTo: Optional[DeviceLifecycleMove] = None
+    roomMove: Optional[DeviceLifecycleRoomMove] = None
+
+
+class SecurityArmStateEvent(BaseModel):
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    locationId: Optional[str] = Field(
+        None, description='The id of the location in which the event was triggered.'
+    )
+    armState: Optional[ArmState1] = Field(
+        None, description='The arm state of a security system.\n'
+    )
+    optionalArguments: Optional[Dict[str, SimpleValue]] = Field(
+        None,
+        description='A set of key / value pairs useful for passing any optional arguments.\n',
+    )
+
+
+class DeviceHealthEvent(BaseModel):
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    locationId: Optional[str] = Field(
+        None,
+        description='The id of the location in which the event was triggered.\n\nThis field is not used or populated for user-level events.\n\nLocation id may also be sent in `ownerId` with `ownerType` = `LOCATION`.\n',
+    )
+    ownerId: Optional[str] = Field(
+        None,
+        description='ID for what owns the device health event. Works in tandem with `ownerType` as a composite identifier.',
+    )
+    ownerType: Optional[EventOwnerType] = None
+    deviceId: Optional[str] = Field(None, description='The id of the device.')
+    hubId: Optional[str] = Field(None, description='The id of the hub.')
+    status: Optional[Status5] = Field(None, description='The status of the device.\n')
+    reason: Optional[Reason] = Field(
+        None, description='The reason the device is offline.\n'
+    )
+    eventSource: Optional[DeviceEventSource] = None
+
+
+class SceneLifecycleEvent(BaseModel):
+    lifecycle: Optional[SceneLifecycle] = None
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    locationId: Optional[str] = Field(
+        None, description='The id of the location in which the event was triggered.'
+    )
+    sceneId: Optional[str] = Field(None, description='The id of the scene.')
+    version: Optional[str] = Field(None, description='The version of the scene.')
+    migrateUuid: Optional[str] = Field(None, description='The migration owner uuid')
+    create: Optional[SceneLifecycleCreate] = None
+    update: Optional[SceneLifecycleUpdate] = None
+    delete: Optional[SceneLifecycleDelete] = None
+    createForBixby: Optional[SceneLifecycleCreateForBixby] = None
+    updateForBixby: Optional[SceneLifecycleUpdateForBixby] = None
+    deleteForBixby: Optional[SceneLifecycleDeleteForBixby] = None
+
+
+class InstalledAppLifecycleEvent(BaseModel):
+    eventId: Optional[str] = Field(None, description='The id of the event.')
+    locationId: Optional[str] = Field(
+        None,
+        description='The ID of the location in which the event was triggered.',
+        example='499e28ba-b33b-49c9-a5a1-cce40e41f8a6',
+    )
+    installedAppId: Optional[str] = Field(
+        None,
+        description='The ID of the installed application.',
+        example='6f5ea629-4c05-4a90-a244-cc129b0a80c3',
+    )
+    appId: Optional[str] = Field(None, description='The ID of the application.')
+    lifecycle: Optional[InstalledAppLifecycle] = None
+    create: Optional[InstalledAppLifecycleCreate] = None
+    install: Optional[InstalledAppLifecycleInstall] = None
+    update: Optional[InstalledAppLifecycleUpdate] = None
+    delete: Optional[InstalledAppLifecycleDelete] = None
+    other: Optional[InstalledAppLifecycleOther] = None
+    error: Optional[InstalledAppLifecycleError] = None
+
+
+InstalledAppLifecycleError.update_forward_refs()
@@ -0,0 +1,592 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    Links,
+    Owner,
+)
+
+from smartapp.api.models.smartthings.capabilities import (
+    CapabilitySubscriptionDetail,
+)
+
+
+class SmartAppEventRequest(BaseModel):
+    name: Optional[str] = Field(
+        None,
+        description='An arbitrary name for the custom SmartApp event.  Typically useful as a hook for in-app routing.',
+    )
+    attributes: Optional[Dict[str, str]] = Field(
+        None,
+        description='An arbitrary set of key / value pairs useful for passing any custom metadata.\n\n* Supports a maximum of 10 entries.\n* Maximum key length: 36 Unicode characters in UTF-8\n* Maximum value length: 256 Unicode characters in UTF-8\n* Allowed characters for *keys* are letters, plus the following special characters: `:`, `_`\n* Allowed characters for *values* are letters, whitespace, and numbers, plus the following special characters: `+`, `-`, `=`, `.`, `_`, `:`, `/`\n* If you need characters outside this allowed set, you can apply standard base-64 encoding.\n',
+    )
+
+
+class DashboardCardLifecycle(Enum):
+    UPDATE = 'UPDATE'
+    DELETE = 'DELETE'
+
+
+class Ui(BaseModel):
+    pluginId: Optional[str] = None
+    pluginUri: Optional[AnyUrl] = None
+    dashboardCardsEnabled: bool
+    preInstallDashboardCardsEnabled: bool
+
+
+class IconImage(BaseModel):
+    url: Optional[AnyUrl] = Field(
+        None, description='A default icon image url for an app. https url required.\n'
+    )
+
+
+class Classification(Enum):
+    AUTOMATION = 'AUTOMATION'
+    SERVICE = 'SERVICE'
+    DEVICE = 'DEVICE'
+    CONNECTED_SERVICE = 'CONNECTED_SERVICE'
+    HIDDEN = 'HIDDEN'
+    LABS = 'LABS'
+
+
+class PrincipalType(Enum):
+    LOCATION = 'LOCATION'
+    USER_LEVEL = 'USER_LEVEL'
+
+
+class StringConfig(BaseModel):
+    value: Optional[constr(max_length=2048)] = Field(None, description='A config value')
+
+
+class DeviceConfig(BaseModel):
+    deviceId: Optional[str] = Field(None, description='The ID of the device.')
+    componentId: Optional[str] = Field(
+        None, description='The component ID on the device.'
+    )
+    permissions: Optional[List[str]] = Field(None, max_items=25)
+
+
+class PermissionConfig(BaseModel):
+    permissions: Optional[List[str]] = Field(None, max_items=25, min_items=1)
+
+
+class ModeConfig(BaseModel):
+    modeId: Optional[str] = Field(None, description='The ID of the mode.')
+
+
+class SceneConfig(BaseModel):
+    sceneId: Optional[str] = Field(None, description='The ID of the scene.')
+    permissions: Optional[List[str]] = Field(None, max_items=25)
+
+
+class MessageConfig(BaseModel):
+    messageGroupKey: Optional[str] = Field(
+        None, description='The key value of the message group.'
+    )
+
+
+class ValueType(Enum):
+    STRING = 'STRING'
+    DEVICE = 'DEVICE'
+    PERMISSION = 'PERMISSION'
+    MODE = 'MODE'
+    SCENE = 'SCENE'
+    MESSAGE = 'MESSAGE'
+    ENUM = 'ENUM'
+
+
+class ConfigEntry(BaseModel):
+    valueType: Optional[ValueType] = Field(None, description='The value type.')
+    stringConfig: Optional[StringConfig] = Field(
+        None, description='The config if valueType is STRING, meaningless otherwise'
+    )
+    deviceConfig: Optional[DeviceConfig] = Field(
+        None, description='The config if valueType is DEVICE, meaningless otherwise'
+    )
+    permissionConfig: Optional[PermissionConfig] = Field(
+        None, description='The config if valueType is PERMISSION, meaningless otherwise'
+    )
+    modeConfig: Optional[ModeConfig] = Field(
+        None, description='The config if valueType is MODE, meaningless otherwise'
+    )
+    sceneConfig: Optional[SceneConfig] = Field(
+        None, description='The config if valueType is SCENE, meaningless otherwise'
+    )
+    messageConfig: Optional[MessageConfig] = Field(
+        None, description='The config if valueType is MESSAGE, meaningless otherwise'
+    )
+
+
+class ConfigEntries(BaseModel):
+    __root__: List[ConfigEntry] = Field(
+        ..., description='A list of available configuration values.'
+    )
+
+
+class ConfigMap(BaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class InstalledAppType(Enum):
+    LAMBDA_SMART_APP = 'LAMBDA_SMART_APP'
+    WEBHOOK_SMART_APP = 'WEBHOOK_SMART_APP'
+
+
+class InstallConfigurationStatus(Enum):
+    STAGED = 'STAGED'
+    DONE = 'DONE'
+    AUTHORIZED = 'AUTHORIZED'
+    REVOKED = 'REVOKED'
+
+
+class InstalledAppStatus(Enum):
+    PENDING = 'PENDING'
+    AUTHORIZED = 'AUTHORIZED'
+    REVOKED = 'REVOKED'
+    DISABLED = 'DISABLED'
+
+
+class DeleteInstalledAppResponse(BaseModel):
+    count: Optional[int] = None
+
+
+class CreateInstalledAppEventsResponse(BaseModel):
+    pass
+
+
+class NoticeCode(Enum):
+    USER_PAUSE = 'USER_PAUSE'
+    REVISIT = 'REVISIT'
+    RECONFIGURE = 'RECONFIGURE'
+
+
+class NoticeAction(Enum):
+    DISMISS = 'DISMISS'
+    EDIT = 'EDIT'
+    NONE = 'NONE'
+
+
+class OnceSchedule(BaseModel):
+    time: int = Field(
+        ...,
+        description='The time in millis from jan 1 1970 UTC for ONCE schedules. Must be less than 2 years from now.',
+    )
+    overwrite: Optional[bool] = None
+
+
+class CronSchedule(BaseModel):
+    expression: constr(max_length=256) = Field(
+        ...,
+        description='The cron expression for the schedule for CRON schedules.\nThe format matches that specified by the [Quartz scheduler](http://www.quartz-scheduler.org/documentation/quartz-2.x/tutorials/crontrigger.html) but should not include the seconds (1st)\nfield. The exact second will be chosen at random but will remain consistent. The years part must be les than 2 years from now.\n',
+        example='15 10 * * ? *',
+    )
+    timezone: str = Field(
+        ..., description='The timezone id for CRON schedules.', example='GMT'
+    )
+
+
+class ScheduleRequest(BaseModel):
+    once: Optional[OnceSchedule] = None
+    name: constr(min_length=1, max_length=36) = Field(
+        ...,
+        description='The unique per installed app name of the schedule.',
+        example='on_schedule-1',
+    )
+    cron: Optional[CronSchedule] = None
+
+
+class Schedule(BaseModel):
+    installedAppId: Optional[UUID] = Field(
+        None,
+        description='The ID of the installed app.',
+        example='736e3903-001c-4d40-b408-ff40d162a06b',
+    )
+    locationId: Optional[UUID] = Field(
+        None,
+        description='The ID of the location the installed app is in.',
+        example='35451c7a-cc23-4838-8a3b-1205090cf161',
+    )
+    userUuid: Optional[UUID] = Field(
+        None,
+        description='The UUID of the user who created the schedule.',
+        example='27843aec-56a1-4b91-83b6-7957d26a3f7d',
+    )
+    scheduledExecutions: Optional[List[int]] = Field(
+        None,
+        description='list of scheduled execution times in millis from jan 1 1970 UTC',
+    )
+    name: constr(min_length=1, max_length=36) = Field(
+        ...,
+        description='The unique per installed app name of the schedule.',
+        example='on_schedule-1',
+    )
+    cron: Optional[CronSchedule] = None
+
+
+class PagedSchedules(BaseModel):
+    items: Optional[List[Schedule]] = None
+    _links: Optional[Links] = None
+
+
+class DeleteScheduleResponse(BaseModel):
+    pass
+
+
+class SubscriptionSource(Enum):
+    DEVICE = 'DEVICE'
+    CAPABILITY = 'CAPABILITY'
+    MODE = 'MODE'
+    DEVICE_LIFECYCLE = 'DEVICE_LIFECYCLE'
+    DEVICE_HEALTH = 'DEVICE_HEALTH'
+    SECURITY_ARM_STATE = 'SECURITY_ARM_STATE'
+    HUB_HEALTH = 'HUB_HEALTH'
+    SCENE_LIFECYCLE = 'SCENE_LIFECYCLE'
+
+
+class DeviceSubscriptionDetail(BaseModel):
+    deviceId: str = Field(
+        ...,
+        description='The GUID of the device that is subscribed to.',
+        example='35451c7a-cc23-4838-8a3b-1205090cf161',
+    )
+    componentId: Optional[str] = Field(
+        '*',
+        description='The component ID on the device that is subscribed to or * for all.',
+        example='main',
+    )
+    capability: Optional[constr(min_length=1, max_length=128)] = Field(
+        '*',
+        description='Name of the capability that is subscribed to or * for all.',
+        example='switch',
+    )
+    attribute: Optional[constr(min_length=1, max_length=256)] = Field(
+        '*',
+        description='Name of the capabilities attribute or * for all.',
+        example='switch',
+    )
+    value: Optional[str] = Field(
+        '*',
+        description='A particular value for the attribute that will trigger the subscription or * for all.',
+        example=['*', 1, 'on', {'key': 30}],
+    )
+    stateChangeOnly: Optional[bool] = Field(
+        None,
+        description='Only execute the subscription if the subscribed event is a state change from previous events.',
+    )
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='A name for the subscription that will be passed to the installed app. Must be unique per installed app.',
+    )
+    modes: Optional[List[str]] = Field(
+        None,
+        description="List of mode ID's that the subscription will execute for. If not provided then all modes will be supported.",
+    )
+
+
+class SubscriptionDelete(BaseModel):
+    count: Optional[int] = None
+
+
+class ModeSubscriptionDetail(BaseModel):
+    locationId: str = Field(
+        ...,
+        description='The GUID for the location to subscribe to mode changes.',
+        example='9f24edfd-f2e5-4a82-8a24-c1955ee46419',
+    )
+
+
+class DeviceLifecycleDetail(BaseModel):
+    deviceIds: Optional[List[str]] = Field(
+        None,
+        description='An array of GUIDs of devices being subscribed to. A max of 20 GUIDs are allowed.',
+        max_items=20,
+    )
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='A name for the subscription that will be passed to the installed app.',
+    )
+    locationId: Optional[str] = Field(
+        None,
+        description='The id of the location that both the app and source device are in.',
+    )
+
+
+class DeviceHealthDetail(BaseModel):
+    deviceIds: Optional[List[str]] = Field(
+        None,
+        description='An array of GUIDs of devices being subscribed to. A max of 20 GUIDs are allowed.',
+        max_items=20,
+    )
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='A name for the subscription that will be passed to the installed app.',
+    )
+    locationId: Optional[str] = Field(
+        None,
+        description='The id of the location that both the app and source device are in.',
+    )
+
+
+class SecurityArmStateDetail(BaseModel):
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='A name for the subscription that will be passed to the installed app.',
+    )
+    locationId: str = Field(
+        ...,
+        description='The id of the location that both the app and the security system are in.',
+    )
+
+
+class HubHealthDetail(BaseModel):
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='A name for the subscription that will be passed to the installed app.',
+    )
+    locationId: str = Field(
+        ..., description='The id of the location that both the app and hubs are in'
+    )
+
+
+class SceneLifecycleDetail(BaseModel):
+    subscriptionName: Optional[str] = Field(
+        None,
+        description='A name for the subscription that will be passed to the installed app.',
+    )
+    locationId: str = Field(
+        ..., description='The id of the location that both the app and scenes are in.'
+    )
+
+
+class SubscriptionId(BaseModel):
+    __root__: UUID = Field(..., description='The subscription id of the subscription.')
+
+
+class SubscriptionFilterTypes(Enum):
+    LOCATIONIDS = 'LOCATIONIDS'
+    DEVICEIDS = 'DEVICEIDS'
+    INSTALLEDSMARTAPPIDS = 'INSTALLEDSMARTAPPIDS'
+    SMARTAPPIDS = 'SMARTAPPIDS'
+
+
+class SubscriptionFilterValues(BaseModel):
+    __root__: List[str] = Field(
+        ..., description='An array of subscription filter values.'
+    )
+
+
+class SubscriptionFilterEventTypes(BaseModel):
+    __root__: List[str]
+
+
+class SubscriptionFilterAttributes(BaseModel):
+    __root__: List[str]
+
+
+class SubscriptionFilterCapabilities(BaseModel):
+    __root__: List[str]
+
+
+class SubscriptionFilterComponents(BaseModel):
+    __root__: List[str]
+
+
+class SubscriptionTargetValue(BaseModel):
+    __root__: AnyUrl = Field(..., description='The address to send events to.')
+
+
+class SmartAppDashboardCardEventRequest(BaseModel):
+    cardId: Optional[str] = Field(
+        None,
+        description='A developer defined dashboard card ID.',
+        example='my_dashboard_card',
+    )
+    lifecycle: Optional[DashboardCardLifecycle] = None
+
+
+class InstallConfiguration(BaseModel):
+    installedAppId: Optional[UUID] = Field(
+        None, description='The ID of the installed app.'
+    )
+    configurationId: Optional[UUID] = Field(
+        None, description='The ID to this configration instance.'
+    )
+    configurationStatus: Optional[InstallConfigurationStatus] = None
+    createdDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+    lastUpdatedDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+
+
+class InstallConfigurationDetail(BaseModel):
+    installedAppId: Optional[UUID] = Field(
+        None, description='The ID of the installed app.'
+    )
+    configurationId: Optional[UUID] = Field(
+        None, description='The ID to this configration instance.'
+    )
+    configurationStatus: Optional[InstallConfigurationStatus] = None
+    config: Optional[ConfigMap] = None
+    createdDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+    lastUpdatedDate: Optional[datetime] = Field(
+        None, description='A UTC ISO-8601 Date-Time String'
+    )
+
+
+class PagedInstallConfigurations(BaseModel):
+    items: Optional[List[InstallConfiguration]] = None
+    _links: Optional[Links] = None
+
+
+class CreateInstalledAppEventsRequest(BaseModel):
+    smartAppEvents: Optional[List[SmartAppEventRequest]] = Field(
+        None,
+        description='An array of smartapp events used to trigger client behavior in loaded web plugin detail pages.  Events will\nbe delivered to JavaScript event handler of all active client processes related to parameterized installed app.\n',
+        max_items=8,
+        min_items=1,
+    )
+    smartAppDashboardCardEvents: Optional[
+        List[SmartAppDashboardCardEventRequest]
+    ] = Field(
+        None,
+        description='An array of smartapp dashboard card events used to trigger client behavior for dashboard cards.\nDashboard card events are directives to a SmartThings client to take actions in relation to lifecycle changes\nto a specific dashboard card.  These events are not delivered to the web plugin event handler.\n',
+        max_items=8,
+        min_items=1,
+    )
+
+
+class Notice(BaseModel):
+    code: Optional[NoticeCode] = None
+    badgeUrl: Optional[str] = Field(
+        None, description='The url of the badge icon for the notice card'
+    )
+    message: Optional[str] = Field(
+        None, description='The localized message to be displayed'
+    )
+    actions: Optional[List[NoticeAction]] = Field(
+        None, description='The action(s) a user can take to resolve this notice'
+    )
+
+
+class Subscription(BaseModel):
+    id: Optional[str] = Field(
+        None,
+        description='The id of the subscription.',
+        example='736e3903-001c-4d40-b408-ff40d162a06b',
+    )
+    installedAppId: Optional[str] = Field(
+        None,
+        description='The id of the subscribing app.',
+        example='499e28ba-b33b-49c9-a5a1-cce40e41f8a6',
+    )
+    sourceType: Optional[SubscriptionSource] = None
+    device: Optional[DeviceSubscriptionDetail] = None
+    capability: Optional[CapabilitySubscriptionDetail] = None
+    mode: Optional[ModeSubscriptionDetail] = None
+    deviceLifecycle: Optional[DeviceLifecycleDetail] = None
+    deviceHealth: Optional[DeviceHealthDetail] = None
+    securityArmState: Optional[SecurityArmStateDetail] = None
+    hubHealth: Optional[HubHealthDetail] = None
+    sceneLifecycle: Optional[SceneLifecycleDetail] = None
+
+
+class SubscriptionRequest(BaseModel):
+    sourceType: str
+    device: Optional[DeviceSubscriptionDetail] = None
+    capability: Optional[CapabilitySubscriptionDetail] = None
+    mode: Optional[ModeSubscriptionDetail] = None
+    deviceLifecycle: Optional[DeviceLifecycleDetail] = None
+    deviceHealth: Optional[DeviceHealthDetail] = None
+    securityArmState: Optional[SecurityArmStateDetail] = None
+    hubHealth: Optional[HubHealthDetail] = None
+    sceneLifecycle: Optional[SceneLifecycleDetail] = None
+
+
+class PagedSubscriptions(BaseModel):
+    items: Optional[List[Subscription]] = None
+    _links: Optional[Links] = None
+
+
+class SubscriptionFilter(BaseModel):
+    type: Optional[SubscriptionFilterTypes] = None
+    value: Optional[SubscriptionFilterValues] = None
+    eventType: Optional[SubscriptionFilterEventTypes] = None
+    attribute: Optional[SubscriptionFilterAttributes] = None
+    capability: Optional[SubscriptionFilterCapabilities] = None
+    component: Optional[SubscriptionFilterComponents] = None
+
+
+class SubscriptionTarget(BaseModel):
+    url: Optional[SubscriptionTargetValue] = None
+
+
+class InstalledApp(BaseModel):
+    installedAppId: UUID = Field(..., description='The ID of the installed app.')
+    installedAppType: InstalledAppType
+    installedAppStatus: InstalledAppStatus
+    displayName: Optional[constr(max_length=100)] = Field(
+        None, description='A user defined name for the installed app. May be null.'
+    )
+    appId: str = Field(..., description='The ID of the app.')
+    referenceId: Optional[str] = Field(
+        None,
+        description='A reference to an upstream system.  For example, Behaviors would reference the behaviorId. May be null.\n',
+    )
+    locationId: Optional[UUID] = Field(
+        None,
+        description='The ID of the location to which the installed app may belong.',
+    )
+    owner: Owner
+    notices: List[Notice]
+    createdDate: datetime = Field(..., description='A UTC ISO-8601 Date-Time String')
+    lastUpdatedDate: datetime = Field(
+        ..., description='A UTC ISO-8601 Date-Time String'
+    )
+    ui: Optional[Ui] = Field(
+        None,
+        description='A collection of settings to drive user interface in SmartThings clients.  Currently, only applicable for\nLAMBDA_SMART_APP and WEBHOOK_SMART_APP app types.\n',
+    )
+    iconImage: Optional[IconImage] = Field(
+        None,
+        description='A default icon image for the app.',
+        example={'url': 'https://smart-home-monitor.com/image'},
+    )
+    classifications: List[Classification] = Field(
+        ...,
+        description='An App maybe associated to many classifications.  A classification drives how the integration is presented\nto the user in the SmartThings mobile clients.  These classifications include:\n* AUTOMATION - Denotes an integration that should display under the "Automation" tab in mobile clients.\n* SERVICE - Denotes an integration that is classified as a "Service".\n* DEVICE - Denotes an integration that should display under the "Device" tab in mobile clients.\n* CONNECTED_SERVICE - Denotes an integration that should display under the "Connected Services" menu in mobile clients.\n* HIDDEN - Denotes an integration that should not display in mobile clients\n',
+    )
+    principalType: PrincipalType = Field(
+        ...,
+        description='Denotes the principal type to be used with the app.  Default is LOCATION.',
+    )
+    restrictionTier: Optional[int] = Field(
+        None, description='Restriction tier of the install, if any.'
+    )
+    singleInstance: bool = Field(
+        ...,
+        description="Inform the installation systems that the associated app can only be installed once within a user's account.\n",
+    )
+
+
+class PagedInstalledApps(BaseModel):
+    items: Optional[List[InstalledApp]] = None
+    _links: Optional[Links] = None
+
+
+class SubscriptionFilters(BaseModel):
+    __root__: List[SubscriptionFilter] = Field(
+        ..., description='An array of subscription filters'
+    )
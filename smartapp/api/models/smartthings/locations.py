@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    Links,
+)
+
+
+class HubId(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='The hub that the device is connected to.',
+        example='f7239728-edb3-48e9-b588-a27f30b968a0',
+    )
+
+
+class UpdateLocationRequest(BaseModel):
+    name: constr(min_length=1, max_length=40) = Field(
+        ..., description='A name for the Location.'
+    )
+    latitude: Optional[float] = Field(None, description='A geographical latitude.')
+    longitude: Optional[float] = Field(None, description='A geographical longitude.')
+    regionRadius: Optional[int] = Field(
+        None,
+        description='The radius in meters around latitude and longitude which defines this :ocation.',
+    )
+    temperatureScale: Optional[str] = Field(
+        None,
+        description='The desired temperature scale used for the Location. Values include F and C.',
+    )
+    locale: Optional[str] = Field(
+        None,
+        description='We expect a POSIX locale but we also accept an IETF BCP 47 language tag.',
+        example='en_US',
+    )
+    additionalProperties: Optional[Dict[str, str]] = Field(
+        None,
+        description='Additional information about the Location that allows SmartThings to further define your Location.',
+    )
+
+
+class DeleteLocationResponse(BaseModel):
+    pass
+
+
+class LocationParentTypes(Enum):
+    LOCATIONGROUP = 'LOCATIONGROUP'
+    ACCOUNT = 'ACCOUNT'
+
+
+class Room(BaseModel):
+    roomId: Optional[UUID] = Field(None, description='The ID of the room.')
+    locationId: Optional[UUID] = Field(
+        None, description='The ID of the parent Location.'
+    )
+    name: Optional[str] = Field(
+        None, description='A name for the room (e.g. Living Room)'
+    )
+    backgroundImage: Optional[str] = Field(None, description='Not currently in use.')
+    created: Optional[datetime] = Field(
+        None, description='The timestamp of when a room was created in UTC.'
+    )
+    lastModified: Optional[datetime] = Field(
+        None, description='The timestamp of when a room was last updated in UTC.'
+    )
+
+
+class CreateRoomRequest(BaseModel):
+    name: constr(min_length=1, max_length=40) = Field(
+        ..., description='A name for the room (e.g. Living Room)'
+    )
+
+
+class UpdateRoomRequest(BaseModel):
+    name: constr(min_length=1, max_length=40) = Field(
+        ..., description='A name for the room.'
+    )
+
+
+class DeleteRoomResponse(BaseModel):
+    pass
+
+
+class Mode(BaseModel):
+    id: str = Field(
+        ...,
+        description='Globally unique id for the mode.',
+        example='9206ea57-2e2e-414c-a792-9087117ca3d8',
+    )
+    label: constr(min_length=1, max_length=25) = Field(
+        ...,
+        description='A name provided by the User. Unique per Location, updatable.',
+        example='Our House',
+    )
+    name: str = Field(
+        ...,
+        description='A name provided when the mode was created. The name is unique per Location, and can not be updated.',
+        example='Home',
+    )
+
+
+class LocationParent(BaseModel):
+    type: Optional[LocationParentTypes] = None
+    id: Optional[constr(min_length=36, max_length=36)] = Field(
+        None, description='The ID of the parent'
+    )
+
+
+class PagedRooms(BaseModel):
+    items: Optional[List[Room]] = None
+    _links: Optional[Links] = None
+
+
+class PagedLocation(BaseModel):
+    locationId: Optional[UUID] = Field(None, description='The ID of the location.')
+    name: Optional[str] = Field(
+        None, description='A name given for the location (eg. Home)'
+    )
+    parent: Optional[LocationParent] = None
+
+
+class Location(BaseModel):
+    locationId: Optional[UUID] = Field(None, description='The ID of the location.')
+    name: Optional[str] = Field(
+        None, description='A name given for the location (eg. Home)'
+    )
+    countryCode: Optional[str] = Field(
+        None, description='An ISO Alpha-3 country code.  (i.e. GBR, USA)', example='USA'
+    )
+    latitude: Optional[float] = Field(None, description='A geographical latitude.')
+    longitude: Optional[float] = Field(None, description='A geographical longitude.')
+    regionRadius: Optional[int] = Field(
+        None,
+        description='The radius in meters around latitude and longitude which defines this location.',
+    )
+    temperatureScale: Optional[str] = Field(
+        None,
+        description='The desired temperature scale used within location. Value can be F or C.',
+    )
+    timeZoneId: Optional[str] = Field(
+        None,
+        description='An ID matching the Java Time Zone ID of the location. Automatically generated if latitude and longitude have been\nprovided.\n',
+    )
+    locale: Optional[str] = Field(
+        None,
+        description='We expect a POSIX locale but we also accept an IETF BCP 47 language tag.',
+        example='en_US',
+    )
+    backgroundImage: Optional[str] = Field(None, description='Not currently in use.')
+    additionalProperties: Optional[Dict[str, str]] = Field(
+        None,
+        description='Additional information about the location that allows SmartThings to further define your location.',
+    )
+    parent: Optional[LocationParent] = None
+    created: Optional[datetime] = Field(
+        None, description='The timestamp of when a location was created in UTC.'
+    )
+    lastModified: Optional[datetime] = Field(
+        None, description='The timestamp of when a location was last updated in UTC.'
+    )
+
+
+class CreateLocationRequest(BaseModel):
+    name: constr(min_length=1, max_length=40) = Field(
+        ..., description='A name given to the Location (e.g. Home)'
+    )
+    countryCode: str = Field(
+        ..., description='An ISO Alpha-3 country code (e.g. GBR, USA)'
+    )
+    latitude: Optional[float] = Field(None, description='A geographical latitude.')
+    longitude: Optional[float] = Field(None, description='A geographical longitude.')
+    regionRadius: Optional[int] = Field(
+        None,
+        description='The radius in meters around latitude and longitude which defines this Location.',
+    )
+    temperatureScale: Optional[str] = Field(
+        None,
+        description='The desired temperature scale used for the Location. Values include F and C.',
+    )
+    locale: Optional[str] = Field(
+        None,
+        description='We expect a POSIX locale but we also accept an IETF BCP 47 language tag.',
+        example='en_US',
+    )
+    additionalProperties: Optional[Dict[str, str]] = Field(
+        None,
+        description='Additional information about the Location that allows SmartThings to further define your Location.',
+    )
+    parent: Optional[LocationParent] = None
+
+
+class PagedLocations(BaseModel):
+    items: Optional[List[PagedLocation]] = None
+    _links: Optional[Links] = None
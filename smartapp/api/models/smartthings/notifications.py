@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    LocaleTag,
+)
+
+
+class DeliveryType(Enum):
+    EMAIL = 'EMAIL'
+    LOGINID = 'LOGINID'
+
+
+class AdhocMessageTemplate(BaseModel):
+    localeTag: LocaleTag
+    variables: Optional[Dict[str, str]] = Field(
+        None,
+        description='A map<string,string> with the key representing the variable name, and the value representing the verbiage\nto be replaced in template string.\n',
+    )
+    template: str = Field(
+        ...,
+        description='A message template string.  Specify variables using the double curly braces convention.\ni.e. "Hello, {{ firstName }}!"\n',
+    )
+
+
+class LocaleVariables(BaseModel):
+    localeTag: LocaleTag
+    variables: Optional[Dict[str, str]] = Field(
+        None,
+        description='A map<string,string> with the key representing the variable name, and the value representing the verbiage\nto be replaced in template string.\n',
+    )
+
+
+class MessageTemplate(BaseModel):
+    localeTag: LocaleTag
+    template: str = Field(
+        ...,
+        description='A message template string. Specify variables using the double curly braces convention.\ni.e. "Hello, {{ firstName }}!"\n',
+    )
+
+
+class MessageType(Enum):
+    PREDEFINED = 'PREDEFINED'
+    ADHOC = 'ADHOC'
+
+
+class PagedMessageTemplate(BaseModel):
+    appId: UUID = Field(..., description='A globally unique identifier for an app.')
+    messageTemplateKey: str
+
+
+class PredefinedMessage(BaseModel):
+    messageTemplateKey: str
+    defaultVariables: Optional[Dict[str, str]] = Field(
+        None,
+        description='A map<string,string> with the key representing the variable name, and the value representing the verbiage\nto be replaced in template string. `defaultVariables` are only used when there are no matching\n`localeVariables`.\n',
+    )
+    localeVariables: Optional[List[LocaleVariables]] = Field(
+        None, description='Variables to resolve for specific locales.\n'
+    )
+
+
+class Delivery(BaseModel):
+    deliveryType: Optional[DeliveryType] = None
+    deliveryTarget: Optional[str] = Field(
+        None, description='Target for the delivery type.'
+    )
+
+
+class AdhocMessage(BaseModel):
+    fallbackLocale: LocaleTag
+    defaultVariables: Optional[Dict[str, str]] = Field(
+        None,
+        description='A map<string,string> with the key representing the variable name, and the value representing the verbiage\nto be replaced in template string. `defaultVariables` will only be used if there are no matching locale-level\n(template) variables for that key.\n',
+    )
+    templates: List[AdhocMessageTemplate] = Field(
+        ...,
+        description='A list of templates representing the same message in different languages.',
+        max_items=35,
+        min_items=1,
+    )
+
+
+class Message(BaseModel):
+    fallbackLocale: LocaleTag
+    templates: List[MessageTemplate] = Field(
+        ...,
+        description='A list of templates representing the same message in different languages.',
+        max_items=35,
+        min_items=1,
+    )
+
+
+class DeliveryMethods(BaseModel):
+    __root__: List[Delivery]
+
+
+class NotificationType(Enum):
+    ALERT = 'ALERT'
+
+
+class NotificationRequest(BaseModel):
+    locationId: Optional[str] = None
+    type:       NotificationType
+    title:      str
+    message:    str
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.notifications import (
+    DeliveryMethods,
+)
+
+
+class EntityTypes(Enum):
+    LOCATION = 'LOCATION'
+
+
+class StatusTypes(Enum):
+    PENDING = 'PENDING'
+    ACCEPTED = 'ACCEPTED'
+    REJECTED = 'REJECTED'
+    EXPIRED = 'EXPIRED'
+
+
+class PrincipalType1(Enum):
+    RAW = 'RAW'
+
+
+class OrganizationMember(BaseModel):
+    principal: Optional[UUID] = Field(
+        None,
+        description='A raw user principal (user uuid).',
+        example='7b8514e6-230d-41cc-b3c2-512bca15abf0',
+    )
+    principalType: Optional[PrincipalType1] = Field('RAW', example='RAW')
+
+
+class Email(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='The E-mail address of the invited party.',
+        example='person@people.net',
+    )
+
+
+class Role(Enum):
+    ADMIN = 'ADMIN'
+    DEVELOPER = 'DEVELOPER'
+
+
+class Modification(Enum):
+    REMOVE = 'REMOVE'
+    CHANGE_ROLE = 'CHANGE_ROLE'
+
+
+class Label(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='A pretty name for a developer organization.',
+        example="Shoes n' Boots",
+    )
+
+
+class ManufacturerName(BaseModel):
+    __root__: str = Field(
+        ..., description='Manufacturer name for the organization.', example='ShoeBoots'
+    )
+
+
+class MnId(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='Legacy `mnId` (also `mnid`) field used by some Samsung services.',
+        example='ShoeBoots',
+    )
+
+
+class OrganizationName(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='A unique name for an organization. Alphanumeric names only (no spaces or special characters)\nmust start with a letter. This will be the "namespace" for the custom capabilities for this org.',
+        example='shoesNBoots1',
+    )
+
+
+class WarehouseGroupId(BaseModel):
+    __root__: UUID = Field(
+        ...,
+        description='The groupId that corresponds to this organization in warehouse.',
+        example='81bfb21a-8716-410b-b2c7-40c14f585b60',
+    )
+
+
+class OrganizationUpdateRequest(BaseModel):
+    label: Optional[Label] = None
+    warehouseGroupId: Optional[WarehouseGroupId] = None
+    mnId: Optional[MnId] = None
+
+
+class InviteRequestItem(BaseModel):
+    email: Email
+    role: Role
+
+
+class InviteResponseItem(InviteRequestItem):
+    status: int = Field(
+        ..., description='Status code for this invite entry.', example=200
+    )
+    info: str = Field(
+        ..., description='Information on the individual invitation.', example='Success'
+    )
+    inviteId: Optional[str] = Field(
+        None, description='Invite ID for sucessfully created invitations.'
+    )
+    acceptUrl: Optional[str] = Field(
+        None,
+        description='The URL the invitee can follow to accept a successful invitation (they must be logged in).',
+    )
+
+
+class OrganizationMemberRole(OrganizationMember):
+    role: Optional[Role] = None
+
+
+class ModifyMemberItem(BaseModel):
+    member: OrganizationMember
+    modification: Modification
+    role: Optional[Role] = None
+
+
+class OrganizationCreateRequest(OrganizationUpdateRequest):
+    manufacturerName: Optional[ManufacturerName] = None
+    name: OrganizationName
+
+
+class Invitation(BaseModel):
+    invitationId: Optional[UUID] = Field(None, description='The ID of the invitation.')
+    inviterUsername: Optional[str] = Field(
+        None, description='The username for the inviter.'
+    )
+    entityType: Optional[EntityTypes] = None
+    entityId: Optional[str] = Field(
+        None,
+        description='The identifier for the specific entity you are inviting access to.',
+    )
+    deliveryMethods: Optional[DeliveryMethods] = None
+    status: Optional[StatusTypes] = None
+    expiration: Optional[str] = Field(
+        None,
+        description='The IS0-8601 date time string in UTC for the expiration of an invitation.',
+        example='2018-02-14T12:44:18+00:00',
+    )
+
+
+class OrganizationResponse(OrganizationCreateRequest):
+    developerGroupId: Optional[str] = Field(
+        None, description='The user group for organization developers.'
+    )
+    adminGroupId: Optional[str] = Field(
+        None, description='The user group for organization admins.'
+    )
+    organizationId: UUID = Field(
+        ..., description='A generated UUID for an organization.'
+    )
+    isDefaultUserOrg: Optional[bool] = Field(
+        False,
+        description='Denotes whether this is the default user org for the caller.',
+    )
@@ -0,0 +1,1047 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    BaseCapabilityReference,
+)
+
+from smartapp.api.models.smartthings.rules import (
+    Alternatives,
+    ArgumentType,
+    AutomationAction,
+    AutomationCondition,
+    CapabilityKey,
+    EnumSliderForAutomationCondition,
+    IconUrl,
+    ListForAutomationAction,
+    ListForAutomationCondition,
+    MultiArgCommand,
+    NumberFieldForAutomationAction,
+    NumberFieldForAutomationCondition,
+    Range,
+    SliderBase,
+    SliderForAutomationAction,
+    SliderForAutomationCondition,
+    Step,
+    SupportedValues,
+    TextFieldForAutomationAction,
+    TextFieldForAutomationCondition,
+    UnitModel,
+    ValueModel,
+    ValueTypeModel,
+    Version,
+)
+
+
+class ComponentId(BaseModel):
+    component: Optional[str] = Field(
+        None,
+        description='Human readable identifier for a device component.',
+        example='main',
+    )
+
+
+class View(Enum):
+    DETAIL_VIEW = 'DETAIL_VIEW'
+    DASHBOARD = 'DASHBOARD'
+    AUTOMATION_ACTIONS = 'AUTOMATION_ACTIONS'
+    AUTOMATION_CONDITIONS = 'AUTOMATION_CONDITIONS'
+
+
+class DeviceConfigView(BaseModel):
+    view: Optional[View] = None
+
+
+class Type3(Enum):
+    dth = 'dth'
+    profile = 'profile'
+
+
+class DeviceConfigType(BaseModel):
+    type: Optional[Type3] = 'profile'
+
+
+class Type4(Enum):
+    dth = 'dth'
+    profile = 'profile'
+
+
+class PoCodes(BaseModel):
+    label: str
+    po: constr(regex=r'^___PO_CODE_[a-zA-Z0-9_]+$') = Field(
+        ..., description="Po code. Should begin with '___PO_CODE'"
+    )
+
+
+class Os(Enum):
+    android = 'android'
+    ios = 'ios'
+    tizen = 'tizen'
+    web = 'web'
+
+
+class DpInfoItem(BaseModel):
+    os: Os = Field(
+        ...,
+        description="The OS of the UI Client used to show the details page. 'iOS': iOS SmartThings 'android': Android SmartThings",
+    )
+    dpUri: str = Field(
+        ...,
+        description="This is linked to obtain the vendor-specific device details page. The device's dashboard card opens the detail view using this link when the user clicks the device card.",
+        example='plugin://example_detail_page_uri',
+    )
+    operatingMode: Optional[str] = Field(
+        None,
+        description='This describes operating mode after onboarding. `easySetup` will launch the plugin for setting up your device while `deviceControl` will launch the plugin for controlling the device directly after onboarding.',
+    )
+
+
+class DpInfo(BaseModel):
+    __root__: List[DpInfoItem] = Field(
+        ...,
+        description='Information used for obtaining details page plugins on different platforms. Array of Details page link objects.',
+    )
+
+
+class Operator(Enum):
+    CONTAINS = 'CONTAINS'
+    DOES_NOT_CONTAIN = 'DOES_NOT_CONTAIN'
+    EQUALS = 'EQUALS'
+    DOES_NOT_EQUAL = 'DOES_NOT_EQUAL'
+    GREATER_THAN = 'GREATER_THAN'
+    GREATER_THAN_OR_EQUALS = 'GREATER_THAN_OR_EQUALS'
+    LESS_THAN = 'LESS_THAN'
+    LESS_THAN_OR_EQUALS = 'LESS_THAN_OR_EQUALS'
+    ONE_OF = 'ONE_OF'
+
+
+class Mnmn(BaseModel):
+    __root__: str = Field(
+        ..., description='The name of the manufacturer', example='SmartThingsCommunity'
+    )
+
+
+class Vid(BaseModel):
+    __root__: str = Field(
+        ...,
+        description="A unique identifier for the presentation of a device. This can be a model number on legacy device integrations, but also may be a system generated UUID based on a device's structure and display configuration.",
+        example='MySmartDevice',
+    )
+
+
+class Component1(BaseModel):
+    __root__: str = Field(..., example='main')
+
+
+class FormattedLabel(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='This displays a string. This can be a formatted string with variables.\nExample: `{{attribute.value}} {{attribute.unit}}` (where `attribute` is the name of an attribute in your capability)\n',
+        example='{{temperatureMeasurement.value}}',
+    )
+
+
+class DisplayType(Enum):
+    pushButton = 'pushButton'
+    toggleSwitch = 'toggleSwitch'
+    switch = 'switch'
+    standbyPowerSwitch = 'standbyPowerSwitch'
+    statelessPowerToggle = 'statelessPowerToggle'
+    playPause = 'playPause'
+    playStop = 'playStop'
+
+
+class DisplayType1(Enum):
+    stepper = 'stepper'
+    feature = 'feature'
+
+
+class DisplayType2(Enum):
+    toggleSwitch = 'toggleSwitch'
+    standbyPowerSwitch = 'standbyPowerSwitch'
+    switch = 'switch'
+    slider = 'slider'
+    pushButton = 'pushButton'
+    textButton = 'textButton'
+    playPause = 'playPause'
+    playStop = 'playStop'
+    list = 'list'
+    textField = 'textField'
+    numberField = 'numberField'
+    stepper = 'stepper'
+    state = 'state'
+
+
+class DisplayType3(Enum):
+    toggleSwitch = 'toggleSwitch'
+    standbyPowerSwitch = 'standbyPowerSwitch'
+    switch = 'switch'
+    slider = 'slider'
+    pushButton = 'pushButton'
+    textButton = 'textButton'
+    playPause = 'playPause'
+    playStop = 'playStop'
+    list = 'list'
+    textField = 'textField'
+    numberField = 'numberField'
+    stepper = 'stepper'
+    state = 'state'
+    multiArgCommand = 'multiArgCommand'
+
+
+class DisplayType4(Enum):
+    slider = 'slider'
+    list = 'list'
+    numberField = 'numberField'
+    textField = 'textField'
+    enumSlider = 'enumSlider'
+
+
+class DisplayType5(Enum):
+    slider = 'slider'
+    list = 'list'
+    numberField = 'numberField'
+    textField = 'textField'
+    multiArgCommand = 'multiArgCommand'
+
+
+class Group(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='The group name to which this belongs. Some complex devices can be shown grouped in the dashboard card. This is used for grouping states and actions in the dashboard.',
+        example='main',
+    )
+
+
+class FeatureItem(BaseModel):
+    key: str = Field(
+        ...,
+        description='The name of the feature to be added to the detail view. For example, if the feature is specified as "cooking", then a detail view item will be added called "cooking"',
+    )
+    value: str = Field(..., description="The alternative string of given 'key' value.")
+
+
+class Feature(BaseModel):
+    __root__: List[FeatureItem] = Field(
+        ...,
+        description='Including a basicPlus item with the “feature” display type adds a shortcut item to the desired detail view.',
+        example=[
+            {'key': 'cooking', 'value': 'Cooking mode'},
+            {'key': 'cleaning', 'value': 'Cleaning mode'},
+        ],
+    )
+
+
+class Button(BaseModel):
+    key: str = Field(
+        ...,
+        description='A command name or an argument name of a command to be mapped with this button.',
+        example='cooling',
+    )
+    label: str = Field(
+        ...,
+        description='The alternative string to be displayed when the `key` is evaluated.',
+        example='Cooling',
+    )
+    state: Optional[str] = Field(
+        None,
+        description='To focus this button according to the current status of given attribute which is mapped with this button.',
+        example='Cooling',
+    )
+
+
+class ExcludeItemsCommand(BaseModel):
+    name: str
+    excludedValues: Optional[List[str]] = Field(
+        None, description='To exclude only some values of the attribute'
+    )
+
+
+class ExcludeItemsCommands(BaseModel):
+    __root__: List[ExcludeItemsCommand]
+
+
+class ExcludeItemsAttribute(BaseModel):
+    name: str = Field(..., description='Attribute name to be excluded')
+    excludedValues: Optional[List[str]] = Field(
+        None, description='To exclude only some values of the attribute'
+    )
+
+
+class ExcludeItemsAttributes(BaseModel):
+    __root__: List[ExcludeItemsAttribute]
+
+
+class Op(Enum):
+    add = 'add'
+    replace = 'replace'
+    remove = 'remove'
+
+
+class PatchItem(BaseModel):
+    op: Op = Field(
+        ...,
+        description='Operation objects MUST have exactly one "op" member, whose value indicates the operation to perform',
+        example='replace',
+    )
+    path: str = Field(
+        ...,
+        description='path specifies a string format for identifying a specific value within a JSON document. It is used by all operations in patch to specify the part of the document to operate on.',
+        example='/0/alternatives/1/value',
+    )
+    value: Optional[Dict[str, Any]] = Field(None, example='Focus mode')
+
+
+class Idx(BaseModel):
+    __root__: int = Field(
+        ...,
+        description='An index among the multiple items of dashboard provided in the capability presentation.',
+    )
+
+
+class Composite(BaseModel):
+    __root__: bool = Field(
+        ...,
+        description='To specify composite use of different state items. If composite is true, multiple states items in the same group are combined to a label.',
+    )
+
+
+class Type6(Enum):
+    remainingTime = 'remainingTime'
+    time = 'time'
+
+
+class TimeFormat(BaseModel):
+    __root__: constr(regex=r'hh:mm(:ss){0,1}') = Field(..., example='hh:mm:ss')
+
+
+class GenerateConfigExclusion(ComponentId, BaseCapabilityReference, DeviceConfigView):
+    pass
+
+
+class LanguageItem(BaseModel):
+    locale: str = Field(..., description='ICU locale')
+    poCodes: List[PoCodes] = Field(
+        ..., description='The list of resources that contain translated text'
+    )
+
+
+class VisibleCondition(CapabilityKey):
+    component: Optional[Component1] = Field(
+        None,
+        description='The component that controls the visibility of this component. This can be another component or this one.',
+    )
+    value: Optional[ValueModel] = None
+    operator: Optional[Operator] = None
+    operand: Optional[str] = Field(
+        None, description='The value that the visible condition evaluates against.'
+    )
+
+
+class GroupVisibleConditions(CapabilityKey):
+    component: Optional[Component1] = Field(
+        None,
+        description='The component that controls the visibility of this component. This can be another component or this one.',
+    )
+    value: Optional[ValueModel] = None
+    operator: Optional[Operator] = None
+    operand: Optional[str] = Field(
+        None, description='The value that the visible condition evaluates against.'
+    )
+
+
+class NumberField(BaseModel):
+    value: Optional[ValueModel] = None
+    valueType: Optional[ValueTypeModel] = None
+    unit: Optional[UnitModel] = None
+    command: str
+    argumentType: Optional[ArgumentType] = None
+    range: Optional[Range] = None
+
+
+class PushButton(BaseModel):
+    command: str
+    argument: Optional[str] = None
+    argumentType: Optional[ArgumentType] = None
+
+
+class Command1(BaseModel):
+    name: Optional[str] = Field(
+        None,
+        description='To specify a single command like "setValue(number)", use “command” field for the command name. If this field is specified then "increase" and "descrease" fields should not be specified. App will calculate desired value when user clicks "+" and "-" button in the UI based on the current value of "attribute" with specified "step".',
+    )
+    increase: Optional[str] = Field(
+        None, description='To specify a command for "increase" without an argument.'
+    )
+    decrease: Optional[str] = Field(
+        None, description='To specify a command for "decrease" without an argument.'
+    )
+    argumentType: Optional[ArgumentType] = None
+
+
+class Stepper(BaseModel):
+    command: Command1
+    value: Optional[ValueModel] = None
+    valueType: Optional[ValueTypeModel] = None
+    step: Step
+    range: Range
+
+
+class TextField(BaseModel):
+    command: str
+    argumentType: Optional[ArgumentType] = None
+    value: Optional[ValueModel] = None
+    valueType: Optional[ValueTypeModel] = None
+    range: Optional[Range] = None
+
+
+class Command2(BaseModel):
+    name: Optional[str] = None
+    on: str
+    off: str
+    argumentType: Optional[ArgumentType] = None
+
+
+class SwitchCommand(BaseModel):
+    command: Command2 = Field(
+        ...,
+        description='To specify separate commands with no arguments for on and off, use the “on” and “off” fields respectively. To specify a single command, use “name” for the command and the “on” and “off” fields for the arguments.',
+    )
+
+
+class StatelessPowerToggleForDashboard(BaseModel):
+    command: str
+    argument: Optional[str] = None
+    argumentType: Optional[ArgumentType] = None
+
+
+class Command3(BaseModel):
+    name: Optional[str] = None
+    play: str
+    pause: str
+    argumentType: Optional[ArgumentType] = None
+
+
+class PlayPauseCommand(BaseModel):
+    command: Command3 = Field(
+        ...,
+        description='To specify separate commands with no arguments for on and off, use the “play” and “pause” fields respectively. To specify a single command, use “name” for the command and the “play” and “pause” fields for the arguments.',
+    )
+
+
+class Command4(BaseModel):
+    name: Optional[str] = None
+    play: str
+    stop: str
+    argumentType: Optional[ArgumentType] = None
+
+
+class PlayStopCommand(BaseModel):
+    command: Command4 = Field(
+        ...,
+        description='To specify separate commands with no arguments for on and off, use the “play” and “stop” fields respectively. To specify a single command, use “name” for the command and the “play” and “stop” fields for the arguments.',
+    )
+
+
+class TextButton(BaseModel):
+    command: Optional[str] = Field(
+        None,
+        description='To specify command name with argument(s) and key of the buttons is the argument of the command. If this is omitted then keys at `buttons` array are the enumCommands without arguments.',
+        example='setThermostatMode',
+    )
+    value: Optional[ValueModel] = None
+    buttons: List[Button] = Field(..., min_items=2)
+    supportedValues: Optional[SupportedValues] = None
+
+
+class ExcludeItem(BaseModel):
+    component: Optional[str] = Field(None, example='main')
+    capability: str = Field(..., example='pictureMode')
+    version: Optional[int] = Field(1, example=1)
+    attributes: Optional[ExcludeItemsAttributes] = None
+
+
+class ExcludedConditionItem(BaseModel):
+    value: Optional[Dict[str, Any]] = Field(
+        None, description='To express that a specific value is selected', example='HDMI'
+    )
+    exclude: List[ExcludeItem]
+
+
+class ExcludeItem1(BaseModel):
+    component: Optional[str] = Field(
+        None,
+        description="To specify target component to exclude, if it's omitted then all components with this capability will be excluded",
+        example='main',
+    )
+    capability: str = Field(..., example='pictureMode')
+    version: Optional[int] = Field(1, example=1)
+    commands: Optional[ExcludeItemsCommands] = None
+
+
+class ExcludedActionItem(BaseModel):
+    value: Optional[Dict[str, Any]] = Field(
+        None, description='To express that a specific value is selected', example='off'
+    )
+    exclude: List[ExcludeItem1]
+
+
+class ExcludedConditionItemId(ExcludedConditionItem):
+    id: Optional[int] = Field(
+        None,
+        description='The index of the array in the given capability to which this exclusion object will be inserted',
+    )
+
+
+class ExcludedActionItemId(ExcludedActionItem):
+    id: Optional[int] = Field(
+        None,
+        description='The index of the array in the given capability to which this exclusion object will be inserted',
+    )
+
+
+class DeviceConfigEntryBase(BaseModel):
+    component: str = Field(..., example='main')
+    capability: str = Field(..., example='thermostatMode')
+    version: Optional[Version] = None
+    visibleCondition: Optional[VisibleCondition] = None
+
+
+class DeviceConfigEntryForDashboardAction(DeviceConfigEntryBase):
+    idx: Optional[Idx] = None
+    group: Optional[Group] = None
+
+
+class RemainingTime(BaseModel):
+    timeFormat: TimeFormat
+    frequency: Optional[int] = Field(
+        60,
+        description='Specify the frequency time(second) so UI client can know how often to update the remaing time.',
+        example=60,
+    )
+
+
+class Time(BaseModel):
+    timeFormat: TimeFormat
+
+
+class FormatInfoItem(BaseModel):
+    key: ValueModel
+    type: Type6 = Field(
+        ...,
+        description='To specify the type of format to display this attribute value. The corresponding field must also be included. For example, if you specify "remainingTime" here, you must also include the "remainingTime" key and its object definition for formatInfo.',
+        example='remainingTime',
+    )
+    remainingTime: Optional[RemainingTime] = None
+    time: Optional[Time] = None
+
+
+class FormatInfo(BaseModel):
+    __root__: List[FormatInfoItem]
+
+
+class Language(BaseModel):
+    __root__: List[LanguageItem]
+
+
+class BadgeItem(BaseModel):
+    iconUrl: IconUrl
+    visibleConditions: Optional[List[VisibleCondition]] = None
+
+
+class Icon(BaseModel):
+    group: Optional[str] = 'main'
+    iconUrl: Optional[IconUrl] = None
+    badge: Optional[List[BadgeItem]] = None
+
+
+class Icons(BaseModel):
+    __root__: List[Icon]
+
+
+class State2(BaseModel):
+    label: Optional[FormattedLabel] = None
+    unit: Optional[UnitModel] = None
+    alternatives: Optional[Alternatives] = None
+
+
+class StateItem(BaseModel):
+    label: FormattedLabel
+    alternatives: Optional[Alternatives] = None
+
+
+class BasicPlusItem(BaseModel):
+    displayType: DisplayType1 = Field(
+        ...,
+        description='To specify the type of UI component to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    stepper: Optional[Stepper] = None
+    feature: Optional[Feature] = None
+    visibleCondition: Optional[VisibleCondition] = None
+
+
+class Command(BaseModel):
+    name: Optional[str] = Field(
+        None,
+        description='name refers to command name and key of the alternatives is the argument of the command',
+    )
+    alternatives: Alternatives
+    argumentType: Optional[ArgumentType] = None
+    supportedValues: Optional[SupportedValues] = None
+
+
+class State5(BaseModel):
+    value: ValueModel
+    valueType: Optional[ValueTypeModel] = None
+    alternatives: Alternatives
+
+
+class ListForDetailView(BaseModel):
+    command: Command
+    state: Optional[State5] = None
+
+
+class State6(BaseModel):
+    value: ValueModel
+    valueType: Optional[ValueTypeModel] = None
+    play: str = Field(
+        ...,
+        description='The value of "attribute" which indicates playing state. When the attribute value equals to this then UI will show playing state.',
+    )
+    pause: str = Field(
+        ...,
+        description='The value of "attribute" which indicates paused state. When the attribute value equals to this then UI will show paused state.',
+    )
+    alternatives: Optional[Alternatives] = None
+
+
+class PlayPause(PlayPauseCommand):
+    state: Optional[State6] = None
+
+
+class State7(BaseModel):
+    value: ValueModel
+    play: str = Field(
+        ...,
+        description='The value of "attribute" which indicates playing state. When the attribute value equals to this then UI will show playing state.',
+    )
+    stop: str = Field(
+        ...,
+        description='The value of "attribute" which indicates stopped state. When the attribute value equals to this then UI will show stopped state.',
+    )
+    alternatives: Optional[Alternatives] = None
+    valueType: Optional[ValueTypeModel] = None
+
+
+class PlayStop(PlayStopCommand):
+    state: State7
+
+
+class Slider(SliderBase):
+    command: Optional[str] = Field(
+        None,
+        description='The command which will send the value of the slider as an argument',
+        example='setVolume',
+    )
+    argumentType: Optional[ArgumentType] = None
+    value: Optional[ValueModel] = None
+    valueType: Optional[ValueTypeModel] = None
+
+
+class StatesArrayItem(StateItem, CapabilityKey):
+    component: Component1
+    visibleCondition: Optional[VisibleCondition] = None
+    composite: Optional[Composite] = None
+    group: Optional[Group] = None
+    formatInfo: Optional[FormatInfo] = None
+
+
+class BasicPlusArrayItem(BasicPlusItem, CapabilityKey):
+    component: Optional[Component1] = None
+
+
+class State8(BaseModel):
+    value: ValueModel
+    valueType: Optional[ValueTypeModel] = None
+    on: str = Field(
+        ..., description='The attribute value that corresponds to the `on` state.'
+    )
+    off: str = Field(
+        ..., description='The attribute value that corresponds to the `off` state.'
+    )
+    label: Optional[FormattedLabel] = None
+    alternatives: Optional[Alternatives] = None
+
+
+class SwitchState(BaseModel):
+    state: Optional[State8] = Field(
+        None, description='To describe "on" and "off" state of a switch'
+    )
+
+
+class State9(BaseModel):
+    value: Optional[ValueModel] = None
+    on: str
+    off: str
+    valueType: Optional[ValueTypeModel] = None
+    alternatives: Optional[Alternatives] = None
+
+
+class SwitchStateForDashboard(BaseModel):
+    state: Optional[State9] = Field(
+        None, description='To describe "on" and "off" state of a switch'
+    )
+
+
+class SwitchForDashboard(SwitchCommand, SwitchStateForDashboard):
+    pass
+
+
+class StandbyPowerSwitchForDashboard(SwitchForDashboard):
+    pass
+
+
+class CapabilityValueForDashboardState(BaseModel):
+    label: Optional[str] = None
+    alternatives: Optional[Alternatives] = None
+
+
+class DeviceConfigEntryForDashboardState(DeviceConfigEntryBase):
+    idx: Optional[Idx] = None
+    group: Optional[Group] = None
+    values: Optional[List[CapabilityValueForDashboardState]] = Field(
+        None,
+        description='A list of valid values for the command argument or attribute that can override those defined by the alternatives provided in the capability presentation.',
+        max_items=1,
+    )
+    composite: Optional[Composite] = None
+    formatInfo: Optional[FormatInfo] = None
+
+
+class Dashboard(BaseModel):
+    states: Optional[List[DeviceConfigEntryForDashboardState]] = None
+    actions: Optional[List[DeviceConfigEntryForDashboardAction]] = None
+    groupVisibleConditions: Optional[GroupVisibleConditions] = None
+
+
+class Dashboard1(BaseModel):
+    states: Optional[List[DeviceConfigEntryForDashboardState]] = None
+    actions: Optional[List[DeviceConfigEntryForDashboardAction]] = None
+    groupVisibleConditions: Optional[GroupVisibleConditions] = None
+
+
+class CapabilityValue(BaseModel):
+    key: str = Field(
+        ...,
+        description='This can be either command name or attribute name.',
+        example='thermostatMode.value',
+    )
+    enabledValues: Optional[List[str]] = Field(
+        None,
+        description='A list of values supported among those defined in the capability alternatives. For instance, a device may not support `auto` for supported thermostat fan modes, so this field might be an array containing `on` and `off`.',
+        example=['cooling', 'heating'],
+    )
+    label: Optional[str] = None
+    alternatives: Optional[Alternatives] = None
+    range: Optional[Range] = None
+    step: Optional[Step] = None
+
+
+class Condition1(BaseModel):
+    label: str = Field(..., example='Audio volume')
+    displayType: DisplayType4 = Field(
+        ...,
+        description='Specify the type of UI component to use to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    slider: Optional[SliderForAutomationCondition] = None
+    list: Optional[ListForAutomationCondition] = None
+    numberField: Optional[NumberFieldForAutomationCondition] = None
+    textField: Optional[TextFieldForAutomationCondition] = None
+    enumSlider: Optional[EnumSliderForAutomationCondition] = None
+    emphasis: Optional[bool] = Field(
+        None,
+        description='The effect used to emphasize this resource widget. The default value is false. If the emphasis value is true and this object has alternatives, a list will appear without a label',
+    )
+
+
+class Switch(SwitchCommand, SwitchState):
+    pass
+
+
+class ToggleSwitch(Switch):
+    pass
+
+
+class AutomationListItem(AutomationCondition):
+    exclusion: Optional[List[ExcludedConditionItem]] = Field(
+        None,
+        description='To exclude specified automation in `exclude` when this item is selected by the user.',
+    )
+    component: Optional[Component1] = None
+    visibleCondition: Optional[VisibleCondition] = None
+
+
+class ToggleSwitchForDashboard(SwitchForDashboard):
+    pass
+
+
+class DeviceConfigEntry(DeviceConfigEntryBase):
+    values: Optional[List[CapabilityValue]] = Field(
+        None,
+        description='A list of valid values for the command argument or attribute that can override those defined by the alternatives provided in the capability presentation.',
+    )
+    patch: Optional[List[PatchItem]] = Field(
+        None,
+        description='A format which is applied some operations(add / replace / remove) from the rfc6902(https://tools.ietf.org/html/rfc6902#section-4). Please note that array in the patch is sequentially processed.',
+    )
+
+
+class ExcludedDeviceActionConfigEntry(DeviceConfigEntry):
+    exclusion: Optional[List[ExcludedActionItemId]] = Field(
+        None,
+        description='To exclude specified automation in `exclude` when this item is selected by the user.',
+    )
+
+
+class ExcludedDeviceConditionConfigEntry(DeviceConfigEntry):
+    exclusion: Optional[List[ExcludedConditionItemId]] = Field(
+        None,
+        description='To exclude specified automation in `exclude` when this item is selected by the user.',
+    )
+
+
+class ActionItem(BaseModel):
+    displayType: DisplayType = Field(
+        ...,
+        description='To specify the type of UI component to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    pushButton: Optional[PushButton] = None
+    toggleSwitch: Optional[ToggleSwitchForDashboard] = None
+    switch: Optional[SwitchForDashboard] = None
+    standbyPowerSwitch: Optional[StandbyPowerSwitchForDashboard] = None
+    statelessPowerToggle: Optional[StatelessPowerToggleForDashboard] = None
+    playPause: Optional[PlayPause] = None
+    playStop: Optional[PlayStop] = None
+    group: Optional[Group] = None
+
+
+class Action1(BaseModel):
+    label: str = Field(..., example='Audio volume')
+    displayType: DisplayType5 = Field(
+        ...,
+        description='To specify the type of UI component to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    slider: Optional[SliderForAutomationAction] = None
+    list: Optional[ListForAutomationAction] = None
+    textField: Optional[TextFieldForAutomationAction] = None
+    numberField: Optional[NumberFieldForAutomationAction] = None
+    multiArgCommand: Optional[MultiArgCommand] = None
+    emphasis: Optional[bool] = Field(
+        None,
+        description='The effect used to emphasize this resource widget. The default value is false. If the emphasis value is true and this object has alternatives, a list will appear without a label',
+    )
+
+
+class AutomationForCapability(BaseModel):
+    conditions: Optional[List[Condition1]] = Field(
+        None,
+        description='To specify the conditions of device state to trigger actions in the automation view of SmartThings app.',
+    )
+    actions: Optional[List[Action1]] = Field(
+        None,
+        description='To specify the actions of device control based on the device state in the automation view of SmartThings app.',
+    )
+
+
+class StandbyPowerSwitch(Switch):
+    pass
+
+
+class ActionsArrayItem(ActionItem, CapabilityKey):
+    component: Optional[Component1] = None
+    visibleCondition: Optional[VisibleCondition] = None
+    group: Optional[Group] = None
+
+
+class ActionListItem(AutomationAction):
+    component: Optional[Component1] = None
+    visibleCondition: Optional[VisibleCondition] = None
+    exclusion: Optional[List[ExcludedActionItem]] = Field(
+        None,
+        description='To exclude specified automation in `exclude` when this item is selected by the user.',
+    )
+
+
+class Automation(BaseModel):
+    conditions: Optional[List[ExcludedDeviceConditionConfigEntry]] = None
+    actions: Optional[List[ExcludedDeviceActionConfigEntry]] = None
+
+
+class CreateProfileDeviceConfigRequest(BaseModel):
+    iconUrl: Optional[IconUrl] = None
+    dashboard: Optional[Dashboard] = None
+    detailView: Optional[List[DeviceConfigEntry]] = None
+    automation: Optional[Automation] = None
+
+
+class Automation1(BaseModel):
+    conditions: Optional[List[ExcludedDeviceConditionConfigEntry]] = None
+    actions: Optional[List[ExcludedDeviceActionConfigEntry]] = None
+
+
+class DeviceConfiguration(BaseModel):
+    mnmn: Mnmn
+    vid: Vid
+    version: Optional[str] = Field(
+        '0.0.1', description='The version of the device configuration.', example='0.0.1'
+    )
+    type: Optional[Type4] = 'profile'
+    dpInfo: Optional[DpInfo] = None
+    iconUrl: Optional[IconUrl] = None
+    icons: Optional[Icons] = None
+    dashboard: Optional[Dashboard1] = None
+    detailView: Optional[List[DeviceConfigEntry]] = None
+    automation: Optional[Automation1] = None
+
+
+class PublicDeviceConfiguration(DeviceConfiguration):
+    presentationId: Optional[str] = Field(
+        None,
+        description='System generated identifier that corresponds to a device presentation (formerly `vid`)',
+    )
+    manufacturerName: Optional[str] = Field(
+        None,
+        description='Secondary namespacing key for grouping presentations (formerly `mnmn`)',
+    )
+
+
+class DashboardModel(BaseModel):
+    states: Optional[List[StatesArrayItem]] = None
+    actions: Optional[List[ActionsArrayItem]] = None
+    basicPlus: Optional[List[BasicPlusArrayItem]] = None
+    groupVisibleConditions: Optional[GroupVisibleConditions] = None
+
+
+class DashboardForCapability(BaseModel):
+    states: Optional[List[StateItem]] = None
+    actions: Optional[List[ActionItem]] = None
+    basicPlus: Optional[List[BasicPlusItem]] = None
+
+
+class DetailViewForCapabilityItem(BaseModel):
+    label: str = Field(..., example='Front door')
+    displayType: DisplayType2 = Field(
+        ...,
+        description='To specify the type of UI component to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    toggleSwitch: Optional[ToggleSwitch] = None
+    standbyPowerSwitch: Optional[StandbyPowerSwitch] = None
+    switch: Optional[Switch] = None
+    slider: Optional[Slider] = None
+    pushButton: Optional[PushButton] = None
+    textButton: Optional[TextButton] = None
+    playPause: Optional[PlayPause] = None
+    playStop: Optional[PlayStop] = None
+    list: Optional[ListForDetailView] = None
+    textField: Optional[TextField] = None
+    numberField: Optional[NumberField] = None
+    stepper: Optional[Stepper] = None
+    state: Optional[State2] = None
+
+
+class DetailViewForCapability(BaseModel):
+    __root__: List[DetailViewForCapabilityItem]
+
+
+class DetailViewItem(CapabilityKey):
+    label: str
+    displayType: DisplayType3 = Field(
+        ...,
+        description='To specify the type of UI component to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    toggleSwitch: Optional[ToggleSwitch] = None
+    standbyPowerSwitch: Optional[StandbyPowerSwitch] = None
+    switch: Optional[Switch] = None
+    slider: Optional[Slider] = None
+    pushButton: Optional[PushButton] = None
+    textButton: Optional[TextButton] = None
+    playPause: Optional[PlayPause] = None
+    playStop: Optional[PlayStop] = None
+    list: Optional[ListForDetailView] = None
+    textField: Optional[TextField] = None
+    numberField: Optional[NumberField] = None
+    stepper: Optional[Stepper] = None
+    state: Optional[State2] = None
+    multiArgCommand: Optional[MultiArgCommand] = None
+
+
+class AutomationModel(BaseModel):
+    conditions: Optional[List[AutomationListItem]] = Field(
+        None,
+        description='To specify the conditions of device state to trigger actions in the automation view of SmartThings app.',
+    )
+    actions: Optional[List[ActionListItem]] = Field(
+        None,
+        description='To specify the actions of device control based on the device state in the automation view of SmartThings app.',
+    )
+
+
+class DetailViewListItem(DetailViewItem):
+    component: Optional[Component1] = None
+    visibleCondition: Optional[VisibleCondition] = None
+
+
+class CreateDeviceConfigRequest(CreateProfileDeviceConfigRequest, DeviceConfigType):
+    pass
+
+
+class CapabilityPresentationForPUT(BaseModel):
+    dashboard: Optional[DashboardForCapability] = None
+    detailView: Optional[DetailViewForCapability] = None
+    automation: Optional[AutomationForCapability] = None
+
+
+class CapabilityPresentation(CapabilityPresentationForPUT):
+    id: Optional[str] = Field(None, example='audioVolume')
+    version: Optional[Version] = Field(None, example=1)
+
+
+class DetailView(BaseModel):
+    __root__: List[DetailViewListItem]
+
+
+class CreateCapabilityPresentationRequest(CapabilityPresentationForPUT):
+    id: str
+    version: Version
+
+
+class DevicePresentation(BaseModel):
+    mnmn: Mnmn
+    vid: Vid
+    version: Optional[str] = Field(
+        '0.0.1', description='The version of the device presentation.', example='0.0.1'
+    )
+    iconUrl: Optional[IconUrl] = None
+    icons: Optional[Icons] = None
+    dashboard: Optional[DashboardModel] = None
+    detailView: Optional[DetailView] = None
+    automation: Optional[AutomationModel] = None
+    dpInfo: DpInfo
+    language: Optional[Language] = None
+
+
+class DossierDevicePresentation(DevicePresentation):
+    manufacturerName: Optional[str] = Field(
+        None,
+        description='Secondary namespacing key for grouping presentations (formerly `mnmn`)',
+    )
+    presentationId: Optional[str] = Field(
+        None,
+        description='System generated identifier that corresponds to a device presentation (formerly `vid`)',
+    )
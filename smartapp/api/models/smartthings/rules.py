@@ -0,0 +1,722 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    Links,
+)
+
+from smartapp.api.models.smartthings.devices import (
+    DeviceCommand,
+)
+
+
+class Status(Enum):
+    Enabled = 'Enabled'
+    Disabled = 'Disabled'
+
+
+class ExecutionLocation(Enum):
+    Cloud = 'Cloud'
+    Local = 'Local'
+
+
+class OwnerType1(Enum):
+    Location = 'Location'
+    User = 'User'
+
+
+class LocationAction(BaseModel):
+    locationId: Optional[str] = Field(
+        None,
+        description='locationId is required for "User level rule". (It\'s optional for "Location level rule")',
+    )
+    mode: Optional[str] = None
+
+
+class MapOperand(BaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class ExecutionResult(Enum):
+    Success = 'Success'
+    Failure = 'Failure'
+    Ignored = 'Ignored'
+
+
+class IfExecutionResult(Enum):
+    True_ = 'True'
+    False_ = 'False'
+
+
+class CommandExecutionResult(Enum):
+    Success = 'Success'
+    Failure = 'Failure'
+    Offline = 'Offline'
+
+
+class IfActionExecutionResult(BaseModel):
+    result: IfExecutionResult
+
+
+class CommandActionExecutionResult(BaseModel):
+    result: CommandExecutionResult
+    deviceId: str = Field(..., description='Device ID for device actions')
+
+
+class LocationActionExecutionResult(BaseModel):
+    result: ExecutionResult
+    locationId: str = Field(..., description='Location ID for location actions')
+
+
+class SleepActionExecutionResult(BaseModel):
+    result: ExecutionResult
+
+
+class ActionExecutionResult(BaseModel):
+    actionId: str
+    if_: Optional[IfActionExecutionResult] = Field(None, alias='if')
+    location: Optional[LocationActionExecutionResult] = None
+    command: Optional[List[CommandActionExecutionResult]] = None
+    sleep: Optional[SleepActionExecutionResult] = None
+
+
+class RuleExecutionResponse(BaseModel):
+    executionId: str
+    id: str
+    result: ExecutionResult
+    actions: Optional[List[ActionExecutionResult]] = None
+
+
+class LocationAttribute(Enum):
+    FineDust = 'FineDust'
+    FineDustIndex = 'FineDustIndex'
+    Humidity = 'Humidity'
+    Mode = 'Mode'
+    Security = 'Security'
+    Temperature = 'Temperature'
+    TemperatureC = 'TemperatureC'
+    TemperatureF = 'TemperatureF'
+    UltraFineDust = 'UltraFineDust'
+    UltraFineDustIndex = 'UltraFineDustIndex'
+    Weather = 'Weather'
+    WeatherAlertSeverity = 'WeatherAlertSeverity'
+
+
+class ArmState(Enum):
+    ArmedStay = 'ArmedStay'
+    ArmedAway = 'ArmedAway'
+    Disarmed = 'Disarmed'
+
+
+class DayOfWeek(Enum):
+    Sun = 'Sun'
+    Mon = 'Mon'
+    Tue = 'Tue'
+    Wed = 'Wed'
+    Thu = 'Thu'
+    Fri = 'Fri'
+    Sat = 'Sat'
+
+
+class DateReference(Enum):
+    Today = 'Today'
+
+
+class TimeReference(Enum):
+    Now = 'Now'
+    Midnight = 'Midnight'
+    Sunrise = 'Sunrise'
+    Noon = 'Noon'
+    Sunset = 'Sunset'
+
+
+class IntervalUnit(Enum):
+    Second = 'Second'
+    Minute = 'Minute'
+    Hour = 'Hour'
+    Day = 'Day'
+    Week = 'Week'
+    Month = 'Month'
+    Year = 'Year'
+
+
+class TriggerMode(Enum):
+    Auto = 'Auto'
+    Always = 'Always'
+    Never = 'Never'
+
+
+class OperandAggregationMode(Enum):
+    None_ = 'None'
+
+
+class ConditionAggregationMode(Enum):
+    Any = 'Any'
+    All = 'All'
+
+
+class Sequence(Enum):
+    Serial = 'Serial'
+    Parallel = 'Parallel'
+
+
+class ActionSequence(BaseModel):
+    actions: Optional[Sequence] = None
+
+
+class CommandSequence(BaseModel):
+    commands: Optional[Sequence] = None
+    devices: Optional[Sequence] = None
+
+
+class IfActionSequence(BaseModel):
+    then: Optional[Sequence] = None
+    else_: Optional[Sequence] = Field(None, alias='else')
+
+
+class Creator(Enum):
+    SMARTTHINGS = 'SMARTTHINGS'
+    ARB = 'ARB'
+    RECIPE = 'RECIPE'
+    UNDEFINED = 'UNDEFINED'
+
+
+class Type5(Enum):
+    inactive = 'inactive'
+    active = 'active'
+
+
+class IconUrl(BaseModel):
+    __root__: str = Field(
+        ...,
+        description='Preloaded iconId or URL used to retrieve icons to be drawn on the UI Client.',
+        example='preload://example_icon_url',
+    )
+
+
+class Step(BaseModel):
+    __root__: float = Field(
+        ...,
+        description='The incremental step that increases or decreases for numeric values.',
+    )
+
+
+class Range(BaseModel):
+    __root__: List[float] = Field(
+        ...,
+        description='The inclusive range of a numeric value or bounds of a string depending on the data type it is applied to.',
+        example=[0, 100],
+        max_items=2,
+        min_items=2,
+    )
+
+
+class Version(BaseModel):
+    __root__: int = Field(
+        ..., description='The version number of the capability.', example=1
+    )
+
+
+class CapabilityKey(BaseModel):
+    capability: str
+    version: Optional[Version] = None
+
+
+class SupportedValues(BaseModel):
+    __root__: constr(regex=r'(^[[a-z]*([A-Z][a-z]*)*){1,36}(\.value)+') = Field(
+        ...,
+        description='The attribute name specified in supportedValues is an array that has values supported at runtime.',
+        example='supportedMode.value',
+    )
+
+
+class DisplayType6(Enum):
+    slider = 'slider'
+    list = 'list'
+    numberField = 'numberField'
+    textField = 'textField'
+    enumSlider = 'enumSlider'
+
+
+class DisplayType7(Enum):
+    slider = 'slider'
+    list = 'list'
+    textField = 'textField'
+    numberField = 'numberField'
+    multiArgCommand = 'multiArgCommand'
+
+
+class Operator1(Enum):
+    EQUALS = 'EQUALS'
+    GREATER_THAN_OR_EQUALS = 'GREATER_THAN_OR_EQUALS'
+    LESS_THAN_OR_EQUALS = 'LESS_THAN_OR_EQUALS'
+
+
+class SupportedOperator(BaseModel):
+    operator: Operator1 = Field(
+        ..., description='The operator to be supported by this display type.'
+    )
+    label: str = Field(..., description='The alternative string of given operator.')
+
+
+class DisplayType8(Enum):
+    slider = 'slider'
+    list = 'list'
+    textField = 'textField'
+    numberField = 'numberField'
+
+
+class ArgumentName(BaseModel):
+    __root__: str = Field(..., description='Argument name of a command')
+
+
+class ValueModel(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    __root__: constr(regex=r'(^[[a-z]*([A-Z][a-z]*)*){1,36}(\.value)+') = Field(
+        ...,
+        description='Notation which indicates the value of an attribute',
+        example='switch.value',
+    )
+
+
+class UnitModel(BaseModel):
+    __root__: constr(regex=r'(^[[a-z]*([A-Z][a-z]*)*){1,36}(\.unit)+') = Field(
+        ..., example='temperature.unit'
+    )
+
+
+class ValueTypeModel(BaseModel):
+    __root__: str = Field(
+        ...,
+        description="The data type of the `value`. It's automatically filled from the given capability.",
+        example='double',
+    )
+
+
+class ArgumentType(BaseModel):
+    __root__: str = Field(
+        ...,
+        description="The data type of the `argument`. It's automatically filled from the given capability.",
+        example='double',
+    )
+
+
+class CommandAction(BaseModel):
+    devices: List[str]
+    commands: List[DeviceCommand]
+    sequence: Optional[CommandSequence] = Field(
+        None,
+        description='The sequence in which the commands are to be executed i.e. Serial or Parallel (default)',
+    )
+
+
+class DateOperand(BaseModel):
+    timeZoneId: Optional[str] = Field(None, description='A java time zone ID reference')
+    daysOfWeek: Optional[List[DayOfWeek]] = None
+    year: Optional[int] = None
+    month: Optional[conint(ge=1, le=12)] = None
+    day: Optional[conint(ge=1, le=31)] = None
+    reference: Optional[DateReference] = None
+
+
+class DeviceOperand(BaseModel):
+    devices: List[str]
+    component: str
+    capability: str
+    attribute: str
+    path: Optional[str] = None
+    aggregation: Optional[OperandAggregationMode] = None
+    trigger: Optional[TriggerMode] = None
+
+
+class LocationOperand(BaseModel):
+    locationId: Optional[str] = Field(
+        None,
+        description='Required for User level rule, optional for Location level in request. Will always be present in response for both.',
+    )
+    attribute: LocationAttribute
+    trigger: Optional[TriggerMode] = None
+
+
+class AlternativeItem(BaseModel):
+    key: str = Field(
+        ...,
+        description="The label string to be displayed when the 'key' is evaluated.",
+        example='on',
+    )
+    value: str = Field(
+        ...,
+        description='The alternative string to be displayed when the `key` is selected.',
+        example='Motion detected',
+    )
+    type: Optional[Type5] = Field(
+        'active',
+        description='This shows the active or inactive state of the value. Active is shown in color, while inactive value is shown dimmed in the UI view. For example, Motion sensor capability would have `detected` as active and in color and `clear` as inactive and dimmed so that a user can see the `detected` event easily.',
+    )
+    iconUrl: Optional[IconUrl] = None
+    description: Optional[str] = Field(
+        None,
+        description='Additional description for each value. This description is shown in detail view or automation under this particular key.',
+    )
+
+
+class NumberFieldForAutomationAction(BaseModel):
+    command: str
+    argumentType: Optional[ArgumentType] = None
+    unit: Optional[UnitModel] = None
+    range: Optional[Range] = None
+
+
+class NumberFieldForAutomationCondition(BaseModel):
+    value: ValueModel
+    valueType: Optional[ValueTypeModel] = None
+    unit: Optional[UnitModel] = None
+    range: Optional[Range] = None
+
+
+class SliderBase(BaseModel):
+    range: Range
+    step: Optional[Step] = None
+    unit: Optional[UnitModel] = None
+
+
+class SliderForAutomationAction(SliderBase):
+    command: str
+    argumentType: Optional[ArgumentType] = None
+
+
+class SliderForAutomationCondition(SliderBase):
+    value: ValueModel
+    valueType: Optional[ValueTypeModel] = None
+
+
+class TextFieldForAutomationAction(BaseModel):
+    command: str
+    argumentType: Optional[ArgumentType] = None
+    range: Optional[Range] = None
+
+
+class TextFieldForAutomationCondition(BaseModel):
+    value: ValueModel
+    valueType: Optional[ValueTypeModel] = None
+    range: Optional[Range] = None
+
+
+class SliderForArgument(SliderBase):
+    name: ArgumentName
+    argumentType: Optional[ArgumentType] = None
+
+
+class TextFieldForArgument(BaseModel):
+    name: ArgumentName
+    argumentType: Optional[ArgumentType] = None
+    range: Optional[Range] = None
+
+
+class NumberFieldForArgument(BaseModel):
+    name: ArgumentName
+    argumentType: Optional[ArgumentType] = None
+    range: Optional[Range] = None
+
+
+class Alternatives(BaseModel):
+    __root__: List[AlternativeItem] = Field(
+        ...,
+        description='A collection of strings that can replace the attribute value in the `label` or `value`. Must be human-readable for the UI client to display.',
+    )
+
+
+class ListBase(BaseModel):
+    alternatives: Alternatives
+    supportedValues: Optional[SupportedValues] = None
+
+
+class ListForAutomationAction(ListBase):
+    command: Optional[str] = Field(
+        None,
+        description='The name of the command that is called when an item is chosen from the list',
+    )
+    argumentType: Optional[ArgumentType] = None
+
+
+class ListForAutomationCondition(ListBase):
+    value: Optional[ValueModel] = None
+    valueType: Optional[ValueTypeModel] = None
+
+
+class EnumSliderForAutomationCondition(BaseModel):
+    alternatives: Alternatives
+    value: ValueModel
+    supportedOperators: Optional[List[SupportedOperator]] = None
+
+
+class ListForArgument(ListBase):
+    name: ArgumentName
+    argumentType: Optional[ArgumentType] = None
+
+
+class AutomationCondition(CapabilityKey):
+    label: str
+    displayType: DisplayType6 = Field(
+        ...,
+        description='To specify the type of UI component to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    slider: Optional[SliderForAutomationCondition] = None
+    list: Optional[ListForAutomationCondition] = None
+    numberField: Optional[NumberFieldForAutomationCondition] = None
+    textField: Optional[TextFieldForAutomationCondition] = None
+    enumSlider: Optional[EnumSliderForAutomationCondition] = None
+    emphasis: Optional[bool] = Field(
+        None,
+        description='The effect used to emphasize this resource widget. The default value is false. If the emphasis value is true and this object has alternatives, a list will appear without a label',
+    )
+
+
+class Argument1(BaseModel):
+    label: str = Field(..., example='Audio volume')
+    displayType: DisplayType8 = Field(
+        ...,
+        description='Specify the type of UI component to use to display this action or state. The corresponding field must also be included. For example, if you specify "list" here, you must also include the "list" key and its object definition for this action or state.',
+    )
+    slider: Optional[SliderForArgument] = None
+    list: Optional[ListForArgument] = None
+    textField: Optional[TextFieldForArgument] = None
+    numberField: Optional[NumberFieldForArgument] = None
+
+
+class MultiArgCommand(BaseModel):
+    command: str = Field(
+        ..., description='Command name to trigger', example='playTrack'
+    )
+    arguments: List[Argument1]
+
+
+class AutomationAction(CapabilityKey):
+    label: str
+    displayType: DisplayType7 = Field(
+        ...,
+        description='To specify the type of UI component to display this action or state. The corresponding field must also be included. For example, if you specify "switch" here, you must also include the "switch" key and its object definition for this action or state.',
+    )
+    slider: Optional[SliderForAutomationAction] = None
+    list: Optional[ListForAutomationAction] = None
+    textField: Optional[TextFieldForAutomationAction] = None
+    numberField: Optional[NumberFieldForAutomationAction] = None
+    multiArgCommand: Optional[MultiArgCommand] = None
+    emphasis: Optional[bool] = Field(
+        None,
+        description='The effect used to emphasize this resource widget. The default value is false. If the emphasis value is true and this object has alternatives, a list will appear without a label',
+    )
+
+
+class RuleRequest(BaseModel):
+    name: str = Field(..., description='The name for the Rule')
+    actions: List[Action]
+    sequence: Optional[ActionSequence] = Field(
+        None,
+        description='The sequence in which the actions are to be executed (i.e. Serial (default) or Parallel).',
+    )
+    timeZoneId: Optional[str] = Field(
+        None,
+        description='The time zone ID for this Rule. This overrides the Location time zone ID, but is overridden by time zone ID provided by each operand individually.',
+    )
+
+
+class Action(BaseModel):
+    if_: Optional[IfAction] = Field(None, alias='if')
+    sleep: Optional[SleepAction] = None
+    command: Optional[CommandAction] = None
+    every: Optional[EveryAction] = None
+    location: Optional[LocationAction] = None
+
+
+class SleepAction(BaseModel):
+    duration: Interval
+
+
+class EveryAction(BaseModel):
+    interval: Optional[Interval] = None
+    specific: Optional[DateTimeOperand] = None
+    actions: List[Action]
+    sequence: Optional[ActionSequence] = Field(
+        None,
+        description='The sequence in which the actions are to be executed i.e. Serial (default) or Parallel',
+    )
+
+
+class BasicCondition(BaseModel):
+    and_: Optional[List[Condition]] = Field(None, alias='and')
+    or_: Optional[List[Condition]] = Field(None, alias='or')
+    not_: Optional[Condition] = Field(None, alias='not')
+    equals: Optional[EqualsCondition] = None
+    greaterThan: Optional[GreaterThanCondition] = None
+    greaterThanOrEquals: Optional[GreaterThanOrEqualsCondition] = None
+    lessThan: Optional[LessThanCondition] = None
+    lessThanOrEquals: Optional[LessThanOrEqualsCondition] = None
+    between: Optional[BetweenCondition] = None
+
+
+class Condition(BaseModel):
+    and_: Optional[List[Condition]] = Field(None, alias='and')
+    or_: Optional[List[Condition]] = Field(None, alias='or')
+    not_: Optional[Condition] = Field(None, alias='not')
+    equals: Optional[EqualsCondition] = None
+    greaterThan: Optional[GreaterThanCondition] = None
+    greaterThanOrEquals: Optional[GreaterThanOrEqualsCondition] = None
+    lessThan: Optional[LessThanCondition] = None
+    lessThanOrEquals: Optional[LessThanOrEqualsCondition] = None
+    between: Optional[BetweenCondition] = None
+    changes: Optional[ChangesCondition] = None
+    remains: Optional[RemainsCondition] = None
+    was: Optional[WasCondition] = None
+
+
+class SimpleCondition(BaseModel):
+    left: Operand
+    right: Operand
+    aggregation: Optional[ConditionAggregationMode] = None
+
+
+class BetweenCondition(BaseModel):
+    value: Operand
+    start: Operand
+    end: Operand
+    aggregation: Optional[ConditionAggregationMode] = None
+
+
+class Operand(BaseModel):
+    boolean: Optional[bool] = None
+    decimal: Optional[float] = None
+    integer: Optional[int] = None
+    string: Optional[str] = None
+    array: Optional[ArrayOperand] = None
+    map: Optional[MapOperand] = None
+    device: Optional[DeviceOperand] = None
+    location: Optional[LocationOperand] = None
+    date: Optional[DateOperand] = None
+    time: Optional[TimeOperand] = None
+    datetime: Optional[DateTimeOperand] = None
+
+
+class ArrayOperand(BaseModel):
+    operands: List[Operand]
+    aggregation: Optional[OperandAggregationMode] = None
+
+
+class DateTimeOperand(BaseModel):
+    timeZoneId: Optional[str] = Field(None, description='A java time zone ID reference')
+    locationId: Optional[str] = Field(
+        None, description='Location ID for location actions'
+    )
+    daysOfWeek: Optional[List[DayOfWeek]] = None
+    year: Optional[int] = None
+    month: Optional[conint(ge=1, le=12)] = None
+    day: Optional[conint(ge=1, le=31)] = None
+    reference: TimeReference
+    offset: Optional[Interval] = None
+
+
+class TimeOperand(BaseModel):
+    timeZoneId: Optional[str] = Field(None, description='A java time zone ID reference')
+    daysOfWeek: Optional[List[DayOfWeek]] = None
+    reference: TimeReference
+    offset: Optional[Interval] = None
+
+
+class Interval(BaseModel):
+    value: Operand
+    unit: IntervalUnit
+
+
+class PagedRules(BaseModel):
+    items: Optional[List[Rule]] = None
+    _links: Optional[Links] = None
+
+
+class Rule(RuleRequest):
+    id: str = Field(..., description='Unique id for the Rule')
+    status: Optional[Status] = Field('Enabled', description='The status of the Rule')
+    executionLocation: Optional[ExecutionLocation] = Field(
+        None,
+        description='The location where the rule is executing, either local or cloud',
+    )
+    ownerId: str = Field(..., description='Owner id')
+    ownerType: OwnerType1 = Field(
+        ..., description='The owner of the rule is either a location or user'
+    )
+    creator: Optional[Creator] = None
+    dateCreated: str = Field(..., description='Created date time')
+    dateUpdated: str = Field(..., description='Last updated date time')
+
+
+class ChangesCondition(BasicCondition):
+    id: str = Field(..., description='Unique id for the condition')
+    operand: Optional[Operand] = None
+
+
+class RemainsCondition(BasicCondition):
+    id: str = Field(..., description='Unique id for the condition')
+    operand: Optional[Operand] = None
+    duration: Interval
+
+
+class WasCondition(BasicCondition):
+    id: str = Field(..., description='Unique id for the condition')
+    duration: Interval
+    operand: Optional[Operand] = None
+
+
+class IfAction(Condition):
+    then: Optional[List[Action]] = None
+    else_: Optional[List[Action]] = Field(None, alias='else')
+    sequence: Optional[IfActionSequence] = Field(
+        None, description='The sequence in which the actions are to be executed'
+    )
+
+
+class EqualsCondition(SimpleCondition):
+    pass
+
+
+class GreaterThanCondition(SimpleCondition):
+    pass
+
+
+class GreaterThanOrEqualsCondition(SimpleCondition):
+    pass
+
+
+class LessThanCondition(SimpleCondition):
+    pass
+
+
+class LessThanOrEqualsCondition(SimpleCondition):
+    pass
+
+
+RuleRequest.update_forward_refs()
+Action.update_forward_refs()
+SleepAction.update_forward_refs()
+EveryAction.update_forward_refs()
+BasicCondition.update_forward_refs()
+Condition.update_forward_refs()
+SimpleCondition.update_forward_refs()
+BetweenCondition.update_forward_refs()
+Operand.update_forward_refs()
+DateTimeOperand.update_forward_refs()
+TimeOperand.update_forward_refs()
+PagedRules.update_forward_refs()
+ChangesCondition.update_forward_refs()
+RemainsCondition.update_forward_refs()
+WasCondition.update_forward_refs()
+IfAction.update_forward_refs()
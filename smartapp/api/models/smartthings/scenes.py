@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.common import (
+    Links,
+)
+
+
+class SceneSummary(BaseModel):
+    sceneId: Optional[str] = Field(
+        None, description='The unique identifier of the Scene'
+    )
+    sceneName: Optional[str] = Field(
+        None, description='The user-defined name of the Scene'
+    )
+    sceneIcon: Optional[str] = Field(None, description='The name of the icon')
+    sceneColor: Optional[str] = Field(None, description='The color of the icon')
+    locationId: Optional[str] = Field(None, description='Location of the Scene')
+    createdBy: Optional[str] = Field(
+        None, description='The unique identifier of the user that created the scene'
+    )
+    createdDate: Optional[datetime] = Field(
+        None, description='The date the scene was created'
+    )
+    lastUpdatedDate: Optional[datetime] = Field(
+        None, description='The date the scene was last updated'
+    )
+    lastExecutedDate: Optional[datetime] = Field(
+        None, description='The date the scene was last executed'
+    )
+    editable: Optional[bool] = Field(
+        None,
+        description='Whether or not this scene can be edited by the logged in user using the version of the app that made the request',
+    )
+    apiVersion: Optional[str] = None
+
+
+class SceneMode(BaseModel):
+    modeId: Optional[str] = Field(None, description='the id of the mode')
+    modeName: Optional[str] = Field(None, description='the name of the mode')
+
+
+class SceneModeRequest(BaseModel):
+    modeId: str = Field(..., description='The id of the mode')
+    actionId: Optional[str] = Field(
+        None,
+        description='the id of the action to be created. Optional, sent by Reaver only',
+    )
+    modeName: Optional[str] = Field(None, description='The name of the mode')
+
+
+class Security(Enum):
+    setArmStay = 'setArmStay'
+    setArmAway = 'setArmAway'
+    disarm = 'disarm'
+
+
+class SceneSecurityModeRequest(BaseModel):
+    actionId: Optional[str] = Field(
+        None,
+        description='the id of the action to be created. Optional, sent by Reaver only',
+    )
+    security: Security = Field(..., description='The id of the security mode')
+    arguments: Optional[str] = Field(None, description='Additional query param')
+
+
+class SceneSleepRequest(BaseModel):
+    seconds: int = Field(..., description='Number of seconds to sleep the sequence')
+
+
+class Status1(Enum):
+    proposed = 'proposed'
+    live = 'live'
+    deprecated = 'deprecated'
+    dead = 'dead'
+
+
+class SceneArgument(BaseModel):
+    name: Optional[str] = Field(None, description='the name of the command')
+    schema_: Optional[Dict[str, Any]] = Field(
+        None, alias='schema', description='the schema of the command'
+    )
+    value: Optional[Dict[str, Any]] = Field(
+        None, description='The value being set for the capability command'
+    )
+
+
+class ScenePagedResult(BaseModel):
+    items: Optional[List[SceneSummary]] = None
+    _links: Optional[Links] = None
+
+
+class SceneCommand(BaseModel):
+    arguments: Optional[List[SceneArgument]] = Field(
+        None, description='the command arguments'
+    )
+
+
+class SceneCapability(BaseModel):
+    capabilityId: Optional[str] = Field(None, description='The id of the capability')
+    status: Optional[Status1] = Field(None, description='The status of the capability')
+    commands: Optional[Dict[str, SceneCommand]] = Field(
+        None, description='Capability commands'
+    )
+
+
+class SceneDeviceGroup(BaseModel):
+    deviceGroupId: Optional[str] = Field(None, description='the id of the device')
+    capability: Optional[SceneCapability] = None
+
+
+class SceneDeviceGroupRequest(BaseModel):
+    deviceGroupId: str = Field(..., description='the id of the device group')
+    actionId: Optional[str] = Field(
+        None,
+        description='the id of the action to be created. Optional, sent by Reaver only',
+    )
+    capability: Optional[SceneCapability] = None
+
+
+class SceneComponent(BaseModel):
+    componentId: Optional[str] = Field(None, description='the id of the component')
+    capabilities: Optional[List[SceneCapability]] = None
+
+
+class SceneDevice(BaseModel):
+    deviceId: Optional[str] = Field(None, description='the id of the device')
+    deviceLabel: Optional[str] = Field(None, description='the label of the device')
+    deviceName: Optional[str] = Field(None, description='the name of the device')
+    deviceTypeId: Optional[str] = Field(
+        None, description="The identifier for the device's DeviceType."
+    )
+    components: Optional[List[SceneComponent]] = None
+    locationId: Optional[str] = Field(None, description='Location of the device')
+
+
+class SceneDeviceRequest(BaseModel):
+    deviceId: Optional[str] = Field(None, description='the id of the device')
+    actionId: Optional[str] = Field(
+        None,
+        description='the id of the action to be created. Optional, sent by Reaver only',
+    )
+    components: Optional[List[SceneComponent]] = None
+
+
+class SceneAction(BaseModel):
+    deviceRequest: Optional[SceneDeviceRequest] = None
+    modeRequest: Optional[SceneModeRequest] = None
+    sleepRequest: Optional[SceneSleepRequest] = None
+    deviceGroupRequest: Optional[SceneDeviceGroupRequest] = None
+
+
+class SceneActionSequence(BaseModel):
+    __root__: List[SceneAction]
+
+
+class SceneRequest(BaseModel):
+    sceneName: str = Field(..., description='The user-defined name of the Scene')
+    sceneIcon: Optional[str] = Field(None, description='The name of the icon')
+    sceneColor: Optional[str] = Field(None, description='The color of the icon')
+    devices: List[SceneDeviceRequest] = Field(
+        ..., description='Non-sequential list of device actions'
+    )
+    sequences: Optional[List[SceneActionSequence]] = Field(
+        None, description='List of parallel action sequences'
+    )
+    mode: Optional[SceneModeRequest] = None
+    securityMode: Optional[SceneSecurityModeRequest] = None
+    devicegroups: Optional[List[SceneDeviceGroupRequest]] = Field(
+        None, description='List of device group actions'
+    )
@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.capabilities import (
+    Capability1,
+)
+
+
+class ServiceSubscriptionBody(BaseModel):
+    capabilities: List[Capability1] = Field(
+        ...,
+        description='capability name(s).\nNOTE: alert cannot be combined with other capabilities\n',
+    )
+    isaId: str = Field(..., description='InstalledApp ID\n')
+    geoplaceId: Optional[str] = Field(
+        None,
+        description='Geo Place ID (This ID is only supported in "alert" capability)\n',
+    )
+    type: Optional[str] = Field(
+        None, description='DIRECT or EXECUTION delivery, default to DIRECT'
+    )
+    predicate: Optional[str] = Field(
+        None,
+        description='JEXL formatted expression. See https://commons.apache.org/proper/commons-jexl/reference/syntax.html\n',
+    )
+
+
+class ServiceNewSubscription(BaseModel):
+    locationId: str = Field(..., description='location ID')
+    subscriptionId: Optional[str] = Field(None, description='subscription ID created')
+
+
+class ServiceDeleteSubscription(BaseModel):
+    locationId: str = Field(..., description='location ID')
+    count: float = Field(..., description='number of subscription deleted')
+
+
+class ServiceCapability(Enum):
+    alert = 'alert'
+    weather = 'weather'
+    airQuality = 'airQuality'
+    forecast = 'forecast'
+    airQualityForecast = 'airQualityForecast'
+
+
+class ServiceCapabilities(BaseModel):
+    __root__: List[ServiceCapability] = Field(
+        ...,
+        description='capability name(s)',
+        example={
+            'capabilities': [
+                'alert',
+                'weather',
+                'forecast',
+                'airQuality',
+                'airQualityForecast',
+            ]
+        },
+    )
+
+
+class AudioFormat(Enum):
+    mp3 = 'mp3'
+    pcm = 'pcm'
+
+
+class TtsProvider(Enum):
+    polly = 'polly'
+    bixby = 'bixby'
+
+
+class Engine(Enum):
+    standard = 'standard'
+    neural = 'neural'
+
+
+class SpeakingStyle(Enum):
+    news = 'news'
+    conversational = 'conversational'
+
+
+class TTSBody(BaseModel):
+    text: str = Field(
+        ...,
+        description='Text to be converted to audio. Cannot exceed 2000 characters for Polly and 425 characters for Bixby',
+    )
+    languageCode: str = Field(
+        ...,
+        description='Language used for the text to be converted to speech. Please refer tts/info API to get the options available',
+    )
+    voiceId: str = Field(
+        ...,
+        description='VoiceId to be used for the text. Please refer tts/info API to get the options available',
+    )
+    audioFormat: Optional[AudioFormat] = Field(
+        None,
+        description='Audio format of the audio file, default to mp3 when ttsProvider is Amazon Polly, default to pcm when ttsProvider is Bixby. Amazon Polly supports mp3 and pcm. Bixby supports only pcm.',
+    )
+    ttsProvider: Optional[TtsProvider] = Field(
+        None,
+        description='TTS provider to use for converting text to speech, default to polly',
+    )
+    engine: Optional[Engine] = Field(
+        None,
+        description='TTS engine to be used, default to standard, standard - robotic voice, neural - human like and natural voice. This option is available only when ttsProvider is Amazon Polly. Please refer tts/info API to get the options available',
+    )
+    speakingStyle: Optional[SpeakingStyle] = Field(
+        None,
+        description='Speaking style to be used. This option is available only when ttsProvider is Amazon Polly, engine is neural, and voiceIds are one of the following - Matthew, Joanna, Lupe. Please refer tts/info API to get the options available',
+    )
+
+
+class AudioFormat1(Enum):
+    mp3 = 'mp3'
+    pcm = 'pcm'
+
+
+class TtsProvider1(Enum):
+    polly = 'polly'
+    bixby = 'bixby'
+
+
+class Engine1(Enum):
+    standard = 'standard'
+    neural = 'neural'
+
+
+class SpeakingStyle1(Enum):
+    news = 'news'
+    conversational = 'conversational'
+
+
+class PlaytextBody(BaseModel):
+    deviceId: str = Field(
+        ...,
+        description='Device ID of device on which the audio should be played. Device must support audioNotification capability.',
+    )
+    text: str = Field(
+        ...,
+        description='Text to be converted to audio. Cannot exceed 2000 characters for Polly and 425 characters for Bixby',
+    )
+    languageCode: str = Field(
+        ...,
+        description='Language used for the text to be converted to speech. Please refer tts/info API to get the options available',
+    )
+    voiceId: str = Field(
+        ...,
+        description='VoiceId to be used for the text. Please refer tts/info API to get the options available',
+    )
+    audioFormat: Optional[AudioFormat1] = Field(
+        None,
+        description='Audio format of the audio file, default to mp3 when ttsProvider is Amazon Polly, default to pcm when ttsProvider is Bixby. Amazon Polly supports mp3 and pcm. Bixby supports only pcm.',
+    )
+    ttsProvider: Optional[TtsProvider1] = Field(
+        None,
+        description='TTS provider to use for converting text to speech, default to polly',
+    )
+    engine: Optional[Engine1] = Field(
+        None,
+        description='TTS engine to be used, default to standard, standard - robotic voice, neural - human like and natural voice. This option is available only when ttsProvider is Amazon Polly. Please refer tts/info API to get the options available',
+    )
+    speakingStyle: Optional[SpeakingStyle1] = Field(
+        None,
+        description='Speaking style to be used. This option is available only when ttsProvider is Amazon Polly, engine is neural, and voiceIds are one of the following - Matthew, Joanna, Lupe. Please refer tts/info API to get the options available',
+    )
+    volume: Optional[conint(ge=0, le=100)] = Field(
+        None,
+        description='Volume of the device at which the audio notification will be played',
+    )
+
+
+class ConvertedTTS(BaseModel):
+    message: str = Field(..., description='message to indicate success')
+    audioURL: str = Field(..., description='Audio URL')
+
+
+class PlayedText(BaseModel):
+    message: str = Field(..., description='message to indicate success')
+
+
+class Gender(Enum):
+    Female = 'Female'
+    Male = 'Male'
+
+
+class SupportedEngine(Enum):
+    neural = 'neural'
+    standard = 'standard'
+
+
+class TTSProvider(Enum):
+    bixby = 'bixby'
+    polly = 'polly'
+
+
+class SpeakingStyleEnum(Enum):
+    news = 'news'
+    conversational = 'conversational'
+
+
+class Voice(BaseModel):
+    Gender: Gender = Field(..., description='Gender of the voice')
+    Id: str = Field(..., description='Voice id of the voice')
+    LanguageCode: str = Field(..., description='Language code of the voice')
+    LanguageName: str = Field(..., description='Language of the voice')
+    Name: str = Field(..., description='Name of the voice')
+    SupportedEngines: Optional[List[SupportedEngine]] = Field(
+        None,
+        description='Supported engines for the voice. This option will be available only when TTSProvider is Amazon Polly',
+    )
+    TTSProvider: TTSProvider = Field(..., description='TTS provider for the voice')
+    SpeakingStyle: Optional[List[SpeakingStyleEnum]] = Field(
+        None,
+        description='Supported speaking styles for the voice.  This option will be available only when TTSProvider is Amazon Polly, engine is neural, and voiceIds are one of the following - Matthew, Joanna, Lupe',
+    )
+
+
+class TTSInfo(BaseModel):
+    voices: List[Voice] = Field(..., description='Voices supported by the TTS service')
+
+
+class PartnerSTConnection(Enum):
+    connected = 'connected'
+    disconnected = 'disconnected'
+
+
+class PartnerSTConnection1(Enum):
+    connected = 'connected'
+    disconnected = 'disconnected'
+
+
+class IsaResults(BaseModel):
+    isaId: str = Field(..., description='isaId installed for the user')
+    appName: str = Field(
+        ...,
+        description='SmartThings Schema connector name given by partner eg Lifx (Connect)',
+    )
+    partnerName: str = Field(..., description='Parnter name eg Lifx Inc')
+    icon: str = Field(..., description='url of partner icon')
+    icon2x: str = Field(..., description='url of partner icon in 2x dimensions')
+    icon3x: str = Field(..., description='url of partner icon in 3x dimensions')
+    locationId: str = Field(..., description='location of the installed smart app')
+    partnerSTConnection: PartnerSTConnection1 = Field(
+        ..., description='connection status between partner and ST platform'
+    )
+    endpointAppId: str = Field(
+        ..., description='endpoint app id of the installed smart app'
+    )
+
+
+class DeviceResults(BaseModel):
+    deviceId: Optional[str] = Field(None, description='deviceId created by DM')
+    name: Optional[str] = Field(
+        None, description='initial device name from the partner'
+    )
+
+
+class CommandArguments(BaseModel):
+    __root__: str = Field(..., example=30)
+
+
+class PostReceipt(BaseModel):
+    endpointAppId: Optional[UUID] = Field(
+        None, example='viper_9121f970-f503-11e8-a7de-7319cef9605d'
+    )
+    stClientId: Optional[UUID] = Field(
+        None, example='e3fd04cb-c488-4bbd-9759-8deb512656a8'
+    )
+    stClientSecret: Optional[UUID] = Field(
+        None,
+        example='02c75d945e69e167233cb635b1f9be76d97ebb0b04f4e6839f3acfad320bed64ab86838dc6312585b037259e7797bf2bb44b3caa7a60539c1f402abe3bbe9256424615fddc48e76823b9c230b15669901becb33711e48192aa54a31e4e287ff47295c61c15e2e046103f13aa250bb561136625b69304cc31ef5004d267d0847184426144c60a74329bb47e2f773469ebb6a1e585175370fda78e03413abbcafe51665e8cbe51adf37dd5a3ff376300ebdbe2a359589951a72867bd3fcc574bd77b9ac85127023f931de3c5bcb213efeab3d94a7ee4a3d20acc6f6e575755b10bceb74290f4182c9bddc407d4361710492611568ebcb0b2ffac09e70d0c977d5f',
+    )
+
+
+class GenerateStOauthBody(BaseModel):
+    endpointAppId: Optional[str] = Field(
+        None, description='SmartThings Schema App id for the partner'
+    )
+
+
+class ViperAppLinks(BaseModel):
+    android: Optional[str] = Field(
+        None, description='app deep linking to partners in android'
+    )
+    ios: Optional[str] = Field(None, description='app deep linking to partners in ios')
+    isLinkingEnabled: Optional[bool] = Field(
+        None, description='whether deep app linking is enabled'
+    )
+
+
+class Subscription1(BaseModel):
+    subscriptionId: str = Field(..., description='subscription ID')
+    geoplaceId: Optional[str] = Field(
+        None,
+        description='Geo Place ID (This ID is only supported in "alert" capability)\n',
+    )
+    type: str = Field(
+        ..., description='DIRECT or EXECUTION delivery, default to DIRECT'
+    )
+    predicate: Optional[str] = Field(None, description='JEXL expression string')
+    subscribedCapabilities: ServiceCapabilities
+
+
+class ServiceLocationInfo(BaseModel):
+    locationId: str = Field(..., description='location ID')
+    subscriptions: List[Subscription1]
+    latitude: float = Field(..., description='latitude')
+    longitude: float = Field(..., description='longitude')
+    city: str = Field(..., description='city')
+
+
+class Isa(BaseModel):
+    pageType: Optional[str] = Field(
+        None,
+        description='Possible values - __requiresLogin__ or __loggedIn__. These two values determine what fields are returned in this response. If value is "requiresLogin", only "oAuthLink" is returned in the response. If value is "loggedIn", only isaId, partnerName, appName, devices and icons are returned.',
+    )
+    isaId: Optional[str] = Field(None, description='isaId (Installed App Id)')
+    endpointAppId: Optional[str] = Field(
+        None, description='endpoint app id of the installed smart app'
+    )
+    partnerName: Optional[str] = Field(
+        None, description='partner or brand name eg LIFX Inc.'
+    )
+    appName: Optional[str] = Field(
+        None, description='Connector name. eg Lifx (Connect)'
+    )
+    icon: Optional[str] = Field(None, description='url of partner icon')
+    icon2x: Optional[str] = Field(
+        None, description='url of partner icon in 2x dimensions'
+    )
+    icon3x: Optional[str] = Field(
+        None, description='url of partner icon in 3x dimensions'
+    )
+    locationId: Optional[str] = Field(
+        None, description='location of the installed smart app'
+    )
+    devices: Optional[List[DeviceResults]] = None
+    oAuthLink: Optional[str] = Field(
+        None,
+        description='generated oAuth link for the user to login to partner server. This will only be returned when the user is not logged in.',
+    )
+    viperAppLinks: Optional[ViperAppLinks] = None
+    partnerSTConnection: Optional[PartnerSTConnection] = Field(
+        None, description='connection status between partner and ST platform'
+    )
+
+
+class LocationIsa(BaseModel):
+    installedSmartApps: Optional[List[IsaResults]] = None
+
+
+class PostEndpointApp(BaseModel):
+    appName: Optional[str] = Field(
+        None, description='The name of the SmartThings Schema App'
+    )
+    partnerName: str = Field(..., description='The name of the partner/brand')
+    oAuthAuthorizationUrl: str = Field(
+        ..., description='oAuth authorization url of the partner'
+    )
+    lambdaArn: Optional[str] = Field(
+        None, description='lambda arn of the partner for US region (default)'
+    )
+    lambdaArnEU: Optional[str] = Field(
+        None, description='lambda arn of the partner for EU region'
+    )
+    lambdaArnAP: Optional[str] = Field(
+        None, description='lambda arn of the partner for AP region'
+    )
+    lambdaArnCN: Optional[str] = Field(
+        None, description='lambda arn of the partner for CN region'
+    )
+    icon: Optional[str] = Field(None, description='url of partner icon')
+    icon2x: Optional[str] = Field(
+        None, description='url of partner icon in 2x dimensions'
+    )
+    icon3x: Optional[str] = Field(
+        None, description='url of partner icon in 3x dimensions'
+    )
+    endpointAppId: Optional[str] = Field(
+        None, description='SmartThings Schema App id for the partner'
+    )
+    oAuthClientId: str = Field(..., description='Client id for the partner oAuth')
+    oAuthClientSecret: str = Field(
+        ..., description='Client secret for the partner oAuth'
+    )
+    oAuthTokenUrl: str = Field(
+        ..., description='oAuth token refresh url of the partner'
+    )
+    oAuthScope: Optional[str] = Field(
+        None,
+        description='oAuth scope for the partner. Example "remote_control:all" for Lifx',
+    )
+    userId: Optional[str] = Field(None, description='user id for the partner')
+    hostingType: str = Field(..., description='Possible values - "lambda" or "webhook"')
+    schemaType: Optional[str] = Field(
+        None,
+        description='Possible values - "alexa-schema", "st-schema", "google-schema"',
+    )
+    webhookUrl: Optional[str] = Field(None, description='webhook url for the partner')
+    certificationStatus: Optional[str] = Field(
+        None, description='Possible values - "", "cst", "wwst", "review"'
+    )
+    userEmail: Optional[str] = Field(None, description='Email for the partner')
+    viperAppLinks: Optional[ViperAppLinks] = None
+
+
+class EndpointApp(BaseModel):
+    appName: Optional[str] = Field(
+        None, description='The name of the SmartThings Schema App'
+    )
+    partnerName: Optional[str] = Field(
+        None, description='The name of the partner/brand'
+    )
+    oAuthAuthorizationUrl: Optional[str] = Field(
+        None, description='oAuth authorization url of the partner'
+    )
+    lambdaArn: Optional[str] = Field(
+        None, description='lambda arn of the partner for US region (default)'
+    )
+    lambdaArnEU: Optional[str] = Field(
+        None, description='lambda arn of the partner for EU region'
+    )
+    lambdaArnAP: Optional[str] = Field(
+        None, description='lambda arn of the partner for AP region'
+    )
+    lambdaArnCN: Optional[str] = Field(
+        None, description='lambda arn of the partner for CN region'
+    )
+    icon: Optional[str] = Field(None, description='url of partner icon')
+    icon2x: Optional[str] = Field(
+        None, description='url of partner icon in 2x dimensions'
+    )
+    icon3x: Optional[str] = Field(
+        None, description='url of partner icon in 3x dimensions'
+    )
+    endpointAppId: Optional[str] = Field(
+        None, description='endpoint app id for the partner'
+    )
+    oAuthClientId: Optional[str] = Field(
+        None, description='Client id for the partner oAuth'
+    )
+    oAuthClientSecret: Optional[str] = Field(
+        None, description='Client secret for the partner oAuth'
+    )
+    oAuthTokenUrl: Optional[str] = Field(
+        None, description='oAuth token refresh url of the partner'
+    )
+    oAuthScope: Optional[str] = Field(
+        None,
+        description='oAuth scope for the partner. Example "remote_control:all" for Lifx',
+    )
+    userId: Optional[str] = Field(None, description='user id for the partner')
+    hostingType: Optional[str] = Field(
+        None, description='Possible values - "lambda" or "webhook"'
+    )
+    schemaType: Optional[str] = Field(
+        None,
+        description='Possible values - "alexa-schema", "st-schema", "google-schema"',
+    )
+    webhookUrl: Optional[str] = Field(None, description='webhook url for the partner')
+    certificationStatus: Optional[str] = Field(
+        None, description='Possible values - "", "cst", "wwst", "review"'
+    )
+    userEmail: Optional[str] = Field(None, description='Email for the partner')
+    viperAppLinks: Optional[ViperAppLinks] = None
+
+
+class UserIdApp(BaseModel):
+    userId: Optional[str] = Field(None, description='UserId')
+    endpointApps: Optional[List[EndpointApp]] = None
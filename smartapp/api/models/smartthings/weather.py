@@ -0,0 +1,1658 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import AnyUrl, BaseModel, Extra, Field, conint, constr
+
+from smartapp.api.models.smartthings.services import (
+    ServiceCapabilities,
+)
+
+
+class LastUpdateTime(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='Time the data was pull from content provider.\nISO 8601 in UTC - YYYY-MM-DDTHH:MM:SS.SSSZ\n',
+    )
+
+
+class HeadlineText(BaseModel):
+    value: Optional[str] = Field(None, description='severe alert headline text')
+
+
+class Severity(BaseModel):
+    value: Optional[int] = Field(
+        None,
+        description='severity of the alert. Smaller the number the more severe the alert is.',
+    )
+
+
+class MessageType1(BaseModel):
+    value: Optional[int] = Field(None, description='1: new\n2: update\n3: cancel\n')
+
+
+class IssueTime(BaseModel):
+    value: Optional[str] = Field(None, description='UTC time when the alert is issued')
+
+
+class ExpireTime(BaseModel):
+    value: Optional[str] = Field(None, description='UTC time when the alert is expired')
+
+
+class AlertItem(BaseModel):
+    lastUpdateTime: Optional[LastUpdateTime] = None
+    headlineText: Optional[HeadlineText] = None
+    severity: Optional[Severity] = None
+    messageType: Optional[MessageType1] = None
+    issueTime: Optional[IssueTime] = None
+    expireTime: Optional[ExpireTime] = None
+
+
+class LastUpdateTime1(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='Time the data was pull from content provider.\nISO 8601 in UTC - YYYY-MM-DDTHH:MM:SS.SSSZ\n',
+    )
+
+
+class Vendor(BaseModel):
+    value: Optional[str] = Field(None, description='Name of the content provider')
+
+
+class Version1(BaseModel):
+    value: Optional[str] = Field(
+        None, description='API version number used with the given vendor'
+    )
+
+
+class AirQualityIndex(BaseModel):
+    value: Optional[int] = Field(None, description='air quality index')
+    unit: Optional[str] = Field(None, description='CAQI')
+
+
+class O3Amount(BaseModel):
+    value: Optional[float] = Field(
+        None, description='(Available for Korea Only) Ozone pollutant in ug/m3'
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class O3Index(BaseModel):
+    value: Optional[float] = Field(
+        None, description='(Available for non-Korea Only) index of Ozone pollutant'
+    )
+    unit: Optional[str] = Field(None, description='EPA')
+
+
+class No2Amount(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(Available for Korea Only) Nitrogen Dioxide pollutant in ug/m3',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class No2Index(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(Available for non-Korea Only) index of Nitrogen Dioxide pollutant',
+    )
+    unit: Optional[str] = Field(None, description='EPA')
+
+
+class So2Amount(BaseModel):
+    value: Optional[float] = Field(
+        None, description='(Available for Korea Only) Sulfur Dioxide pollutant in ug/m3'
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class So2Index(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(Available for non-Korea Only) index of Sulfur Dioxide pollutant',
+    )
+    unit: Optional[str] = Field(None, description='EPA')
+
+
+class CoAmount(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(Available for Korea Only) Carbon Monoxide pollutant in ug/m3',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class CoIndex(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(Available for non-Korea Only) index of Carbon Monoxide pollutant',
+    )
+    unit: Optional[str] = Field(None, description='EPA')
+
+
+class Pm10Amount(BaseModel):
+    value: Optional[float] = Field(
+        None, description='amount of particulate matter less than 10 microns in ug/m3'
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Index(BaseModel):
+    value: Optional[int] = Field(
+        None, description='index of particulate matter less than 10 microns'
+    )
+    unit: Optional[str] = Field(None, description='EPA')
+
+
+class Pm25Amount(BaseModel):
+    value: Optional[float] = Field(
+        None, description='amount of particulate matter less than 2.5 microns in ug/m3'
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Index(BaseModel):
+    value: Optional[int] = Field(
+        None, description='index of particulate matter less than 2.5 microns'
+    )
+    unit: Optional[str] = Field(None, description='EPA')
+
+
+class AirQuality(BaseModel):
+    lastUpdateTime: Optional[LastUpdateTime1] = None
+    vendor: Optional[Vendor] = None
+    version: Optional[Version1] = None
+    airQualityIndex: Optional[AirQualityIndex] = None
+    o3Amount: Optional[O3Amount] = None
+    o3Index: Optional[O3Index] = None
+    no2Amount: Optional[No2Amount] = None
+    no2Index: Optional[No2Index] = None
+    so2Amount: Optional[So2Amount] = None
+    so2Index: Optional[So2Index] = None
+    coAmount: Optional[CoAmount] = None
+    coIndex: Optional[CoIndex] = None
+    pm10Amount: Optional[Pm10Amount] = None
+    pm10Index: Optional[Pm10Index] = None
+    pm25Amount: Optional[Pm25Amount] = None
+    pm25Index: Optional[Pm25Index] = None
+
+
+class LastUpdateTime2(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='Time the data was pull from content provider.\nISO 8601 in UTC - YYYY-MM-DDTHH:MM:SS.SSSZ\n',
+    )
+
+
+class Vendor1(BaseModel):
+    value: Optional[str] = Field(None, description='Name of the content provider')
+
+
+class Version2(BaseModel):
+    value: Optional[str] = Field(
+        None, description='API version number used with the given vendor'
+    )
+
+
+class Precip1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour liquid precipitation amount in millimeters\n'
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 1 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nmaximium 1 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n2 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 2 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 2 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n3 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 3 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 3 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n4 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 4 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 4 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = None
+
+
+class Precip5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan) 5 hours forecast liquid precipitation amount in millimeters',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 5 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 5 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='6 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 6 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 6 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n7 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 7 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 7 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n8 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 8 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 8 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n9 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 9 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 9 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n10 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 10 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 10 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n11 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 11 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 11 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n12 hours forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMin12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 12 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class PrecipMax12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nminimium 12 hour forecast liquid precipitation amount in millimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Precip24Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='Rolling twenty-four hour liquid precipitation amount in\nmillimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='mm')
+
+
+class Snow1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='One hour snowfall amount in centimeters\n'
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium one hour forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium one hour forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n2 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 2 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 2 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n3 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 3 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 3 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n4 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 4 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 4 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n5 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 5 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 5 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='6 hours forecast snowfall amount in centimeters\n'
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 6 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 6 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n7 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 7 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 7 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n8 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 8 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 8 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n9 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 9 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 9 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n10 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 10 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 10 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n11 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 11 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 11 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\n12 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMin12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMinimium 12 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class SnowMax12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea and Japan)\nMaximium 12 hours forecast snowfall amount in centimeters\n',
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Snow24Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Twenty four hour snowfall amount in centimeters\n'
+    )
+    unit: Optional[str] = Field(None, description='cm')
+
+
+class Temperature1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Temperature12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None, description='Rolling hour temperature in Celcius.\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class Forecast(BaseModel):
+    lastUpdateTime: Optional[LastUpdateTime2] = None
+    vendor: Optional[Vendor1] = None
+    version: Optional[Version2] = None
+    precip1Hour: Optional[Precip1Hour] = None
+    precipMin1Hour: Optional[PrecipMin1Hour] = None
+    precipMax1Hour: Optional[PrecipMax1Hour] = None
+    precip2Hour: Optional[Precip2Hour] = None
+    precipMin2Hour: Optional[PrecipMin2Hour] = None
+    precipMax2Hour: Optional[PrecipMax2Hour] = None
+    precip3Hour: Optional[Precip3Hour] = None
+    precipMin3Hour: Optional[PrecipMin3Hour] = None
+    precipMax3Hour: Optional[PrecipMax3Hour] = None
+    precip4Hour: Optional[Precip4Hour] = None
+    precipMin4Hour: Optional[PrecipMin4Hour] = None
+    precipMax4Hour: Optional[PrecipMax4Hour] = None
+    precip5Hour: Optional[Precip5Hour] = None
+    precipMin5Hour: Optional[PrecipMin5Hour] = None
+    precipMax5Hour: Optional[PrecipMax5Hour] = None
+    precip6Hour: Optional[Precip6Hour] = None
+    precipMin6Hour: Optional[PrecipMin6Hour] = None
+    precipMax6Hour: Optional[PrecipMax6Hour] = None
+    precip7Hour: Optional[Precip7Hour] = None
+    precipMin7Hour: Optional[PrecipMin7Hour] = None
+    precipMax7Hour: Optional[PrecipMax7Hour] = None
+    precip8Hour: Optional[Precip8Hour] = None
+    precipMin8Hour: Optional[PrecipMin8Hour] = None
+    precipMax8Hour: Optional[PrecipMax8Hour] = None
+    precip9Hour: Optional[Precip9Hour] = None
+    precipMin9Hour: Optional[PrecipMin9Hour] = None
+    precipMax9Hour: Optional[PrecipMax9Hour] = None
+    precip10Hour: Optional[Precip10Hour] = None
+    precipMin10Hour: Optional[PrecipMin10Hour] = None
+    precipMax10Hour: Optional[PrecipMax10Hour] = None
+    precip11Hour: Optional[Precip11Hour] = None
+    precipMin11Hour: Optional[PrecipMin11Hour] = None
+    precipMax11Hour: Optional[PrecipMax11Hour] = None
+    precip12Hour: Optional[Precip12Hour] = None
+    precipMin12Hour: Optional[PrecipMin12Hour] = None
+    precipMax12Hour: Optional[PrecipMax12Hour] = None
+    precip24Hour: Optional[Precip24Hour] = None
+    snow1Hour: Optional[Snow1Hour] = None
+    snowMin1Hour: Optional[SnowMin1Hour] = None
+    snowMax1Hour: Optional[SnowMax1Hour] = None
+    snow2Hour: Optional[Snow2Hour] = None
+    snowMin2Hour: Optional[SnowMin2Hour] = None
+    snowMax2Hour: Optional[SnowMax2Hour] = None
+    snow3Hour: Optional[Snow3Hour] = None
+    snowMin3Hour: Optional[SnowMin3Hour] = None
+    snowMax3Hour: Optional[SnowMax3Hour] = None
+    snow4Hour: Optional[Snow4Hour] = None
+    snowMin4Hour: Optional[SnowMin4Hour] = None
+    snowMax4Hour: Optional[SnowMax4Hour] = None
+    snow5Hour: Optional[Snow5Hour] = None
+    snowMin5Hour: Optional[SnowMin5Hour] = None
+    snowMax5Hour: Optional[SnowMax5Hour] = None
+    snow6Hour: Optional[Snow6Hour] = None
+    snowMin6Hour: Optional[SnowMin6Hour] = None
+    snowMax6Hour: Optional[SnowMax6Hour] = None
+    snow7Hour: Optional[Snow7Hour] = None
+    snowMin7Hour: Optional[SnowMin7Hour] = None
+    snowMax7Hour: Optional[SnowMax7Hour] = None
+    snow8Hour: Optional[Snow8Hour] = None
+    snowMin8Hour: Optional[SnowMin8Hour] = None
+    snowMax8Hour: Optional[SnowMax8Hour] = None
+    snow9Hour: Optional[Snow9Hour] = None
+    snowMin9Hour: Optional[SnowMin9Hour] = None
+    snowMax9Hour: Optional[SnowMax9Hour] = None
+    snow10Hour: Optional[Snow10Hour] = None
+    snowMin10Hour: Optional[SnowMin10Hour] = None
+    snowMax10Hour: Optional[SnowMax10Hour] = None
+    snow11Hour: Optional[Snow11Hour] = None
+    snowMin11Hour: Optional[SnowMin11Hour] = None
+    snowMax11Hour: Optional[SnowMax11Hour] = None
+    snow12Hour: Optional[Snow12Hour] = None
+    snowMin12Hour: Optional[SnowMin12Hour] = None
+    snowMax12Hour: Optional[SnowMax12Hour] = None
+    snow24Hour: Optional[Snow24Hour] = None
+    temperature1Hour: Optional[Temperature1Hour] = None
+    temperature2Hour: Optional[Temperature2Hour] = None
+    temperature3Hour: Optional[Temperature3Hour] = None
+    temperature4Hour: Optional[Temperature4Hour] = None
+    temperature5Hour: Optional[Temperature5Hour] = None
+    temperature6Hour: Optional[Temperature6Hour] = None
+    temperature7Hour: Optional[Temperature7Hour] = None
+    temperature8Hour: Optional[Temperature8Hour] = None
+    temperature9Hour: Optional[Temperature9Hour] = None
+    temperature10Hour: Optional[Temperature10Hour] = None
+    temperature11Hour: Optional[Temperature11Hour] = None
+    temperature12Hour: Optional[Temperature12Hour] = None
+
+
+class LastUpdateTime3(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='Time the data was pull from content provider.\nISO 8601 in UTC - YYYY-MM-DDTHH:MM:SS.SSSZ\n',
+    )
+
+
+class Vendor2(BaseModel):
+    value: Optional[str] = Field(None, description='Name of the content provider')
+
+
+class Version3(BaseModel):
+    value: Optional[str] = Field(
+        None, description='API version number used with the given vendor'
+    )
+
+
+class Pm10Index1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\none hour index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n2 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n3 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n4 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n5 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\nsix hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n7 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n8 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n9 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n10 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n11 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Index12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n12 hours index forecast of particulate matter less than 10 microns\n',
+    )
+
+
+class Pm10Amount1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\none hour dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n2 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n3 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n4 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n5 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\nsix hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n7 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n8 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n9 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n10 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n11 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm10Amount12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n12 hours dust amount forecast of particulate matter less than 10 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Index1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\none hour index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n2 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n3 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n4 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n5 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\nsix hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n7 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n8 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n9 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n10 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n11 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Index12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n12 hours index forecast of particulate matter less than 2.5 microns\n',
+    )
+
+
+class Pm25Amount1Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\none hour dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount2Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n2 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount3Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n3 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount4Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n4 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount5Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n5 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount6Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\nsix hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount7Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n7 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount8Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n8 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount9Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n9 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount10Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n10 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount11Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n11 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class Pm25Amount12Hour(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is only available in Korea)\n12 hours dust amount forecast of particulate matter less than 2.5 microns\n',
+    )
+    unit: Optional[str] = Field(None, description='μg/m^3')
+
+
+class AirQualityForecast(BaseModel):
+    lastUpdateTime: Optional[LastUpdateTime3] = None
+    vendor: Optional[Vendor2] = None
+    version: Optional[Version3] = None
+    pm10Index1Hour: Optional[Pm10Index1Hour] = None
+    pm10Index2Hour: Optional[Pm10Index2Hour] = None
+    pm10Index3Hour: Optional[Pm10Index3Hour] = None
+    pm10Index4Hour: Optional[Pm10Index4Hour] = None
+    pm10Index5Hour: Optional[Pm10Index5Hour] = None
+    pm10Index6Hour: Optional[Pm10Index6Hour] = None
+    pm10Index7Hour: Optional[Pm10Index7Hour] = None
+    pm10Index8Hour: Optional[Pm10Index8Hour] = None
+    pm10Index9Hour: Optional[Pm10Index9Hour] = None
+    pm10Index10Hour: Optional[Pm10Index10Hour] = None
+    pm10Index11Hour: Optional[Pm10Index11Hour] = None
+    pm10Index12Hour: Optional[Pm10Index12Hour] = None
+    pm10Amount1Hour: Optional[Pm10Amount1Hour] = None
+    pm10Amount2Hour: Optional[Pm10Amount2Hour] = None
+    pm10Amount3Hour: Optional[Pm10Amount3Hour] = None
+    pm10Amount4Hour: Optional[Pm10Amount4Hour] = None
+    pm10Amount5Hour: Optional[Pm10Amount5Hour] = None
+    pm10Amount6Hour: Optional[Pm10Amount6Hour] = None
+    pm10Amount7Hour: Optional[Pm10Amount7Hour] = None
+    pm10Amount8Hour: Optional[Pm10Amount8Hour] = None
+    pm10Amount9Hour: Optional[Pm10Amount9Hour] = None
+    pm10Amount10Hour: Optional[Pm10Amount10Hour] = None
+    pm10Amount11Hour: Optional[Pm10Amount11Hour] = None
+    pm10Amount12Hour: Optional[Pm10Amount12Hour] = None
+    pm25Index1Hour: Optional[Pm25Index1Hour] = None
+    pm25Index2Hour: Optional[Pm25Index2Hour] = None
+    pm25Index3Hour: Optional[Pm25Index3Hour] = None
+    pm25Index4Hour: Optional[Pm25Index4Hour] = None
+    pm25Index5Hour: Optional[Pm25Index5Hour] = None
+    pm25Index6Hour: Optional[Pm25Index6Hour] = None
+    pm25Index7Hour: Optional[Pm25Index7Hour] = None
+    pm25Index8Hour: Optional[Pm25Index8Hour] = None
+    pm25Index9Hour: Optional[Pm25Index9Hour] = None
+    pm25Index10Hour: Optional[Pm25Index10Hour] = None
+    pm25Index11Hour: Optional[Pm25Index11Hour] = None
+    pm25Index12Hour: Optional[Pm25Index12Hour] = None
+    pm25Amount1Hour: Optional[Pm25Amount1Hour] = None
+    pm25Amount2Hour: Optional[Pm25Amount2Hour] = None
+    pm25Amount3Hour: Optional[Pm25Amount3Hour] = None
+    pm25Amount4Hour: Optional[Pm25Amount4Hour] = None
+    pm25Amount5Hour: Optional[Pm25Amount5Hour] = None
+    pm25Amount6Hour: Optional[Pm25Amount6Hour] = None
+    pm25Amount7Hour: Optional[Pm25Amount7Hour] = None
+    pm25Amount8Hour: Optional[Pm25Amount8Hour] = None
+    pm25Amount9Hour: Optional[Pm25Amount9Hour] = None
+    pm25Amount10Hour: Optional[Pm25Amount10Hour] = None
+    pm25Amount11Hour: Optional[Pm25Amount11Hour] = None
+    pm25Amount12Hour: Optional[Pm25Amount12Hour] = None
+
+
+class LastUpdateTime4(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='Time the data was pull from content provider.\nISO 8601 in UTC - YYYY-MM-DDTHH:MM:SS.SSSZ\n',
+    )
+
+
+class Vendor3(BaseModel):
+    value: Optional[str] = Field(None, description='Name of the content provider')
+
+
+class Version4(BaseModel):
+    value: Optional[str] = Field(
+        None, description='API version number used with the given vendor'
+    )
+
+
+class CloudCeiling(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='(This attribute is not available in Korea and Japan) Base of lowest Mostly Cloudy or Cloudy layer in meters\n',
+    )
+    unit: Optional[str] = Field(None, description='m')
+
+
+class CloudCoverPhrase(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='(This attribute is not available in Korea and Japan)\nDescriptive sky cover - based on percentage of cloud cover.\n\nRange - Clear: coverage < 0.09375; Partly Cloudy: coverage < .59375; Mostly Cloudy: coverage < .75; Cloudy: coverage >= .75\n',
+    )
+
+
+class IconCode(BaseModel):
+    value: Optional[int] = Field(
+        None, description='This number is the key to the weather icon lookup.'
+    )
+
+
+class ConditionState(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='enumerated string of [CLEAR, SNOW, RAIN, CLOUDY, STORM, DUSTY, FOGGY]',
+    )
+
+
+class RelativeHumidity(BaseModel):
+    value: Optional[int] = Field(
+        None,
+        description='The relative humidity of the air, which is defined as the\nratio of the amount of water vapor in the air to the amount\nof vapor required to bring the air to saturation at a\nconstant temperature. Relative humidity is always expressed\nas a percentage.\n\nRange - 0 to 10\n',
+    )
+    unit: Optional[str] = Field(None, description='%')
+
+
+class SunriseTimeLocal(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='This field contains the local time of sunrise. It reflects\nany local daylight savings conventions in UTC.\n\nISO 8601 in UTC - YYYY-MM-DDTHH:MM:SS.SSSZ\n',
+    )
+
+
+class SunsetTimeLocal(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='This field contains the local time of sunset. It reflects\nany local daylight savings conventions.\n\nISO 8601 in UTC - YYYY-MM-DDTHH:MM:SS.SSSZ\n',
+    )
+
+
+class Temperature(BaseModel):
+    value: Optional[float] = Field(None, description='Temperature in Celcius\n')
+    unit: Optional[str] = Field(None, description='C')
+
+
+class TemperatureFeelsLike(BaseModel):
+    value: Optional[float] = Field(
+        None, description='An apparent temperature in Celcius\n'
+    )
+    unit: Optional[str] = Field(None, description='C')
+
+
+class UvDescription(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='(This attribute is not available in Korea and Japan) The UV index description which complements the uvIndex value\n',
+    )
+    unit: Optional[str] = None
+
+
+class UvIndex(BaseModel):
+    value: Optional[int] = Field(
+        None,
+        description='The UV index provides indices of the intensity of the solar\nradiation level and risk of skin damage due to exposure.\n\nRange - -2=Not Available, -1=No Report, 0-2=Low, 3-5=Moderate, 6-7=High, 8-10= Very High, 11-16=Extreme\n',
+    )
+
+
+class Visibility(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='The horizontal visibility at the observation point in kilometers\n',
+    )
+    unit: Optional[str] = Field(None, description='Km')
+
+
+class WeatherDetailUrl(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='A detail URL from weather vendor with a detail weather information web page\n',
+    )
+
+
+class WindDirection(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='The magnetic wind direction from which the wind blows\nexpressed in degrees.\n\nRange - 0<=wind_dire_deg<=350, in 10 degree intervals\n',
+    )
+    unit: Optional[str] = Field(None, description='°')
+
+
+class WindDirectionCardinal(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='(This attribute is not available in Korea and Japan)\nThis field contains the cardinal direction from which the\nwind blows in an abbreviated form.\n\nRange - N, NNE, NE, ENE, E, ESE, SE, SSE, S, SSW, SW, WSW, W, WNW, NW, NNW, CALM\n',
+    )
+
+
+class WindGust(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='This data field contains information about sudden and\ntemporary variations of the average Wind Speed in kilometers\nper hour.\n',
+    )
+    unit: Optional[str] = Field(None, description='Km/h')
+
+
+class WindSpeed(BaseModel):
+    value: Optional[float] = Field(
+        None,
+        description='The wind information reported in the hourly current\nconditions corresponds to a 10-minute average called the\nsustained wind speed in kilometers per hour\n',
+    )
+    unit: Optional[str] = Field(None, description='Km/h')
+
+
+class WxPhraseLong(BaseModel):
+    value: Optional[str] = Field(
+        None,
+        description='A text description of observed weather conditions\naccompanying the iconCode field.\n\nRange - 32 character phrase\n',
+    )
+
+
+class Weather(BaseModel):
+    lastUpdateTime: Optional[LastUpdateTime4] = None
+    vendor: Optional[Vendor3] = None
+    version: Optional[Version4] = None
+    cloudCeiling: Optional[CloudCeiling] = None
+    cloudCoverPhrase: Optional[CloudCoverPhrase] = None
+    iconCode: Optional[IconCode] = None
+    conditionState: Optional[ConditionState] = None
+    relativeHumidity: Optional[RelativeHumidity] = None
+    sunriseTimeLocal: Optional[SunriseTimeLocal] = None
+    sunsetTimeLocal: Optional[SunsetTimeLocal] = None
+    temperature: Optional[Temperature] = None
+    temperatureFeelsLike: Optional[TemperatureFeelsLike] = None
+    uvDescription: Optional[UvDescription] = None
+    uvIndex: Optional[UvIndex] = None
+    visibility: Optional[Visibility] = None
+    weatherDetailUrl: Optional[WeatherDetailUrl] = None
+    windDirection: Optional[WindDirection] = None
+    windDirectionCardinal: Optional[WindDirectionCardinal] = None
+    windGust: Optional[WindGust] = None
+    windSpeed: Optional[WindSpeed] = None
+    wxPhraseLong: Optional[WxPhraseLong] = None
+
+
+class ServiceCapabilityData(BaseModel):
+    locationId: str = Field(..., description='location ID')
+    name: Optional[ServiceCapabilities] = None
+    alert: Optional[List[AlertItem]] = None
+    airQuality: Optional[AirQuality] = None
+    forecast: Optional[Forecast] = None
+    airQualityForecast: Optional[AirQualityForecast] = None
+    weather: Optional[Weather] = None
+
+
+class ConditionState1(Enum):
+    UNKNOWN = 'UNKNOWN'
+    CLEAR = 'CLEAR'
+    SNOW = 'SNOW'
+    RAIN = 'RAIN'
+    CLOUDY = 'CLOUDY'
+    STORM = 'STORM'
+    DUSTY = 'DUSTY'
+    FOGGY = 'FOGGY'
+
+
+class WeatherData(BaseModel):
+    cloudCeilingInM: Optional[int] = Field(None, description='Cloud ceiling in meters')
+    cloudCoverPhrase: Optional[str] = Field(
+        None, description='The phrase of the cloud cover'
+    )
+    relativeHumidityInPercent: Optional[int] = Field(
+        None, description='Relative Humidity Percentage'
+    )
+    sunriseDate: Optional[str] = None
+    sunsetDate: Optional[str] = None
+    temperatureInC: Optional[float] = Field(
+        None, description='Temperature in degrees celsius'
+    )
+    temperatureFeelsLikeInC: Optional[float] = Field(
+        None, description='Feels-like temperature in degrees celsius'
+    )
+    uvDescription: Optional[str] = None
+    uvIndex: Optional[int] = None
+    visibilityInKm: Optional[float] = None
+    windDirectionInDegrees: Optional[int] = None
+    windDirectionCardinal: Optional[str] = None
+    windGustInKmph: Optional[int] = None
+    windSpeedInKmph: Optional[int] = None
+    conditionPhraseLong: Optional[str] = None
+    conditionState: Optional[ConditionState1] = None
+
+
+class AirQualityData(BaseModel):
+    airQualityIndex: Optional[int] = None
+    o3AmountInUgm3: Optional[float] = None
+    o3Index: Optional[int] = None
+    no2AmountInUgm3: Optional[float] = None
+    no2Index: Optional[int] = None
+    so2AmountInUgm3: Optional[float] = None
+    so2Index: Optional[int] = None
+    coAmountInUgm3: Optional[float] = None
+    coIndex: Optional[int] = None
+    pm10AmountInUgm3: Optional[float] = None
+    pm10Index: Optional[int] = None
+    pm25AmountInUgm3: Optional[float] = None
+    pm25Index: Optional[int] = None
+
+
+class Severity1(Enum):
+    UNKNOWN_SEVERITY = 'UNKNOWN_SEVERITY'
+    EXTREME = 'EXTREME'
+    SEVERE = 'SEVERE'
+    MODERATE = 'MODERATE'
+
+
+class State1(Enum):
+    NONE = 'NONE'
+    NEW = 'NEW'
+    UPDATE = 'UPDATE'
+    CANCEL = 'CANCEL'
+
+
+class SevereAlertData(BaseModel):
+    headlineText: Optional[str] = None
+    detailUrl: Optional[str] = None
+    startTime: Optional[str] = None
+    endTime: Optional[str] = None
+    severity: Optional[Severity1] = None
+    state: Optional[State1] = None
+
+
+class WeatherEvent(BaseModel):
+    weatherData: Optional[WeatherData] = None
+    airQualityData: Optional[AirQualityData] = None
+    severeAlertData: Optional[SevereAlertData] = None
+    geoPlaceId: Optional[str] = Field(None, description='The id of the GeoPlace.')
@@ -1,6 +1,10 @@
 from smartapp.api.smartapp import \
-    context, task, smartapp
+    context, definition, pool, priority, supervisor, task, lanes, smartapp
 
-AppTask    = task.AppTask
-SmartApp   = smartapp.SmartApp
-AppContext = context.AppContext
+AppTask        = task.AppTask
+ProcessPool    = pool.ProcessPool
+TaskSupervisor = supervisor.TaskSupervisor
+KeyedExecutor  = lanes.KeyedExecutor
+Priority       = priority.Priority
+SmartApp       = smartapp.SmartApp
+AppContext     = context.AppContext
@@ -1,9 +1,12 @@
 from __future__ import annotations
 import signal
+import inspect
 import fastapi
+import pydantic
 
 from smartapp import redis
 from smartapp.api import models, smartapp
+from smartapp.api.smartapp import definition
 from typing import Callable, List
 
 from smartapp import logger
@@ -19,7 +22,60 @@ class Option(dict):
         self['id'] = id
 
 
-class Setting(models.smartapp.PageSetting):
+class Node(pydantic.BaseModel):
+    """Part of a configuration page, any change bumps its revision and the
+    revisions of its parents, so that serialized pages know they are stale.
+    Once frozen, along with the definition it belongs to, it can not change.
+    """
+
+    _revision: int  = pydantic.PrivateAttr(0)
+    _parent:   Node = pydantic.PrivateAttr(None)
+    _frozen:   bool = pydantic.PrivateAttr(False)
+
+    def __setattr__(self, name, value):
+        if name not in self.__private_attributes__:
+            self.check()
+        super().__setattr__(name, value)
+        if name not in self.__private_attributes__:
+            self.touch()
+
+    def children(self) -> List[Node]:
+        return []
+
+    def freeze(self, frozen: bool=True) -> Node:
+        self._frozen = frozen
+        for child in self.children():
+            child._parent = self
+            child.freeze(frozen)
+        return self
+
+    def check(self):
+        if self._frozen:
+            raise definition.DefinitionFrozen(
+                "{} is part of a shared app definition and can not change".format(
+                    self.__class__.__name__
+                )
+            )
+
+    def touch(self):
+        self.check()
+        node = self
+        while node is not None:
+            node._revision += 1
+            node = node._parent
+
+    def adopt(self, child: Node) -> Node:
+        self.check()
+        child._parent = self
+        self.touch()
+        return child
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+
+class Setting(Node, models.smartapp.PageSetting):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -27,8 +83,9 @@ class Setting(models.smartapp.PageSetting):
         self.permissions = ['r','w','x']
 
     def option(self, name=None, id=None) -> type[Setting]:
+        self.check()
         self.options.append(Option(name, id))
-        self.options[len(self.options)-1]
+        self.touch()
         return self
 
     def has_multiple(self, val: bool) -> type[Setting]:
@@ -40,41 +97,74 @@ class Setting(models.smartapp.PageSetting):
         return self
 
 
-class Section(models.smartapp.PageSection):
+class Section(Node, models.smartapp.PageSection):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.settings = []
 
+    def children(self) -> List[Setting]:
+        return self.settings or []
+
     def setting(self, name: str, id: str, type: models.smartapp.PageSettingType,
                 multiple: bool=False, required: bool=False, **kwargs) -> List[Setting]:
-        self.settings.append(
+        self.settings.append(self.adopt(
                 Setting(name=name, id=id, type=type, multiple=multiple ,required=required, **kwargs)
-        )
+        ))
         idx = len(self.settings)-1
         log.info("add settings with index {} to section {}".format(idx, self.name))
         return self.settings[idx]
 
 
-class Page(models.smartapp.PageData):
+class Page(Node, models.smartapp.PageData):
+
+    _render_copy: bool = pydantic.PrivateAttr(False)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.sections = []
 
+    def children(self) -> List[Section]:
+        return self.sections or []
+
+    @property
+    def shareable(self) -> bool:
+        """False when a render function without arguments updates the page
+        itself, which can then not be shared by installed apps"""
+        return self._render_copy or not self.render_func
+
     def reset(self):
+        self.check()
         while len(self.sections):
             self.sections.pop()
+        self.touch()
 
     def section(self, name=None) -> List[Section]:
-        self.sections.append(Section(name=name))
+        self.sections.append(self.adopt(Section(name=name)))
         idx = len(self.sections)-1
         log.info("page {}: add section with index {}".format(self.pageId, idx))
         return self.sections[idx]
 
     def render(self, body: Callable):
+        """Render the page on every request with `body`, an async function
+        called with the installed app and a copy of the page to fill.
+
+        Functions without arguments update the page itself: apps with such
+        pages do not share their definition, every installed app builds
+        its own with the app factory."""
+        self.check()
+        self._render_copy = bool(inspect.signature(body).parameters)
         self.render_func = body
 
+    async def rendered(self, app: smartapp.SmartApp) -> Page:
+        if not self._render_copy:
+            self.check()
+            await self.render_func()
+            return self
+        page = self.copy(deep=True).freeze(False)
+        await self.render_func(app, page)
+        return page
+
 
 class Route(object):
 
@@ -82,23 +172,22 @@ class Route(object):
         self.verb = verb
         self.path = path
         self.func = func
-        self.app  = None
         self.auth = None
 
     def set_auth_handler(self, func: str) -> type[Route]:
         self.auth = func
         return self
 
-    def register(self):
-        handler = getattr(self.app, self.func)
-        path = '/{}{}'.format(self.app.app_id, self.path)
+    def register(self, app: smartapp.SmartApp):
+        handler = getattr(app, self.func)
+        path = '/{}{}'.format(app.app_id, self.path)
 
         kwargs = {'path': path,
                   'methods': [self.verb],
                   'endpoint': handler}
 
         if self.auth:
-            auth = getattr(self.app, self.auth)
+            auth = getattr(app, self.auth)
             auth = fastapi.Depends(auth)
             kwargs.update({'dependencies': [auth]})
         router.add_route(**kwargs)
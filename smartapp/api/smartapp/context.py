@@ -3,7 +3,7 @@ import aiohttp
 from typing import Generator
 
 from smartapp.api import models, types, smartapp
-from smartapp import redis, api, authentication
+from smartapp import redis, api, authentication, metrics, tracing
 
 from smartapp import logger
 log = logger.get()
@@ -14,18 +14,42 @@ class AppContext(redis.Redis):
 
     _instances = {}
     _ctx = {}
+    _restored = set()
+    _template = None
     new_app = None
     key = KEY_PREFIX + 'none'
 
+    @classmethod
+    def template(cls) -> smartapp.SmartApp:
+        """The app built by `new_app`, once, whose definition is shared by
+        the instances of all the installed apps when it is shareable"""
+        if not cls._template:
+            cls._template = cls.new_app()
+            if cls._template.definition.shareable:
+                cls._template.definition.freeze()
+        return cls._template
+
+    @classmethod
+    def install(cls) -> smartapp.SmartApp:
+        template = cls.template()
+        if not template.definition.frozen:
+            log.warning("app definition %s renders pages in place, built per installed app",
+                        template.name)
+            app = cls.new_app()
+            app.setup()
+            return app
+        return template.install()
+
     @classmethod
     async def get(cls, app_id: str) -> type[smartapp.SmartApp]:
         if app_id in cls._instances:
             return cls._instances[app_id]
-        log.info("no app instance for app_id %s (found: %s)", app_id, cls._instances.keys())
-        app = cls.new_app()
-        app.ctx = cls(app_id, app)
-        app.load_routes()
-        return app
+        with tracing.span('context.get', app_id=app_id):
+            log.info("no app instance for app_id %s (found: %s)", app_id, cls._instances.keys())
+            app = cls.install()
+            app.ctx = cls(app_id, app)
+            app.load_routes()
+            return app
 
     @classmethod
     async def delete(cls, app: smartapp.SmartApp):
@@ -53,9 +77,20 @@ class AppContext(redis.Redis):
 
     @classmethod
     async def init(cls) -> None:
-        cls.key = KEY_PREFIX + cls.new_app().name
-        for app_id in cls().hkeys(cls.key):
-            app = await cls.get(app_id.decode())
+        """Instantiate the installed apps and replay their update
+        lifecycle; the apps restored from a `smartapp.state.Snapshot` are
+        not replayed, their contexts are loaded from a single `HGETALL`"""
+        cls.key = KEY_PREFIX + cls.template().name
+        restored, cls._restored = cls._restored, set()
+        stored = cls().hgetall(cls.key) if restored else dict.fromkeys(cls().hkeys(cls.key))
+        for app_id, raw in stored.items():
+            app_id = app_id.decode()
+            if app_id in restored:
+                if app_id not in cls._ctx:
+                    cls._ctx[app_id] = types.AppCtx.parse_raw(raw)
+                await cls.get(app_id)
+                continue
+            app = await cls.get(app_id)
             await app.lifecycle_update(
                 models.smartapp.InstallData(
                     installedApp=models.smartapp.InstalledApp(
@@ -159,3 +194,10 @@ class AppContext(redis.Redis):
     @property
     def secret(self) -> str:
         return self.app_ctx.secret
+
+
+metrics.Gauge('smartapp_context_cache_entries', 'Entries in the AppContext caches',
+              ['cache'], function=lambda: {
+                  ('instances',): len(AppContext._instances),
+                  ('ctx',):       len(AppContext._ctx),
+              })
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from typing import Any
+
+from smartapp import logger
+log = logger.get()
+
+
+class DefinitionFrozen(TypeError):
+    pass
+
+
+class AppDefinition(object):
+    """Definition of a SmartApp: name, OAuth scopes, configuration pages
+    and routes, along with their serialized configuration responses.
+
+    The definition is built once by the app factory given to
+    `smartapp.init`, frozen, and shared by the
+    `smartapp.api.smartapp.smartapp.SmartApp` instance of every installed
+    app, which only keep their own context and configuration.
+    """
+
+    __slots__ = ('name', 'description', 'st_id', 'permissions', 'pages',
+                 'routes', 'frozen', 'revision', 'serialized')
+
+    def __init__(self, name: str, st_id: str):
+        self.name        = name
+        self.description = name
+        self.st_id       = st_id
+        self.permissions = []
+        self.pages       = {}
+        self.routes      = []
+        self.frozen      = False
+        self.revision    = 0
+        self.serialized  = {}
+
+    def check(self):
+        if self.frozen:
+            raise DefinitionFrozen(
+                "the definition of '{}' is shared by installed apps and can not change".format(self.name)
+            )
+
+    def touch(self):
+        """Mark the definition as changed, so its serialized responses
+        are built again"""
+        self.check()
+        self.revision += 1
+
+    @property
+    def shareable(self) -> bool:
+        """False when a page is rendered in place, see
+        `smartapp.api.smartapp.configuration.Page.render`"""
+        return all(page.shareable for page in self.pages.values())
+
+    def freeze(self) -> AppDefinition:
+        if not self.frozen:
+            self.permissions = tuple(self.permissions)
+            for page in self.pages.values():
+                page.freeze()
+            self.frozen = True
+            log.info("app definition %s: %s pages, %s routes, %s scopes",
+                     self.name, len(self.pages), len(self.routes), len(self.permissions))
+        return self
+
+    def cached(self, key: str, owner: Any, revision: int) -> bytes:
+        cached = self.serialized.get(key)
+        if cached and cached[0] is owner and cached[1] == revision:
+            return cached[2]
+        return None
+
+    def cache(self, key: str, owner: Any, revision: int, data: bytes) -> bytes:
+        self.serialized[key] = (owner, revision, data)
+        return data
@@ -0,0 +1,128 @@
+from __future__ import annotations
+import asyncio
+import collections
+from typing import Callable, List
+
+from smartapp.api.smartapp import task, priority, supervisor
+
+from smartapp import logger
+log = logger.get()
+
+LANE_APP    = 'app'
+LANE_DEVICE = 'device'
+
+
+class Lane(object):
+    """FIFO of pending calls for a single key, drained by one worker"""
+
+    __slots__ = ('key', 'pending', 'tail', 'worker')
+
+    def __init__(self, key):
+        self.key     = key
+        self.pending = collections.deque()
+        self.tail    = None
+        self.worker  = None
+
+
+class KeyedExecutor(object, metaclass=supervisor.TaskMeta):
+    """Run calls serially per key, and in parallel across keys.
+
+    Every lane is keyed by `(app_id, device_id)`.  Work for an installed
+    app as a whole (install, update, uninstall, ...) uses `device_id=None`.
+    When `tasks['lanes']` is set to `'device'`, device events are given a
+    lane of their own so that two devices of the same app do not wait on
+    each other, while the app lane still acts as a barrier: device work
+    waits for the app work queued before it, and app work waits for all
+    device work queued before it.
+
+    Lanes only exist while they have pending work, so idle apps hold no
+    state here.
+    """
+
+    _lanes  = {}
+    _groups = {}
+
+    @classmethod
+    def by_device(cls) -> bool:
+        return cls.config.get('lanes', LANE_APP) == LANE_DEVICE
+
+    @classmethod
+    def barrier(cls, app_id: str, device_id: str=None) -> List[asyncio.Future]:
+        """Futures that a new call on this lane has to wait for"""
+        if device_id is None:
+            keys = cls._groups.get(app_id, ())
+            return [cls._lanes[key].tail for key in keys if key[1] is not None]
+        lane = cls._lanes.get((app_id, None))
+        return [lane.tail] if lane else []
+
+    @classmethod
+    def submit(cls, app_id: str, func: Callable, *args, device_id: str=None,
+                    prio: priority.Priority=priority.Priority.HIGH,
+                    timeout=task.DEFAULT_TIMEOUT, **kwargs) -> asyncio.Future:
+        """Queue `func(*args, **kwargs)` on the lane for `app_id` / `device_id`,
+        the call is run by `smartapp.api.smartapp.supervisor.TaskSupervisor`
+        with priority `prio`
+
+        Returns:
+            `asyncio.Future`: resolved with the result of the call
+        """
+        key = (app_id, device_id)
+        after = [fut for fut in cls.barrier(app_id, device_id) if not fut.done()]
+        fut = asyncio.get_running_loop().create_future()
+        fut.add_done_callback(task.AppTask.done)
+
+        lane = cls._lanes.get(key)
+        if not lane:
+            lane = cls._lanes[key] = Lane(key)
+            cls._groups.setdefault(app_id, set()).add(key)
+        lane.pending.append((func, args, kwargs, prio, timeout, after, fut))
+        lane.tail = fut
+        if not lane.worker:
+            lane.worker = supervisor.TaskSupervisor.spawn(
+                cls._drain(lane), name='lane:{}'.format(app_id), limit=False, timeout=None
+            )
+        return fut
+
+    @classmethod
+    async def _drain(cls, lane: Lane):
+        try:
+            while lane.pending:
+                func, args, kwargs, prio, timeout, after, fut = lane.pending[0]
+                if after:
+                    await asyncio.wait(after)
+                if not fut.done():
+                    try:
+                        result = await supervisor.TaskSupervisor.spawn(
+                            func(*args, **kwargs), app_id=lane.key[0], prio=prio,
+                            name=getattr(func, '__qualname__', None), timeout=timeout
+                        )
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        if not fut.done():
+                            fut.set_exception(e)
+                    else:
+                        if not fut.done():
+                            fut.set_result(result)
+                lane.pending.popleft()
+        finally:
+            for item in lane.pending:
+                item[-1].cancel()
+            cls._release(lane)
+
+    @classmethod
+    def _release(cls, lane: Lane):
+        app_id = lane.key[0]
+        cls._lanes.pop(lane.key, None)
+        group = cls._groups.get(app_id)
+        if group is not None:
+            group.discard(lane.key)
+            if not group:
+                cls._groups.pop(app_id)
+
+    @classmethod
+    def pending(cls, app_id: str=None) -> int:
+        """Number of queued calls, for one app or overall"""
+        if app_id is not None:
+            return sum(len(cls._lanes[key].pending) for key in cls._groups.get(app_id, ()))
+        return sum(len(lane.pending) for lane in cls._lanes.values())
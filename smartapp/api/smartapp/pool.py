@@ -0,0 +1,198 @@
+from __future__ import annotations
+import os
+import time
+import pickle
+import asyncio
+import importlib
+import multiprocessing
+from concurrent import futures
+from typing import Any, Dict, Tuple
+
+from smartapp.api.smartapp import supervisor
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_START_METHOD = 'spawn'
+
+
+def invoke(ref: Tuple[str, str], payload: bytes) -> Tuple[float, bytes]:
+    """Worker side of `ProcessPool.run`, resolves the function from its
+    module and qualified name, and runs the undecorated version of it."""
+    module, qualname = ref
+    func = importlib.import_module(module)
+    for attr in qualname.split('.'):
+        func = getattr(func, attr)
+    func = getattr(func, '__wrapped__', func)
+    started = time.time()
+    args, kwargs = pickle.loads(payload)
+    return started, pickle.dumps(func(*args, **kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class ProcessPool(object, metaclass=supervisor.TaskMeta):
+    """Managed `concurrent.futures.ProcessPoolExecutor` used by
+    `smartapp.api.smartapp.task.AppTask.cpu_bound`.
+
+    The pool is started on first use with `tasks['processes']` workers
+    (default: cpu count) using the `tasks['start_method']` multiprocessing
+    context.  Arguments and results are pickled once with the highest
+    protocol, which also gives the payload sizes reported by `stats()`.
+
+    A call which times out, or whose task is cancelled (e.g. by the
+    timeout of its supervised task or lane), is cancelled if it is still
+    queued.  If it already started it is left to complete, its result
+    discarded, until every worker runs such an abandoned call: the only
+    way to stop them is then to terminate the workers, and the pool is
+    recycled.  The calls killed by a recycle, queued or started, are
+    submitted again to the new pool.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get(cls) -> ProcessPool:
+        if not cls._instance:
+            cls._instance = cls(
+                cls.config.get('processes', os.cpu_count() or 1),
+                cls.config.get('start_method', DEFAULT_START_METHOD)
+            )
+        return cls._instance
+
+    @classmethod
+    def shutdown(cls, wait: bool=True):
+        if cls._instance:
+            cls._instance.close(wait=wait)
+            cls._instance = None
+
+    @classmethod
+    async def stop(cls):
+        """`shutdown()` without blocking the event loop while the workers
+        complete their calls"""
+        await asyncio.get_running_loop().run_in_executor(None, cls.shutdown)
+
+    def __init__(self, processes: int, start_method: str=DEFAULT_START_METHOD):
+        self.processes    = processes
+        self.start_method = start_method
+        self._executor    = None
+        self.in_flight    = 0
+        self.submitted    = 0
+        self.completed    = 0
+        self.failed       = 0
+        self.timeouts     = 0
+        self.cancelled    = 0
+        self.recycled     = 0
+        self.retried      = 0
+        self.abandoned    = set()
+        self.generation   = 0
+        self.queue_wait   = 0.0
+        self.run_time     = 0.0
+        self.bytes_in     = 0
+        self.bytes_out    = 0
+
+    @property
+    def executor(self) -> futures.ProcessPoolExecutor:
+        if not self._executor:
+            log.info("starting process pool with %s workers", self.processes)
+            self._executor = futures.ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context(self.start_method)
+            )
+        return self._executor
+
+    def recycle(self):
+        executor, self._executor = self._executor, None
+        if not executor:
+            return
+        log.warning("recycling process pool, %s workers run abandoned calls",
+                    len(self.abandoned))
+        self.recycled += 1
+        self.generation += 1
+        self.abandoned = set()
+        for proc in list((getattr(executor, '_processes', None) or {}).values()):
+            proc.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def abandon(self, cfut: futures.Future):
+        """Stop a call whose result is no longer awaited"""
+        if cfut.cancel():
+            return
+        abandoned = self.abandoned
+        abandoned.add(cfut)
+        cfut.add_done_callback(abandoned.discard)
+        if len(abandoned) >= self.processes:
+            self.recycle()
+
+    def killed(self, cfut: futures.Future, generation: int) -> bool:
+        """Whether a call was cancelled or broken by a recycle of the pool
+        rather than by its caller"""
+        if generation == self.generation or not cfut.done():
+            return False
+        return cfut.cancelled() or isinstance(cfut.exception(), futures.process.BrokenProcessPool)
+
+    def close(self, wait: bool=True):
+        executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def run(self, ref: Tuple[str, str], args: Tuple, kwargs: Dict[str, Any],
+                        timeout: float=None) -> Any:
+        payload = pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+        self.bytes_in += len(payload)
+        self.submitted += 1
+        self.in_flight += 1
+        submitted = time.time()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                generation = self.generation
+                cfut = self.executor.submit(invoke, ref, payload)
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    started, result = await asyncio.wait_for(asyncio.wrap_future(cfut),
+                                                             remaining)
+                    break
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    self.abandon(cfut)
+                    raise
+                except asyncio.CancelledError:
+                    if not self.killed(cfut, generation):
+                        self.cancelled += 1
+                        self.abandon(cfut)
+                        raise
+                except futures.process.BrokenProcessPool:
+                    if not self.killed(cfut, generation):
+                        self.failed += 1
+                        raise
+                except Exception:
+                    self.failed += 1
+                    raise
+                self.retried += 1
+                log.info("%s killed by a recycle of the process pool, submitted again", ref[1])
+        finally:
+            self.in_flight -= 1
+        finished = time.time()
+        self.completed += 1
+        self.queue_wait += started - submitted
+        self.run_time += finished - started
+        self.bytes_out += len(result)
+        return pickle.loads(result)
+
+    def stats(self) -> Dict[str, Any]:
+        done = self.completed or 1
+        return {
+            'processes':      self.processes,
+            'in_flight':      self.in_flight,
+            'submitted':      self.submitted,
+            'completed':      self.completed,
+            'failed':         self.failed,
+            'timeouts':       self.timeouts,
+            'cancelled':      self.cancelled,
+            'recycled':       self.recycled,
+            'retried':        self.retried,
+            'abandoned':      len(self.abandoned),
+            'queue_wait_avg': self.queue_wait / done,
+            'run_time_avg':   self.run_time / done,
+            'bytes_in':       self.bytes_in,
+            'bytes_out':      self.bytes_out,
+        }
@@ -0,0 +1,84 @@
+from __future__ import annotations
+import enum
+import asyncio
+import contextlib
+import collections
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_RESERVED    = 8
+
+
+class Priority(enum.IntEnum):
+    """Scheduling class of a unit of work, lower values are served first"""
+    HIGH = 0
+    LOW  = 1
+
+
+class PriorityLimiter(object):
+    """Bounded number of concurrently running tasks, split in two classes.
+
+    `Priority.HIGH` work (configuration, install, update, uninstall...)
+    may use the full `capacity`, while `Priority.LOW` work (device events,
+    timers) is capped so that `reserved` slots always stay available to
+    high priority work.  Waiters are woken highest priority first, FIFO
+    within a class.
+    """
+
+    def __init__(self, capacity: int, reserved: int=0):
+        if reserved >= capacity:
+            raise ValueError('reserved must be lower than capacity')
+        self.capacity = capacity
+        self.reserved = reserved
+        self.active   = [0 for _ in Priority]
+        self.waiters  = [collections.deque() for _ in Priority]
+
+    def available(self, prio: Priority) -> bool:
+        if sum(self.active) >= self.capacity:
+            return False
+        if prio == Priority.LOW:
+            return self.active[prio] < self.capacity - self.reserved
+        return True
+
+    async def acquire(self, prio: Priority):
+        if not any(self.waiters[p] for p in Priority if p <= prio) \
+                and self.available(prio):
+            self.active[prio] += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self.waiters[prio].append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release(prio)
+            raise
+
+    def release(self, prio: Priority):
+        self.active[prio] -= 1
+        self.wake()
+
+    def wake(self):
+        for prio in Priority:
+            waiters = self.waiters[prio]
+            while waiters and self.available(prio):
+                fut = waiters.popleft()
+                if fut.done():
+                    continue
+                self.active[prio] += 1
+                fut.set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, prio: Priority):
+        await self.acquire(prio)
+        try:
+            yield
+        finally:
+            self.release(prio)
+
+    def stats(self) -> dict:
+        return {prio.name: {'active': self.active[prio],
+                            'waiting': len(self.waiters[prio])}
+                for prio in Priority}
@@ -1,17 +1,31 @@
 from __future__ import annotations
+import copy
+import json
 import random
 import threading
 import asyncio
-from typing import List, Dict, Any, Generator
+from typing import List, Dict, Any, Callable, Generator
 
-from smartapp import api
+from fastapi.encoders import jsonable_encoder
+
+from smartapp import api, scheduler, state, tracing
 from smartapp.api import smartthings, models, types
-from smartapp.api.smartapp import configuration, task
+from smartapp.api.smartapp import configuration, definition, task
 
 from smartapp import logger
 log = logger.get()
 
 
+def serialize(data: models.smartapp.ConfigurationData) -> bytes:
+    """Body of the `LifecycleResponse` the lifecycle route sends for `data`"""
+    with tracing.span('serialize'):
+        resp = models.LifecycleResponse.parse_obj({'configurationData': data.dict()})
+        return json.dumps(
+            jsonable_encoder(resp, exclude_none=True),
+            ensure_ascii=False, allow_nan=False, separators=(',', ':')
+        ).encode('utf-8')
+
+
 class SmartApp(object):
     """class: SmartApp
 
@@ -27,15 +41,82 @@ class SmartApp(object):
             name (str): SmartApp appName
             descrtiption (str): SmartApp description
         """
-        self.name          = name
-        self.description   = name
-        self.st_id         = st_id
-        self.permissions   = []
+        self.definition    = definition.AppDefinition(name, st_id)
         self.ctx           = None
-        self.routes        = []
-        self.pages         = {}
         self.configuration = {}
 
+    def install(self) -> SmartApp:
+        """New instance of the app for an installed app.  The (frozen)
+        definition is shared, the other attributes set by the app factory
+        are deep copied, so that installed apps never share their state.
+        State which can not be copied (locks, clients, ...) is created in
+        `setup()`, called on every installed app."""
+        self.definition.freeze()
+        memo = {id(self.definition): self.definition}
+        memo.update((id(page), page) for page in self.pages.values())
+        memo.update((id(route), route) for route in self.routes)
+        app = object.__new__(self.__class__)
+        for name, value in self.__dict__.items():
+            try:
+                app.__dict__[name] = copy.deepcopy(value, memo)
+            except (TypeError, copy.Error) as e:
+                raise TypeError(
+                    "{}.{} can not be copied for an installed app, create it in setup(): {}".format(
+                        self.__class__.__name__, name, e
+                    )
+                )
+        app.ctx           = None
+        app.configuration = {}
+        app.setup()
+        return app
+
+    def setup(self):
+        """Per installed app initialization, for state which can not be
+        copied from the app built by the factory given to `smartapp.init`"""
+        pass
+
+    def touch(self):
+        self.definition.touch()
+
+    @property
+    def name(self):
+        return self.definition.name
+
+    @name.setter
+    def name(self, value):
+        self.touch()
+        self.definition.name = value
+
+    @property
+    def description(self):
+        return self.definition.description
+
+    @description.setter
+    def description(self, value):
+        self.touch()
+        self.definition.description = value
+
+    @property
+    def st_id(self):
+        return self.definition.st_id
+
+    @st_id.setter
+    def st_id(self, value):
+        self.touch()
+        self.definition.st_id = value
+
+    @property
+    def permissions(self):
+        return self.definition.permissions
+
+    @property
+    def pages(self):
+        return self.definition.pages
+
+    @property
+    def routes(self):
+        return self.definition.routes
+
     @property
     def app_id(self):
         """`smartapp.api.smartapp.context.AppContext.app_id` (InstappedAppId)"""
@@ -91,8 +172,9 @@ class SmartApp(object):
         Returns:
             `SmartApp` (self)
         """
+        self.touch()
         if scopes:
-            self.permissions += scopes
+            self.permissions.extend(scopes)
         else:
             self.permissions.append(scope)
         return self
@@ -109,6 +191,7 @@ class SmartApp(object):
             `smartapp.api.smartapp.configuration.Page`: a new page
 
         """
+        self.touch()
         if not pageId:
             pageId = len(self.pages)
         kwargs.update({'pageId': str(pageId), 'name': name, 'complete': last_page})
@@ -130,6 +213,7 @@ class SmartApp(object):
         Returns:
             `smartapp.api.smartapp.configuration.Route`: the new route
         """
+        self.touch()
         route = configuration.Route(verb=verb, path=path, func=func)
         self.routes.append(route)
         return route
@@ -182,6 +266,10 @@ class SmartApp(object):
             obj = {'capability': obj}
         if type == models.SubscriptionType.SCENE_LIFECYCLE:
             obj = {'sceneLifecycle': obj}
+        if type == models.SubscriptionType.DEVICE_HEALTH:
+            obj = {'deviceHealth': obj}
+        if type == models.SubscriptionType.HUB_HEALTH:
+            obj = {'hubHealth': obj}
         obj.update({'sourceType': type.value})
 
         return await smartthings.InstalledApp(
@@ -208,7 +296,7 @@ class SmartApp(object):
         coros = []
         async for item in installedapp.subscriptions():
             coros.append(installedapp.unsubscribe(item.id))
-        await asyncio.wait({task.AppTask(asyncio.gather, *coros)})
+        await asyncio.wait({task.AppTask.awaited(asyncio.gather, *coros)})
 
     async def subscriptions(self) -> Generator[models.Subscription]:
         """List this AppContext Subscriptions
@@ -236,6 +324,111 @@ class SmartApp(object):
             session=self.session, app_id=self.app_id
         ).event(evt)
 
+    def schedule(self, name: str, handler: str=scheduler.scheduler.DEFAULT_HANDLER,
+                       delay: float=None, cron: str=None, timezone: str='UTC',
+                       data: Dict[str, Any]=None) -> int:
+        """Schedule a call to `handler` with a `smartapp.api.models.smartthings.TimerEvent`,
+        once after `delay` seconds, or on every occurrence of `cron`.  Schedules are
+        persisted by `smartapp.scheduler.Scheduler` and survive restarts, scheduling
+        an existing name replaces it.
+
+        Args:
+            name (str): schedule name, unique for the InstalledApp
+            handler (str): name of the SmartApp method to call
+            delay (float): seconds from now, for a one time schedule
+            cron (str): cron expression, for a recurring schedule
+            timezone (str): timezone of the cron expression
+            data (dict): JSON serializable value passed as second argument to `handler`
+
+        Returns:
+            int: next due time, in millis
+        """
+        if (delay is None) == (cron is None):
+            raise ValueError("schedule() requires one of delay or cron")
+        req = models.smartthings.ScheduleRequest(name=name)
+        if cron:
+            req.cron = models.smartthings.CronSchedule(expression=cron, timezone=timezone)
+        else:
+            req.once = models.smartthings.OnceSchedule(time=scheduler.scheduler.now_ms() + int(delay * 1000))
+        return scheduler.Scheduler.add(self.app_id, req, handler=handler, data=data)
+
+    def unschedule(self, name: str=None) -> int:
+        """Delete schedule `name`, or all the schedules of this InstalledApp
+
+        Returns:
+            int: number of schedules deleted
+        """
+        if name:
+            return int(scheduler.Scheduler.remove(self.app_id, name))
+        return scheduler.Scheduler.clear(self.app_id)
+
+    def schedules(self) -> Dict[str, Dict[str, Any]]:
+        """Schedules of this InstalledApp, by name"""
+        return dict(scheduler.Scheduler.list(self.app_id))
+
+    async def device_state(self, device_id: str, component: str, capability: str,
+                                 attribute: str, max_age: float=None) -> state.State:
+        """Current value of a device attribute, from the mirror of the
+        location kept up to date by the DEVICE_EVENTs of its apps, see
+        `smartapp.state.DeviceState`.  The device status is only requested
+        for attributes the mirror has not seen, or older than `max_age`.
+
+        Args:
+            device_id (str): SmartThings DeviceID
+            component (str): component id, 'main' for most devices
+            capability (str): capability id
+            attribute (str): attribute name
+            max_age (float): seconds, refresh older values from the API
+
+        Returns:
+            `smartapp.state.State`: value, unit, source and age
+        """
+        return await state.DeviceState.state(self.location_id, self.session, device_id,
+                                             component, capability, attribute, max_age)
+
+    async def inventory(self) -> state.Index:
+        """Index of the devices of the location, by capability, room and
+        profile, and of its scenes, listed once per process and kept up to
+        date by `subscribe_inventory()`, see `smartapp.state.Inventory`
+
+        Returns:
+            `smartapp.state.Index`
+        """
+        return await state.Inventory.get(self.location_id, self.session)
+
+    async def subscribe_inventory(self):
+        """Subscribe to the device and scene lifecycle events of the
+        location, which keep `inventory()` up to date without listing the
+        devices again"""
+        await self.subscribe(models.SubscriptionType.DEVICE_LIFECYCLE, {})
+        await self.subscribe(models.SubscriptionType.SCENE_LIFECYCLE, {})
+
+    async def subscribe_health(self):
+        """Subscribe to the device and hub health events of the location,
+        which keep the health table consulted by `command()` up to date"""
+        await self.subscribe(models.SubscriptionType.DEVICE_HEALTH, {})
+        await self.subscribe(models.SubscriptionType.HUB_HEALTH, {})
+
+    async def command(self, device_id: str, cmd: Dict[str, Any],
+                            defer: float=None) -> Dict[Any, Any]:
+        """Send a command to a device, unless the health table of the
+        location reports it offline, see `smartapp.state.Health`
+
+        Args:
+            device_id (str): SmartThings DeviceID
+            cmd (dict): `smartapp.api.models.smartthings.DeviceCommand`
+            defer (float): seconds to wait for an offline device to come
+                back online, before giving up
+
+        Returns:
+            dict
+
+        Raises:
+            `smartapp.state.DeviceOffline`: the device is offline
+        """
+        await state.Health.ready(self.location_id, device_id, defer)
+        return await smartthings.Device(session=self.session).command(device_id, cmd)
+
     @task.AppTask.handle_excs
     async def renew_token(self):
         log.info("requesting token refresh for app_id %s", self.app_id)
@@ -257,6 +450,9 @@ class SmartApp(object):
 
     def initialize(self) -> models.smartapp.ConfigurationData:
         self.configuration = {}
+        return self.initialize_data()
+
+    def initialize_data(self) -> models.smartapp.ConfigurationData:
         return models.smartapp.ConfigurationData(
             initialize=models.smartapp.InitializeData(
                 name=self.name,
@@ -275,15 +471,40 @@ class SmartApp(object):
         page = self.pages[str(pageId)]
 
         if page.render_func:
-            await page.render_func()
+            page = await page.rendered(self)
 
         return models.smartapp.ConfigurationData(
             page=page
         )
 
+    def serialized(self, key: str, owner: Any, revision: int,
+                         build: Callable[[], models.smartapp.ConfigurationData]) -> bytes:
+        """Serialized response of a static part of the definition, built
+        once and kept until the revision of its owner changes"""
+        data = self.definition.cached(key, owner, revision)
+        if data is None:
+            data = self.definition.cache(key, owner, revision, serialize(build()))
+        return data
+
+    def initialize_response(self) -> bytes:
+        """Serialized `LifecycleResponse` of the INITIALIZE phase"""
+        self.configuration = {}
+        return self.serialized('initialize', self.definition, self.definition.revision,
+                               self.initialize_data)
+
+    async def page_response(self, pageId: str) -> bytes:
+        """Serialized `LifecycleResponse` of a PAGE phase, only pages with
+        a render function are rendered and serialized on every request"""
+        page = self.pages[str(pageId)]
+        if page.render_func:
+            return serialize(await self.pageId(pageId))
+        return self.serialized(
+            'page:{}'.format(pageId), page, page.revision,
+            lambda: models.smartapp.ConfigurationData(page=page)
+        )
+
     def load_routes(self):
         for route in self.routes:
-            route.app = self
-            route.register()
+            route.register(self)
 
         configuration.router.reload()
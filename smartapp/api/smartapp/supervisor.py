@@ -0,0 +1,215 @@
+from __future__ import annotations
+import time
+import asyncio
+import contextlib
+import contextvars
+import collections
+from typing import Any, Coroutine, Dict, List
+
+import smartapp
+from smartapp import metrics, tracing
+from smartapp.api.smartapp import priority
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_TIMEOUT  = 10.0
+DEFAULT_PER_APP  = 8
+DEFAULT_GRACE    = 30.0
+TIMED_OUT_KEEP   = 100
+
+TASKS = metrics.Counter('smartapp_tasks', 'Supervised tasks by outcome',
+                        ['outcome'])
+
+# set while a supervised task holds its slots, tasks spawned from it with
+# inherit=True run within the slots of their parent
+_holding = contextvars.ContextVar('smartapp_task_slots', default=())
+
+
+class TaskMeta(type):
+
+    @property
+    def config(cls):
+        return getattr(smartapp.config, 'tasks', None) or {}
+
+
+class TaskInfo(object):
+    """Bookkeeping of a supervised task"""
+
+    __slots__ = ('name', 'app_id', 'prio', 'timeout', 'created', 'started')
+
+    def __init__(self, name: str, app_id: str, prio: priority.Priority, timeout: float):
+        self.name    = name
+        self.app_id  = app_id
+        self.prio    = prio
+        self.timeout = timeout
+        self.created = time.monotonic()
+        self.started = None
+
+    def dict(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            'name':    self.name,
+            'app_id':  self.app_id,
+            'prio':    self.prio.name,
+            'timeout': self.timeout,
+            'state':   'running' if self.started else 'waiting',
+            'age':     now - self.created,
+            'runtime': now - self.started if self.started else 0.0,
+        }
+
+
+class TaskSupervisor(object, metaclass=TaskMeta):
+    """Owner of every task created through `smartapp.api.smartapp.task.AppTask`
+    and `smartapp.api.smartapp.lanes.KeyedExecutor`.
+
+    Tasks run once they obtain a slot of the global
+    `smartapp.api.smartapp.priority.PriorityLimiter`
+    (`tasks['concurrency']`, `tasks['reserved']`) and a slot of their
+    installed app (`tasks['per_app']`).  A supervised task which awaits
+    a child spawns it with `inherit=True`: the child reuses the slots of
+    its parent, so nesting cannot deadlock.  Other children, which may
+    outlive their parent, obtain their own slots.
+
+    On shutdown, `drain()` waits up to `tasks['grace']` seconds for the
+    tracked tasks before cancelling what is left.
+    """
+
+    _tasks     = {}
+    _apps      = {}
+    _limiter   = None
+    _timed_out = collections.deque(maxlen=TIMED_OUT_KEEP)
+
+    @classmethod
+    def limiter(cls) -> priority.PriorityLimiter:
+        if not cls._limiter:
+            cls._limiter = priority.PriorityLimiter(
+                cls.config.get('concurrency', priority.DEFAULT_CONCURRENCY),
+                cls.config.get('reserved', priority.DEFAULT_RESERVED)
+            )
+        return cls._limiter
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def app_slot(cls, app_id: str):
+        entry = cls._apps.get(app_id)
+        if not entry:
+            entry = cls._apps[app_id] = [
+                asyncio.Semaphore(cls.config.get('per_app', DEFAULT_PER_APP)), 0
+            ]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                cls._apps.pop(app_id, None)
+
+    @classmethod
+    def spawn(cls, coro: Coroutine, name: str=None, app_id: str=None,
+                   prio: priority.Priority=priority.Priority.HIGH,
+                   timeout: float=DEFAULT_TIMEOUT, limit: bool=True,
+                   inherit: bool=False) -> asyncio.Task:
+        """Run `coro` as a supervised task
+
+        Args:
+            coro (Coroutine): coroutine to run
+            name (str): task name, used for introspection
+            app_id (str): InstalledAppId the work belongs to
+            prio (`smartapp.api.smartapp.priority.Priority`): scheduling class
+            timeout (float): seconds before the task is cancelled, None for no limit
+            limit (bool): False to bypass the concurrency limits
+            inherit (bool): the caller awaits the task, which may run within
+                the slots held by the caller
+
+        Returns:
+            `asyncio.Task`
+        """
+        info = TaskInfo(name or getattr(coro, '__qualname__', str(coro)), app_id, prio, timeout)
+        task = asyncio.get_running_loop().create_task(cls._run(coro, info, limit, inherit), name=info.name)
+        cls._tasks[task] = info
+        task.add_done_callback(cls._tasks.pop)
+        return task
+
+    @classmethod
+    async def _run(cls, coro: Coroutine, info: TaskInfo, limit: bool, inherit: bool) -> Any:
+        async with contextlib.AsyncExitStack() as stack:
+            try:
+                holding = _holding.get() if inherit else ()
+                if limit and 'global' not in holding:
+                    await stack.enter_async_context(cls.limiter().slot(info.prio))
+                    holding += ('global',)
+                if limit and info.app_id and info.app_id not in holding:
+                    await stack.enter_async_context(cls.app_slot(info.app_id))
+                    holding += (info.app_id,)
+            except BaseException:
+                coro.close()
+                raise
+            _holding.set(holding)
+            info.started = time.monotonic()
+            try:
+                with tracing.span('task', task=info.name):
+                    result = await asyncio.wait_for(coro, info.timeout)
+            except asyncio.TimeoutError:
+                TASKS.labels('timeout').inc()
+                cls._timed_out.append(info.dict())
+                raise
+            except asyncio.CancelledError:
+                TASKS.labels('cancelled').inc()
+                raise
+            except Exception:
+                TASKS.labels('failed').inc()
+                raise
+            TASKS.labels('ok').inc()
+            return result
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._tasks)
+
+    @classmethod
+    async def drain(cls, grace: float=None):
+        """Wait for the tracked tasks to complete, at most `grace` seconds,
+        then cancel the remaining ones"""
+        if grace is None:
+            grace = cls.config.get('grace', DEFAULT_GRACE)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + grace
+        current = asyncio.current_task()
+        log.info("draining %s tasks", len(cls._tasks))
+        while True:
+            tasks = [task for task in cls._tasks if task is not current]
+            remaining = deadline - loop.time()
+            if not tasks or remaining <= 0:
+                break
+            await asyncio.wait(tasks, timeout=remaining)
+        if tasks:
+            log.warning("cancelling %s tasks after %ss grace period", len(tasks), grace)
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks, timeout=1.0)
+
+    @classmethod
+    def running(cls, app_id: str=None) -> List[Dict[str, Any]]:
+        """Tracked tasks, optionally only those of `app_id`"""
+        return [info.dict() for info in cls._tasks.values()
+                if app_id is None or info.app_id == app_id]
+
+    @classmethod
+    def timed_out(cls) -> List[Dict[str, Any]]:
+        """The most recent tasks which were cancelled by their timeout"""
+        return list(cls._timed_out)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            'tasks':     len(cls._tasks),
+            'apps':      len(cls._apps),
+            'timed_out': len(cls._timed_out),
+            'limiter':   cls.limiter().stats(),
+        }
+
+
+metrics.Gauge('smartapp_tasks_tracked', 'Supervised tasks waiting or running',
+              function=TaskSupervisor.size)
@@ -7,25 +7,30 @@ import traceback
 from typing import Callable, Any
 
 from smartapp.api import types
+from smartapp.api.smartapp import pool, supervisor
 
 from smartapp import logger
 log = logger.get()
 
-DEFAULT_TIMEOUT=10.0
+DEFAULT_TIMEOUT = supervisor.DEFAULT_TIMEOUT
+
 
 class AppTask(object):
     """Create a new AppTask instance.  Provides a convenient way
     to run a particular function as an async task, handling basic
     plubming like timeouts, exceptions, logging, etc.
 
+    Tasks are owned by `smartapp.api.smartapp.supervisor.TaskSupervisor`,
+    which bounds their concurrency and drains them on shutdown.  When
+    `func` is a SmartApp method, the task counts toward the limit of its
+    installed app.
+
     Args:
         func (Callable): function to call
         args (list): call args
         kwargs (dict): call kwargs
     """
 
-    loop = asyncio.get_event_loop()
-
     @staticmethod
     def handle_excs(func: Callable) -> Callable:
         """(**decorator**) Provides a standard set of exception handlers
@@ -67,12 +72,30 @@ class AppTask(object):
         """
         @functools.wraps(func)
         async def wrapper(self, *args, **kwargs):
-            coro = asyncio.wait_for(
-                func(self, *args, **kwargs), timeout=timeout
-            )
+            cls(func, self, *args, timeout=timeout, **kwargs)
+        return wrapper
 
-            task = cls.loop.create_task(coro)
-            task.add_done_callback(cls.done)
+    @classmethod
+    def cpu_bound(cls, func: Callable=None, *,
+                       timeout: float=DEFAULT_TIMEOUT) -> Callable:
+        """(**decorator**) The decorated function is executed in the
+        `smartapp.api.smartapp.pool.ProcessPool` rather than on the event
+        loop, and becomes awaitable.  Use it for CPU heavy work such as
+        aggregations or parsing large payloads.
+
+        The function must be defined at module level (or be a
+        staticmethod), and its arguments and result must be picklable.
+        May be used as `@AppTask.cpu_bound` or `@AppTask.cpu_bound(timeout=30)`.
+        """
+        if func is None:
+            return functools.partial(cls.cpu_bound, timeout=timeout)
+        if '<locals>' in func.__qualname__:
+            raise TypeError('cpu_bound requires a module level function')
+        ref = (func.__module__, func.__qualname__)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await pool.ProcessPool.get().run(ref, args, kwargs, timeout=timeout)
         return wrapper
 
     @classmethod
@@ -87,27 +110,42 @@ class AppTask(object):
         """
         @functools.wraps(func)
         async def wrapper(self, *args, **kwargs):
-            coro = asyncio.wait_for(
-                func(self, *args, **kwargs), timeout=timeout
-            )
-
-            task = cls.loop.create_task(coro)
-            task.add_done_callback(cls.done)
+            cls(func, self, *args, timeout=timeout, **kwargs)
         return wrapper(self, *args, **kwargs)
 
-    def __new__(cls, func: Callable, *args,
-                     timeout=DEFAULT_TIMEOUT, **kwargs) -> None:
-        coro = asyncio.wait_for(
-            func(*args, **kwargs), timeout=timeout
-        )
+    @classmethod
+    def awaited(cls, func: Callable, *args,
+                     timeout=DEFAULT_TIMEOUT, **kwargs) -> asyncio.Task:
+        """Like `AppTask`, for a task which the caller awaits: it runs
+        within the concurrency slots held by the caller, if any"""
+        return cls.spawn(func, args, kwargs, timeout, True)
 
-        task = cls.loop.create_task(coro)
+    @classmethod
+    def spawn(cls, func: Callable, args: tuple, kwargs: dict,
+                   timeout: float, inherit: bool) -> asyncio.Task:
+        task = supervisor.TaskSupervisor.spawn(
+            func(*args, **kwargs), name=func.__qualname__,
+            app_id=cls.owner(func, args), timeout=timeout, inherit=inherit
+        )
         task.add_done_callback(cls.done)
-        asyncio.ensure_future(task, loop=cls.loop)
         return task
 
+    def __new__(cls, func: Callable, *args,
+                     timeout=DEFAULT_TIMEOUT, **kwargs) -> asyncio.Task:
+        return cls.spawn(func, args, kwargs, timeout, False)
+
+    @staticmethod
+    def owner(func: Callable, args: tuple) -> str:
+        """InstalledAppId of the SmartApp a call belongs to, if any"""
+        for obj in (getattr(func, '__self__', None), args[0] if args else None):
+            app_id = getattr(obj, 'app_id', None)
+            if isinstance(app_id, str):
+                return app_id
+
     @staticmethod
     def done(task):
+        if task.cancelled():
+            return
         exc = task.exception()
         if exc:
             msg = str(exc)
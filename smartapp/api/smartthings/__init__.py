@@ -1,11 +1,12 @@
 from smartapp.api.smartthings import \
     base, oauth, devices, installedapps, \
-    scenes, notification, rules
+    scenes, notification, rules, validation
 
-APIClient     = base.APIClient
-OAuth         = oauth.OAuth
-Device        = devices.Device
-InstalledApp  = installedapps.InstalledApp
-Scene         = scenes.Scene
-Notification  = notification.Notification
-Rule          = rules.Rule
+APIClient        = base.APIClient
+ValidationPolicy = validation.Policy
+OAuth            = oauth.OAuth
+Device           = devices.Device
+InstalledApp     = installedapps.InstalledApp
+Scene            = scenes.Scene
+Notification     = notification.Notification
+Rule             = rules.Rule
@@ -1,9 +1,72 @@
+from urllib import parse
+
 from smartapp.api import http
 from smartapp.api import models
+from smartapp.api.smartthings import validation
 
 class APIClient(http.RESTClient):
 
-    def __init__(self, resource, token=None, session=None):
+    def __init__(self, resource, token=None, session=None, policy=None):
         api = self.__class__.config.get('api')
-        super().__init__(api['host'], api['base'], resource, token=token, session=session)
+        super().__init__(api['host'], api['base'], resource, token=token, session=session,
+                         scheme=api.get('scheme'))
+        if policy:
+            self.validator = validation.Validator(policy, self.settings().get(
+                'sample_rate', validation.DEFAULT_SAMPLE_RATE
+            ))
+            self.listing = self.validator
+        else:
+            self.validator = validation.validator(resource, self.settings())
+            self.listing = validation.validator(
+                '{}.list'.format(resource), self.settings(), validation.Policy.TRUSTED
+            )
+
+    @classmethod
+    def settings(cls):
+        return cls.config.get('validation') or {}
+
+    def parse(self, model, data):
+        """Build a response model according to the validation policy of the
+        resource, see `smartapp.api.smartthings.validation.Policy`
+
+        Args:
+            model (Type[pydantic.BaseModel]): response model
+            data (dict): response body
+
+        Returns:
+            pydantic.BaseModel
+        """
+        return self.validator.parse(model, data)
+
+    def parse_page(self, model, data):
+        """Build a page of a listing, according to the `<resource>.list`
+        policy (default: trusted)
+
+        Args:
+            model (Type[pydantic.BaseModel]): page model
+            data (dict): response body
+
+        Returns:
+            pydantic.BaseModel
+        """
+        return self.listing.parse(model, data)
+
+    async def pages(self, model, endpoint='/', params=None):
+        """Pages of a listing, following the `_links.next` of the responses
+
+        Args:
+            model (Type[pydantic.BaseModel]): page model
+            endpoint (str): listing endpoint
+            params (dict): query of the first page
 
+        Yields:
+            pydantic.BaseModel
+        """
+        while True:
+            data = await self.do('GET', endpoint, params=params)
+            yield self.parse_page(model, data)
+            href = ((data.get('_links') or {}).get('next') or {}).get('href') \
+                if isinstance(data, dict) else None
+            if not href:
+                return
+            params = dict(parse.parse_qsl(parse.urlparse(href).query))
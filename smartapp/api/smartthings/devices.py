@@ -18,18 +18,20 @@ class Device(base.APIClient):
     def __init__(self, **kwargs):
         super().__init__(RESOURCE, **kwargs)
 
-    async def list(self):
-        """Yields a device generator, despite the function being
-        async, the generator returned is not so we are blocking
-        for the full response.
+    async def list(self, location_id=None):
+        """Yields the devices, of a location when `location_id` is
+        given, every page of the listing is requested in turn.
+
+        Args:
+            location_id (str): LocationID
 
         Yields:
-            smartapp.api.models.DeviceCollection
+            smartapp.api.models.smartthings.Device
         """
-        for item in models.DeviceCollection.construct(
-            **await self.do('GET', '/')
-        ).items:
-            yield item
+        params = {'locationId': location_id} if location_id else None
+        async for page in self.pages(models.DeviceCollection, params=params):
+            for item in page.items:
+                yield item
 
     async def get(self, device_api_id):
         """ Return the Device
@@ -40,7 +42,7 @@ class Device(base.APIClient):
         Returns:
             smartapp.api.models.smartthings.Device
         """
-        return models.smartthings.Device.parse_obj(
+        return self.parse(models.smartthings.Device,
             await self.do('GET', '/{}'.format(device_api_id))
         )
 
@@ -53,7 +55,7 @@ class Device(base.APIClient):
         Returns:
             smartapp.api.models.smartthings.DeviceStatus
         """
-        return models.smartthings.DeviceStatus.parse_obj(
+        return self.parse(models.smartthings.DeviceStatus,
             await self.do('GET', '/{}/status'.format(device_api_id))
         )
 
@@ -67,7 +69,7 @@ class Device(base.APIClient):
         Returns:
             smartapp.api.models.smartthings.ComponentStatus
         """
-        return models.smartthings.ComponentStatus.parse_obj(
+        return self.parse(models.smartthings.ComponentStatus,
             await self.do('GET',
                 '/{}/components/{}/status'.format(device_api_id, component_id)
             )
@@ -86,7 +88,7 @@ class Device(base.APIClient):
         Returns:
             smartapp.api.models.smartthings.Device
         """
-        return models.smartthings.Device.parse_obj(
+        return self.parse(models.smartthings.Device,
             await self.do('POST', '/',
                 models.smartthings.DeviceInstallRequest(
                     app=models.smartthings.App(
@@ -149,7 +151,7 @@ class Device(base.APIClient):
         Return:
             smartapp.api.models.smartthings.Device
         """
-        return models.smartthings.Device.parse_obj(
+        return self.parse(models.smartthings.Device,
             await self.do('PUT', '/{}'.format(device_api_id),
                 models.smartthings.UpdateDeviceRequest.parse_obj(
                     update
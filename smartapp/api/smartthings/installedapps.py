@@ -21,7 +21,7 @@ class InstalledApp(base.APIClient):
         Returns:
             `smartapp.api.models.InstalledAppCollection`
         """
-        return models.InstalledAppCollection.parse_obj(
+        return self.parse(models.InstalledAppCollection,
             await self.do('GET', '/')
         )
 
@@ -38,7 +38,7 @@ class InstalledApp(base.APIClient):
             if not self.app_id:
                 raise ValueError('app_id')
             app_id = self.app_id
-        for item in models.SubscriptionCollection.parse_obj(
+        for item in self.parse(models.SubscriptionCollection,
             await self.do(
                 'GET', '/' + app_id + '/subscriptions'
             ) or {'items': []}
@@ -63,7 +63,7 @@ class InstalledApp(base.APIClient):
             if not self.app_id:
                 raise ValueError('app_id')
             app_id = self.app_id
-        return models.smartthings.Subscription.parse_obj(
+        return self.parse(models.smartthings.Subscription,
             await self.do('POST', '/' + app_id + '/subscriptions',
                 models.smartthings.SubscriptionRequest.parse_obj(data).dict()
             )
@@ -12,7 +12,7 @@ class OAuth(http.RESTClient):
         basic=base64.b64encode(
             '{}:{}'.format(oauth['client_id'], oauth['client_secret']
         ).encode()).decode()
-        super().__init__(oauth['host'], oauth['base'], basic=basic)
+        super().__init__(oauth['host'], oauth['base'], basic=basic, scheme=oauth.get('scheme'))
 
     async def refresh_token(self, refresh_token):
         return models.AuthToken.parse_raw(
@@ -24,8 +24,8 @@ class Rule(base.APIClient):
         Yields:
             `smartapp.api.models.smartthings.Rule`
         """
-        for rule in models.smartthings.PagedRules.construct(
-            **await self.do('GET', '/', params={'locationId': location_id})
+        for rule in self.parse_page(models.smartthings.PagedRules,
+            await self.do('GET', '/', params={'locationId': location_id})
         ).items:
             yield rule
 
@@ -18,18 +18,20 @@ class Scene(base.APIClient):
     def __init__(self, **kwargs):
         super().__init__(RESOURCE, **kwargs)
 
-    async def list(self):
-        """Yields a scene generator, despite the function being
-        async, the generator returned is not so we are blocking
-        for the full response.
+    async def list(self, location_id=None):
+        """Yields the scenes, of a location when `location_id` is
+        given, every page of the listing is requested in turn.
+
+        Args:
+            location_id (str): LocationID
 
         Yields:
-            smartapp.api.models.SceneCollection
+            smartapp.api.models.smartthings.SceneSummary
         """
-        for item in models.SceneCollection.construct(
-            **await self.do('GET', '/')
-        ).items:
-            yield item
+        params = {'locationId': location_id} if location_id else None
+        async for page in self.pages(models.SceneCollection, params=params):
+            for item in page.items:
+                yield item
 
     async def execute(self, scene_id):
         """Execute Scene
@@ -41,6 +43,6 @@ class Scene(base.APIClient):
             smartapp.api.models.RequestStatus
         """
         endpoint = '/{}/execute'.format(scene_id)
-        return models.smartapp.RequestStatus.parse_obj(
+        return self.parse(models.smartapp.RequestStatus,
             await self.do('POST', endpoint)
         )
@@ -0,0 +1,165 @@
+from __future__ import annotations
+import enum
+import itertools
+from typing import Any, Dict, Tuple, Type
+
+import pydantic
+from pydantic import fields
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_SAMPLE_RATE = 100
+
+# field kinds of a construction plan
+SCALAR = 0
+MODEL  = 1
+ENUM   = 2
+
+IMMUTABLE = (type(None), str, int, float, bool, enum.Enum)
+
+
+class Policy(str, enum.Enum):
+    """How responses of the SmartThings API are turned into models
+
+    - FULL: `parse_obj`, every field is validated
+    - SAMPLED: one response out of `sample_rate` is validated, the others
+      are built like TRUSTED; validation errors are logged, not raised
+    - TRUSTED: `construct`, nested models and enums are built recursively
+      but scalars are kept as received
+    """
+    FULL    = 'full'
+    SAMPLED = 'sampled'
+    TRUSTED = 'trusted'
+
+
+_plans = {}
+
+
+def plan(model: Type[pydantic.BaseModel]) -> Tuple[Dict[str, Tuple[Any, ...]], Dict[str, Any], Tuple[str, ...], bool]:
+    """How to build a model, computed once: (name, shape, kind, type) of each
+    field keyed by alias and by name, the immutable defaults of optional
+    fields, the optional fields whose default must be copied, and whether
+    unknown keys are kept"""
+    cached = _plans.get(model)
+    if cached is None:
+        steps, defaults, copies = {}, {}, []
+        for name, field in model.__fields__.items():
+            kind = SCALAR
+            if isinstance(field.type_, type):
+                if issubclass(field.type_, pydantic.BaseModel):
+                    kind = MODEL
+                elif issubclass(field.type_, enum.Enum):
+                    kind = ENUM
+            steps[name] = steps[field.alias] = (name, field.shape, kind, field.type_)
+            if field.required:
+                continue
+            if field.default_factory is None and isinstance(field.default, IMMUTABLE):
+                defaults[name] = field.default
+            else:
+                copies.append(name)
+        cached = _plans[model] = (
+            steps, defaults, tuple(copies), model.__config__.extra == pydantic.Extra.allow
+        )
+    return cached
+
+
+def convert(kind: int, type_: Any, value: Any) -> Any:
+    if kind == MODEL:
+        if type_.__custom_root_type__:
+            return type_.construct(__root__=value)
+        return construct(type_, value) if isinstance(value, dict) else value
+    try:
+        return type_(value)
+    except ValueError:
+        return value
+
+
+def construct(model: Type[pydantic.BaseModel], data: Dict[str, Any]) -> pydantic.BaseModel:
+    """`model.construct()` which also builds nested models, lists and
+    mappings of models, and enums, without validating anything
+
+    Args:
+        model (Type[pydantic.BaseModel]): model to build
+        data (dict): response data, keyed by alias
+
+    Returns:
+        pydantic.BaseModel
+    """
+    steps, defaults, copies, extra = plan(model)
+    values = dict(defaults)
+    fields_set = set()
+    for key, value in data.items():
+        step = steps.get(key)
+        if not step:
+            if extra:
+                values[key] = value
+                fields_set.add(key)
+            continue
+        name, shape, kind, type_ = step
+        if kind != SCALAR and value is not None:
+            if shape == fields.SHAPE_SINGLETON:
+                value = convert(kind, type_, value)
+            elif shape in (fields.SHAPE_LIST, fields.SHAPE_SEQUENCE) and isinstance(value, list):
+                value = [convert(kind, type_, item) for item in value]
+            elif shape in fields.MAPPING_LIKE_SHAPES and isinstance(value, dict):
+                value = {k: convert(kind, type_, v) for k, v in value.items()}
+        values[name] = value
+        fields_set.add(name)
+    for name in copies:
+        if name not in fields_set:
+            values[name] = model.__fields__[name].get_default()
+    # what `BaseModel.construct()` does, minus its per field default lookups
+    instance = model.__new__(model)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__fields_set__', fields_set)
+    instance._init_private_attributes()
+    return instance
+
+
+class Validator(object):
+    """Validation policy of one resource"""
+
+    __slots__ = ('policy', 'rate', 'counter')
+
+    def __init__(self, policy: Policy=Policy.FULL, rate: int=DEFAULT_SAMPLE_RATE):
+        self.policy  = Policy(policy)
+        self.rate    = max(1, int(rate))
+        self.counter = itertools.count()
+
+    def sample(self) -> bool:
+        return not next(self.counter) % self.rate
+
+    def parse(self, model: Type[pydantic.BaseModel], data: Dict[str, Any]) -> pydantic.BaseModel:
+        if self.policy == Policy.FULL:
+            return model.parse_obj(data)
+        if self.policy == Policy.SAMPLED and self.sample():
+            try:
+                return model.parse_obj(data)
+            except pydantic.ValidationError as e:
+                log.warning("sampled %s response failed validation: %s", model.__name__, e)
+        return construct(model, data)
+
+
+_validators = {}
+
+
+def validator(resource: str, settings: Dict[str, Any], default: Policy=None) -> Validator:
+    """Shared validator of a resource, from the `smartthings['validation']`
+    settings, e.g. `{'default': 'full', 'devices': 'sampled', 'sample_rate': 100}`
+
+    Paged listings have their own key, e.g. `'devices.list'`, and are
+    trusted unless configured otherwise: they were never validated.
+    """
+    found = _validators.get(resource)
+    if not found:
+        found = _validators[resource] = Validator(
+            settings.get(resource, default or settings.get('default', Policy.FULL)),
+            settings.get('sample_rate', DEFAULT_SAMPLE_RATE)
+        )
+    return found
+
+
+def reset():
+    """Forget the validators, e.g. after a configuration change"""
+    _validators.clear()
@@ -1,3 +1,4 @@
+import hmac
 import uuid
 import enum
 import random
@@ -42,5 +43,5 @@ class AppAuth(object):
 
     def authorize(self, req: types.AppRequest):
         token = self.__class__.get_token_auth_header(req)
-        if not token == self.secret:
+        if not hmac.compare_digest(token.encode(), str(self.secret).encode()):
             http_error(401)
@@ -1,9 +1,11 @@
+import time
+import fastapi
 import pydantic
 import traceback
 from urllib import parse
 from typing import Dict
 
-from smartapp import api
+from smartapp import api, scheduler, metrics, tracing, state
 from smartapp.api import models, http, types
 
 from smartapp import logger
@@ -11,21 +13,54 @@ log = logger.get()
 
 app_ctx = None
 
+LIFECYCLES = metrics.Counter('smartapp_lifecycles', 'Lifecycle requests handled',
+                             ['lifecycle', 'outcome'])
+LATENCY    = metrics.Histogram('smartapp_lifecycle_seconds', 'Lifecycle handling latency',
+                               ['lifecycle'])
+
 class SmartApp(http.RESTClient):
     """SmartApp controller"""
 
     @staticmethod
-    async def dispatch_event(app, handler, evt):
+    async def dispatch_event(app, handler, evt, **kwargs):
         if handler not in app.__dir__():
             return
         handler = getattr(app, handler)
-        return api.AppTask(handler, evt)
+        return api.KeyedExecutor.submit(app.app_id, handler, evt, **kwargs)
+
+    @staticmethod
+    def partition(evt: models.smartapp.EventData):
+        """Split an EventData batch per device when device lanes are enabled,
+        events which are not device events stay on the app lane"""
+        if not api.KeyedExecutor.by_device():
+            yield None, evt
+            return
+        groups = {}
+        for item in evt.events or []:
+            device_id = item.deviceEvent.deviceId if item.deviceEvent else None
+            groups.setdefault(device_id, []).append(item)
+        for device_id, events in groups.items():
+            yield device_id, evt.copy(update={'events': events})
+
+    @classmethod
+    def parse(cls, body: Dict) -> models.AllLifecycles:
+        """Build the lifecycle request, the events of an EVENT lifecycle
+        are a `smartapp.api.models.CompactEventData` when
+        `smartthings['compact_events']` is set"""
+        if body.get('lifecycle') != models.smartapp.LifecycleType.event.value \
+                or not cls.config.get('compact_events'):
+            return models.AllLifecycles.parse_obj(body)
+        data = body.pop('eventData', None)
+        lifecycle = models.AllLifecycles.parse_obj(body)
+        if data is not None:
+            lifecycle.eventData = models.CompactEventData.parse_obj(data)
+        return lifecycle
 
     def __init__(self, token=None):
         api = self.__class__.config.get('api')
         if not token:
             token = api.get('token')
-        super().__init__(api['host'], api['base'], token=token)
+        super().__init__(api['host'], api['base'], token=token, scheme=api.get('scheme'))
 
     def get_ctx(self, evt: models.LifecycleBase) -> types.AppCtx:
        return types.AppCtx(
@@ -39,7 +74,7 @@ class SmartApp(http.RESTClient):
                                   ) -> models.LifecycleResponse:
         evt = lifecycle.confirmationData
         url = parse.urlparse(evt.confirmationUrl)
-        client = http.RESTClient(url.netloc, url.path, '', token=self.token)
+        client = http.RESTClient(url.netloc, url.path, '', token=self.token, scheme=url.scheme)
         try:
             return models.LifecycleResponse.parse_obj(
                 await client.do('GET', '?{}'.format(url.query))
@@ -52,18 +87,16 @@ class SmartApp(http.RESTClient):
                                    ) -> models.LifecycleResponse:
         evt = lifecycle.configurationData
         app = await app_ctx.get(evt.installedAppId)
-        log.info("lifecycle: configuration: %s", evt.json())
+        if log.isEnabledFor(logger.DEBUG):
+            log.debug("lifecycle: configuration: %s", evt.json())
         if evt.phase == models.smartapp.Phase.initialize:
-            resp = models.LifecycleResponse(
-                configurationData=app.initialize()
-            )
+            body = app.initialize_response()
         else:
             await getattr(app, 'lifecycle_configuration')(evt)
-            resp =  models.LifecycleResponse(
-                configurationData=await app.pageId(evt.pageId)
-            )
-        log.info("lifecycle: response: %s", resp.json())
-        return resp
+            body = await app.page_response(evt.pageId)
+        if log.isEnabledFor(logger.DEBUG):
+            log.debug("lifecycle: response: %s", body.decode())
+        return fastapi.Response(content=body, media_type='application/json')
 
     async def handle_install(self, lifecycle: models.AllLifecycles
                             ) -> models.LifecycleResponse:
@@ -80,6 +113,7 @@ class SmartApp(http.RESTClient):
         evt = lifecycle.uninstallData
         app = await app_ctx.get(evt.installedApp.installedAppId)
         await self.dispatch_event(app, 'lifecycle_uninstall', evt)
+        scheduler.Scheduler.clear(app.app_id)
         await app_ctx.delete(app)
         return models.LifecycleResponse(
             uninstallData={}
@@ -99,18 +133,35 @@ class SmartApp(http.RESTClient):
                           ) -> models.LifecycleResponse:
         evt = lifecycle.eventData
         app = await app_ctx.get(evt.installedApp.installedAppId)
-        await self.dispatch_event(app, 'handle_event', evt)
+        state.DeviceState.apply(evt.installedApp.locationId, evt.events)
+        state.Inventory.apply(evt.installedApp.locationId, evt.events, app)
+        state.Health.apply(evt.installedApp.locationId, evt.events)
+        state.History.apply(evt.events)
+        for device_id, data in self.partition(evt):
+            await self.dispatch_event(app, 'handle_event', data, device_id=device_id,
+                                      prio=api.Priority.LOW)
         return models.LifecycleResponse(
             eventData={}
         )
 
     async def handle_lifecycle(self, lifecycle: models.AllLifecycles
                               ) -> models.LifecycleResponse:
-        lifecycle_base = models.LifecycleBase.parse_obj(lifecycle)
-        log.info("lifecycle: request: %s", lifecycle_base.json())
+        log.info("lifecycle: %s %s", lifecycle.lifecycle, lifecycle.executionId)
+        if log.isEnabledFor(logger.DEBUG):
+            log.debug("lifecycle: request: %s", models.LifecycleBase.parse_obj(lifecycle).json())
         handler = "handle_{}".format(lifecycle.lifecycle.lower())
         try:
             handler = getattr(self, handler)
         except AttributeError:
+            LIFECYCLES.labels(lifecycle.lifecycle, 'unhandled').inc()
             return log.error("missing lifecycle handler: %s", handler)
-        return await handler(lifecycle)
+        start = time.perf_counter()
+        outcome = 'error'
+        try:
+            with tracing.span(handler.__name__):
+                response = await handler(lifecycle)
+            outcome = 'ok'
+            return response
+        finally:
+            LATENCY.labels(lifecycle.lifecycle).observe(time.perf_counter() - start)
+            LIFECYCLES.labels(lifecycle.lifecycle, outcome).inc()
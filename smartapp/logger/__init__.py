@@ -1,49 +1,206 @@
 import sys
+import json
+import time
+import queue
+import atexit
 import logging
-import inspect
+import logging.handlers
 
-from logging import INFO, WARN, ERROR, DEBUG
+from logging import INFO, WARN, WARNING, ERROR, DEBUG
 
 FORMAT = '[%(asctime)s] [%(levelname)s] [%(name)s] [%(item)s:%(lineno)d] %(message)s'
 DATE_FMT = '%Y-%m-%d %H:%M:%S %z'
 
+DEFAULT_RATE_PERIOD = 1.0
+
 class LoggerError(Exception):
     pass
 
 class Logger(object):
+    """Module logger, `item` is the name of the module which called `get()`.
+    Level checks happen before anything is built for a record."""
+
+    __slots__ = ('item', 'extra')
 
     instance = None
+    listener = None
 
     def __init__(self, item):
-        self.item = item
+        self.item  = item
+        self.extra = {'item': item}
 
-    def xtra(self):
-        return {'item': self.item}
+    def isEnabledFor(self, level):
+        return self.__class__.instance.isEnabledFor(level)
 
     def info(self, *args):
-        self.__class__.instance.info(*args, extra=self.xtra())
+        instance = self.__class__.instance
+        if instance.isEnabledFor(INFO):
+            instance.log(INFO, *args, extra=self.extra, stacklevel=2)
 
-    def warn(self, *args):
-        self.__class__.instance.warn(*args, extra=self.xtra())
+    def warning(self, *args):
+        instance = self.__class__.instance
+        if instance.isEnabledFor(WARNING):
+            instance.log(WARNING, *args, extra=self.extra, stacklevel=2)
+
+    warn = warning
 
     def error(self, *args):
-        self.__class__.instance.error(*args, extra=self.xtra())
+        instance = self.__class__.instance
+        if instance.isEnabledFor(ERROR):
+            instance.log(ERROR, *args, extra=self.extra, stacklevel=2)
 
     def debug(self, *args):
-        self.__class__.instance.debug(*args, extra=self.xtra())
+        instance = self.__class__.instance
+        if instance.isEnabledFor(DEBUG):
+            instance.log(DEBUG, *args, extra=self.extra, stacklevel=2)
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record):
+        data = {
+            'time':    self.formatTime(record, self.datefmt),
+            'level':   record.levelname,
+            'name':    record.name,
+            'item':    getattr(record, 'item', record.module),
+            'line':    record.lineno,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+class RateLimit(logging.Filter):
+    """Per message type rate limiting and sampling, the type of a record
+    is its call site, so that preformatted messages share one entry and
+    the tables stay as small as the code.
+
+    At most `limit` records of a type are kept per `period` seconds, the
+    first record of the next period reports how many were dropped.
+    `sample` maps message prefixes to N, to keep one record out of N of
+    the matching types, e.g. `{'lifecycle: request': 100}`; the prefix is
+    matched against the first message of a call site.
+    """
+
+    def __init__(self, limit=None, period=DEFAULT_RATE_PERIOD, sample=None):
+        super().__init__()
+        self.limit   = limit
+        self.period  = period
+        self.sample  = sample or {}
+        self.every   = {}
+        self.counts  = {}
+        self.windows = {}
+
+    def sampled(self, site, msg):
+        every = self.every.get(site)
+        if every is None:
+            every = next((n for prefix, n in self.sample.items()
+                          if msg.startswith(prefix)), 1)
+            self.every[site] = every
+        if every <= 1:
+            return True
+        count = self.counts[site] = self.counts.get(site, 0) + 1
+        return count % every == 1
+
+    def filter(self, record):
+        msg = record.msg if isinstance(record.msg, str) else str(record.msg)
+        site = (record.pathname, record.lineno)
+        if not self.sampled(site, msg):
+            return False
+        if not self.limit:
+            return True
+        now = time.monotonic()
+        window = self.windows.get(site)
+        if not window or now - window[0] >= self.period:
+            dropped = window[2] if window else 0
+            self.windows[site] = [now, 1, 0]
+            if dropped:
+                record.msg = '{} ({} similar messages dropped)'.format(msg, dropped)
+            return True
+        if window[1] < self.limit:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
 
+class QueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records with their message merged, formatting and I/O
+    happen on the thread of the `logging.handlers.QueueListener`"""
 
-def init(service, level=INFO):
+    dropped = 0
+
+    def prepare(self, record):
+        record.msg  = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.__class__.dropped += 1
+
+
+def stop():
+    """Flush and stop the background logging thread"""
+    listener, Logger.listener = Logger.listener, None
+    if listener:
+        listener.stop()
+
+
+def configure(level=None, json=False, queue_size=0, background=True,
+              rate_limit=None, rate_period=DEFAULT_RATE_PERIOD, sample=None):
+    """(Re)configure the output of the logger created by `init()`
+
+    Args:
+        level (int|str): log level
+        json (bool): one JSON object per line instead of `FORMAT`
+        queue_size (int): bound of the queue to the background thread, 0 for none
+        background (bool): write on a background thread, not the caller's
+        rate_limit (int): max records per message type and `rate_period`
+        rate_period (float): seconds
+        sample (dict): message prefix to N, keep 1 record out of N
+    """
+    logger = Logger.instance
+    if not logger:
+        raise LoggerError('logger must be initialized first')
+    stop()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for filt in list(logger.filters):
+        logger.removeFilter(filt)
+
+    sh = logging.StreamHandler(sys.stdout)
+    if json:
+        sh.setFormatter(JSONFormatter(datefmt=DATE_FMT))
+    else:
+        sh.setFormatter(logging.Formatter(fmt=FORMAT, datefmt=DATE_FMT))
+    if background:
+        records = queue.Queue(queue_size) if queue_size else queue.SimpleQueue()
+        logger.addHandler(QueueHandler(records))
+        Logger.listener = logging.handlers.QueueListener(records, sh)
+        Logger.listener.start()
+    else:
+        logger.addHandler(sh)
+    if rate_limit or sample:
+        logger.addFilter(RateLimit(rate_limit, rate_period, sample))
+    if level is not None:
+        logger.setLevel(level)
+
+
+def init(service, level=INFO, **kwargs):
     if Logger.instance:
         raise LoggerError('logger can only be initialized once')
     logger = logging.getLogger(service)
-    sh = logging.StreamHandler(sys.stdout)
-    sh.setFormatter(logging.Formatter(fmt=FORMAT, datefmt=DATE_FMT))
-    logger.addHandler(sh)
     logger.setLevel(level)
     Logger.instance = logger
+    configure(**kwargs)
+    atexit.register(stop)
 
 def get():
     if not Logger.instance:
         raise LoggerError('logger must be initialized first')
-    return Logger(inspect.getmodule(inspect.stack()[1][0]).__name__)
+    return Logger(sys._getframe(1).f_globals['__name__'])
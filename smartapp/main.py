@@ -13,6 +13,10 @@ log = logger.get()
 
 from smartapp import version
 from smartapp import rest
+from smartapp import api
+from smartapp import scheduler
+from smartapp import monitor
+from smartapp import state
 
 if 'IS_TEST' in os.environ:
     version.__version__ = '1.2.3'
@@ -25,8 +29,17 @@ app = fastapi.FastAPI(
     version=version.__version__
 )
 
+def openapi():
+    if not app.openapi_schema:
+        rest.smartapp.document(fastapi.FastAPI.openapi(app))
+    return app.openapi_schema
+
+app.openapi = openapi
+
 def include_routes():
     app.include_router(rest.version.router, tags=['Version'])
+    app.include_router(rest.metrics.router, tags=['Metrics'])
+    app.include_router(rest.admin.router, tags=['Admin'])
     app.include_router(rest.smartapp.router, tags=['SmartApp'])
 
 @app.on_event('startup')
@@ -35,7 +48,12 @@ async def startup():
 
 @app.on_event('shutdown')
 async def shutdown():
-    pass
+    await scheduler.Scheduler.stop()
+    await monitor.LoopMonitor.stop()
+    await state.Snapshot.stop()
+    await api.TaskSupervisor.drain()
+    await state.Snapshot.flush()
+    await api.ProcessPool.stop()
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
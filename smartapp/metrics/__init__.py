@@ -0,0 +1,10 @@
+from smartapp.metrics import metrics
+
+Registry  = metrics.Registry
+Counter   = metrics.Counter
+Gauge     = metrics.Gauge
+Histogram = metrics.Histogram
+REGISTRY  = metrics.REGISTRY
+
+def render() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+import bisect
+from typing import Any, Callable, Dict, Generator, Iterable, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def escape(value: Any) -> str:
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Registry(object):
+    """Metrics exposed together, in the Prometheus text format"""
+
+    def __init__(self):
+        self.metrics = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError('duplicate metric: {}'.format(metric.name))
+        self.metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Metric:
+        return self.metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.append('# HELP {} {}'.format(metric.name, metric.documentation))
+            lines.append('# TYPE {} {}'.format(metric.name, metric.kind))
+            for suffix, labels, value in metric.samples():
+                if labels:
+                    lines.append('{}{}{{{}}} {}'.format(metric.name, suffix, ','.join(
+                        '{}="{}"'.format(key, escape(val)) for key, val in labels.items()
+                    ), number(value)))
+                else:
+                    lines.append('{}{} {}'.format(metric.name, suffix, number(value)))
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+class Metric(object):
+    """A metric family, with one child per combination of label values.
+
+    Children are created on first use and kept, so that recording a value
+    is a dict lookup and an in place update: no lock and no allocation
+    beyond the label tuple.  Updates are meant to happen on the event
+    loop thread.
+    """
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str]=(),
+                       registry: Registry=None):
+        self.name          = name
+        self.documentation = documentation
+        self.labelnames    = tuple(labels)
+        self.children      = {}
+        (registry or REGISTRY).register(self)
+
+    def child(self) -> Any:
+        raise NotImplementedError()
+
+    def labels(self, *values: str) -> Any:
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError('{} expects labels {}'.format(self.name, self.labelnames))
+            child = self.children[values] = self.child()
+        return child
+
+    def samples(self) -> Generator[Sample]:
+        for values, child in list(self.children.items()):
+            labels = dict(zip(self.labelnames, values))
+            for suffix, extra, value in child.samples():
+                yield suffix, dict(labels, **extra), value
+
+
+class CounterValue(object):
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float=1):
+        self.value += amount
+
+    def samples(self) -> Generator[Sample]:
+        yield '_total', {}, self.value
+
+
+class Counter(Metric):
+    """Monotonic count, exposed as `<name>_total`"""
+
+    kind = 'counter'
+    child = CounterValue
+
+    def inc(self, amount: float=1):
+        self.labels().inc(amount)
+
+
+class GaugeValue(object):
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float=1):
+        self.value += amount
+
+    def dec(self, amount: float=1):
+        self.value -= amount
+
+    def samples(self) -> Generator[Sample]:
+        yield '', {}, self.value
+
+
+class Gauge(Metric):
+    """Value which goes up and down, or is read from `function` when
+    scraped: a callable returning a number, or a dict of label value
+    tuples to numbers"""
+
+    kind = 'gauge'
+    child = GaugeValue
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str]=(),
+                       registry: Registry=None, function: Callable[[], Any]=None):
+        super().__init__(name, documentation, labels, registry)
+        self.function = function
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def samples(self) -> Generator[Sample]:
+        if not self.function:
+            yield from super().samples()
+            return
+        value = self.function()
+        if not isinstance(value, dict):
+            yield '', {}, value
+            return
+        for values, val in value.items():
+            yield '', dict(zip(self.labelnames, values)), val
+
+
+class HistogramValue(object):
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum    = 0.0
+        self.count  = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum   += value
+        self.count += 1
+
+    def samples(self) -> Generator[Sample]:
+        total = 0
+        for bound, count in zip(self.bounds + (float('inf'),), self.counts):
+            total += count
+            yield '_bucket', {'le': number(float(bound))}, total
+        yield '_sum', {}, self.sum
+        yield '_count', {}, self.count
+
+
+class Histogram(Metric):
+    """Distribution of observed values over fixed buckets"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str]=(),
+                       registry: Registry=None, buckets: Iterable[float]=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def child(self) -> HistogramValue:
+        return HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
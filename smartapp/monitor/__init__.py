@@ -0,0 +1,7 @@
+from smartapp.monitor import loop, profiler, memory
+
+LoopMonitor  = loop.LoopMonitor
+Profiler     = profiler.Profiler
+ProfilerBusy = profiler.ProfilerBusy
+
+footprint    = memory.footprint
@@ -0,0 +1,149 @@
+from __future__ import annotations
+import sys
+import time
+import asyncio
+import threading
+import traceback
+import collections
+from typing import Any, Dict, List
+
+import smartapp
+from smartapp import api, metrics
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_INTERVAL  = 0.1
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_SAMPLES   = 50
+STACK_LIMIT       = 40
+
+LAG     = metrics.Histogram('smartapp_loop_lag_seconds', 'Event loop scheduling lag',
+                            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1,
+                                     0.25, 0.5, 1.0, 2.5, 5.0))
+BLOCKED = metrics.Counter('smartapp_loop_blocked', 'Callbacks which blocked the event loop '
+                          'longer than monitor[\'threshold\']')
+
+
+class Stall(object):
+    """A callback which held the event loop, with the stack it was running
+    when the watchdog noticed"""
+
+    __slots__ = ('started', 'duration', 'stack')
+
+    def __init__(self, started: float, stack: List[str]):
+        self.started  = started
+        self.duration = None
+        self.stack    = stack
+
+    def dict(self) -> Dict[str, Any]:
+        return {
+            'started':  self.started,
+            'duration': self.duration,
+            'stack':    self.stack,
+        }
+
+
+class LoopMonitor(object):
+    """Opt-in event loop lag and blocking call detector
+    (`monitor['enabled']`).
+
+    A task wakes up every `monitor['interval']` seconds and records how
+    late it was (`smartapp_loop_lag_seconds`).  A watchdog thread checks
+    the heartbeat of that task: when the loop did not run it for more
+    than `monitor['threshold']` seconds, it captures the stack of the
+    loop thread, i.e. the offending code.  The last `monitor['samples']`
+    stalls are kept for `stats()`.
+    """
+
+    _runner    = None
+    _watchdog  = None
+    _stopped   = None
+    _heartbeat = 0.0
+    _thread_id = None
+    _stall     = None
+    _stalls    = collections.deque(maxlen=DEFAULT_SAMPLES)
+    _lag       = {'last': 0.0, 'max': 0.0, 'total': 0.0, 'count': 0}
+
+    @classmethod
+    def settings(cls) -> Dict[str, Any]:
+        return getattr(smartapp.config, 'monitor', None) or {}
+
+    @classmethod
+    def start(cls):
+        settings = cls.settings()
+        if cls._runner or not settings.get('enabled'):
+            return
+        interval  = settings.get('interval', DEFAULT_INTERVAL)
+        threshold = settings.get('threshold', DEFAULT_THRESHOLD)
+        cls._stalls = collections.deque(maxlen=settings.get('samples', DEFAULT_SAMPLES))
+        cls._thread_id = threading.get_ident()
+        cls._heartbeat = time.monotonic()
+        cls._stopped = threading.Event()
+        cls._runner = api.TaskSupervisor.spawn(
+            cls.run(interval), name='loop-monitor', limit=False, timeout=None
+        )
+        cls._watchdog = threading.Thread(target=cls.watch, args=(interval, threshold),
+                                         name='loop-monitor', daemon=True)
+        cls._watchdog.start()
+        log.info("loop monitor started, interval %ss, threshold %ss", interval, threshold)
+
+    @classmethod
+    async def stop(cls):
+        runner, cls._runner = cls._runner, None
+        if runner:
+            cls._stopped.set()
+            runner.cancel()
+            await asyncio.wait([runner])
+            cls._watchdog.join(timeout=1.0)
+
+    @classmethod
+    async def run(cls, interval: float):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lag = max(0.0, loop.time() - expected)
+            cls._heartbeat = time.monotonic()
+            LAG.observe(lag)
+            stats = cls._lag
+            stats['last'] = lag
+            stats['max'] = max(stats['max'], lag)
+            stats['total'] += lag
+            stats['count'] += 1
+            stall, cls._stall = cls._stall, None
+            if stall:
+                stall.duration = cls._heartbeat - stall.started
+                log.warning("event loop blocked for %.3fs in %s", stall.duration,
+                            stall.stack[-1].strip() if stall.stack else '?')
+
+    @classmethod
+    def watch(cls, interval: float, threshold: float):
+        while not cls._stopped.wait(min(interval, threshold) / 2):
+            if cls._stall:
+                continue
+            beat = cls._heartbeat
+            if time.monotonic() - beat > interval + threshold:
+                cls.sample(beat + interval)
+
+    @classmethod
+    def sample(cls, started: float):
+        frame = sys._current_frames().get(cls._thread_id)
+        stack = traceback.format_stack(frame, limit=STACK_LIMIT) if frame else []
+        cls._stall = Stall(started, stack)
+        cls._stalls.append(cls._stall)
+        BLOCKED.inc()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        lag = cls._lag
+        return {
+            'running': cls._runner is not None,
+            'lag': {
+                'last': lag['last'],
+                'max':  lag['max'],
+                'avg':  lag['total'] / (lag['count'] or 1),
+            },
+            'blocked': BLOCKED.labels().value,
+            'stalls':  [stall.dict() for stall in cls._stalls],
+        }
@@ -0,0 +1,128 @@
+from __future__ import annotations
+import sys
+import types
+import random
+import asyncio
+import logging
+import resource
+import threading
+from typing import Any, Dict, Iterable, Set
+
+import smartapp
+from smartapp import api
+
+DEFAULT_SAMPLE = 20
+
+# shared by everything or owned by the runtime, never walked into
+OPAQUE = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+    types.MethodType, types.CodeType, types.FrameType, asyncio.AbstractEventLoop,
+    threading.Thread, logging.Logger,
+)
+
+
+def sizeof(obj: Any, seen: Set[int]) -> int:
+    """Approximate bytes of `obj` and of the objects it references, the
+    ids in `seen` excepted; the ids of the objects counted are added to
+    `seen`"""
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, OPAQUE):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item, 0)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        try:
+            stack.append(object.__getattribute__(item, '__dict__'))
+        except AttributeError:
+            pass
+        for klass in type(item).__mro__:
+            for slot in klass.__dict__.get('__slots__', ()):
+                try:
+                    stack.append(object.__getattribute__(item, slot))
+                except (AttributeError, TypeError):
+                    pass
+    return total
+
+
+def reachable(roots: Iterable[Any]) -> Set[int]:
+    seen = set()
+    for root in roots:
+        sizeof(root, seen)
+    return seen
+
+
+def resident() -> int:
+    """Resident set size of the process in bytes, the peak where the
+    current one is not available"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def routes(app_id: str) -> list:
+    prefix = '/{}/'.format(app_id)
+    return [route for route in smartapp.main.app.router.routes
+            if getattr(route, 'path', '').startswith(prefix)]
+
+
+def breakdown(app: api.SmartApp, shared: Set[int]) -> Dict[str, int]:
+    """Bytes held by one installed app, per kind of object"""
+    ctx = app.ctx
+    parts = {
+        'session': getattr(ctx, '_session', None),
+        'app_ctx': getattr(ctx, 'app_ctx', None),
+        'context': ctx,
+        'app':     app,
+        'routes':  routes(app.app_id) if ctx else [],
+    }
+    seen = set(shared)
+    seen.update(id(part) for part in parts.values() if part is not None)
+    sizes = {}
+    for name, part in parts.items():
+        if part is None:
+            sizes[name] = 0
+            continue
+        seen.discard(id(part))
+        sizes[name] = sizeof(part, seen)
+    return sizes
+
+
+def footprint(sample: int=DEFAULT_SAMPLE) -> Dict[str, Any]:
+    """Approximate bytes held per installed app, averaged over `sample`
+    of them: the `SmartApp` instance, its `AppContext`, `AppCtx`,
+    `aiohttp.ClientSession` and routes.  The objects reachable from the
+    app built by the factory (definition, pages, ...), the application
+    and the redis connection pool are shared by the installed apps and
+    not counted.  Walking the objects costs about a
+    millisecond per app, on the event loop."""
+    context = api.AppContext
+    apps = list(context._instances.values())
+    picked = random.sample(apps, min(sample, len(apps))) if sample else apps
+    shared = reachable([context._template]) if context._template else set()
+    # referenced by the routes and the redis clients of every app
+    shared.update((id(smartapp.main.app), id(context._pool)))
+    totals = dict.fromkeys(('app', 'context', 'app_ctx', 'session', 'routes'), 0)
+    for app in picked:
+        for name, size in breakdown(app, shared).items():
+            totals[name] += size
+    count = len(picked) or 1
+    per_app = {name: total // count for name, total in totals.items()}
+    bytes_per_app = sum(per_app.values())
+    return {
+        'apps':          len(apps),
+        'sampled':       len(picked),
+        'bytes_per_app': bytes_per_app,
+        'total':         bytes_per_app * len(apps),
+        'breakdown':     per_app,
+        'resident':      resident(),
+    }
@@ -0,0 +1,117 @@
+from __future__ import annotations
+import io
+import sys
+import time
+import pstats
+import asyncio
+import cProfile
+import marshal
+import threading
+import collections
+from typing import Dict
+
+import smartapp
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_INTERVAL = 0.005
+DEFAULT_MAX      = 30.0
+STACK_LIMIT      = 100
+
+
+class ProfilerBusy(RuntimeError):
+    pass
+
+
+def frame_name(frame) -> str:
+    code = frame.f_code
+    return '{}:{}:{}'.format(frame.f_globals.get('__name__', '?'), code.co_name, code.co_firstlineno)
+
+
+class Profiler(object):
+    """On demand profiling of the event loop thread of the worker, one run
+    at a time and at most `admin['profile_max']` seconds.  Nothing runs
+    while idle.
+
+    `collapsed()` samples the stack of the loop thread from another thread
+    every `interval` seconds, which is cheap enough for production, and
+    returns collapsed stacks (`frame;frame;frame count`) for flame graph
+    tools.  `profile()` runs `cProfile` on the loop thread, which is exact
+    but slows it down.
+    """
+
+    _running = False
+
+    @classmethod
+    def settings(cls) -> Dict:
+        return getattr(smartapp.config, 'admin', None) or {}
+
+    @classmethod
+    def duration(cls, seconds: float) -> float:
+        return max(0.0, min(float(seconds), cls.settings().get('profile_max', DEFAULT_MAX)))
+
+    @classmethod
+    def acquire(cls):
+        if cls._running:
+            raise ProfilerBusy('a profile is already running')
+        cls._running = True
+
+    @staticmethod
+    def sample(thread_id: int, seconds: float, interval: float) -> collections.Counter:
+        stacks = collections.Counter()
+        own = sys._getframe()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(thread_id)
+            names = []
+            while frame is not None and frame is not own and len(names) < STACK_LIMIT:
+                names.append(frame_name(frame))
+                frame = frame.f_back
+            if names:
+                stacks[';'.join(reversed(names))] += 1
+            time.sleep(interval)
+        return stacks
+
+    @classmethod
+    async def collapsed(cls, seconds: float, interval: float=DEFAULT_INTERVAL) -> str:
+        """Collapsed stacks of the loop thread, sampled for `seconds`"""
+        cls.acquire()
+        try:
+            seconds = cls.duration(seconds)
+            log.info("profiler: sampling the event loop for %ss", seconds)
+            stacks = await asyncio.get_running_loop().run_in_executor(
+                None, cls.sample, threading.get_ident(), seconds, max(interval, 0.001)
+            )
+        finally:
+            cls._running = False
+        return ''.join('{} {}\n'.format(stack, count) for stack, count in stacks.most_common())
+
+    @classmethod
+    async def profile(cls, seconds: float) -> pstats.Stats:
+        """`cProfile` statistics of the loop thread, for `seconds`"""
+        cls.acquire()
+        try:
+            seconds = cls.duration(seconds)
+            log.info("profiler: profiling the event loop for %ss", seconds)
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.disable()
+        finally:
+            cls._running = False
+        return pstats.Stats(profiler)
+
+    @staticmethod
+    def text(stats: pstats.Stats, limit: int=50) -> str:
+        out = io.StringIO()
+        stats.stream = out
+        stats.sort_stats('cumulative').print_stats(limit)
+        return out.getvalue()
+
+    @staticmethod
+    def dump(stats: pstats.Stats) -> bytes:
+        """`pstats.Stats.dump_stats` content, for snakeviz, pstats, ..."""
+        return marshal.dumps(stats.stats)
@@ -0,0 +1,41 @@
+import atexit
+
+from smartapp.recorder import recorder, player
+
+Recorder  = recorder.Recorder
+Writer    = recorder.Writer
+REDACTED  = recorder.REDACTED
+
+read      = recorder.read
+redact    = recorder.redact
+replay    = player.replay
+profile   = player.profile
+calibrate = player.calibrate
+
+
+def stop():
+    """Flush and close the recording"""
+    writer, Recorder.writer = Recorder.writer, None
+    if writer:
+        writer.stop()
+
+
+def configure(enabled=True, path='smartapp-traffic.jsonl.gz', outbound=True,
+              queue_size=recorder.DEFAULT_QUEUE_SIZE):
+    """Configure recording, from the `recorder` section of the config
+
+    Args:
+        enabled (bool): record the lifecycle requests
+        path (str): file the records are appended to, gzip compressed
+            when it ends with `.gz`
+        outbound (bool): also record the SmartThings API calls
+        queue_size (int): records waiting to be written before new ones
+            are dropped
+    """
+    stop()
+    Recorder.outbound = outbound
+    if enabled:
+        Recorder.writer = Writer(path, queue_size)
+
+
+atexit.register(stop)
@@ -0,0 +1,55 @@
+"""Replay or summarize a lifecycle traffic recording.
+
+    python -m smartapp.recorder replay FILE [--url http://127.0.0.1:8080/]
+        [--speed 1] [--token TOKEN] [--concurrency 100]
+    python -m smartapp.recorder stats FILE
+"""
+import json
+import asyncio
+import argparse
+import collections
+
+from smartapp import recorder
+
+
+def stats(path):
+    lifecycles = collections.Counter()
+    first = last = None
+    for record in recorder.read(path):
+        first = record['t'] if first is None else first
+        last = record['t']
+        if record['k'] == 'in':
+            body = record['b']
+            lifecycles[body.get('lifecycle') if isinstance(body, dict) else None] += 1
+    return {
+        'duration':   (last - first) if first is not None else 0.0,
+        'lifecycles': dict(lifecycles),
+        'outbound':   recorder.profile(recorder.read(path)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    play = commands.add_parser('replay', help='POST the recorded lifecycles to an instance')
+    play.add_argument('path')
+    play.add_argument('--url', default='http://127.0.0.1:8080/')
+    play.add_argument('--speed', type=float, default=1.0,
+                      help='1 for the recorded rate, N for N times faster, 0 for no pauses')
+    play.add_argument('--token', help='sent in place of the redacted tokens')
+    play.add_argument('--concurrency', type=int, default=100)
+    summary = commands.add_parser('stats', help='summarize a recording')
+    summary.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'stats':
+        result = stats(args.path)
+    else:
+        result = asyncio.run(recorder.replay(
+            recorder.read(args.path), args.url, args.speed, args.token, args.concurrency
+        ))
+    print(json.dumps(result, indent=2, default=str))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+import time
+import asyncio
+import statistics
+import collections
+from typing import Any, Dict, Iterable, List
+
+import aiohttp
+
+from smartapp.recorder import recorder
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_CONCURRENCY = 100
+
+
+def restore(obj: Any, token: str) -> Any:
+    """Copy of `obj` with the redacted values replaced by `token`"""
+    if isinstance(obj, dict):
+        return {key: restore(value, token) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [restore(value, token) for value in obj]
+    return token if obj == recorder.REDACTED else obj
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    if len(latencies) < 2:
+        latencies = latencies * 2 or [0.0, 0.0]
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {'p50': quantiles[49], 'p95': quantiles[94], 'p99': quantiles[98]}
+
+
+async def replay(records: Iterable[Dict[str, Any]], url: str, speed: float=1.0,
+                 token: str=None, concurrency: int=DEFAULT_CONCURRENCY) -> Dict[str, Any]:
+    """POST the recorded lifecycles to `url`, spaced as recorded divided by
+    `speed`, or as fast as `concurrency` allows when `speed` is 0
+
+    Args:
+        records: `smartapp.recorder.read()`
+        url (str): lifecycle endpoint of the instance, e.g. http://127.0.0.1:8080/
+        speed (float): 1 for the original rate, N for N times faster
+        token (str): substituted to the redacted tokens, which are sent
+            as they are otherwise
+        concurrency (int): max requests in flight
+
+    Returns:
+        dict: counts per status and lifecycle, latencies in seconds and
+        `lag`, how late the requests were sent compared to the schedule
+    """
+    statuses   = collections.Counter()
+    lifecycles = collections.Counter()
+    latencies  = []
+    lag        = []
+    limit      = asyncio.Semaphore(concurrency)
+
+    async def send(session, body):
+        try:
+            start = time.perf_counter()
+            async with session.post(url, json=body) as resp:
+                await resp.read()
+                statuses[resp.status] += 1
+            latencies.append(time.perf_counter() - start)
+        except aiohttp.ClientError as e:
+            statuses[e.__class__.__name__] += 1
+        finally:
+            limit.release()
+
+    pending = set()
+    started = time.monotonic()
+    first   = None
+    async with aiohttp.ClientSession() as session:
+        for record in records:
+            if record.get('k') != 'in':
+                continue
+            body = record['b']
+            if first is None:
+                first = record['t']
+            if speed:
+                delay = (record['t'] - first) / speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    lag.append(-delay)
+            await limit.acquire()
+            if isinstance(body, dict):
+                lifecycles[body.get('lifecycle')] += 1
+                if token:
+                    body = restore(body, token)
+            task = asyncio.ensure_future(send(session, body))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.wait(pending)
+    elapsed = time.monotonic() - started
+    sent = sum(statuses.values())
+    return {
+        'sent':       sent,
+        'elapsed':    elapsed,
+        'rate':       sent / elapsed if elapsed else 0.0,
+        'statuses':   dict(statuses),
+        'lifecycles': dict(lifecycles),
+        'latency':    percentiles(latencies),
+        'lag':        max(lag, default=0.0),
+    }
+
+
+def profile(records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Per resource count, latency and error statuses of the recorded
+    SmartThings API calls"""
+    durations = collections.defaultdict(list)
+    errors = collections.defaultdict(collections.Counter)
+    for record in records:
+        if record.get('k') != 'out':
+            continue
+        resource = record.get('res') or 'none'
+        durations[resource].append(record['d'])
+        status = record.get('s')
+        if not isinstance(status, int) or status >= 400:
+            errors[resource][status] += 1
+    return {
+        resource: {
+            'count':  len(values),
+            'mean':   statistics.mean(values),
+            'stdev':  statistics.pstdev(values),
+            'errors': dict(errors[resource]),
+        } for resource, values in durations.items()
+    }
+
+
+def calibrate(faults, records: Iterable[Dict[str, Any]]):
+    """Script `faults` (`smartapp.simulator.Faults`) with the latency and
+    error rates of the recorded SmartThings API calls, per resource"""
+    for resource, stats in profile(records).items():
+        faults.delay(stats['mean'], stats['stdev'], 'lognormal', resource=resource)
+        for status, count in stats['errors'].items():
+            if isinstance(status, int):
+                faults.error(status, rate=count / stats['count'], resource=resource)
+    return faults
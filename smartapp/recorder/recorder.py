@@ -0,0 +1,126 @@
+from __future__ import annotations
+import gzip
+import json
+import time
+import queue
+import threading
+from typing import Any, Dict, Iterator
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_QUEUE_SIZE = 10000
+REDACTED           = '<redacted>'
+
+# keys whose values are credentials, in lifecycle and API bodies
+SECRETS = frozenset((
+    'authToken', 'refreshToken', 'access_token', 'refresh_token', 'token',
+    'client_secret', 'secret', 'password', 'Authorization',
+))
+
+
+def redact(obj: Any) -> Any:
+    """Copy of `obj` with the values of `SECRETS` replaced by `REDACTED`"""
+    if isinstance(obj, dict):
+        return {key: REDACTED if key in SECRETS and value else redact(value)
+                for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [redact(value) for value in obj]
+    return obj
+
+
+def opener(path: str):
+    return gzip.open if path.endswith('.gz') else open
+
+
+class Writer(object):
+    """Append records to `path` from a background thread, gzip compressed
+    when it ends with `.gz`.  Parsing, redaction and I/O never run on the
+    event loop; records are dropped when `queue_size` are already waiting."""
+
+    def __init__(self, path: str, queue_size: int=DEFAULT_QUEUE_SIZE):
+        self.path    = path
+        self.queue   = queue.Queue(queue_size)
+        self.dropped = 0
+        self.thread  = threading.Thread(target=self.run, name='recorder', daemon=True)
+        self.thread.start()
+
+    def put(self, record: tuple):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        with opener(self.path)(self.path, 'at') as out:
+            while True:
+                record = self.queue.get()
+                if record is None:
+                    break
+                try:
+                    out.write(json.dumps(self.encode(*record), separators=(',', ':'),
+                                         default=str) + '\n')
+                except Exception as e:
+                    log.error("recorder: %s", e)
+                if self.queue.empty():
+                    out.flush()
+
+    @staticmethod
+    def encode(kind: str, at: float, *args) -> Dict[str, Any]:
+        if kind == 'in':
+            body, = args
+            try:
+                body = json.loads(body)
+            except ValueError:
+                body = body.decode(errors='replace')
+            return {'t': at, 'k': kind, 'b': redact(body)}
+        resource, verb, url, params, body, status, response, duration = args
+        if isinstance(body, str):
+            try:
+                body = json.loads(body)
+            except ValueError:
+                pass
+        return {'t': at, 'k': kind, 'res': resource, 'v': verb, 'u': url,
+                'p': redact(params), 'q': redact(body), 's': status,
+                'r': redact(response), 'd': round(duration, 6)}
+
+    def stop(self):
+        self.queue.put(None)
+        self.thread.join(timeout=5.0)
+
+
+class Recorder(object):
+    """Process wide recording settings, see `smartapp.recorder.configure`"""
+
+    writer   = None
+    outbound = True
+
+    @classmethod
+    def lifecycle(cls, body: bytes):
+        """Record the raw body of a `POST /` lifecycle request"""
+        writer = cls.writer
+        if writer:
+            writer.put(('in', time.time(), body))
+
+    @classmethod
+    def exchange(cls, resource: str, verb: str, url: str, params: Dict, body: Any,
+                      status: Any, response: Any, duration: float):
+        """Record a SmartThings API call and its response"""
+        writer = cls.writer
+        if writer and cls.outbound:
+            writer.put(('out', time.time(), resource, verb, url, params, body, status,
+                        response, duration))
+
+
+def read(path: str) -> Iterator[Dict[str, Any]]:
+    """The records of a recording, up to the last complete one when it is
+    still being written"""
+    with opener(path)(path, 'rt') as records:
+        try:
+            for line in records:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return
+        except (EOFError, gzip.BadGzipFile):
+            return
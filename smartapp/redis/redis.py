@@ -1,7 +1,14 @@
+import time
 import typing
 import redis
 import smartapp
 
+from smartapp import metrics, tracing
+
+LATENCY = metrics.Histogram('smartapp_redis_seconds', 'Redis command latency',
+                            ['command'], buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01,
+                                                  0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+
 class RedisMeta(typing._ProtocolMeta):
 
     @property
@@ -26,5 +33,13 @@ class Redis(redis.Redis, metaclass=RedisMeta):
             connection_pool=self.__class__.get_pool(),
         )
 
+    def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            with tracing.span('redis', command=args[0]):
+                return super().execute_command(*args, **options)
+        finally:
+            LATENCY.labels(args[0]).observe(time.perf_counter() - start)
+
     def do(self, *args, **kwargs):
         return self.execute_command(*args, **kwargs)
@@ -1,3 +1,3 @@
-from smartapp.rest import version, smartapp, errors
+from smartapp.rest import version, metrics, admin, smartapp, errors
 
 http_error = errors.http_error
@@ -0,0 +1,57 @@
+import enum
+import fastapi
+
+import smartapp
+from smartapp import authentication, monitor
+from smartapp.rest import errors
+
+URI_BASE = '/admin'
+
+
+def authorize(request: fastapi.Request):
+    """Admin routes need `Authorization: Bearer <admin['secret']>`, and do
+    not exist when no secret is configured"""
+    secret = (getattr(smartapp.config, 'admin', None) or {}).get('secret')
+    if not secret:
+        errors.http_error(404)
+    authentication.AppAuth(secret).authorize(request)
+
+
+router = fastapi.APIRouter(prefix=URI_BASE, dependencies=[fastapi.Depends(authorize)])
+
+
+class ProfileFormat(str, enum.Enum):
+    collapsed = 'collapsed'
+    pstats    = 'pstats'
+    text      = 'text'
+
+
+@router.get('/loop')
+def get_loop():
+    return monitor.LoopMonitor.stats()
+
+
+@router.get('/memory')
+def get_memory(sample: int=monitor.memory.DEFAULT_SAMPLE):
+    """Approximate bytes held per installed app, for LRU and worker
+    sizing, see `smartapp.monitor.footprint`"""
+    return monitor.footprint(sample)
+
+
+@router.get('/profile')
+async def get_profile(seconds: float=5.0, format: ProfileFormat=ProfileFormat.collapsed,
+                      interval: float=monitor.profiler.DEFAULT_INTERVAL):
+    """Profile the event loop of this worker for `seconds`: collapsed
+    stacks (flame graph input), a `pstats` dump or the `pstats` report"""
+    try:
+        if format == ProfileFormat.collapsed:
+            return fastapi.responses.PlainTextResponse(
+                await monitor.Profiler.collapsed(seconds, interval)
+            )
+        stats = await monitor.Profiler.profile(seconds)
+    except monitor.ProfilerBusy:
+        errors.http_error(409)
+    if format == ProfileFormat.pstats:
+        return fastapi.Response(monitor.Profiler.dump(stats), media_type='application/octet-stream',
+                                headers={'Content-Disposition': 'attachment; filename="profile.pstats"'})
+    return fastapi.responses.PlainTextResponse(monitor.Profiler.text(stats))
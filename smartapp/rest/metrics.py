@@ -0,0 +1,11 @@
+import fastapi
+
+from smartapp import metrics
+
+URI_BASE='/metrics'
+router = fastapi.APIRouter()
+
+
+@router.get(URI_BASE, response_class=fastapi.responses.PlainTextResponse)
+def get_metrics():
+    return fastapi.Response(content=metrics.render(), media_type=metrics.metrics.CONTENT_TYPE)
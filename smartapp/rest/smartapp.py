@@ -1,10 +1,13 @@
+import warnings
 import fastapi
+from pydantic.error_wrappers import ErrorWrapper
+from fastapi.exceptions import RequestValidationError
 
 from smartapp import logger
 log = logger.get()
 
 from smartapp.api import models
-from smartapp import controllers
+from smartapp import controllers, tracing, recorder
 
 URI_BASE = '/'
 router = fastapi.APIRouter()
@@ -17,10 +20,48 @@ def respond(resp):
 
 @router.post(URI_BASE, response_model=models.LifecycleResponse, status_code=200,
              response_model_exclude_none=True)
-async def post_lifecycle(lifecycle: models.AllLifecycles):
-    ctrl = controllers.SmartApp()
-    return respond(await ctrl.handle_lifecycle(lifecycle))
+async def post_lifecycle(request: fastapi.Request):
+    # parsed by the controller rather than FastAPI, so that EVENT
+    # lifecycles may skip building the full pydantic models
+    with tracing.trace('lifecycle') as root:
+        try:
+            with tracing.span('parse'):
+                body = await request.json()
+                if recorder.Recorder.writer:
+                    recorder.Recorder.lifecycle(await request.body())
+                if not isinstance(body, dict):
+                    raise TypeError('lifecycle must be an object')
+                lifecycle = controllers.SmartApp.parse(body)
+        except (ValueError, TypeError) as e:
+            raise RequestValidationError([ErrorWrapper(e, ('body',))])
+        root.set('lifecycle', lifecycle.lifecycle)
+        root.set('execution_id', lifecycle.executionId)
+        ctrl = controllers.SmartApp()
+        return respond(await ctrl.handle_lifecycle(lifecycle))
+
+
+def document(schema: dict) -> dict:
+    """Add the lifecycle request body, which `post_lifecycle` parses
+    itself, to the OpenAPI `schema`"""
+    body = models.AllLifecycles.schema(ref_template='#/components/schemas/{model}')
+    schemas = schema.setdefault('components', {}).setdefault('schemas', {})
+    for name, definition in body.pop('definitions', {}).items():
+        schemas.setdefault(name, definition)
+    schemas.setdefault(body['title'], body)
+    schema['paths'][URI_BASE]['post']['requestBody'] = {
+        'content': {'application/json': {
+            'schema': {'$ref': '#/components/schemas/{}'.format(body['title'])}
+        }},
+        'required': True,
+    }
+    return schema
 
 
 def add_route(*args, **kwargs):
-    router.add_api_route(*args, **kwargs)
+    """Deprecated, the routes of the installed apps are added to the
+    application directly by `smartapp.AppRouter`"""
+    warnings.warn('smartapp.rest.smartapp.add_route is deprecated, routes are added to '
+                  'the application with smartapp.AppRouter.add_route', DeprecationWarning,
+                  stacklevel=2)
+    from smartapp import main
+    main.app.router.add_api_route(*args, **kwargs)
@@ -0,0 +1,5 @@
+from smartapp.scheduler import cron, scheduler
+
+CronExpression = cron.CronExpression
+CronError      = cron.CronError
+Scheduler      = scheduler.Scheduler
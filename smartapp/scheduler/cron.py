@@ -0,0 +1,122 @@
+from __future__ import annotations
+import datetime
+import zoneinfo
+from typing import Dict, Tuple
+
+MONTHS = {name: idx + 1 for idx, name in enumerate(
+    ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+)}
+WEEKDAYS = {name: idx for idx, name in enumerate(
+    ['SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT']
+)}
+QUARTZ_WEEKDAYS = {name: idx + 1 for name, idx in WEEKDAYS.items()}
+ANY = ('*', '?')
+MAX_DAYS = 366 * 5
+
+
+class CronError(ValueError):
+    pass
+
+
+def parse(field: str, low: int, high: int, names: Dict[str, int]={}) -> Tuple[int]:
+    """Expand one cron field (lists, ranges, steps and names) to its values"""
+    def value(item):
+        item = item.upper()
+        if item in names:
+            return names[item]
+        if not item.isdigit():
+            raise CronError('invalid cron value: {}'.format(item))
+        return int(item)
+
+    values = set()
+    for part in field.split(','):
+        step = None
+        if '/' in part:
+            part, step = part.split('/', 1)
+            step = value(step)
+            if not step:
+                raise CronError('invalid cron step: {}'.format(field))
+        if part in ANY:
+            start, end = low, high
+        elif '-' in part:
+            start, end = [value(item) for item in part.split('-', 1)]
+        else:
+            start = value(part)
+            end = high if step else start
+        if not low <= start <= end <= high:
+            raise CronError('cron value out of range: {}'.format(field))
+        values.update(range(start, end + 1, step or 1))
+    return tuple(sorted(values))
+
+
+class CronExpression(object):
+    """Cron expression evaluated in a timezone.
+
+    Accepts the classic 5 fields `minute hour day month weekday`, or the
+    6 fields of a SmartThings `smartapp.api.models.smartthings.CronSchedule`,
+    which is the Quartz format without seconds: `minute hour day month
+    weekday year`, where weekdays are numbered 1 (SUN) to 7 (SAT) and `?`
+    stands for "no specific value".
+
+    As in cron, when both the day of month and the weekday are restricted,
+    a day matching either of them fires.
+    """
+
+    __slots__ = ('expression', 'tz', 'minutes', 'hours', 'days', 'months',
+                 'weekdays', 'years', 'any_day', 'any_weekday')
+
+    def __init__(self, expression: str, timezone: str='UTC'):
+        fields = expression.split()
+        if len(fields) not in (5, 6):
+            raise CronError('expected 5 or 6 cron fields: {}'.format(expression))
+        self.expression = expression
+        self.tz         = zoneinfo.ZoneInfo(timezone)
+        self.minutes    = parse(fields[0], 0, 59)
+        self.hours      = parse(fields[1], 0, 23)
+        self.days       = frozenset(parse(fields[2], 1, 31))
+        self.months     = frozenset(parse(fields[3], 1, 12, MONTHS))
+        if len(fields) == 6:
+            self.weekdays = frozenset(day - 1 for day in parse(fields[4], 1, 7, QUARTZ_WEEKDAYS))
+            self.years    = frozenset(parse(fields[5], 1970, 2199))
+        else:
+            self.weekdays = frozenset(day % 7 for day in parse(fields[4], 0, 7, WEEKDAYS))
+            self.years    = None
+        self.any_day     = fields[2] in ANY
+        self.any_weekday = fields[4] in ANY
+
+    def match(self, date: datetime.date) -> bool:
+        if self.years is not None and date.year not in self.years:
+            return False
+        if date.month not in self.months:
+            return False
+        weekday = (date.weekday() + 1) % 7
+        if self.any_day and self.any_weekday:
+            return True
+        if self.any_day:
+            return weekday in self.weekdays
+        if self.any_weekday:
+            return date.day in self.days
+        return date.day in self.days or weekday in self.weekdays
+
+    def next(self, after: float) -> float:
+        """First fire time strictly after `after`
+
+        Args:
+            after (float): UNIX timestamp
+
+        Returns:
+            float: UNIX timestamp
+        """
+        start = datetime.datetime.fromtimestamp(after, self.tz)
+        date = start.date()
+        for _ in range(MAX_DAYS):
+            if self.match(date):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        ts = datetime.datetime(
+                            date.year, date.month, date.day, hour, minute, tzinfo=self.tz
+                        ).timestamp()
+                        if ts > after:
+                            return ts
+            date += datetime.timedelta(days=1)
+        raise CronError('no fire time within {} days: {}'.format(MAX_DAYS, self.expression))
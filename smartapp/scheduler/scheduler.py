@@ -0,0 +1,252 @@
+from __future__ import annotations
+import json
+import time
+import uuid
+import asyncio
+import datetime
+from typing import Any, Dict, Generator, List, Tuple
+
+import smartapp
+from smartapp import api, redis
+from smartapp.api import models
+from smartapp.scheduler import cron
+
+from smartapp import logger
+log = logger.get()
+
+KEY_PREFIX      = 'smartapp-schedule-'
+DEFAULT_HANDLER = 'handle_timer'
+DEFAULT_POLL    = 1.0
+DEFAULT_LEASE   = 60.0
+DEFAULT_BATCH   = 100
+
+# move due jobs out of sight of the other replicas until their lease expires
+CLAIM = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[3])
+for i = 1, #due, 2 do
+    redis.call('ZADD', KEYS[1], ARGV[2], due[i])
+end
+return due
+"""
+
+# only the holder of the lease may remove or reschedule a job
+COMPLETE = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not score or tonumber(score) ~= tonumber(ARGV[2]) then
+    return 0
+end
+if ARGV[3] == '' then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[2], ARGV[1])
+else
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+end
+return 1
+"""
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class Scheduler(redis.Redis):
+    """Delayed and CRON jobs for installed apps, persisted in Redis.
+
+    Each job is stored as a `smartapp.api.models.smartthings.ScheduleRequest`
+    in a hash, and its next due time (millis) in a sorted set, so schedules
+    survive restarts and are shared by every replica.  A single timer per
+    replica sleeps until the head of the sorted set is due, or at most
+    `scheduler['poll']` seconds to notice jobs added by other replicas;
+    the jobs are only claimed once the head is due, and the timer reads
+    Redis from the default executor rather than on the event loop.
+
+    Due jobs are claimed atomically by pushing their score to the end of a
+    lease (`scheduler['lease']` seconds), so exactly one replica runs them.
+    A job whose replica dies before completing is claimed again once its
+    lease expires.  Jobs run on the lane of their installed app with
+    `smartapp.api.smartapp.priority.Priority.LOW`, and call the handler of
+    the app with a `smartapp.api.models.smartthings.TimerEvent`.
+    """
+
+    _key    = None
+    _runner = None
+    _wakeup = None
+
+    @classmethod
+    def key(cls) -> str:
+        if not cls._key:
+            cls._key = KEY_PREFIX + api.AppContext.template().name
+        return cls._key
+
+    @classmethod
+    def jobs_key(cls) -> str:
+        return cls.key() + '-jobs'
+
+    @staticmethod
+    def job_id(app_id: str, name: str) -> str:
+        return '{}:{}'.format(app_id, name)
+
+    @classmethod
+    def settings(cls) -> Dict[str, Any]:
+        return getattr(smartapp.config, 'scheduler', None) or {}
+
+    @classmethod
+    def due(cls, req: models.smartthings.ScheduleRequest, after: float=None) -> int:
+        """Next due time of a schedule in millis, None when it is exhausted"""
+        if req.cron:
+            after = time.time() if after is None else after
+            return int(cron.CronExpression(
+                req.cron.expression, req.cron.timezone
+            ).next(after) * 1000)
+        if req.once and (after is None or req.once.time > after * 1000):
+            return req.once.time
+        return None
+
+    @classmethod
+    def add(cls, app_id: str, req: models.smartthings.ScheduleRequest,
+                 handler: str=DEFAULT_HANDLER, data: Dict[str, Any]=None) -> int:
+        """Create or replace the schedule `req.name` of an installed app
+
+        Returns:
+            int: due time in millis
+        """
+        due = cls.due(req)
+        if due is None:
+            raise ValueError('schedule requires once or cron')
+        job_id = cls.job_id(app_id, req.name)
+        job = {'app_id': app_id, 'handler': handler, 'data': data,
+               'request': req.dict(exclude_none=True)}
+        pipe = cls().pipeline()
+        pipe.hset(cls.jobs_key(), job_id, json.dumps(job))
+        pipe.zadd(cls.key(), {job_id: due})
+        pipe.execute()
+        log.info("scheduled %s for %s", job_id, due)
+        if cls._wakeup:
+            cls._wakeup.set()
+        return due
+
+    @classmethod
+    def remove(cls, app_id: str, name: str) -> bool:
+        job_id = cls.job_id(app_id, name)
+        pipe = cls().pipeline()
+        pipe.zrem(cls.key(), job_id)
+        pipe.hdel(cls.jobs_key(), job_id)
+        return bool(pipe.execute()[0])
+
+    @classmethod
+    def list(cls, app_id: str) -> Generator[Tuple[str, Dict[str, Any]]]:
+        """Schedules of an installed app, as (name, job) tuples"""
+        prefix = cls.job_id(app_id, '')
+        for job_id, job in cls().hscan_iter(cls.jobs_key(), match=prefix + '*'):
+            yield job_id.decode()[len(prefix):], json.loads(job)
+
+    @classmethod
+    def clear(cls, app_id: str) -> int:
+        """Remove every schedule of an installed app"""
+        names = [name for name, _ in cls.list(app_id)]
+        for name in names:
+            cls.remove(app_id, name)
+        return len(names)
+
+    @classmethod
+    def claim(cls, now: int, lease: int, batch: int) -> List[Tuple[str, int]]:
+        due = cls().eval(CLAIM, 1, cls.key(), now, lease, batch)
+        return [(due[i].decode(), int(float(due[i+1]))) for i in range(0, len(due), 2)]
+
+    @classmethod
+    def complete(cls, job_id: str, lease: int, due: int=None) -> bool:
+        return bool(cls().eval(COMPLETE, 2, cls.key(), cls.jobs_key(),
+                               job_id, lease, '' if due is None else due))
+
+    @classmethod
+    async def fire(cls, job_id: str, scheduled: int, lease: int):
+        raw = cls().hget(cls.jobs_key(), job_id)
+        if not raw:
+            return cls.complete(job_id, lease)
+        job = json.loads(raw)
+        req = models.smartthings.ScheduleRequest.parse_obj(job['request'])
+        evt = models.smartthings.TimerEvent(
+            eventId=str(uuid.uuid4()),
+            name=req.name,
+            type=models.smartthings.TimerType.CRON if req.cron else models.smartthings.TimerType.ONCE,
+            time=datetime.datetime.fromtimestamp(scheduled / 1000, datetime.timezone.utc),
+            expression=req.cron.expression if req.cron else None
+        )
+        try:
+            app = await api.AppContext.get(job['app_id'])
+            handler = getattr(app, job['handler'], None)
+            if not handler:
+                log.error("schedule %s: app has no handler %s", job_id, job['handler'])
+            elif job.get('data') is not None:
+                await handler(evt, job['data'])
+            else:
+                await handler(evt)
+        finally:
+            cls.complete(job_id, lease, cls.due(req, max(scheduled / 1000, time.time())))
+
+    @classmethod
+    def start(cls):
+        if not cls._runner:
+            cls._runner = api.TaskSupervisor.spawn(
+                cls.run(), name='scheduler', limit=False, timeout=None
+            )
+
+    @classmethod
+    async def stop(cls):
+        runner, cls._runner = cls._runner, None
+        if runner:
+            runner.cancel()
+            await asyncio.wait([runner])
+
+    @classmethod
+    async def run(cls):
+        settings = cls.settings()
+        poll  = settings.get('poll', DEFAULT_POLL)
+        lease = int(settings.get('lease', DEFAULT_LEASE) * 1000)
+        batch = settings.get('batch', DEFAULT_BATCH)
+        cls._wakeup = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        log.info("scheduler started on %s", cls.key())
+        while True:
+            try:
+                now, claimed, delay = await loop.run_in_executor(None, cls.scan, poll, lease, batch)
+                for job_id, scheduled in claimed:
+                    api.KeyedExecutor.submit(
+                        job_id.split(':', 1)[0], cls.fire, job_id, scheduled, now + lease,
+                        prio=api.Priority.LOW, timeout=lease / 1000
+                    )
+            except Exception as e:
+                log.error("scheduler: %s", e)
+                delay = poll
+            cls._wakeup.clear()
+            try:
+                await asyncio.wait_for(cls._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    @classmethod
+    def head(cls) -> float:
+        """Due time of the next job in millis, None when there is none"""
+        head = cls().zrange(cls.key(), 0, 0, withscores=True)
+        return head[0][1] if head else None
+
+    @classmethod
+    def scan(cls, poll: float, lease: int, batch: int) -> Tuple[int, List[Tuple[str, int]], float]:
+        """Claim the due jobs, only when the next job is due, and the seconds
+        to sleep until the next one, at most `poll` to notice the jobs added
+        by other replicas.  Blocks on Redis, runs in the default executor.
+
+        Returns:
+            tuple: the claim time, the claimed jobs and the delay
+        """
+        now = now_ms()
+        head = cls.head()
+        claimed = []
+        if head is not None and head <= now:
+            claimed = cls.claim(now, now + lease, batch)
+            if len(claimed) == batch:
+                return now, claimed, 0.0
+            head = cls.head()
+        if head is None:
+            return now, claimed, poll
+        return now, claimed, min(poll, max(0.0, (head - now_ms()) / 1000))
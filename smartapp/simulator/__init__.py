@@ -0,0 +1,6 @@
+from smartapp.simulator import simulator, faults
+
+Simulator = simulator.Simulator
+Faults    = faults.Faults
+Latency   = faults.Latency
+LOCATION  = simulator.LOCATION
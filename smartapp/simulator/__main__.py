@@ -0,0 +1,58 @@
+"""Run the SmartThings API simulator standalone.
+
+    python -m smartapp.simulator [--port 8081] [--devices 20]
+        [--latency 0.05] [--jitter 0.02] [--distribution lognormal]
+        [--error-rate 0.01] [--rate-limit 250] [--token-ttl 3600]
+        [--calibrate RECORDING]
+
+`--calibrate` takes the latency and error rates per resource from a
+`smartapp.recorder` recording, on top of the other options.
+"""
+import asyncio
+import argparse
+
+from smartapp import recorder
+from smartapp.simulator import Simulator, faults
+
+
+async def serve(args):
+    sim = Simulator(token_ttl=args.token_ttl, page_size=args.page_size)
+    for idx in range(args.devices):
+        sim.add_device('Device {}'.format(idx), ['switch', 'switchLevel'])
+    sim.faults.delay(args.latency, args.jitter, args.distribution)
+    if args.error_rate:
+        sim.faults.error(503, rate=args.error_rate)
+    if args.rate_limit:
+        sim.faults.rate_limit(args.rate_limit, 60.0)
+    if args.calibrate:
+        recorder.calibrate(sim.faults, recorder.read(args.calibrate))
+    port = await sim.start(args.host, args.port)
+    print('simulator listening on http://{}:{}'.format(args.host, port))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await sim.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--devices', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.0, help='mean seconds per request')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--distribution', default='normal', choices=faults.DISTRIBUTIONS)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='rate of 503 responses')
+    parser.add_argument('--rate-limit', type=int, default=0, help='requests per token and minute')
+    parser.add_argument('--token-ttl', type=float, default=None, help='seconds')
+    parser.add_argument('--page-size', type=int, default=None, help='items per listing page')
+    parser.add_argument('--calibrate', help='recording to take the latency and errors from')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+import math
+import time
+import random
+from typing import Dict, Optional, Tuple
+
+DISTRIBUTIONS = ('constant', 'uniform', 'normal', 'lognormal')
+
+
+class Latency(object):
+    """Response delay distribution, `mean` and `jitter` (standard deviation,
+    or half width for `uniform`) in seconds"""
+
+    __slots__ = ('mean', 'jitter', 'distribution')
+
+    def __init__(self, mean: float=0.0, jitter: float=0.0, distribution: str='normal'):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError('distribution must be one of {}'.format(', '.join(DISTRIBUTIONS)))
+        self.mean         = mean
+        self.jitter       = jitter
+        self.distribution = distribution
+
+    def sample(self) -> float:
+        mean, jitter = self.mean, self.jitter
+        if not jitter or self.distribution == 'constant':
+            return mean
+        if self.distribution == 'uniform':
+            return random.uniform(max(0.0, mean - jitter), mean + jitter)
+        if self.distribution == 'normal':
+            return max(0.0, random.gauss(mean, jitter))
+        if not mean:
+            return 0.0
+        # long tail with the requested mean and standard deviation
+        sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2))
+        return random.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+
+
+class Fault(object):
+    """Error response served instead of the real one: to the next `count`
+    matching requests (a burst), then to a `rate` of them"""
+
+    __slots__ = ('status', 'rate', 'count', 'resource', 'verb', 'retry_after')
+
+    def __init__(self, status: int, rate: float=0.0, count: int=0, resource: str=None,
+                       verb: str=None, retry_after: float=None):
+        self.status      = status
+        self.rate        = rate
+        self.count       = count
+        self.resource    = resource
+        self.verb        = verb
+        self.retry_after = retry_after
+
+    def matches(self, resource: str, verb: str) -> bool:
+        return (self.resource is None or self.resource == resource) \
+            and (self.verb is None or self.verb == verb)
+
+    def fire(self) -> bool:
+        if self.count:
+            self.count -= 1
+            return True
+        return bool(self.rate) and random.random() < self.rate
+
+    @property
+    def spent(self) -> bool:
+        return not self.count and not self.rate
+
+
+class Throttle(object):
+    """Token bucket per access token, `limit` requests per `period` seconds
+    like the rate limits of the SmartThings API"""
+
+    __slots__ = ('limit', 'period', 'resource', 'buckets')
+
+    def __init__(self, limit: int, period: float=60.0, resource: str=None):
+        self.limit    = limit
+        self.period   = period
+        self.resource = resource
+        self.buckets  = {}
+
+    def take(self, token: str) -> float:
+        """0 when the request is allowed, else the seconds until it would be"""
+        now = time.monotonic()
+        allowance, last = self.buckets.get(token, (self.limit, now))
+        allowance = min(self.limit, allowance + (now - last) * self.limit / self.period)
+        if allowance < 1:
+            self.buckets[token] = (allowance, now)
+            return (1 - allowance) * self.period / self.limit
+        self.buckets[token] = (allowance - 1, now)
+        return 0.0
+
+
+class Faults(object):
+    """Scriptable misbehaviour of `smartapp.simulator.Simulator`, the
+    methods chain:
+
+        sim.faults.delay(0.05, 0.02, 'lognormal')\\
+                  .error(503, count=20)\\
+                  .error(500, rate=0.01, resource='devices')\\
+                  .rate_limit(250, 60)
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> Faults:
+        self.latency   = {None: Latency()}
+        self.errors    = []
+        self.throttles = []
+        return self
+
+    def delay(self, mean: float, jitter: float=0.0, distribution: str='normal',
+                    resource: str=None) -> Faults:
+        """Delay the responses, of `resource` or of all of them"""
+        self.latency[resource] = Latency(mean, jitter, distribution)
+        return self
+
+    def error(self, status: int=500, rate: float=0.0, count: int=0, resource: str=None,
+                    verb: str=None, retry_after: float=None) -> Faults:
+        """Fail the next `count` requests and/or a `rate` of them with `status`"""
+        self.errors.append(Fault(status, rate, count, resource, verb, retry_after))
+        return self
+
+    def rate_limit(self, limit: int, period: float=60.0, resource: str=None) -> Faults:
+        """Answer 429 with a `Retry-After` beyond `limit` requests per token
+        and `period`"""
+        self.throttles.append(Throttle(limit, period, resource))
+        return self
+
+    def sample(self, resource: str) -> float:
+        return (self.latency.get(resource) or self.latency[None]).sample()
+
+    def check(self, resource: str, verb: str, token: str) -> Optional[Tuple[int, Dict[str, str]]]:
+        """The injected status and headers of a request, if any"""
+        for throttle in self.throttles:
+            if throttle.resource in (None, resource):
+                wait = throttle.take(token)
+                if wait:
+                    return 429, {'Retry-After': str(math.ceil(wait))}
+        for fault in self.errors:
+            if fault.matches(resource, verb) and fault.fire():
+                if fault.spent:
+                    self.errors.remove(fault)
+                headers = {}
+                if fault.retry_after is not None:
+                    headers['Retry-After'] = str(math.ceil(fault.retry_after))
+                return fault.status, headers
+        return None
@@ -0,0 +1,413 @@
+from __future__ import annotations
+import json
+import time
+import uuid
+import asyncio
+import datetime
+import collections
+from typing import Any, Dict, List
+
+import pydantic
+from aiohttp import web
+
+from smartapp.api import models
+from smartapp.simulator import faults
+
+from smartapp import logger
+log = logger.get()
+
+LOCATION = '00000000-0000-4000-8000-000000000001'
+
+# initial state of the capabilities of the devices added without status
+DEFAULTS = {
+    'switch':                 {'switch': 'off'},
+    'switchLevel':            {'level': 0},
+    'temperatureMeasurement': {'temperature': 20},
+    'motionSensor':           {'motion': 'inactive'},
+    'contactSensor':          {'contact': 'closed'},
+    'battery':                {'battery': 100},
+}
+
+# (capability, command) -> attribute and value, None for the first argument
+COMMANDS = {
+    ('switch', 'on'):            ('switch', 'on'),
+    ('switch', 'off'):           ('switch', 'off'),
+    ('switchLevel', 'setLevel'): ('level', None),
+}
+
+
+class Invalid(Exception):
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code   = code
+
+
+def now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+def respond(data: Any=None, status: int=200, headers: Dict[str, str]=None) -> web.Response:
+    if isinstance(data, pydantic.BaseModel):
+        text = data.json(exclude_none=True, by_alias=True)
+    else:
+        text = json.dumps({} if data is None else data)
+    return web.Response(text=text, status=status, headers=headers,
+                        content_type='application/json')
+
+
+def error(status: int, code: str, message: str, headers: Dict[str, str]=None) -> web.Response:
+    return respond(models.smartthings.ErrorResponse(
+        requestId=str(uuid.uuid4()),
+        error=models.smartthings.Error(code=code, message=message),
+    ), status, headers)
+
+
+class Simulator(object):
+    """Local stand-in for the parts of the SmartThings API called by
+    `smartapp.api.smartthings`: devices, installedapps and their
+    subscriptions, rules, scenes, notification and the OAuth token
+    endpoint.  Requests and responses are the `smartapp.api.models`.
+
+        sim = Simulator(token_ttl=3600)
+        sim.add_device('Lamp', ['switch', 'switchLevel'])
+        sim.faults.delay(0.05, 0.02, 'lognormal').error(503, count=10)
+        port = await sim.start()
+        ...
+        await sim.stop()
+
+    Point `smartthings['api']` at it with `scheme: http`,
+    `host: 127.0.0.1:<port>` and `base: ''`, and `smartthings['oauth']`
+    with `base: '/oauth'`.  Bearer tokens are accepted on first sight
+    unless `strict`; they are rejected with 401 once `expire()`d or older
+    than `token_ttl` seconds, until renewed through the token endpoint.
+    Device and scene listings are filtered by `locationId`, and split in
+    pages of `page_size` items linked by `_links.next`.
+    """
+
+    def __init__(self, token_ttl: float=None, strict: bool=False, page_size: int=None):
+        self.token_ttl      = token_ttl
+        self.strict         = strict
+        self.page_size      = page_size
+        self.faults         = faults.Faults()
+        self.calls          = collections.Counter()
+        self.devices        = {}
+        self.status         = {}
+        self.commands       = collections.defaultdict(list)
+        self.installed_apps = {}
+        self.subscriptions  = collections.defaultdict(dict)
+        self.app_events     = collections.defaultdict(list)
+        self.rules          = {}
+        self.scenes         = {}
+        self.notifications  = []
+        self.tokens         = {}
+        self.refresh_tokens = set()
+        self.runner         = None
+        self.app            = web.Application(middlewares=[self.middleware])
+        self.app.add_routes([
+            web.get('/devices{slash:/?}', self.list_devices),
+            web.post('/devices{slash:/?}', self.create_device),
+            web.get('/devices/{device_id}', self.get_device),
+            web.put('/devices/{device_id}', self.update_device),
+            web.get('/devices/{device_id}/status', self.device_status),
+            web.get('/devices/{device_id}/components/{component_id}/status', self.component_status),
+            web.post('/devices/{device_id}/commands', self.device_commands),
+            web.post('/devices/{device_id}/events', self.device_events),
+            web.get('/installedapps{slash:/?}', self.list_installed_apps),
+            web.get('/installedapps/{app_id}/subscriptions', self.list_subscriptions),
+            web.post('/installedapps/{app_id}/subscriptions', self.subscribe),
+            web.delete('/installedapps/{app_id}/subscriptions', self.unsubscribe_all),
+            web.delete('/installedapps/{app_id}/subscriptions/{id}', self.unsubscribe),
+            web.post('/installedapps/{app_id}/events', self.installed_app_events),
+            web.get('/rules{slash:/?}', self.list_rules),
+            web.post('/rules{slash:/?}', self.create_rule),
+            web.delete('/rules/{id}', self.delete_rule),
+            web.get('/scenes{slash:/?}', self.list_scenes),
+            web.post('/scenes/{scene_id}/execute', self.execute_scene),
+            web.post('/notification{slash:/?}', self.notify),
+            web.post('/oauth/token', self.token),
+        ])
+
+    async def start(self, host: str='127.0.0.1', port: int=0) -> int:
+        self.runner = web.AppRunner(self.app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        log.info("simulator: listening on %s:%s", host, port)
+        return port
+
+    async def stop(self):
+        runner, self.runner = self.runner, None
+        if runner:
+            await runner.cleanup()
+
+    # state
+
+    def add_device(self, label: str=None, capabilities: List[str]=('switch',),
+                         device_id: str=None, location_id: str=LOCATION, room_id: str=None,
+                         status: Dict[str, Dict[str, Any]]=None) -> str:
+        """Add a device with a `main` component, `status` maps capability
+        to attribute to value and defaults to `DEFAULTS`"""
+        device_id = device_id or str(uuid.uuid4())
+        self.devices[device_id] = models.smartthings.Device.parse_obj({
+            'deviceId': device_id, 'label': label or device_id, 'name': label or device_id,
+            'manufacturerName': 'SmartThings', 'presentationId': 'simulator',
+            'locationId': location_id, 'roomId': room_id, 'type': 'VIPER',
+            'restrictionTier': 0, 'createTime': now(),
+            'components': [{
+                'id': 'main', 'capabilities': [{'id': cap} for cap in capabilities],
+                'categories': [{'name': 'Other', 'categoryType': 'manufacturer'}],
+            }],
+        })
+        status = status or {cap: DEFAULTS.get(cap, {}) for cap in capabilities}
+        self.status[device_id] = {'main': {
+            cap: {attr: {'value': value, 'timestamp': now()} for attr, value in attrs.items()}
+            for cap, attrs in status.items()
+        }}
+        return device_id
+
+    def add_installed_app(self, app_id: str=None, location_id: str=LOCATION) -> str:
+        app_id = app_id or str(uuid.uuid4())
+        self.installed_apps[app_id] = models.smartthings.InstalledApp.parse_obj({
+            'installedAppId': app_id, 'installedAppType': 'WEBHOOK_SMART_APP',
+            'installedAppStatus': 'AUTHORIZED', 'appId': 'simulator', 'locationId': location_id,
+            'owner': {'ownerType': 'USER', 'ownerId': 'simulator'}, 'notices': [],
+            'createdDate': now(), 'lastUpdatedDate': now(), 'classifications': ['AUTOMATION'],
+            'principalType': 'LOCATION', 'singleInstance': False,
+        })
+        return app_id
+
+    def add_scene(self, name: str, location_id: str=LOCATION) -> str:
+        scene_id = str(uuid.uuid4())
+        self.scenes[scene_id] = models.smartthings.SceneSummary(
+            sceneId=scene_id, sceneName=name, locationId=location_id, createdDate=now(),
+        )
+        return scene_id
+
+    def issue(self) -> models.AuthToken:
+        token = models.AuthToken(access_token=str(uuid.uuid4()),
+                                 refresh_token=str(uuid.uuid4()), token_type='bearer')
+        self.tokens[token.access_token] = time.monotonic()
+        self.refresh_tokens.add(token.refresh_token)
+        return token
+
+    def expire(self, token: str=None):
+        """Expire `token`, or all the tokens seen so far"""
+        for key in [token] if token else list(self.tokens):
+            self.tokens[key] = None
+
+    # plumbing
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler) -> web.Response:
+        resource = request.path.strip('/').split('/', 1)[0]
+        self.calls[resource] += 1
+        delay = self.faults.sample(resource)
+        if delay:
+            await asyncio.sleep(delay)
+        token = None
+        if resource != 'oauth':
+            token = self.authenticate(request)
+            if not token:
+                return error(401, 'UnauthorizedError', 'invalid or expired token')
+        injected = self.faults.check(resource, request.method, token)
+        if injected:
+            status, headers = injected
+            return error(status, 'SimulatedError', 'injected by the simulator', headers)
+        try:
+            return await handler(request)
+        except Invalid as e:
+            return error(e.status, e.code, str(e))
+
+    def authenticate(self, request: web.Request) -> str:
+        scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+        if scheme.lower() != 'bearer' or not token or token == 'None':
+            return None
+        issued = self.tokens.get(token, False)
+        if issued is False and not self.strict:
+            issued = self.tokens[token] = time.monotonic()
+        if not issued:
+            return None
+        if self.token_ttl and time.monotonic() - issued > self.token_ttl:
+            self.tokens[token] = None
+            return None
+        return token
+
+    @staticmethod
+    async def body(request: web.Request, model: type) -> pydantic.BaseModel:
+        """The request body as `model`, the notification and rules clients
+        send JSON text without a JSON content type"""
+        try:
+            text = await request.text()
+            return model.parse_obj(json.loads(text) if text else {})
+        except (ValueError, pydantic.ValidationError) as e:
+            raise Invalid(422, 'ConstraintViolationError', str(e))
+
+    def page(self, request: web.Request, items: List[pydantic.BaseModel]) -> web.Response:
+        location_id = request.query.get('locationId')
+        if location_id:
+            items = [item for item in items if item.locationId == location_id]
+        start = int(request.query.get('page', 0))
+        size = self.page_size or len(items) or 1
+        data = {'items': [json.loads(item.json(exclude_none=True, by_alias=True))
+                          for item in items[start * size:(start + 1) * size]]}
+        if (start + 1) * size < len(items):
+            query = dict(request.query, page=str(start + 1))
+            data['_links'] = {'next': {'href': str(request.url.with_query(query))}}
+        return respond(data)
+
+    def device_id(self, request: web.Request) -> str:
+        device_id = request.match_info['device_id']
+        if device_id not in self.devices:
+            raise Invalid(404, 'NotFoundError', 'device not found')
+        return device_id
+
+    def installed_app(self, request: web.Request) -> str:
+        app_id = request.match_info['app_id']
+        if app_id not in self.installed_apps:
+            try:
+                self.add_installed_app(app_id)
+            except pydantic.ValidationError:
+                raise Invalid(404, 'NotFoundError', 'installed app not found')
+        return app_id
+
+    # devices
+
+    async def list_devices(self, request: web.Request) -> web.Response:
+        return self.page(request, list(self.devices.values()))
+
+    async def create_device(self, request: web.Request) -> web.Response:
+        data = await self.body(request, models.smartthings.DeviceInstallRequest)
+        device_id = self.add_device(data.label, [], location_id=data.locationId)
+        return respond(self.devices[device_id])
+
+    async def get_device(self, request: web.Request) -> web.Response:
+        return respond(self.devices[self.device_id(request)])
+
+    async def update_device(self, request: web.Request) -> web.Response:
+        device = self.devices[self.device_id(request)]
+        data = await self.body(request, models.smartthings.UpdateDeviceRequest)
+        if data.label:
+            device.label = data.label
+        return respond(device)
+
+    async def device_status(self, request: web.Request) -> web.Response:
+        return respond({'components': self.status[self.device_id(request)]})
+
+    async def component_status(self, request: web.Request) -> web.Response:
+        components = self.status[self.device_id(request)]
+        try:
+            return respond(components[request.match_info['component_id']])
+        except KeyError:
+            raise Invalid(404, 'NotFoundError', 'component not found')
+
+    async def device_commands(self, request: web.Request) -> web.Response:
+        device_id = self.device_id(request)
+        data = await self.body(request, models.smartthings.DeviceCommandsRequest)
+        components = self.status[device_id]
+        results = []
+        for command in data.commands or []:
+            capabilities = components.get(command.component or 'main', {})
+            if command.capability not in capabilities:
+                raise Invalid(422, 'ConstraintViolationError', '{} is not a capability of {}'.format(
+                    command.capability, device_id))
+            self.commands[device_id].append(command)
+            effect = COMMANDS.get((command.capability, command.command))
+            if effect:
+                attribute, value = effect
+                if value is None:
+                    value = (command.arguments or [None])[0]
+                capabilities[command.capability][attribute] = {'value': value, 'timestamp': now()}
+            results.append({'id': str(uuid.uuid4()), 'status': 'ACCEPTED'})
+        return respond(models.smartthings.DeviceCommandsResponse(results=results))
+
+    async def device_events(self, request: web.Request) -> web.Response:
+        device_id = self.device_id(request)
+        data = await self.body(request, models.smartthings.DeviceEventsRequest)
+        for event in data.deviceEvents or []:
+            component = self.status[device_id].setdefault(event.component or 'main', {})
+            component.setdefault(event.capability, {})[event.attribute] = {
+                'value': event.value, 'unit': event.unit, 'timestamp': now(),
+            }
+        return respond({})
+
+    # installed apps
+
+    async def list_installed_apps(self, request: web.Request) -> web.Response:
+        return respond(models.InstalledAppCollection(items=list(self.installed_apps.values())))
+
+    async def list_subscriptions(self, request: web.Request) -> web.Response:
+        subscriptions = self.subscriptions[self.installed_app(request)]
+        return respond(models.SubscriptionCollection(items=list(subscriptions.values())))
+
+    async def subscribe(self, request: web.Request) -> web.Response:
+        app_id = self.installed_app(request)
+        data = await self.body(request, models.smartthings.SubscriptionRequest)
+        subscription = models.smartthings.Subscription.parse_obj(dict(
+            data.dict(exclude_none=True), id=str(uuid.uuid4()), installedAppId=app_id,
+        ))
+        self.subscriptions[app_id][subscription.id] = subscription
+        return respond(subscription)
+
+    async def unsubscribe(self, request: web.Request) -> web.Response:
+        removed = self.subscriptions[self.installed_app(request)].pop(request.match_info['id'], None)
+        return respond({'count': 1 if removed else 0})
+
+    async def unsubscribe_all(self, request: web.Request) -> web.Response:
+        subscriptions = self.subscriptions.pop(self.installed_app(request), {})
+        return respond({'count': len(subscriptions)})
+
+    async def installed_app_events(self, request: web.Request) -> web.Response:
+        data = await self.body(request, models.smartthings.CreateInstalledAppEventsRequest)
+        self.app_events[self.installed_app(request)].append(data)
+        return respond({})
+
+    # rules, scenes, notification
+
+    async def list_rules(self, request: web.Request) -> web.Response:
+        location_id = request.query.get('locationId')
+        return respond({'items': [json.loads(rule.json(exclude_none=True, by_alias=True))
+                                  for rule in self.rules.values() if rule.ownerId == location_id]})
+
+    async def create_rule(self, request: web.Request) -> web.Response:
+        location_id = request.query.get('locationId')
+        if not location_id:
+            raise Invalid(422, 'ConstraintViolationError', 'locationId is required')
+        data = await self.body(request, models.smartthings.RuleRequest)
+        rule = models.smartthings.Rule.parse_obj(dict(
+            data.dict(exclude_none=True, by_alias=True), id=str(uuid.uuid4()),
+            ownerId=location_id, ownerType='Location', dateCreated=now(), dateUpdated=now(),
+        ))
+        self.rules[rule.id] = rule
+        return respond(rule)
+
+    async def delete_rule(self, request: web.Request) -> web.Response:
+        rule = self.rules.pop(request.match_info['id'], None)
+        if not rule:
+            raise Invalid(404, 'NotFoundError', 'rule not found')
+        return respond(rule)
+
+    async def list_scenes(self, request: web.Request) -> web.Response:
+        return self.page(request, list(self.scenes.values()))
+
+    async def execute_scene(self, request: web.Request) -> web.Response:
+        if request.match_info['scene_id'] not in self.scenes:
+            raise Invalid(404, 'NotFoundError', 'scene not found')
+        return respond(models.smartapp.RequestStatus(status='success'))
+
+    async def notify(self, request: web.Request) -> web.Response:
+        self.notifications.append(await self.body(request, models.smartthings.NotificationRequest))
+        return respond({'code': 200, 'message': 'Success'})
+
+    # oauth
+
+    async def token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if form.get('grant_type') != 'refresh_token':
+            return respond({'error': 'unsupported_grant_type'}, 400)
+        if form.get('refresh_token') not in self.refresh_tokens and self.strict:
+            return respond({'error': 'invalid_grant'}, 400)
+        self.refresh_tokens.discard(form.get('refresh_token'))
+        return respond(self.issue())
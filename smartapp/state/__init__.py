@@ -0,0 +1,16 @@
+from smartapp.state import mirror, inventory, health, history, snapshot
+
+DeviceState   = mirror.DeviceState
+LocationState = mirror.LocationState
+State         = mirror.State
+
+Inventory     = inventory.Inventory
+Index         = inventory.Index
+Selection     = inventory.Selection
+
+Health        = health.Health
+DeviceOffline = health.DeviceOffline
+
+History       = history.History
+
+Snapshot      = snapshot.Snapshot
@@ -0,0 +1,218 @@
+from __future__ import annotations
+import time
+import asyncio
+from typing import Any, Dict, Iterable, Optional
+
+from smartapp.api import models
+from smartapp.state import inventory
+
+from smartapp import logger
+log = logger.get()
+
+EventType = models.smartthings.EventType
+
+OFFLINE = 'OFFLINE'
+ONLINE  = 'ONLINE'
+
+# hub status -> integration types of the devices it takes offline
+RADIOS = {
+    'ZWAVE_OFFLINE':     ('ZWAVE',),
+    'ZIGBEE_OFFLINE':    ('ZIGBEE',),
+    'BLUETOOTH_OFFLINE': ('BLE', 'BLE_D2D'),
+}
+RADIO_ONLINE = {
+    'ZWAVE_ONLINE':     'ZWAVE_OFFLINE',
+    'ZIGBEE_ONLINE':    'ZIGBEE_OFFLINE',
+    'BLUETOOTH_ONLINE': 'BLUETOOTH_OFFLINE',
+}
+
+
+class DeviceOffline(RuntimeError):
+
+    def __init__(self, device_id: str, reason: str):
+        super().__init__("device {} is offline: {}".format(device_id, reason))
+        self.device_id = device_id
+        self.reason    = reason
+
+
+def value(enum: Any) -> Optional[str]:
+    return getattr(enum, 'value', enum)
+
+
+class DeviceHealth(object):
+
+    __slots__ = ('status', 'reason', 'hub_id', 'updated')
+
+    def __init__(self, status: str, reason: str=None, hub_id: str=None):
+        self.status  = status
+        self.reason  = reason
+        self.hub_id  = hub_id
+        self.updated = time.time()
+
+
+class HubHealth(object):
+
+    __slots__ = ('status', 'reason', 'radios', 'updated')
+
+    def __init__(self):
+        self.status  = ONLINE
+        self.reason  = None
+        self.radios  = set()
+        self.updated = time.time()
+
+
+class LocationHealth(object):
+    """Health of the devices and hubs of a location"""
+
+    def __init__(self, location_id: str):
+        self.location_id = location_id
+        self.devices     = {}
+        self.hubs        = {}
+        self.waiters     = set()
+
+    def device(self, event: models.smartthings.DeviceHealthEvent):
+        current = self.devices.get(event.deviceId)
+        hub_id = event.hubId or (current.hub_id if current else None)
+        self.devices[event.deviceId] = DeviceHealth(value(event.status), value(event.reason),
+                                                    hub_id)
+        self.wake()
+
+    def hub(self, event: models.smartthings.HubHealthEvent):
+        hub = self.hubs.get(event.hubId)
+        if hub is None:
+            hub = self.hubs[event.hubId] = HubHealth()
+        status = value(event.status)
+        if status in RADIOS:
+            hub.radios.add(status)
+        elif status in RADIO_ONLINE:
+            hub.radios.discard(RADIO_ONLINE[status])
+        else:
+            hub.status = status
+            if status == ONLINE:
+                hub.radios.clear()
+        hub.reason  = value(event.reason)
+        hub.updated = time.time()
+        self.wake()
+
+    def offline(self, device_id: str) -> Optional[str]:
+        """Why the device is offline, None when it is not known to be"""
+        device = self.devices.get(device_id)
+        if device is None:
+            return None
+        if device.status == OFFLINE:
+            return device.reason or OFFLINE
+        hub = self.hubs.get(device.hub_id) if device.hub_id else None
+        if hub is None:
+            return None
+        if hub.status == OFFLINE:
+            return 'HUB_OFFLINE'
+        if hub.radios:
+            index = inventory.Inventory.index(self.location_id)
+            known = index.devices.get(device_id) if index else None
+            kind = value(known.type) if known else None
+            for radio in hub.radios:
+                if kind in RADIOS[radio]:
+                    return radio
+        return None
+
+    def wake(self):
+        waiters, self.waiters = self.waiters, set()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class Health(object):
+    """Process wide health table of the devices and hubs, per location.
+
+    Fed by the DEVICE_HEALTH_EVENTs and HUB_HEALTH_EVENTs of the apps of
+    the location (see `SmartApp.subscribe_health`), which the controller
+    applies before dispatching them.  A device is offline when its last
+    health event says so, when its hub is offline, or when the radio of
+    its integration type (Z-Wave, Zigbee, Bluetooth, known from the
+    `smartapp.state.Inventory` when the location is indexed) is offline.
+    Devices without a health event are assumed online.
+
+    `SmartApp.command` consults it to skip, or defer, the commands to
+    offline devices instead of waiting on the API for them to fail.
+    """
+
+    _locations = {}
+
+    @classmethod
+    def location(cls, location_id: str) -> LocationHealth:
+        try:
+            return cls._locations[location_id]
+        except KeyError:
+            location = cls._locations[location_id] = LocationHealth(location_id)
+            return location
+
+    @classmethod
+    def apply(cls, location_id: str, events: Iterable[Any]) -> int:
+        """Apply the health events of an EVENT lifecycle
+
+        Returns:
+            int: number of health events
+        """
+        applied = 0
+        for event in events or ():
+            if event.eventType == EventType.DEVICE_HEALTH_EVENT:
+                item = event.deviceHealthEvent
+                if item is not None and item.deviceId:
+                    cls.location(location_id).device(item)
+                    applied += 1
+            elif event.eventType == EventType.HUB_HEALTH_EVENT:
+                item = event.hubHealthEvent
+                if item is not None and item.hubId:
+                    cls.location(location_id).hub(item)
+                    applied += 1
+        return applied
+
+    @classmethod
+    def offline(cls, location_id: str, device_id: str) -> Optional[str]:
+        location = cls._locations.get(location_id)
+        return location.offline(device_id) if location else None
+
+    @classmethod
+    async def ready(cls, location_id: str, device_id: str, defer: float=None):
+        """Return once the device is not known to be offline, waiting at
+        most `defer` seconds for it to come back
+
+        Raises:
+            DeviceOffline: still offline
+        """
+        reason = cls.offline(location_id, device_id)
+        if reason is None:
+            return
+        deadline = time.monotonic() + (defer or 0.0)
+        location = cls._locations[location_id]
+        while reason is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeviceOffline(device_id, reason)
+            waiter = asyncio.get_running_loop().create_future()
+            location.waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                location.waiters.discard(waiter)
+            reason = location.offline(device_id)
+        log.info("health: device %s back online", device_id)
+
+    @classmethod
+    def summary(cls, location_id: str) -> Dict[str, Dict[str, str]]:
+        """Status of the known devices and hubs of a location"""
+        location = cls._locations.get(location_id)
+        if location is None:
+            return {'devices': {}, 'hubs': {}}
+        return {
+            'devices': {device_id: location.offline(device_id) or device.status
+                        for device_id, device in location.devices.items()},
+            'hubs':    {hub_id: hub.status for hub_id, hub in location.hubs.items()},
+        }
+
+    @classmethod
+    def clear(cls):
+        cls._locations = {}
@@ -0,0 +1,273 @@
+from __future__ import annotations
+import time
+import warnings
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_CAPACITY = 1024
+
+
+def require():
+    if numpy is None:
+        raise RuntimeError("attribute history requires numpy, install smartapp-sdk[history]")
+
+
+class Series(object):
+    """Ring buffers of one numeric attribute, a row of `capacity` samples
+    per device.  Values and times are two `(devices, capacity)` float64
+    arrays, empty slots hold NaN; rows are added by doubling the arrays,
+    so memory is bounded by `16 * capacity` bytes per device (twice that
+    while growing)."""
+
+    def __init__(self, capacity: int=DEFAULT_CAPACITY):
+        require()
+        self.capacity = capacity
+        self.rows     = {}
+        self.ids      = []
+        self.last     = []
+        self.values   = numpy.full((0, capacity), numpy.nan)
+        self.times    = numpy.full((0, capacity), numpy.nan)
+        self.heads    = numpy.zeros(0, dtype=numpy.int64)
+
+    def row(self, device_id: str) -> int:
+        row = self.rows.get(device_id)
+        if row is None:
+            row = self.rows[device_id] = len(self.ids)
+            self.ids.append(device_id)
+            self.last.append(None)
+            if row == len(self.heads):
+                self.grow(max(4, 2 * row))
+        return row
+
+    def grow(self, rows: int):
+        extra = rows - len(self.heads)
+        empty = numpy.full((extra, self.capacity), numpy.nan)
+        self.values = numpy.concatenate((self.values, empty))
+        self.times  = numpy.concatenate((self.times, empty))
+        self.heads  = numpy.concatenate((self.heads, numpy.zeros(extra, dtype=numpy.int64)))
+
+    def append(self, device_id: str, value: float, at: float, event_id: str=None) -> bool:
+        """Write a sample, unless it is the event written last for the
+        device (delivered to several apps of the location)"""
+        row = self.row(device_id)
+        if event_id is not None and self.last[row] == event_id:
+            return False
+        self.last[row] = event_id
+        head = self.heads[row]
+        self.values[row, head] = value
+        self.times[row, head] = at
+        self.heads[row] = (head + 1) % self.capacity
+        return True
+
+    def window(self, seconds: float=None, devices: Iterable[str]=None,
+                     now: float=None) -> Window:
+        """Samples of the last `seconds` (all the samples held when None),
+        of `devices` (all the devices when None)"""
+        if devices is None:
+            ids = list(self.ids)
+            rows = numpy.arange(len(ids))
+        else:
+            ids = [device_id for device_id in devices if device_id in self.rows]
+            rows = numpy.array([self.rows[device_id] for device_id in ids], dtype=numpy.int64)
+        times = self.times[rows]
+        values = self.values[rows]
+        if seconds is not None:
+            start = (time.time() if now is None else now) - seconds
+            with numpy.errstate(invalid='ignore'):
+                outside = ~(times >= start)
+            times = numpy.where(outside, numpy.nan, times)
+            values = numpy.where(outside, numpy.nan, values)
+        return Window(ids, times, values)
+
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.times.nbytes + self.heads.nbytes
+
+
+class Window(object):
+    """Samples of a `Series` over a time window, a row per device; the
+    aggregations run on all the rows at once and return the value of
+    each device with samples in the window"""
+
+    __slots__ = ('ids', 'times', 'values')
+
+    def __init__(self, ids: List[str], times: Any, values: Any):
+        self.ids    = ids
+        self.times  = times
+        self.values = values
+
+    def per_device(self, result: Any) -> Dict[str, float]:
+        return {device_id: float(value) for device_id, value in zip(self.ids, result)
+                if not numpy.isnan(value)}
+
+    def reduce(self, func: Any, *args) -> Dict[str, float]:
+        with warnings.catch_warnings():
+            # rows without samples in the window
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return self.per_device(func(self.values, *args, axis=1))
+
+    def count(self) -> Dict[str, int]:
+        counts = numpy.count_nonzero(~numpy.isnan(self.values), axis=1)
+        return {device_id: int(count) for device_id, count in zip(self.ids, counts) if count}
+
+    def mean(self) -> Dict[str, float]:
+        return self.reduce(numpy.nanmean)
+
+    def min(self) -> Dict[str, float]:
+        return self.reduce(numpy.nanmin)
+
+    def max(self) -> Dict[str, float]:
+        return self.reduce(numpy.nanmax)
+
+    def percentile(self, q: float) -> Dict[str, float]:
+        """`q`th percentile, 0 to 100"""
+        return self.reduce(numpy.nanpercentile, q)
+
+    def latest(self) -> Dict[str, float]:
+        return self.per_device(self.edge(newest=True)[1])
+
+    def edge(self, newest: bool) -> Tuple[Any, Any]:
+        """Times and values of the oldest or newest sample of every row"""
+        empty = numpy.isnan(self.times)
+        if newest:
+            cols = numpy.argmax(numpy.where(empty, -numpy.inf, self.times), axis=1)
+        else:
+            cols = numpy.argmin(numpy.where(empty, numpy.inf, self.times), axis=1)
+        rows = numpy.arange(len(self.ids))
+        filled = ~empty.all(axis=1)
+        return (numpy.where(filled, self.times[rows, cols], numpy.nan),
+                numpy.where(filled, self.values[rows, cols], numpy.nan))
+
+    def rate(self) -> Dict[str, float]:
+        """Change per second between the oldest and the newest sample"""
+        first_at, first = self.edge(newest=False)
+        last_at, last = self.edge(newest=True)
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            elapsed = last_at - first_at
+            rate = numpy.where(elapsed > 0, (last - first) / elapsed, numpy.nan)
+        return self.per_device(rate)
+
+    def resample(self, step: float, how: str='mean',
+                       start: float=None) -> Tuple[Any, Dict[str, Any]]:
+        """Aggregate the samples in bins of `step` seconds from `start`
+        (the oldest sample by default) with `how`: mean, min, max, sum or
+        count.  Empty bins are NaN (0 for count)
+
+        Returns:
+            tuple: the start times of the bins, and the bins of each device
+        """
+        taken = ~numpy.isnan(self.times)
+        if not taken.any():
+            return numpy.zeros(0), {}
+        if start is None:
+            start = float(self.times[taken].min())
+        bins = max(int((self.times[taken].max() - start) // step) + 1, 1)
+        rows = numpy.nonzero(taken)[0]
+        cols = ((self.times[taken] - start) // step).astype(numpy.int64)
+        keep = cols >= 0
+        index = rows[keep] * bins + cols[keep]
+        values = self.values[taken][keep]
+        shape = len(self.ids) * bins
+        counts = numpy.bincount(index, minlength=shape)
+        if how in ('mean', 'sum'):
+            out = numpy.bincount(index, weights=values, minlength=shape)
+            if how == 'mean':
+                with numpy.errstate(invalid='ignore', divide='ignore'):
+                    out = out / counts
+            out[counts == 0] = numpy.nan
+        elif how in ('min', 'max'):
+            out = numpy.full(shape, numpy.inf if how == 'min' else -numpy.inf)
+            (numpy.minimum if how == 'min' else numpy.maximum).at(out, index, values)
+            out[counts == 0] = numpy.nan
+        elif how == 'count':
+            out = counts
+        else:
+            raise ValueError("resample: unknown aggregation {}".format(how))
+        out = out.reshape(len(self.ids), bins)
+        edges = start + step * numpy.arange(bins)
+        return edges, {device_id: out[row] for row, device_id in enumerate(self.ids)
+                       if counts[row * bins:(row + 1) * bins].any()}
+
+
+class History(object):
+    """Process wide history of numeric device attributes, a `Series` per
+    tracked `(capability, attribute)`, written from the DEVICE_EVENTs of
+    the EVENT lifecycles by the controller.  Attributes are tracked from
+    `history['attributes']` (`'capability.attribute'` strings) or with
+    `track()`; nothing is recorded otherwise.  Requires numpy.
+
+        History.track('powerMeter', 'power', capacity=2880)
+        window = History.window('powerMeter', 'power', seconds=3600, devices=meters)
+        window.mean(), window.percentile(95), window.rate()
+        edges, bins = window.resample(300, 'max')
+    """
+
+    _series = {}
+
+    @classmethod
+    def configure(cls, attributes: Iterable[str]=(), capacity: int=DEFAULT_CAPACITY):
+        for name in attributes:
+            capability, attribute = name.split('.', 1)
+            cls.track(capability, attribute, capacity)
+
+    @classmethod
+    def track(cls, capability: str, attribute: str, capacity: int=DEFAULT_CAPACITY) -> Series:
+        key = (capability, attribute)
+        series = cls._series.get(key)
+        if series is None:
+            series = cls._series[key] = Series(capacity)
+            log.info("history: tracking %s.%s, %s samples per device", capability,
+                     attribute, capacity)
+        return series
+
+    @classmethod
+    def series(cls, capability: str, attribute: str) -> Optional[Series]:
+        return cls._series.get((capability, attribute))
+
+    @classmethod
+    def apply(cls, events: Iterable[Any], at: float=None) -> int:
+        """Write the numeric values of the tracked attributes of the device
+        events of an EVENT lifecycle
+
+        Returns:
+            int: number of samples written
+        """
+        if not cls._series:
+            return 0
+        at = time.time() if at is None else at
+        written = 0
+        for event in events or ():
+            item = event.deviceEvent
+            if item is None:
+                continue
+            series = cls._series.get((item.capability, item.attribute))
+            if series is None or not item.deviceId:
+                continue
+            try:
+                value = float(item.value)
+            except (TypeError, ValueError):
+                continue
+            written += series.append(item.deviceId, value, at, item.eventId)
+        return written
+
+    @classmethod
+    def window(cls, capability: str, attribute: str, seconds: float=None,
+                    devices: Iterable[str]=None) -> Window:
+        series = cls._series.get((capability, attribute))
+        if series is None:
+            raise KeyError("{}.{} is not tracked".format(capability, attribute))
+        return series.window(seconds, devices)
+
+    @classmethod
+    def nbytes(cls) -> int:
+        return sum(series.nbytes() for series in cls._series.values())
+
+    @classmethod
+    def clear(cls):
+        cls._series = {}
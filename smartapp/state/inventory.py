@@ -0,0 +1,417 @@
+from __future__ import annotations
+import time
+import asyncio
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from smartapp import api, metrics
+from smartapp.api import smartthings, models, types
+
+from smartapp import logger
+log = logger.get()
+
+LIFECYCLES = metrics.Counter('smartapp_inventory_lifecycles',
+                             'Lifecycle events applied to the inventory', ['kind', 'outcome'])
+
+DeviceLifecycle = models.smartthings.DeviceLifecycle
+SceneLifecycle  = models.smartthings.SceneLifecycle
+EventType       = models.smartthings.EventType
+
+
+class Gap(Exception):
+    """A lifecycle event which does not follow from the inventory, some
+    events were missed"""
+
+
+def device_id(device: models.smartthings.Device) -> str:
+    value = device.deviceId
+    return getattr(value, '__root__', value)
+
+
+def capabilities(device: models.smartthings.Device) -> Set[str]:
+    """Capability ids of all the components of a device"""
+    return {capability.id for component in device.components or ()
+            for capability in component.capabilities or ()}
+
+
+def profile(device: models.smartthings.Device) -> Optional[str]:
+    return device.profile.id if device.profile else None
+
+
+def count(bits: int) -> int:
+    return bin(bits).count('1')
+
+
+class Selection(object):
+    """Devices of an `Index`, as a bitset of their slots.  Selections of
+    the same index combine with `&`, `|`, `-`, `^` and `~`; iterating a
+    selection yields device ids.  A selection is a snapshot, to be used
+    before the index changes: the slots of removed devices are reused."""
+
+    __slots__ = ('index', 'bits')
+
+    def __init__(self, index: Index, bits: int=0):
+        self.index = index
+        self.bits  = bits
+
+    def combine(self, other: Selection, bits: int) -> Selection:
+        if other.index is not self.index:
+            raise ValueError("selections of different inventories")
+        return Selection(self.index, bits)
+
+    def __and__(self, other: Selection) -> Selection:
+        return self.combine(other, self.bits & other.bits)
+
+    def __or__(self, other: Selection) -> Selection:
+        return self.combine(other, self.bits | other.bits)
+
+    def __sub__(self, other: Selection) -> Selection:
+        return self.combine(other, self.bits & ~other.bits)
+
+    def __xor__(self, other: Selection) -> Selection:
+        return self.combine(other, self.bits ^ other.bits)
+
+    def __invert__(self) -> Selection:
+        return Selection(self.index, self.index.used & ~self.bits)
+
+    def __iter__(self) -> Iterator[str]:
+        ids = self.index.ids
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield ids[low.bit_length() - 1]
+            bits ^= low
+
+    def __len__(self) -> int:
+        return count(self.bits)
+
+    def __bool__(self) -> bool:
+        return bool(self.bits)
+
+    def __contains__(self, device_id: str) -> bool:
+        slot = self.index.slots.get(device_id)
+        return slot is not None and bool(self.bits >> slot & 1)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Selection) and other.index is self.index \
+            and other.bits == self.bits
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return 'Selection({} devices)'.format(len(self))
+
+    def devices(self) -> List[models.smartthings.Device]:
+        devices = self.index.devices
+        return [devices[device_id] for device_id in self]
+
+
+class Index(object):
+    """Devices of a location, indexed by capability, room and profile,
+    and its scenes by id (None when they can not be listed).  Each device
+    holds a slot, reused once the device is removed, and each key maps to
+    the bitset of the slots of its devices."""
+
+    def __init__(self, location_id: str):
+        self.location_id   = location_id
+        self.ids           = []
+        self.slots         = {}
+        self.free          = []
+        self.used          = 0
+        self.devices       = {}
+        self.keys          = {}
+        self.by_capability = {}
+        self.by_room       = {}
+        self.by_profile    = {}
+        self.scenes        = None
+        self.loaded        = None
+        self.stale         = False
+
+    def mappings(self, device: models.smartthings.Device) -> Iterator[Tuple[Dict[str, int], str]]:
+        for capability in capabilities(device):
+            yield self.by_capability, capability
+        if device.roomId:
+            yield self.by_room, device.roomId
+        if profile(device):
+            yield self.by_profile, profile(device)
+
+    def add(self, device: models.smartthings.Device):
+        """Add a device, or index it again once it changed"""
+        key = device_id(device)
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.free.pop() if self.free else len(self.ids)
+            if slot == len(self.ids):
+                self.ids.append(key)
+            else:
+                self.ids[slot] = key
+            self.slots[key] = slot
+            self.used |= 1 << slot
+        else:
+            self.unset(key, slot)
+        self.devices[key] = device
+        self.keys[key] = keys = list(self.mappings(device))
+        bit = 1 << slot
+        for mapping, value in keys:
+            mapping[value] = mapping.get(value, 0) | bit
+
+    def unset(self, key: str, slot: int):
+        bit = 1 << slot
+        for mapping, value in self.keys.pop(key, ()):
+            bits = mapping.get(value, 0) & ~bit
+            if bits:
+                mapping[value] = bits
+            else:
+                mapping.pop(value, None)
+
+    def remove(self, key: str) -> Optional[models.smartthings.Device]:
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return None
+        self.unset(key, slot)
+        self.ids[slot] = None
+        self.free.append(slot)
+        self.used &= ~(1 << slot)
+        return self.devices.pop(key)
+
+    def all(self) -> Selection:
+        return Selection(self, self.used)
+
+    def capability(self, *ids: str) -> Selection:
+        """Devices with every capability in `ids`"""
+        bits = self.used
+        for capability in ids:
+            bits &= self.by_capability.get(capability, 0)
+        return Selection(self, bits)
+
+    def room(self, room_id: str) -> Selection:
+        return Selection(self, self.by_room.get(room_id, 0))
+
+    def profile(self, profile_id: str) -> Selection:
+        return Selection(self, self.by_profile.get(profile_id, 0))
+
+    def select(self, capability: Any=(), room: str=None, profile: str=None) -> Selection:
+        """Devices with the capabilities in `capability` (an id or ids),
+        in `room` and of `profile`, when given"""
+        if isinstance(capability, str):
+            capability = (capability,)
+        selection = self.capability(*capability)
+        if room is not None:
+            selection &= self.room(room)
+        if profile is not None:
+            selection &= self.profile(profile)
+        return selection
+
+    def device_lifecycle(self, event: models.smartthings.DeviceLifecycleEvent) -> bool:
+        """Apply a device lifecycle event in place
+
+        Returns:
+            bool: False when the device has to be read from the API
+
+        Raises:
+            Gap: the event does not follow from the indexed device
+        """
+        lifecycle, key = event.lifecycle, event.deviceId
+        if lifecycle in (DeviceLifecycle.DELETE, DeviceLifecycle.MOVE_FROM):
+            self.remove(key)
+            return True
+        if lifecycle in (DeviceLifecycle.CREATE, DeviceLifecycle.MOVE_TO):
+            return False
+        device = self.devices.get(key)
+        if device is None:
+            raise Gap("{} of unknown device {}".format(lifecycle.value, key))
+        if lifecycle == DeviceLifecycle.ROOM_MOVE and event.roomMove:
+            if (device.roomId or None) != (event.roomMove.roomIdFrom or None):
+                raise Gap("device {} moved from room {}, indexed in {}".format(
+                    key, event.roomMove.roomIdFrom, device.roomId))
+            self.add(device.copy(update={'roomId': event.roomMove.roomIdTo}))
+            return True
+        if lifecycle == DeviceLifecycle.UPDATE and event.update:
+            if event.update.componentDiff:
+                return False
+            label = event.update.labelDiff
+            if label:
+                if label.old is not None and label.old != device.label:
+                    raise Gap("device {} renamed from {!r}, indexed as {!r}".format(
+                        key, label.old, device.label))
+                self.devices[key] = device.copy(update={'label': label.new})
+        return True
+
+    def scene_lifecycle(self, event: models.smartthings.SceneLifecycleEvent) -> bool:
+        """Apply a scene lifecycle event in place
+
+        Returns:
+            bool: False when the scenes have to be listed again
+        """
+        if self.scenes is None:
+            return True
+        if event.lifecycle in (SceneLifecycle.DELETE, SceneLifecycle.DELETEFORBIXBY):
+            self.scenes.pop(event.sceneId, None)
+            return True
+        # created and updated scenes are not described by the event
+        return False
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.slots
+
+
+class Inventory(object):
+    """Process wide device and scene inventory, an `Index` per location.
+
+    The index of a location is built from a full `Device.list` and
+    `Scene.list` on first use, so that selector queries never call the
+    API:
+
+        index = await app.inventory()
+        lights = index.select('switchLevel', room=room_id) - index.capability('colorControl')
+
+    It is then maintained from the DEVICE_LIFECYCLE and SCENE_LIFECYCLE
+    events of the apps of the location (see `SmartApp.subscribe_inventory`),
+    which the controller applies before dispatching them.  Deletes, moves,
+    room moves and renames are applied in place; created devices, devices
+    whose components changed and created or updated scenes are read from
+    the API.  An event which does not follow from the index, like the room
+    move of an unknown device, means that events were missed: the index is
+    marked stale and listed again.  API reads are queued on a lane of
+    their own per location, so they apply in the order of the events.
+    """
+
+    _locations = {}
+    _pending   = {}
+    _restored  = None
+
+    @classmethod
+    def index(cls, location_id: str) -> Optional[Index]:
+        """The index of a location, restored from the snapshot on first use"""
+        index = cls._locations.get(location_id)
+        if index is None and cls._restored is not None:
+            index = cls._restored.index(location_id)
+            if index is not None:
+                cls._locations[location_id] = index
+        return index
+
+    @classmethod
+    async def load(cls, location_id: str, session: Any) -> Index:
+        """Build the index of a location from a full listing, once for
+        concurrent callers"""
+        pending = cls._pending.get(location_id)
+        if pending is None:
+            pending = cls._pending[location_id] = asyncio.ensure_future(
+                cls.fetch(location_id, session)
+            )
+            pending.add_done_callback(lambda _: cls._pending.pop(location_id, None))
+        return await asyncio.shield(pending)
+
+    @classmethod
+    async def fetch(cls, location_id: str, session: Any) -> Index:
+        index = Index(location_id)
+        async for device in smartthings.Device(session=session).list(location_id):
+            index.add(device)
+        index.scenes = await cls.list_scenes(location_id, session)
+        index.loaded = time.time()
+        log.info("inventory: %s devices and %s scenes in location %s", len(index),
+                 len(index.scenes or ()), location_id)
+        cls._locations[location_id] = index
+        return index
+
+    @staticmethod
+    async def list_scenes(location_id: str, session: Any) -> Optional[Dict[str, Any]]:
+        try:
+            return {scene.sceneId: scene async for scene in
+                    smartthings.Scene(session=session).list(location_id)}
+        except types.AppHTTPError as e:
+            log.warning("inventory: scenes of location %s not listed: %s", location_id, e)
+            return None
+
+    @classmethod
+    def apply(cls, location_id: str, events: Iterable[Any], app: Any) -> int:
+        """Apply the lifecycle events of an EVENT lifecycle to the index of
+        `location_id`, when it is indexed; the API is read with the session
+        of `app`
+
+        Returns:
+            int: number of lifecycle events
+        """
+        index = cls.index(location_id)
+        if index is None:
+            return 0
+        applied = 0
+        for event in events or ():
+            if event.eventType == EventType.DEVICE_LIFECYCLE_EVENT:
+                kind, apply, item = 'device', index.device_lifecycle, event.deviceLifecycle
+            elif event.eventType == EventType.SCENE_LIFECYCLE_EVENT:
+                kind, apply, item = 'scene', index.scene_lifecycle, event.sceneLifecycle
+            else:
+                continue
+            applied += 1
+            if item is None or index.stale:
+                continue
+            try:
+                if apply(item):
+                    LIFECYCLES.labels(kind, 'applied').inc()
+                elif kind == 'device':
+                    LIFECYCLES.labels(kind, 'read').inc()
+                    cls.submit(location_id, cls.refresh_device, location_id, item.deviceId,
+                               app.session)
+                else:
+                    LIFECYCLES.labels(kind, 'read').inc()
+                    cls.submit(location_id, cls.refresh_scenes, location_id, app.session)
+            except Gap as e:
+                LIFECYCLES.labels(kind, 'gap').inc()
+                cls.resync(index, app.session, e)
+        return applied
+
+    @staticmethod
+    def submit(location_id: str, func: Callable, *args) -> asyncio.Future:
+        return api.KeyedExecutor.submit('inventory:{}'.format(location_id), func, *args,
+                                        prio=api.Priority.LOW)
+
+    @classmethod
+    def resync(cls, index: Index, session: Any, reason: Any):
+        if index.stale:
+            return
+        log.warning("inventory: listing location %s again: %s", index.location_id, reason)
+        index.stale = True
+        cls.submit(index.location_id, cls.load, index.location_id, session)
+
+    @classmethod
+    async def refresh_device(cls, location_id: str, device_id: str, session: Any):
+        index = cls.index(location_id)
+        if index is None or index.stale:
+            return
+        try:
+            device = await smartthings.Device(session=session).get(device_id)
+        except types.AppHTTPError as e:
+            if e.status_code != 404:
+                return cls.resync(index, session, e)
+            device = None
+        if device is None or device.locationId != location_id:
+            index.remove(device_id)
+        else:
+            index.add(device)
+
+    @classmethod
+    async def refresh_scenes(cls, location_id: str, session: Any):
+        index = cls.index(location_id)
+        if index is None or index.stale:
+            return
+        scenes = await cls.list_scenes(location_id, session)
+        if scenes is not None:
+            index.scenes = scenes
+
+    @classmethod
+    async def get(cls, location_id: str, session: Any) -> Index:
+        index = cls.index(location_id)
+        if index is None:
+            index = await cls.load(location_id, session)
+        return index
+
+    @classmethod
+    def forget(cls, location_id: str):
+        cls._locations.pop(location_id, None)
+
+    @classmethod
+    def clear(cls):
+        cls._locations = {}
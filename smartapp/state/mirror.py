@@ -0,0 +1,194 @@
+from __future__ import annotations
+import time
+import asyncio
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from smartapp.api import smartthings, models
+
+from smartapp import logger
+log = logger.get()
+
+SOURCE_EVENT    = 'event'
+SOURCE_STATUS   = 'status'
+SOURCE_SNAPSHOT = 'snapshot'
+
+# (component, capability, attribute)
+Key = Tuple[str, str, str]
+
+
+class State(object):
+    """Value of a device attribute held by the mirror.  `source` is
+    `'event'` when it was last set by a DEVICE_EVENT, `'status'` when it
+    was read from the device status and `'snapshot'` when it was restored
+    by `smartapp.state.Snapshot`; `updated` is the local time it was set
+    at.  A `value` of None with the `'status'` source means that the
+    device status does not report the attribute."""
+
+    __slots__ = ('value', 'unit', 'data', 'source', 'updated')
+
+    def __init__(self, value: Any, unit: str=None, data: Dict=None,
+                       source: str=SOURCE_EVENT, updated: float=None):
+        self.value   = value
+        self.unit    = unit
+        self.data    = data
+        self.source  = source
+        self.updated = time.time() if updated is None else updated
+
+    @property
+    def age(self) -> float:
+        """Seconds since the value was set"""
+        return time.time() - self.updated
+
+    def __repr__(self) -> str:
+        return 'State(value={!r}, unit={!r}, source={!r}, age={:.1f})'.format(
+            self.value, self.unit, self.source, self.age
+        )
+
+
+def attributes(status: models.smartthings.DeviceStatus) -> Iterator[Tuple[Key, Dict]]:
+    """The attribute states of a device status, by key; the components are
+    models or dicts depending on the validation policy of `devices`"""
+    for component_id, component in (status.components or {}).items():
+        capabilities = component if isinstance(component, dict) else component.__dict__
+        for capability, attrs in capabilities.items():
+            for attribute, value in (attrs or {}).items():
+                if isinstance(value, dict):
+                    yield (component_id, capability, attribute), value
+
+
+class LocationState(object):
+    """Attribute states of the devices of a location, by device id"""
+
+    def __init__(self, location_id: str):
+        self.location_id = location_id
+        self.devices     = {}
+        self.seeded      = set()
+        self.pending     = {}
+
+    def update(self, event: Any) -> Optional[State]:
+        """Apply a `smartapp.api.models.smartthings.DeviceEvent`, or its
+        compact counterpart"""
+        if not event.deviceId or not event.attribute:
+            return None
+        state = State(event.value, event.unit, event.data)
+        key = (event.componentId or 'main', event.capability, event.attribute)
+        self.devices.setdefault(event.deviceId, {})[key] = state
+        return state
+
+    def seed(self, device_id: str, status: models.smartthings.DeviceStatus, since: float):
+        """Store a device status requested at `since`, the attributes
+        updated by events received meanwhile are kept"""
+        device = self.devices.setdefault(device_id, {})
+        for key, attr in attributes(status):
+            current = device.get(key)
+            if current is None or current.updated < since:
+                device[key] = State(attr.get('value'), attr.get('unit'), attr.get('data'),
+                                    SOURCE_STATUS)
+        self.seeded.add(device_id)
+
+    def get(self, device_id: str, key: Key) -> Optional[State]:
+        return self.devices.get(device_id, {}).get(key)
+
+    def forget(self, device_id: str):
+        self.devices.pop(device_id, None)
+        self.seeded.discard(device_id)
+
+    def __len__(self) -> int:
+        return sum(len(device) for device in self.devices.values())
+
+
+class DeviceState(object):
+    """Process wide mirror of the device attributes, per location.
+
+    A location is mirrored from the first `state()` call of an app of the
+    location: every device is read once with `Device.status`, then kept up
+    to date by the DEVICE_EVENTs of the apps of the location, which the
+    controller applies before dispatching them.  The API is only called
+    again for attributes the mirror has not seen, or older than the
+    `max_age` given by the caller; attributes of devices without a
+    subscription keep their `'status'` source and grow old.
+    """
+
+    _locations = {}
+    _restored  = None
+
+    @classmethod
+    def mirrored(cls, location_id: str) -> Optional[LocationState]:
+        """The mirror of a location, restored from the snapshot on first use"""
+        location = cls._locations.get(location_id)
+        if location is None and cls._restored is not None:
+            location = cls._restored.location(location_id)
+            if location is not None:
+                cls._locations[location_id] = location
+        return location
+
+    @classmethod
+    def location(cls, location_id: str) -> LocationState:
+        location = cls.mirrored(location_id)
+        if location is None:
+            location = cls._locations[location_id] = LocationState(location_id)
+        return location
+
+    @classmethod
+    def apply(cls, location_id: str, events: Iterable[Any]) -> int:
+        """Apply the device events of an EVENT lifecycle to the mirror of
+        `location_id`, when it is mirrored
+
+        Returns:
+            int: number of attributes updated
+        """
+        location = cls.mirrored(location_id)
+        if location is None:
+            return 0
+        applied = 0
+        for event in events or ():
+            if event.deviceEvent is not None and location.update(event.deviceEvent):
+                applied += 1
+        return applied
+
+    @classmethod
+    async def seed(cls, location: LocationState, device_id: str, session: Any) -> None:
+        """Read the status of a device, once for concurrent callers"""
+        pending = location.pending.get(device_id)
+        if pending is None:
+            pending = location.pending[device_id] = asyncio.ensure_future(
+                cls.fetch(location, device_id, session)
+            )
+            pending.add_done_callback(lambda _: location.pending.pop(device_id, None))
+        await asyncio.shield(pending)
+
+    @staticmethod
+    async def fetch(location: LocationState, device_id: str, session: Any) -> None:
+        since = time.time()
+        status = await smartthings.Device(session=session).status(device_id)
+        location.seed(device_id, status, since)
+
+    @classmethod
+    async def state(cls, location_id: str, session: Any, device_id: str, component: str,
+                         capability: str, attribute: str, max_age: float=None) -> State:
+        location = cls.location(location_id)
+        key = (component, capability, attribute)
+        state = location.get(device_id, key)
+        if state is not None and (max_age is None or state.age <= max_age):
+            return state
+        if state is not None or device_id not in location.seeded:
+            log.debug("state: reading %s of device %s", key, device_id)
+            await cls.seed(location, device_id, session)
+            state = location.get(device_id, key)
+        if state is None:
+            # not reported by the device, no point in asking again
+            state = State(None, source=SOURCE_STATUS)
+            location.devices.setdefault(device_id, {})[key] = state
+        return state
+
+    @classmethod
+    def forget(cls, location_id: str, device_id: str=None):
+        """Drop a device, or a whole location, from the mirror"""
+        if device_id is None:
+            cls._locations.pop(location_id, None)
+        elif location_id in cls._locations:
+            cls._locations[location_id].forget(device_id)
+
+    @classmethod
+    def clear(cls):
+        cls._locations = {}
@@ -0,0 +1,315 @@
+from __future__ import annotations
+import os
+import json
+import mmap
+import time
+import zlib
+import asyncio
+import struct
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import pydantic
+from pydantic.json import pydantic_encoder
+
+from smartapp import api
+from smartapp.api import models
+from smartapp.api.smartapp import context
+from smartapp.api.smartthings import validation
+from smartapp.state import mirror, inventory
+
+from smartapp import logger
+log = logger.get()
+
+MAGIC  = b'SMARTAPP-SNAPSHOT-1\n'
+LENGTH = struct.Struct('<Q')
+
+DEFAULT_INTERVAL = 60.0
+DEFAULT_MAX_AGE  = 3600.0
+
+APPS      = 'apps'
+INVENTORY = 'inventory/'
+STATE     = 'state/'
+
+
+def default(obj: Any) -> Any:
+    if isinstance(obj, pydantic.BaseModel):
+        return obj.dict(by_alias=True, exclude_none=True)
+    return pydantic_encoder(obj)
+
+
+def key() -> str:
+    """Redis key of the app contexts, which a snapshot belongs to"""
+    return context.KEY_PREFIX + api.AppContext.template().name
+
+
+def encode(key: str, parts: Dict[str, Any]) -> bytes:
+    """The snapshot file of `parts`: the magic, the length of a JSON header
+    holding the offset and length of every part, then the parts, each
+    compressed JSON so that one can be read without the others"""
+    sections, blobs, offset = {}, [], 0
+    for name, part in parts.items():
+        blob = zlib.compress(json.dumps(part, default=default, separators=(',', ':')).encode())
+        sections[name] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+    header = json.dumps({'written': time.time(), 'key': key,
+                         'sections': sections}).encode()
+    return b''.join([MAGIC, LENGTH.pack(len(header)), header] + blobs)
+
+
+def dump(path: str, key: str, parts: Dict[str, Any]) -> int:
+    """Write the snapshot atomically, readers see the previous file or
+    this one; it is only readable by the user of the process"""
+    data = encode(key, parts)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    fd = os.open(tmp, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        os.fchmod(fd, 0o600)
+        f.write(data)
+        f.flush()
+        os.fsync(fd)
+    os.replace(tmp, path)
+    return len(data)
+
+
+class Reader(object):
+    """A snapshot file mapped in memory; the header is read when opened
+    and each part is decompressed when it is first asked for"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self.map[:len(MAGIC)] != MAGIC:
+                raise ValueError("not a snapshot")
+            start = len(MAGIC) + LENGTH.size
+            size, = LENGTH.unpack(self.map[len(MAGIC):start])
+            header = json.loads(self.map[start:start + size])
+        except Exception:
+            self.map.close()
+            raise
+        self.data     = start + size
+        self.written  = header['written']
+        self.key      = header['key']
+        self.sections = header['sections']
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.written
+
+    def section(self, name: str) -> Optional[Any]:
+        """Decode a part once, None when it is not in the file or was
+        already decoded"""
+        entry = self.sections.pop(name, None)
+        if entry is None or self.map.closed:
+            return None
+        offset, length = entry
+        start = self.data + offset
+        part = json.loads(zlib.decompress(self.map[start:start + length]))
+        if not self.sections:
+            self.close()
+        return part
+
+    def index(self, location_id: str) -> Optional[inventory.Index]:
+        part = self.section(INVENTORY + location_id)
+        if part is None:
+            return None
+        index = inventory.Index(location_id)
+        for data in part['devices']:
+            index.add(validation.construct(models.smartthings.Device, data))
+        if part['scenes'] is not None:
+            index.scenes = {scene_id: validation.construct(models.smartthings.SceneSummary, data)
+                            for scene_id, data in part['scenes'].items()}
+        index.loaded = part['loaded']
+        log.info("snapshot: %s devices of location %s restored", len(index), location_id)
+        return index
+
+    def location(self, location_id: str) -> Optional[mirror.LocationState]:
+        part = self.section(STATE + location_id)
+        if part is None:
+            return None
+        location = mirror.LocationState(location_id)
+        for device_id, states in part['devices'].items():
+            location.devices[device_id] = {
+                (component, capability, attribute):
+                    mirror.State(value, unit, data, mirror.SOURCE_SNAPSHOT, updated)
+                for component, capability, attribute, value, unit, data, updated in states
+            }
+        location.seeded.update(part['seeded'])
+        log.info("snapshot: state of %s devices of location %s restored",
+                 len(location.devices), location_id)
+        return location
+
+    def close(self):
+        self.sections = {}
+        if not self.map.closed:
+            self.map.close()
+
+
+def states(location: mirror.LocationState) -> Iterator[Tuple[str, list]]:
+    for device_id, device in location.devices.items():
+        yield device_id, [key + (state.value, state.unit, state.data, state.updated)
+                          for key, state in device.items()]
+
+
+class Snapshot(object):
+    """Periodic snapshot of the process wide caches, so that a restarted
+    worker starts warm: the ids of the installed apps
+    (`smartapp.api.smartapp.AppContext`), the `Inventory` and the
+    `DeviceState` mirror of every location.  The contexts themselves, with
+    their tokens and secrets, stay in Redis.
+
+    Every `snapshot['interval']` seconds, and on shutdown once the tasks
+    are drained, they are written to `snapshot['path']` (only readable by
+    the user of the process), compressed JSON per part, by a thread.  On
+    startup a snapshot younger than `snapshot['max_age']` and of the same
+    app is mapped in memory: `AppContext.init` loads the contexts with a
+    single `HGETALL` and instantiates the apps of the snapshot without
+    replaying their update lifecycle; apps installed since are replayed,
+    and apps uninstalled since are ignored.  The inventory and the mirror
+    of a location are only decoded once the location is used.
+
+    Device changes missed while the worker was down are caught up the
+    same way as missed events: restored states keep the time they were
+    set at (see `max_age` of `DeviceState.state`), and lifecycle events
+    which do not follow from a restored index have it listed again.
+    """
+
+    _path     = None
+    _interval = DEFAULT_INTERVAL
+    _max_age  = DEFAULT_MAX_AGE
+    _runner   = None
+    _reader   = None
+    _final    = False
+
+    @classmethod
+    def configure(cls, enabled: bool=True, path: str=None,
+                       interval: float=DEFAULT_INTERVAL, max_age: float=DEFAULT_MAX_AGE):
+        """Configure the snapshot, from the `snapshot` section of the config
+
+        Args:
+            enabled (bool): write the snapshot and start from it
+            path (str): snapshot file, required when enabled; its directory
+                is created private to the user of the process
+            interval (float): seconds between two snapshots
+            max_age (float): older snapshots are not restored
+        """
+        if enabled and not path:
+            raise ValueError("snapshot: 'path' is required")
+        cls._path     = path if enabled else None
+        cls._interval = interval
+        cls._max_age  = max_age
+
+    @classmethod
+    def collect(cls) -> Dict[str, Any]:
+        """The parts of the snapshot, on the event loop.  The device and
+        scene models of the inventory are replaced rather than changed in
+        place, so copying their containers is enough for a thread to encode
+        them; the states of the mirror are copied to tuples"""
+        parts = {APPS: list(api.AppContext._ctx)}
+        for location_id, index in inventory.Inventory._locations.items():
+            if index.stale:
+                continue
+            parts[INVENTORY + location_id] = {
+                'devices': list(index.devices.values()),
+                'scenes':  dict(index.scenes) if index.scenes is not None else None,
+                'loaded':  index.loaded,
+            }
+        for location_id, location in mirror.DeviceState._locations.items():
+            parts[STATE + location_id] = {
+                'devices': dict(states(location)),
+                'seeded':  list(location.seeded),
+            }
+        return parts
+
+    @classmethod
+    async def write(cls, path: str=None) -> int:
+        """Write a snapshot now
+
+        Returns:
+            int: bytes written
+        """
+        path = path or cls._path
+        parts = cls.collect()
+        size = await asyncio.get_running_loop().run_in_executor(None, dump, path, key(), parts)
+        log.debug("snapshot: %s bytes written to %s", size, path)
+        return size
+
+    @classmethod
+    def restore(cls, path: str=None) -> bool:
+        """Hand the apps of a snapshot to `AppContext.init`, and the
+        inventory and mirror parts to `Inventory` and `DeviceState`, to
+        decode on use
+
+        Returns:
+            bool: a snapshot was restored
+        """
+        path = path or cls._path
+        try:
+            reader = Reader(path)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError) as e:
+            log.warning("snapshot: %s not restored: %s", path, e)
+            return False
+        if reader.key != key() or reader.age > cls._max_age:
+            log.info("snapshot: %s ignored, %s written %.0fs ago", path, reader.key, reader.age)
+            reader.close()
+            return False
+        apps = reader.section(APPS) or []
+        api.AppContext._restored = set(apps)
+        cls._reader = inventory.Inventory._restored = mirror.DeviceState._restored = reader
+        log.info("snapshot: %s apps restored from %s, written %.0fs ago", len(apps),
+                 path, reader.age)
+        return True
+
+    @classmethod
+    def start(cls):
+        if cls._runner or not cls._path:
+            return
+        cls.restore()
+        cls._runner = api.TaskSupervisor.spawn(
+            cls.run(), name='snapshot', limit=False, timeout=None
+        )
+
+    @classmethod
+    async def stop(cls):
+        """Stop the periodic snapshots, `flush()` writes the last one"""
+        runner, cls._runner = cls._runner, None
+        if runner:
+            runner.cancel()
+            await asyncio.wait([runner])
+            cls._final = True
+
+    @classmethod
+    async def flush(cls):
+        """Write the last snapshot, once the tasks which update the caches
+        are drained"""
+        final, cls._final = cls._final, False
+        if final:
+            try:
+                await cls.write()
+            except OSError as e:
+                log.warning("snapshot: not written to %s: %s", cls._path, e)
+        cls.forget()
+
+    @classmethod
+    async def run(cls):
+        while True:
+            await asyncio.sleep(cls._interval)
+            try:
+                await cls.write()
+            except OSError as e:
+                log.warning("snapshot: not written to %s: %s", cls._path, e)
+
+    @classmethod
+    def forget(cls):
+        """Drop the parts of the restored snapshot not decoded yet"""
+        reader, cls._reader = cls._reader, None
+        inventory.Inventory._restored = mirror.DeviceState._restored = None
+        if reader:
+            reader.close()
@@ -0,0 +1,46 @@
+import atexit
+
+from smartapp.tracing import tracing, exporters
+
+Span         = tracing.Span
+Tracer       = tracing.Tracer
+FileExporter = exporters.FileExporter
+OTLPExporter = exporters.OTLPExporter
+
+trace   = tracing.trace
+span    = tracing.span
+current = tracing.current
+
+EXPORTERS = {
+    'file': FileExporter,
+    'otlp': OTLPExporter,
+}
+
+
+def stop():
+    """Flush and stop the exporter"""
+    exporter, Tracer.exporter = Tracer.exporter, None
+    if exporter:
+        exporter.stop()
+
+
+def configure(enabled=True, rate=1.0, service='smartapp', exporter=None, **kwargs):
+    """Configure tracing, from the `tracing` section of the config
+
+    Args:
+        enabled (bool): record spans of the lifecycle requests
+        rate (float): fraction of the requests which are traced
+        service (str): service name reported to the exporter
+        exporter (str): 'file' or 'otlp', None to only keep spans in context
+        kwargs: exporter arguments, `path` for 'file', `endpoint` and
+            `headers` for 'otlp', and `queue_size`
+    """
+    stop()
+    Tracer.enabled = enabled
+    Tracer.rate    = rate
+    Tracer.service = service
+    if exporter:
+        Tracer.exporter = EXPORTERS[exporter](**kwargs)
+
+
+atexit.register(stop)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+import json
+import queue
+import threading
+import urllib.request
+from typing import Any, Dict, List
+
+from smartapp.tracing import tracing
+
+from smartapp import logger
+log = logger.get()
+
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_ENDPOINT   = 'http://localhost:4318/v1/traces'
+
+
+class Exporter(object):
+    """Export finished traces from a background thread, so that file or
+    network I/O never runs on the event loop.  Traces are dropped when
+    `queue_size` are already waiting."""
+
+    def __init__(self, queue_size: int=DEFAULT_QUEUE_SIZE):
+        self.queue   = queue.Queue(queue_size)
+        self.dropped = 0
+        self.thread  = threading.Thread(target=self.run, name=self.__class__.__name__,
+                                        daemon=True)
+        self.thread.start()
+
+    def export(self, spans: List[tracing.Span]):
+        try:
+            self.queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        while True:
+            spans = self.queue.get()
+            if spans is None:
+                break
+            try:
+                self.write(spans)
+            except Exception as e:
+                log.error("tracing: %s: %s", self.__class__.__name__, e)
+
+    def write(self, spans: List[tracing.Span]):
+        raise NotImplementedError()
+
+    def stop(self):
+        self.queue.put(None)
+        self.thread.join(timeout=5.0)
+
+
+class FileExporter(Exporter):
+    """Append one JSON object per span to `path`"""
+
+    def __init__(self, path: str, queue_size: int=DEFAULT_QUEUE_SIZE):
+        self.path = path
+        super().__init__(queue_size)
+
+    def write(self, spans: List[tracing.Span]):
+        with open(self.path, 'a') as out:
+            for span in spans:
+                out.write(json.dumps(span.dict(), default=str) + '\n')
+
+
+def attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+class OTLPExporter(Exporter):
+    """POST spans to an OpenTelemetry collector, in the OTLP/HTTP JSON
+    encoding"""
+
+    def __init__(self, endpoint: str=DEFAULT_ENDPOINT, headers: Dict[str, str]=None,
+                       queue_size: int=DEFAULT_QUEUE_SIZE):
+        self.endpoint = endpoint
+        self.headers  = dict(headers or {}, **{'Content-Type': 'application/json'})
+        super().__init__(queue_size)
+
+    @staticmethod
+    def span(span: tracing.Span) -> Dict[str, Any]:
+        data = {
+            'traceId':           span.trace.trace_id,
+            'spanId':            span.span_id,
+            'name':              span.name,
+            'kind':              1,
+            'startTimeUnixNano': str(span.start),
+            'endTimeUnixNano':   str(span.end),
+            'attributes':        [attribute(key, value) for key, value in span.attributes.items()],
+            'status':            {'code': 2, 'message': span.error} if span.error else {'code': 1},
+        }
+        if span.parent_id:
+            data['parentSpanId'] = span.parent_id
+        return data
+
+    def payload(self, spans: List[tracing.Span]) -> Dict[str, Any]:
+        return {'resourceSpans': [{
+            'resource':   {'attributes': [attribute('service.name', tracing.Tracer.service)]},
+            'scopeSpans': [{
+                'scope': {'name': 'smartapp'},
+                'spans': [self.span(span) for span in spans],
+            }],
+        }]}
+
+    def write(self, spans: List[tracing.Span]):
+        request = urllib.request.Request(
+            self.endpoint, data=json.dumps(self.payload(spans)).encode('utf-8'),
+            headers=self.headers, method='POST'
+        )
+        with urllib.request.urlopen(request, timeout=10.0) as resp:
+            resp.read()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+import os
+import time
+import random
+import contextvars
+from typing import Any, Dict, List
+
+# span of the current task, tasks spawned from it inherit the context
+# and so record their spans in the same trace
+_current = contextvars.ContextVar('smartapp_span', default=None)
+
+
+class Trace(object):
+    """Spans of one sampled request, exported once none is open"""
+
+    __slots__ = ('trace_id', 'spans', 'open')
+
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans    = []
+        self.open     = 0
+
+
+class Span(object):
+    """Timed operation of a trace, a context manager which becomes the
+    parent of the spans started within it"""
+
+    __slots__ = ('trace', 'name', 'span_id', 'parent_id', 'start', 'end',
+                 'attributes', 'error', 'token')
+
+    def __init__(self, trace: Trace, name: str, parent: Span=None,
+                       attributes: Dict[str, Any]=None):
+        self.trace      = trace
+        self.name       = name
+        self.span_id    = os.urandom(8).hex()
+        self.parent_id  = parent.span_id if parent else None
+        self.start      = None
+        self.end        = None
+        self.attributes = attributes or {}
+        self.error      = None
+        self.token      = None
+
+    def set(self, key: str, value: Any) -> Span:
+        self.attributes[key] = value
+        return self
+
+    def record(self, exc: BaseException) -> Span:
+        """Mark the span as failed by `exc`, for errors which are handled
+        within the span and so never reach `__exit__`"""
+        self.error = '{}: {}'.format(exc.__class__.__name__, exc)
+        return self
+
+    def __enter__(self) -> Span:
+        self.trace.open += 1
+        self.token = _current.set(self)
+        self.start = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.time_ns()
+        if exc is not None:
+            self.record(exc)
+        _current.reset(self.token)
+        self.token = None
+        trace = self.trace
+        trace.spans.append(self)
+        trace.open -= 1
+        if not trace.open:
+            spans, trace.spans = trace.spans, []
+            Tracer.export(spans)
+
+    @property
+    def duration(self) -> float:
+        """Seconds"""
+        return (self.end - self.start) / 1e9 if self.end else None
+
+    def dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id':   self.trace.trace_id,
+            'span_id':    self.span_id,
+            'parent_id':  self.parent_id,
+            'name':       self.name,
+            'start':      self.start,
+            'end':        self.end,
+            'duration':   self.duration,
+            'attributes': self.attributes,
+            'error':      self.error,
+        }
+
+
+class NoSpan(object):
+    """Stand-in returned when nothing is traced, it records nothing"""
+
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> NoSpan:
+        return self
+
+    def record(self, exc: BaseException) -> NoSpan:
+        return self
+
+    def __enter__(self) -> NoSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+NO_SPAN = NoSpan()
+
+
+class Tracer(object):
+    """Process wide tracing settings, see `smartapp.tracing.configure`"""
+
+    enabled  = False
+    rate     = 1.0
+    service  = 'smartapp'
+    exporter = None
+
+    @classmethod
+    def export(cls, spans: List[Span]):
+        if cls.exporter:
+            cls.exporter.export(spans)
+
+
+def trace(name: str, **attributes) -> Span:
+    """Start the root span of a request, when tracing is enabled and the
+    request is sampled; within an ongoing trace this is `span()`"""
+    parent = _current.get()
+    if parent is not None:
+        return Span(parent.trace, name, parent, attributes)
+    if not Tracer.enabled or (Tracer.rate < 1.0 and random.random() >= Tracer.rate):
+        return NO_SPAN
+    return Span(Trace(), name, None, attributes)
+
+
+def span(name: str, **attributes) -> Span:
+    """Start a child of the current span, outside of a sampled trace this
+    costs a context variable lookup and records nothing"""
+    parent = _current.get()
+    if parent is None:
+        return NO_SPAN
+    return Span(parent.trace, name, parent, attributes)
+
+
+def current() -> Span:
+    """The innermost open span of the current context, or `NO_SPAN`"""
+    return _current.get() or NO_SPAN
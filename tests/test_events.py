@@ -0,0 +1,66 @@
+import copy
+import pickle
+import pytest
+
+from smartapp import controllers
+from smartapp.api import models
+from tests import test_config
+from tests.conftest import client, APP_ID
+
+
+def device_event(value):
+    return {
+        'eventType': 'DEVICE_EVENT',
+        'deviceEvent': {
+            'deviceId': 'device-1',
+            'componentId': ''.join(['ma', 'in']),
+            'capability': ''.join(['switch', 'Level']),
+            'attribute': 'level',
+            'value': value,
+            'stateChange': True,
+        }
+    }
+
+LIFECYCLE = {
+    'lifecycle': 'EVENT',
+    'executionId': 'execution-1',
+    'eventData': {
+        'authToken': 'token',
+        'installedApp': {'installedAppId': APP_ID, 'locationId': 'location-1', 'config': {}},
+        'events': [device_event(10), device_event(20),
+                   {'eventType': 'MODE_EVENT', 'modeEvent': {'modeId': 'night'}}],
+    }
+}
+
+
+@pytest.fixture
+def compact_events():
+    test_config.smartthings['compact_events'] = True
+    yield
+    del test_config.smartthings['compact_events']
+
+
+def test_compact_events(compact_events):
+    lifecycle = controllers.SmartApp.parse(copy.deepcopy(LIFECYCLE))
+    evt = lifecycle.eventData
+    assert isinstance(evt, models.CompactEventData)
+    first, second, mode = evt.events
+    assert first.deviceEvent.value == 10
+    assert first.deviceEvent.capability is second.deviceEvent.capability
+    assert mode.modeEvent.modeId == 'night'
+    with pytest.raises(AttributeError):
+        first.deviceEvent.value = 30
+
+    full = models.smartapp.EventData.parse_obj(LIFECYCLE['eventData'])
+    assert evt.model() == full
+    assert pickle.loads(pickle.dumps(evt)) == evt
+
+
+def test_full_events():
+    lifecycle = controllers.SmartApp.parse(copy.deepcopy(LIFECYCLE))
+    assert isinstance(lifecycle.eventData, models.smartapp.EventData)
+
+
+def test_invalid_lifecycle():
+    assert client.post('/', data='not json').status_code == 422
+    assert client.post('/', json={'executionId': 'missing-lifecycle'}).status_code == 422
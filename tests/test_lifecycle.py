@@ -1,4 +1,7 @@
 import uuid
+import asyncio
+import pytest
+import smartapp
 from smartapp.api import models
 from tests.conftest import test_app, client, APP_ID
 
@@ -53,3 +56,117 @@ def test_lifecycle_configuration_page1():
     )
     app = test_app()
     assert data.page.name == app.pageId('1').page.name
+
+
+def test_configuration_responses_cached():
+    app = test_app()
+    init = app.initialize_response()
+    assert app.initialize_response() is init
+    app.grant('x:devices:*')
+    assert b'x:devices:*' in app.initialize_response()
+
+    page = asyncio.run(app.page_response('0'))
+    assert asyncio.run(app.page_response('0')) is page
+    app.pages['0'].sections[0].setting(name='Other', id='other',
+                                       type=smartapp.api.SettingType.TEXT)
+    assert b'"other"' in asyncio.run(app.page_response('0'))
+
+    rendered = []
+    async def render():
+        rendered.append(True)
+    app.pages['0'].render(render)
+    asyncio.run(app.page_response('0'))
+    asyncio.run(app.page_response('0'))
+    assert len(rendered) == 2
+
+
+def test_installed_apps_share_definition():
+    ctx = smartapp.api.AppContext
+    ctx._pool = None
+    first = asyncio.run(ctx.get(str(uuid.uuid4())))
+    second = asyncio.run(ctx.get(str(uuid.uuid4())))
+    try:
+        assert first is not second
+        assert first.definition is second.definition is ctx.template().definition
+        assert first.pages is second.pages
+        assert first.initialize_response() is second.initialize_response()
+        with pytest.raises(smartapp.api.smartapp.definition.DefinitionFrozen):
+            first.grant('x:devices:*')
+    finally:
+        asyncio.run(ctx.delete(first))
+        asyncio.run(ctx.delete(second))
+
+
+def test_render_page_copy():
+    app = test_app()
+    page = app.pages['0']
+    async def render(app, page):
+        page.reset()
+        page.section(app.name)
+    page.render(render)
+    data = asyncio.run(app.pageId('0'))
+    assert [section.name for section in data.page.sections] == ['TestApp']
+    assert [section.name for section in page.sections] == ['Device Choice', 'Setting1 Section']
+
+
+class StatefulApp(smartapp.api.smartapp.SmartApp):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seen = {}
+        self.page('Main').section('Devices')
+
+    def setup(self):
+        self.lock = asyncio.Lock()
+
+
+def test_installed_apps_own_their_state():
+    template = StatefulApp('Stateful', 'Stateful SmartApp')
+    first, second = template.install(), template.install()
+    first.seen['dev'] = 1
+    assert second.seen == {} and template.seen == {}
+    assert first.lock is not second.lock and not hasattr(template, 'lock')
+    assert first.definition is second.definition
+    assert first.pages['0'] is template.pages['0']
+
+
+def test_frozen_pages_are_immutable():
+    app = test_app()
+    app.definition.freeze()
+    page = app.pages['0']
+    frozen = smartapp.api.smartapp.definition.DefinitionFrozen
+    with pytest.raises(frozen):
+        page.section('Other')
+    with pytest.raises(frozen):
+        page.name = 'Other'
+    with pytest.raises(frozen):
+        page.sections[0].setting(name='Other', id='other', type=smartapp.api.SettingType.TEXT)
+    with pytest.raises(frozen):
+        page.sections[1].settings[0].option('test2', 'value3')
+    with pytest.raises(frozen):
+        page.render(lambda app, page: None)
+
+
+def test_pages_rendered_in_place_are_not_shared():
+    ctx = smartapp.api.AppContext
+
+    def new_app():
+        app = test_app()
+        async def render():
+            app.pages['0'].reset()
+        app.pages['0'].render(render)
+        return app
+
+    ctx._pool = None
+    factory, ctx.new_app, ctx._template = ctx.new_app, new_app, None
+    try:
+        first = asyncio.run(ctx.get(str(uuid.uuid4())))
+        second = asyncio.run(ctx.get(str(uuid.uuid4())))
+        assert first.pages['0'] is not second.pages['0']
+        assert not first.definition.frozen
+        asyncio.run(first.pageId('0'))
+        assert not first.pages['0'].sections and second.pages['0'].sections
+    finally:
+        asyncio.run(ctx.delete(first))
+        asyncio.run(ctx.delete(second))
+        ctx.new_app, ctx._template = factory, None
@@ -0,0 +1,53 @@
+import io
+import json
+import logging
+
+from smartapp import logger
+
+
+def record(msg, *args, line=1):
+    return logging.LogRecord('smartapp', logging.INFO, __file__, line, msg, args, None)
+
+
+def test_rate_limit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(logger.time, 'monotonic', lambda: now[0])
+    limit = logger.RateLimit(limit=2, period=1.0)
+    assert [limit.filter(record('event %s', i)) for i in range(4)] == [True, True, False, False]
+    # other message types have their own budget
+    assert limit.filter(record('other %s', 1, line=2))
+    now[0] += 1.0
+    rec = record('event %s', 5)
+    assert limit.filter(rec)
+    assert rec.getMessage() == 'event 5 (2 similar messages dropped)'
+
+
+def test_sampling():
+    sample = logger.RateLimit(sample={'lifecycle: request': 3})
+    kept = [sample.filter(record('lifecycle: request: %s', i)) for i in range(6)]
+    assert kept == [True, False, False, True, False, False]
+    assert sample.filter(record('lifecycle: %s %s', 'EVENT', 1, line=2))
+
+
+def test_rate_limit_tables_bounded():
+    limit = logger.RateLimit(limit=2, sample={'add section': 2})
+    kept = [limit.filter(record('add section with index {}'.format(i))) for i in range(100)]
+    assert kept[:4] == [True, False, True, False]
+    assert len(limit.windows) == len(limit.every) == len(limit.counts) == 1
+
+
+def test_json_output(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(logger.sys, 'stdout', out)
+    logger.configure(json=True, background=True)
+    try:
+        log = logger.get()
+        log.debug("not enabled")
+        log.info("hello %s", 'world')
+        logger.stop()
+    finally:
+        logger.configure()
+    line = json.loads(out.getvalue())
+    assert line['message'] == 'hello world'
+    assert line['item'] == __name__
+    assert line['line'] == test_json_output.__code__.co_firstlineno + 7
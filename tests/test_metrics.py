@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+
+from smartapp import metrics, redis
+from smartapp.api.smartapp import supervisor
+from tests.conftest import client
+
+
+def test_histogram_buckets():
+    registry = metrics.Registry()
+    hist = metrics.Histogram('test_seconds', 'test', ['op'], registry=registry,
+                             buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        hist.labels('get').observe(value)
+    text = registry.render()
+    assert '# TYPE test_seconds histogram' in text
+    assert 'test_seconds_bucket{op="get",le="0.1"} 2' in text
+    assert 'test_seconds_bucket{op="get",le="1"} 3' in text
+    assert 'test_seconds_bucket{op="get",le="+Inf"} 4' in text
+    assert 'test_seconds_count{op="get"} 4' in text
+
+
+def test_counter_and_gauge():
+    registry = metrics.Registry()
+    counter = metrics.Counter('test_events', 'test', registry=registry)
+    counter.inc()
+    counter.inc(2)
+    metrics.Gauge('test_size', 'test', ['cache'], registry=registry,
+                  function=lambda: {('a"b',): 3})
+    text = registry.render()
+    assert 'test_events_total 3' in text
+    assert 'test_size{cache="a\\"b"} 3' in text
+    with pytest.raises(ValueError):
+        metrics.Counter('test_events', 'test', registry=registry)
+    with pytest.raises(ValueError):
+        counter.labels('extra')
+
+
+def test_task_outcomes():
+    tasks = supervisor.TASKS
+    before = {key: child.value for key, child in tasks.children.items()}
+
+    async def fail():
+        raise RuntimeError()
+
+    async def run():
+        ok = supervisor.TaskSupervisor.spawn(asyncio.sleep(0))
+        slow = supervisor.TaskSupervisor.spawn(asyncio.sleep(1), timeout=0.01)
+        bad = supervisor.TaskSupervisor.spawn(fail())
+        await asyncio.gather(ok, slow, bad, return_exceptions=True)
+    asyncio.run(run())
+    for outcome in ('ok', 'timeout', 'failed'):
+        assert tasks.labels(outcome).value == before.get((outcome,), 0) + 1
+
+
+def test_metrics_route():
+    redis.Redis._pool = None
+    redis.Redis().do('SET', 'metrics-test', '1')
+    resp = client.get('/metrics')
+    assert resp.status_code == 200
+    assert resp.headers['content-type'].startswith('text/plain')
+    assert 'smartapp_redis_seconds_count{command="SET"}' in resp.text
+    assert 'smartapp_context_cache_entries{cache="instances"}' in resp.text
+    assert '# TYPE smartapp_lifecycle_seconds histogram' in resp.text
@@ -0,0 +1,22 @@
+import os
+import sys
+import subprocess
+
+from smartapp.api import models
+
+
+def test_models_resolve():
+    smartthings = models.smartthings
+    for name, module in smartthings.INDEX.items():
+        model = getattr(smartthings, name)
+        assert model.__module__ == '{}.{}'.format(smartthings.__name__, module)
+    assert 'Device' in dir(smartthings)
+
+
+def test_models_load_lazily():
+    probe = ("import sys, smartapp; "
+             "print('smartapp.api.models.smartthings.weather' in sys.modules)")
+    env = dict(os.environ, IS_TEST='1')
+    out = subprocess.run([sys.executable, '-c', probe], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    assert out.strip() == 'False'
@@ -0,0 +1,127 @@
+import uuid
+import time
+import asyncio
+import pytest
+
+from smartapp import monitor
+from tests import test_config
+from tests.conftest import client
+
+
+def blocking_call():
+    time.sleep(0.3)
+
+
+def test_loop_monitor_captures_stalls():
+    async def run():
+        monitor.LoopMonitor.start()
+        await asyncio.sleep(0.1)
+        blocking_call()
+        await asyncio.sleep(0.1)
+        await monitor.LoopMonitor.stop()
+
+    test_config.monitor = {'enabled': True, 'interval': 0.02, 'threshold': 0.05}
+    try:
+        asyncio.run(run())
+    finally:
+        del test_config.monitor
+    stats = monitor.LoopMonitor.stats()
+    assert not stats['running']
+    assert stats['blocked'] >= 1 and stats['lag']['max'] >= 0.2
+    stall = stats['stalls'][-1]
+    assert stall['duration'] >= 0.2
+    assert 'blocking_call' in ''.join(stall['stack'])
+
+
+def test_monitor_disabled_by_default():
+    async def run():
+        monitor.LoopMonitor.start()
+        return monitor.LoopMonitor._runner
+    assert asyncio.run(run()) is None
+
+
+def test_admin_requires_secret():
+    assert client.get('/admin/loop').status_code == 404
+    test_config.admin = {'secret': 'admin-secret'}
+    try:
+        assert client.get('/admin/loop').status_code == 401
+        headers = {'Authorization': 'Bearer wrong'}
+        assert client.get('/admin/loop', headers=headers).status_code == 401
+        headers = {'Authorization': 'Bearer admin-secret'}
+        resp = client.get('/admin/loop', headers=headers)
+        assert resp.status_code == 200
+        assert set(resp.json()) == {'running', 'lag', 'blocked', 'stalls'}
+    finally:
+        del test_config.admin
+
+
+def busy_loop(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+def test_profiler_collapsed_stacks():
+    async def run():
+        profile = asyncio.ensure_future(monitor.Profiler.collapsed(0.2, 0.002))
+        await asyncio.sleep(0.01)
+        with pytest.raises(monitor.ProfilerBusy):
+            await monitor.Profiler.collapsed(0.1)
+        busy_loop(0.1)
+        return await profile
+    stacks = asyncio.run(run())
+    lines = [line.rsplit(' ', 1) for line in stacks.splitlines()]
+    assert all(int(count) > 0 for _, count in lines)
+    assert any(stack.endswith(':busy_loop:{}'.format(busy_loop.__code__.co_firstlineno))
+               for stack, _ in lines)
+    assert not monitor.Profiler._running
+
+
+def test_admin_profile_route():
+    import marshal
+    test_config.admin = {'secret': 'admin-secret', 'profile_max': 0.1}
+    headers = {'Authorization': 'Bearer admin-secret'}
+    try:
+        assert client.get('/admin/profile').status_code == 401
+        resp = client.get('/admin/profile?seconds=10&format=text', headers=headers)
+        assert resp.status_code == 200 and 'function calls' in resp.text
+        resp = client.get('/admin/profile?seconds=0.05&format=pstats', headers=headers)
+        assert resp.status_code == 200 and isinstance(marshal.loads(resp.content), dict)
+        resp = client.get('/admin/profile?seconds=0.05', headers=headers)
+        assert resp.status_code == 200
+    finally:
+        del test_config.admin
+
+
+def test_memory_footprint_per_installed_app(with_redis):
+    from smartapp.api import AppContext
+    from smartapp.monitor import memory
+
+    AppContext._pool = None
+
+    async def install(count):
+        apps = [await AppContext.get(str(uuid.uuid4())) for _ in range(count)]
+        AppContext.template()
+        return apps
+
+    apps = asyncio.run(install(3))
+    try:
+        footprint = monitor.footprint(sample=0)
+        assert footprint['apps'] >= 3 and footprint['sampled'] == footprint['apps']
+        assert footprint['bytes_per_app'] == sum(footprint['breakdown'].values()) > 0
+        assert footprint['resident'] > 0
+        # the app routes are counted, the definition shared with the template is not
+        sizes = memory.breakdown(apps[0], memory.reachable([AppContext._template]))
+        assert sizes['routes'] > 0
+        assert sizes['app'] < memory.sizeof(apps[0].definition, set())
+    finally:
+        for app in apps:
+            asyncio.run(AppContext.delete(app))
+        AppContext._pool = None
+    headers = {'Authorization': 'Bearer admin-secret'}
+    test_config.admin = {'secret': 'admin-secret'}
+    try:
+        resp = client.get('/admin/memory?sample=2', headers=headers)
+        assert resp.status_code == 200 and resp.json()['sampled'] <= 2
+    finally:
+        del test_config.admin
@@ -0,0 +1,87 @@
+import time
+import asyncio
+import pytest
+from aiohttp import web
+
+from smartapp import recorder, simulator
+from tests.conftest import client
+from tests.test_lifecycle import initialize
+
+
+def record(path, outbound=True):
+    recorder.configure(path=path, outbound=outbound)
+    try:
+        resp = client.post('/', data=initialize.json())
+        recorder.Recorder.exchange('devices', 'POST', 'http://api/devices/d1/commands', None,
+                                   {'commands': [{'capability': 'switch', 'command': 'on'}]},
+                                   200, {'results': []}, 0.02)
+        recorder.Recorder.exchange('oauth', 'POST', 'http://auth/token', None,
+                                   {'grant_type': 'refresh_token', 'refresh_token': 'r1'},
+                                   200, {'access_token': 'a2', 'refresh_token': 'r2'}, 0.1)
+    finally:
+        recorder.stop()
+    assert resp.status_code == 200
+    return list(recorder.read(path))
+
+
+def test_recorder_redacts_tokens(tmp_path):
+    records = record(str(tmp_path / 'traffic.jsonl.gz'))
+    assert [item['k'] for item in records] == ['in', 'out', 'out']
+    lifecycle, command, token = records
+    assert lifecycle['b']['lifecycle'] == 'CONFIGURATION'
+    assert command['res'] == 'devices' and command['s'] == 200 and command['d'] == 0.02
+    assert token['q']['refresh_token'] == recorder.REDACTED
+    assert token['r'] == {'access_token': recorder.REDACTED, 'refresh_token': recorder.REDACTED}
+    assert recorder.redact({'installData': {'authToken': 'secret-token', 'x': [{'token': 't'}]}}) \
+        == {'installData': {'authToken': recorder.REDACTED, 'x': [{'token': recorder.REDACTED}]}}
+
+
+def test_recorder_lifecycles_only(tmp_path):
+    records = record(str(tmp_path / 'traffic.jsonl'), outbound=False)
+    assert [item['k'] for item in records] == ['in']
+    assert recorder.Recorder.writer is None
+
+
+def test_replay_speed_and_tokens():
+    received = []
+
+    async def lifecycle(request):
+        received.append((time.monotonic(), await request.json()))
+        return web.json_response({})
+
+    records = [
+        {'t': 100.0, 'k': 'in', 'b': {'lifecycle': 'EVENT', 'eventData': {'authToken': recorder.REDACTED}}},
+        {'t': 100.1, 'k': 'out', 'res': 'devices', 'd': 0.05, 's': 200},
+        {'t': 100.5, 'k': 'in', 'b': {'lifecycle': 'EVENT', 'eventData': {'authToken': recorder.REDACTED}}},
+        {'t': 101.0, 'k': 'in', 'b': {'lifecycle': 'PING'}},
+    ]
+
+    async def run():
+        app = web.Application()
+        app.add_routes([web.post('/', lifecycle)])
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await recorder.replay(records, 'http://127.0.0.1:{}/'.format(port),
+                                         speed=5.0, token='local-token')
+        finally:
+            await runner.cleanup()
+
+    result = asyncio.run(run())
+    assert result['sent'] == 3 and result['statuses'] == {200: 3}
+    assert result['lifecycles'] == {'EVENT': 2, 'PING': 1}
+    assert received[0][1]['eventData']['authToken'] == 'local-token'
+    # 1s recorded, replayed 5 times faster
+    assert received[-1][0] - received[0][0] == pytest.approx(0.2, abs=0.1)
+
+
+def test_calibrate_simulator_from_recording():
+    records = [{'t': 0.0, 'k': 'out', 'res': 'devices', 'd': duration, 's': status}
+               for duration, status in ((0.1, 200), (0.3, 200), (0.2, 429), (0.2, 200))]
+    faults = recorder.calibrate(simulator.Faults(), records)
+    latency = faults.latency['devices']
+    assert latency.mean == pytest.approx(0.2) and latency.distribution == 'lognormal'
+    assert [(fault.status, fault.rate) for fault in faults.errors] == [(429, 0.25)]
@@ -8,6 +8,12 @@ def test_smartapp_version_route():
     assert resp.status_code == 200
     assert resp.json() == {'version': '1.2.3'}
 
+def test_smartapp_lifecycle_body_documented():
+    schema = client.get('/openapi.json').json()
+    body = schema['paths']['/']['post']['requestBody']
+    assert body['content']['application/json']['schema'] == {'$ref': '#/components/schemas/AllLifecycles'}
+    assert 'AllLifecycles' in schema['components']['schemas']
+
 @pytest.fixture(autouse=True)
 def app_instance():
     app = test_app()
@@ -44,3 +50,13 @@ def test_smartapp_route_use_auth(app_instance):
 def test_smartapp_route_non_exist():
     resp = client.get(APP_ID + '/nonexistent')
     assert resp.status_code == 404
+
+def test_deprecated_add_route():
+    from smartapp import rest
+    async def legacy():
+        return {'name': 'legacy'}
+    with pytest.deprecated_call():
+        rest.smartapp.add_route('/legacy-route', legacy, methods=['GET'])
+    resp = client.get('/legacy-route')
+    assert resp.status_code == 200
+    assert resp.json() == {'name': 'legacy'}
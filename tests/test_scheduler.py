@@ -0,0 +1,101 @@
+import asyncio
+import datetime
+import pytest
+
+from smartapp import scheduler
+from smartapp.api import models
+from tests.conftest import APP_ID
+
+Scheduler = scheduler.Scheduler
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool(with_redis):
+    Scheduler._pool = None
+    yield
+    Scheduler._pool = None
+
+
+def ts(*args, tz=datetime.timezone.utc):
+    return datetime.datetime(*args, tzinfo=tz).timestamp()
+
+
+def test_cron_next():
+    nightly = scheduler.CronExpression('0 2 * * *')
+    assert nightly.next(ts(2026, 1, 1, 1, 59)) == ts(2026, 1, 1, 2, 0)
+    assert nightly.next(ts(2026, 1, 1, 2, 0)) == ts(2026, 1, 2, 2, 0)
+
+    quartz = scheduler.CronExpression('15 10 ? * 2-6 *', 'America/New_York')
+    tz = quartz.tz
+    # saturday 2026-01-03 -> monday 2026-01-05
+    assert quartz.next(ts(2026, 1, 3, 12, 0, tz=tz)) == ts(2026, 1, 5, 10, 15, tz=tz)
+
+    with pytest.raises(scheduler.CronError):
+        scheduler.CronExpression('61 * * * *')
+
+
+def test_claim_once_per_lease():
+    req = models.smartthings.ScheduleRequest(
+        name='once', once=models.smartthings.OnceSchedule(time=1000)
+    )
+    Scheduler.add(APP_ID, req)
+    job_id = Scheduler.job_id(APP_ID, 'once')
+
+    assert Scheduler.claim(2000, 62000, 10) == [(job_id, 1000)]
+    assert Scheduler.claim(3000, 63000, 10) == []
+    # a stale lease holder cannot complete the job
+    assert not Scheduler.complete(job_id, 1234)
+    assert Scheduler.complete(job_id, 62000)
+    assert dict(Scheduler.list(APP_ID)) == {}
+
+
+def test_fire_reschedules_cron():
+    fired = []
+
+    class App(object):
+        async def handle_timer(self, evt):
+            fired.append(evt)
+
+    async def get(app_id):
+        return App()
+
+    req = models.smartthings.ScheduleRequest(
+        name='nightly', cron=models.smartthings.CronSchedule(expression='0 2 * * *', timezone='UTC')
+    )
+    due = Scheduler.add(APP_ID, req)
+    job_id = Scheduler.job_id(APP_ID, 'nightly')
+    [(_, scheduled)] = Scheduler.claim(due, due + 60000, 10)
+
+    original, scheduler.scheduler.api.AppContext.get = scheduler.scheduler.api.AppContext.get, get
+    try:
+        asyncio.run(Scheduler.fire(job_id, scheduled, due + 60000))
+    finally:
+        scheduler.scheduler.api.AppContext.get = original
+
+    assert fired[0].name == 'nightly'
+    assert fired[0].type == models.smartthings.TimerType.CRON
+    assert Scheduler().zscore(Scheduler.key(), job_id) > due
+    assert Scheduler.clear(APP_ID) == 1
+
+
+def test_scan_claims_only_due_jobs(monkeypatch):
+    claims = []
+    claim = Scheduler.claim
+    monkeypatch.setattr(Scheduler, 'claim', lambda *args: claims.append(args) or claim(*args))
+    assert Scheduler.scan(1.0, 60000, 10)[1:] == ([], 1.0)
+
+    later = models.smartthings.ScheduleRequest(
+        name='later', once=models.smartthings.OnceSchedule(time=scheduler.scheduler.now_ms() + 500)
+    )
+    Scheduler.add(APP_ID, later)
+    _, claimed, delay = Scheduler.scan(1.0, 60000, 10)
+    assert claimed == [] and 0.0 < delay <= 0.5 and claims == []
+
+    due = models.smartthings.ScheduleRequest(
+        name='due', once=models.smartthings.OnceSchedule(time=scheduler.scheduler.now_ms() - 1000)
+    )
+    Scheduler.add(APP_ID, due)
+    _, claimed, delay = Scheduler.scan(1.0, 60000, 10)
+    assert [job_id for job_id, _ in claimed] == [Scheduler.job_id(APP_ID, 'due')]
+    assert len(claims) == 1 and delay <= 0.5
+    Scheduler.clear(APP_ID)
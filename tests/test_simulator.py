@@ -0,0 +1,123 @@
+import asyncio
+import statistics
+import aiohttp
+import pytest
+
+from smartapp import api, simulator
+from smartapp.api import models
+from tests import test_config
+
+
+def run(sim, coro):
+    async def main():
+        port = await sim.start()
+        saved = test_config.smartthings
+        test_config.smartthings = dict(saved, api={
+            'scheme': 'http', 'host': '127.0.0.1:{}'.format(port), 'base': '', 'token': 'token',
+        }, oauth={
+            'scheme': 'http', 'host': '127.0.0.1:{}'.format(port), 'base': '/oauth',
+            'client_id': 'client', 'client_secret': 'secret',
+        })
+        try:
+            return await coro(port)
+        finally:
+            test_config.smartthings = saved
+            await sim.stop()
+    return asyncio.run(main())
+
+
+def test_simulator_devices():
+    sim = simulator.Simulator()
+    lamp = sim.add_device('Lamp', ['switch', 'switchLevel'])
+
+    async def scenario(port):
+        devices = api.Device(token='token')
+        listed = [device async for device in devices.list()]
+        await devices.command(lamp, {'capability': 'switchLevel', 'command': 'setLevel',
+                                     'arguments': [40]})
+        await devices.command(lamp, {'capability': 'switch', 'command': 'on'})
+        status = await devices.status(lamp)
+        with pytest.raises(api.AppHTTPError) as missing:
+            await devices.status('unknown')
+        with pytest.raises(api.AppHTTPError) as invalid:
+            await devices.command(lamp, {'capability': 'lock', 'command': 'lock'})
+        return listed, status, missing.value, invalid.value
+
+    listed, status, missing, invalid = run(sim, scenario)
+    assert [device.label for device in listed] == ['Lamp']
+    assert status.components['main'].switch['switch']['value'] == 'on'
+    assert status.components['main'].switchLevel['level']['value'] == 40
+    assert missing.status_code == 404 and invalid.status_code == 422
+    assert len(sim.commands[lamp]) == 2
+
+
+def test_simulator_subscriptions():
+    sim = simulator.Simulator()
+    app_id = sim.add_installed_app()
+
+    async def scenario(port):
+        installed = api.InstalledApp(token='token', app_id=app_id)
+        created = await installed.subscribe({
+            'sourceType': 'DEVICE', 'device': {
+                'deviceId': 'device-1', 'componentId': 'main', 'capability': 'switch',
+                'attribute': 'switch', 'value': '*', 'stateChangeOnly': True,
+                'subscriptionName': 'switches',
+            },
+        })
+        listed = [item.id async for item in installed.subscriptions()]
+        await installed.unsubscribe(created.id)
+        return created, listed
+
+    created, listed = run(sim, scenario)
+    assert listed == [created.id]
+    assert not sim.subscriptions[app_id]
+
+
+def test_simulator_error_bursts_and_rate_limits():
+    sim = simulator.Simulator()
+    lamp = sim.add_device('Lamp')
+    sim.faults.error(503, count=2, resource='devices').rate_limit(4, 60.0)
+
+    async def scenario(port):
+        devices = api.Device(token='token')
+        statuses = []
+        for _ in range(4):
+            try:
+                await devices.status(lamp)
+                statuses.append(200)
+            except api.AppHTTPError as e:
+                statuses.append(e.status_code)
+        async with aiohttp.ClientSession(headers={'Authorization': 'Bearer token'}) as session:
+            async with session.get('http://127.0.0.1:{}/devices/{}'.format(port, lamp)) as resp:
+                return statuses, resp.status, resp.headers.get('Retry-After')
+
+    statuses, throttled, retry_after = run(sim, scenario)
+    assert statuses == [503, 503, 200, 200]
+    assert throttled == 429 and int(retry_after) > 0
+
+
+def test_simulator_token_expiry():
+    sim = simulator.Simulator()
+    lamp = sim.add_device('Lamp')
+
+    async def scenario(port):
+        await api.Device(token='token').status(lamp)
+        sim.expire()
+        with pytest.raises(api.AuthInvalid):
+            await api.Device(token='token').status(lamp)
+        auth = await api.smartthings.OAuth().refresh_token('refresh')
+        return auth, await api.Device(token=auth.access_token).status(lamp)
+
+    auth, status = run(sim, scenario)
+    assert auth.access_token != 'token' and status.components['main']
+
+
+def test_simulator_latency_distributions():
+    for distribution in ('uniform', 'normal', 'lognormal'):
+        latency = simulator.Latency(0.05, 0.02, distribution)
+        samples = [latency.sample() for _ in range(5000)]
+        assert min(samples) >= 0.0
+        assert statistics.mean(samples) == pytest.approx(0.05, rel=0.1)
+    assert simulator.Latency(0.05, 0.02, 'constant').sample() == 0.05
+    with pytest.raises(ValueError):
+        simulator.Latency(0.05, 0.02, 'pareto')
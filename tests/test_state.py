@@ -0,0 +1,364 @@
+import os
+import copy
+import uuid
+import types
+import asyncio
+import aiohttp
+import pytest
+
+from smartapp import api, controllers, simulator, state
+from smartapp.api import models
+from tests import test_events
+from tests.conftest import client
+from tests.test_simulator import run
+
+
+@pytest.fixture(autouse=True)
+def mirror():
+    state.DeviceState.clear()
+    state.Inventory.clear()
+    state.Health.clear()
+    yield state.DeviceState
+    state.Snapshot.forget()
+    state.DeviceState.clear()
+    state.Inventory.clear()
+    state.Health.clear()
+
+
+def test_device_state_seeded_once(mirror):
+    sim = simulator.Simulator()
+    lamp = sim.add_device('Lamp', status={'switch': {'switch': 'off'}, 'switchLevel': {'level': 40}})
+
+    async def scenario(port):
+        async with aiohttp.ClientSession(headers={'Authorization': 'Bearer token'}) as session:
+            read = lambda *key, **kwargs: mirror.state('location-1', session, lamp, 'main', *key,
+                                                       **kwargs)
+            switch, level = await asyncio.gather(read('switch', 'switch'),
+                                                 read('switchLevel', 'level'))
+            missing = await read('lock', 'lock')
+            lifecycle = copy.deepcopy(test_events.LIFECYCLE)
+            for item in lifecycle['eventData']['events'][:2]:
+                item['deviceEvent'].update(deviceId=lamp, componentId='main')
+            evt = controllers.SmartApp.parse(lifecycle).eventData
+            assert mirror.apply('location-1', evt.events) == 2
+            assert mirror.apply('location-2', evt.events) == 0
+            updated = await read('switchLevel', 'level')
+            calls = sim.calls['devices']
+            refreshed = await read('switch', 'switch', max_age=0)
+            return switch, level, missing, updated, calls, refreshed
+
+    switch, level, missing, updated, calls, refreshed = run(sim, scenario)
+    assert (switch.value, switch.source) == ('off', state.mirror.SOURCE_STATUS)
+    assert level.value == 40
+    assert missing.value is None and missing.source == state.mirror.SOURCE_STATUS
+    assert updated.value == '20' and updated.source == state.mirror.SOURCE_EVENT
+    assert calls == 1 and sim.calls['devices'] == 2
+    assert refreshed.value == 'off' and refreshed.age < switch.age
+    # a refresh replaces the values set before it was requested
+    assert mirror.location('location-1').get(lamp, ('main', 'switchLevel', 'level')).value == 40
+
+
+def test_device_state_fed_by_event_lifecycle(mirror):
+    location = mirror.location('location-1')
+    resp = client.post('/', json=copy.deepcopy(test_events.LIFECYCLE))
+    assert resp.status_code == 200
+    assert location.get('device-1', ('main', 'switchLevel', 'level')).value == '20'
+    # a status requested before the event does not override it
+    status = models.smartthings.DeviceStatus.parse_obj(
+        {'components': {'main': {'switchLevel': {'level': {'value': 5}}}}})
+    location.seed('device-1', status, since=0.0)
+    assert location.get('device-1', ('main', 'switchLevel', 'level')).value == '20'
+    assert 'device-1' in location.seeded
+
+
+def test_inventory_index():
+    sim = simulator.Simulator(page_size=2)
+    lamp = sim.add_device('Lamp', ['switch', 'switchLevel'], room_id='living')
+    plug = sim.add_device('Plug', ['switch'], room_id='living')
+    bulb = sim.add_device('Bulb', ['switch', 'switchLevel', 'colorControl'], room_id='bedroom')
+    sensor = sim.add_device('Sensor', ['motionSensor', 'battery'], room_id='bedroom')
+    sim.add_device('Elsewhere', ['switch'], location_id='location-2')
+
+    async def scenario(port):
+        async with aiohttp.ClientSession(headers={'Authorization': 'Bearer token'}) as session:
+            first, second = await asyncio.gather(
+                state.Inventory.get(simulator.LOCATION, session),
+                state.Inventory.get(simulator.LOCATION, session))
+            return first, second, sim.calls['devices']
+
+    index, again, calls = run(sim, scenario)
+    assert index is again and calls == 2 and len(index) == 4
+    switches = index.capability('switch')
+    assert set(switches) == {lamp, plug, bulb}
+    assert set(index.select('switchLevel', room='living')) == {lamp}
+    assert set(switches - index.capability('colorControl')) == {lamp, plug}
+    assert set(index.room('living') | index.room('bedroom')) == {lamp, plug, bulb, sensor}
+    assert set(~switches) == {sensor} and len(index.capability('switch', 'battery')) == 0
+    assert bulb in index.capability('colorControl') and plug not in index.room('bedroom')
+
+    # incremental: remove, move and reuse the free slot
+    slot = index.slots[plug]
+    index.remove(plug)
+    moved = sim.devices[lamp].copy(update={'roomId': 'bedroom'})
+    index.add(moved)
+    new = sim.add_device('New', ['switch'], room_id='living')
+    index.add(sim.devices[new])
+    assert set(index.room('bedroom')) == {lamp, bulb, sensor}
+    assert set(index.room('living')) == {new} and index.slots[new] == slot
+    assert set(index.capability('switch')) == {lamp, bulb, new} and len(index.ids) == 4
+    assert index.select('switchLevel', room='bedroom').devices() == [moved, sim.devices[bulb]]
+
+
+def lifecycle_events(*events):
+    return controllers.SmartApp.parse({
+        'lifecycle': 'EVENT', 'eventData': {'events': list(events)}
+    }).eventData.events
+
+
+def device_lifecycle(lifecycle, device_id, **kwargs):
+    return {'eventType': 'DEVICE_LIFECYCLE_EVENT', 'deviceLifecycle': dict(
+        kwargs, lifecycle=lifecycle, deviceId=device_id, locationId=simulator.LOCATION)}
+
+
+def scene_lifecycle(lifecycle, scene_id):
+    return {'eventType': 'SCENE_LIFECYCLE_EVENT', 'sceneLifecycle': {
+        'lifecycle': lifecycle, 'sceneId': scene_id, 'locationId': simulator.LOCATION}}
+
+
+def test_inventory_lifecycles():
+    sim = simulator.Simulator()
+    lamp = sim.add_device('Lamp', ['switch'], room_id='living')
+    plug = sim.add_device('Plug', ['switch'], room_id='living')
+    morning = sim.add_scene('Morning')
+    key = 'inventory:{}'.format(simulator.LOCATION)
+
+    async def settle():
+        while api.KeyedExecutor.pending(key):
+            await asyncio.sleep(0.01)
+
+    async def scenario(port):
+        async with aiohttp.ClientSession(headers={'Authorization': 'Bearer token'}) as session:
+            app = types.SimpleNamespace(session=session)
+            index = await state.Inventory.get(simulator.LOCATION, session)
+            listed = sim.calls['devices'], sim.calls['scenes']
+            heater = sim.add_device('Heater', ['switch', 'thermostatHeatingSetpoint'])
+            evening = sim.add_scene('Evening')
+            del sim.scenes[morning]
+            applied = state.Inventory.apply(simulator.LOCATION, lifecycle_events(
+                device_lifecycle('ROOM_MOVE', lamp, roomMove={
+                    'roomIdFrom': 'living', 'roomIdTo': 'bedroom'}),
+                device_lifecycle('UPDATE', plug, update={
+                    'labelDiff': {'old': 'Plug', 'new': 'Kettle'}}),
+                device_lifecycle('CREATE', heater, create={}),
+                scene_lifecycle('DELETE', morning),
+                scene_lifecycle('CREATE', evening),
+                test_events.device_event(10),
+            ), app)
+            await settle()
+            updated = (set(index.room('bedroom')), index.devices[plug].label,
+                       set(index.capability('thermostatHeatingSetpoint')), set(index.scenes))
+            calls = sim.calls['devices'], sim.calls['scenes']
+            # a room move which does not follow from the index: events were missed
+            stray = sim.add_device('Stray', ['switch'])
+            state.Inventory.apply(simulator.LOCATION, lifecycle_events(
+                device_lifecycle('DELETE', plug),
+                device_lifecycle('ROOM_MOVE', lamp, roomMove={
+                    'roomIdFrom': 'kitchen', 'roomIdTo': 'living'}),
+                device_lifecycle('DELETE', heater),
+            ), app)
+            assert index.stale and heater in index
+            await settle()
+            return (listed, applied, updated, calls, index, state.Inventory.index(simulator.LOCATION),
+                    heater, evening, stray)
+
+    listed, applied, updated, calls, stale, index, heater, evening, stray = run(sim, scenario)
+    assert listed == (1, 1) and applied == 5
+    assert updated == ({lamp}, 'Kettle', {heater}, {evening})
+    # one read of the created device and one listing of the scenes
+    assert calls == (2, 2)
+    assert index is not stale and not index.stale
+    assert set(index.all()) == {lamp, plug, heater, stray}
+
+
+def device_health(device_id, status, hub_id='hub-1', reason=None):
+    return {'eventType': 'DEVICE_HEALTH_EVENT', 'deviceHealthEvent': {
+        'deviceId': device_id, 'hubId': hub_id, 'status': status, 'reason': reason}}
+
+
+def hub_health(status, hub_id='hub-1'):
+    return {'eventType': 'HUB_HEALTH_EVENT', 'hubHealthEvent': {'hubId': hub_id, 'status': status}}
+
+
+def test_health_table():
+    Health = state.Health
+    lifecycle = copy.deepcopy(test_events.LIFECYCLE)
+    lifecycle['eventData']['events'] = [
+        device_health('lamp', 'ONLINE'), device_health('plug', 'ONLINE'),
+        device_health('lock', 'OFFLINE', reason='ZWAVE_OFFLINE'), hub_health('ZIGBEE_OFFLINE'),
+    ]
+    resp = client.post('/', json=lifecycle)
+    assert resp.status_code == 200
+    location = test_events.LIFECYCLE['eventData']['installedApp']['locationId']
+    assert Health.offline(location, 'lock') == 'ZWAVE_OFFLINE'
+    assert Health.offline(location, 'unknown') is None
+    # the integration type of the devices comes from the inventory
+    assert Health.offline(location, 'lamp') is None
+    index = state.Inventory._locations[location] = state.Index(location)
+    index.add(models.smartthings.Device.construct(
+        deviceId='lamp', type=models.smartthings.DeviceIntegrationType.ZIGBEE))
+    assert Health.offline(location, 'lamp') == 'ZIGBEE_OFFLINE'
+
+    async def scenario():
+        with pytest.raises(state.DeviceOffline) as offline:
+            await Health.ready(location, 'lock')
+        await Health.ready(location, 'plug')
+        events = lifecycle_events(hub_health('OFFLINE'))
+        assert Health.apply(location, events) == 1
+        assert Health.offline(location, 'plug') == 'HUB_OFFLINE'
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, Health.apply, location, lifecycle_events(hub_health('ONLINE')))
+        start = loop.time()
+        await Health.ready(location, 'plug', defer=1.0)
+        waited = loop.time() - start
+        with pytest.raises(state.DeviceOffline):
+            await Health.ready(location, 'lock', defer=0.05)
+        return offline.value, waited
+
+    offline, waited = asyncio.run(scenario())
+    assert offline.device_id == 'lock' and offline.reason == 'ZWAVE_OFFLINE'
+    assert 0.04 < waited < 0.5
+    assert Health.summary(location) == {
+        'devices': {'lamp': 'ONLINE', 'plug': 'ONLINE', 'lock': 'ZWAVE_OFFLINE'},
+        'hubs': {'hub-1': 'ONLINE'},
+    }
+
+
+def power(device_id, value, event_id=None):
+    return {'eventType': 'DEVICE_EVENT', 'deviceEvent': {
+        'eventId': event_id, 'deviceId': device_id, 'componentId': 'main',
+        'capability': 'powerMeter', 'attribute': 'power', 'value': value}}
+
+
+def test_attribute_history():
+    numpy = pytest.importorskip('numpy')
+    History = state.History
+    History.clear()
+    try:
+        assert History.apply(lifecycle_events(power('meter-1', 10))) == 0
+        series = History.track('powerMeter', 'power', capacity=4)
+        for at, (first, second) in enumerate(((10, 100), (20, 'off'), (30, 300), (40, 400),
+                                              (50, 500), (60, 600))):
+            History.apply(lifecycle_events(power('meter-1', first), power('meter-2', second),
+                                           test_events.device_event(5)), at=1000.0 + at * 10)
+        # duplicated deliveries of the same event are written once
+        events = lifecycle_events(power('meter-3', 7, 'e1'))
+        assert History.apply(events, at=1000.0) == 1 and History.apply(events, at=1000.0) == 0
+
+        window = series.window(devices=['meter-1', 'meter-2', 'unknown'])
+        assert window.ids == ['meter-1', 'meter-2']
+        # the ring keeps the last 4 samples, the 'off' value is skipped
+        assert window.count() == {'meter-1': 4, 'meter-2': 4}
+        assert window.mean() == {'meter-1': 45.0, 'meter-2': 450.0}
+        assert window.min() == {'meter-1': 30.0, 'meter-2': 300.0}
+        assert window.max()['meter-2'] == 600.0 and window.latest()['meter-1'] == 60.0
+        assert window.percentile(50) == {'meter-1': 45.0, 'meter-2': 450.0}
+        assert window.rate() == {'meter-1': 1.0, 'meter-2': 10.0}
+
+        recent = series.window(seconds=15, now=1050.0)
+        assert recent.mean() == {'meter-1': 55.0, 'meter-2': 550.0}
+        edges, bins = series.window().resample(20, 'max')
+        assert list(edges) == [1000.0, 1020.0, 1040.0]
+        assert numpy.isnan(bins['meter-1'][0]) and list(bins['meter-1'][1:]) == [40.0, 60.0]
+        assert bins['meter-3'][0] == 7.0 and numpy.isnan(bins['meter-3'][1:]).all()
+        assert series.nbytes() == 4 * 4 * 16 + 4 * 8
+    finally:
+        History.clear()
+
+
+def test_snapshot_warm_restart(with_redis, tmp_path, monkeypatch):
+    from smartapp.api import AppContext
+    from smartapp.api.smartapp import context
+    Snapshot = state.Snapshot
+
+    sim = simulator.Simulator()
+    lamp = sim.add_device('Lamp', ['switch', 'switchLevel'], room_id='living',
+                          status={'switch': {'switch': 'on'}})
+    sim.add_device('Plug', ['switch'], room_id='living')
+    sim.add_scene('Morning')
+
+    async def scenario(port):
+        async with aiohttp.ClientSession(headers={'Authorization': 'Bearer token'}) as session:
+            await state.Inventory.get(simulator.LOCATION, session)
+            return await state.DeviceState.state(simulator.LOCATION, session, lamp, 'main',
+                                                 'switch', 'switch')
+
+    switch = run(sim, scenario)
+    replayed = []
+
+    async def lifecycle_update(self, data):
+        replayed.append(self.app_id)
+
+    monkeypatch.setattr(type(AppContext.template()), 'lifecycle_update', lifecycle_update)
+    AppContext._pool = None
+    AppContext.key = context.KEY_PREFIX + AppContext.template().name
+    kept, renewed, gone, fresh = (str(uuid.uuid4()) for _ in range(4))
+    path = str(tmp_path / 'snapshot.bin')
+    Snapshot.configure(path=path)
+    try:
+        for app_id in (kept, renewed, gone):
+            asyncio.run(AppContext.get(app_id))
+        for app_id in (kept, renewed):
+            AppContext.store(app_id, AppContext._ctx[app_id])
+        assert asyncio.run(Snapshot.write()) > 0
+        # the worker restarts: another replica renewed a token and installed an app
+        AppContext.store(renewed, AppContext._ctx[renewed].copy(update={'token': 'renewed'}))
+        AppContext.store(fresh, api.AppCtx(app_id=fresh, secret='secret'))
+        for app_id in (kept, renewed, gone):
+            AppContext._instances.pop(app_id)
+            AppContext._ctx.pop(app_id)
+        state.Inventory.clear()
+        state.DeviceState.clear()
+
+        assert Snapshot.restore()
+        assert {kept, renewed, gone} <= AppContext._restored
+        assert not {kept, renewed, gone} & set(AppContext._ctx) and not state.Inventory._locations
+        # the contexts and their credentials stay in Redis, the file is private
+        reader = state.snapshot.Reader(path)
+        assert set(reader.section(state.snapshot.APPS)) == AppContext._restored
+        reader.close()
+        assert os.stat(path).st_mode & 0o777 == 0o600
+        index = state.Inventory.index(simulator.LOCATION)
+        assert len(index) == 2 and len(index.scenes) == 1
+        assert set(index.room('living')) == set(index.ids)
+        location = state.DeviceState.location(simulator.LOCATION)
+        restored = location.get(lamp, ('main', 'switch', 'switch'))
+        assert restored.value == 'on' and restored.source == state.mirror.SOURCE_SNAPSHOT
+        assert restored.updated == switch.updated
+        assert state.Inventory.index('location-2') is None
+
+        asyncio.run(AppContext.init())
+        assert replayed == [fresh]
+        assert kept in AppContext._instances and renewed in AppContext._instances
+        assert AppContext._ctx[renewed].token == 'renewed'
+        assert AppContext._ctx[kept].secret and gone not in AppContext._instances
+        # the last snapshot is written by flush(), once the tasks are drained
+        async def shutdown():
+            Snapshot.start()
+            await Snapshot.stop()
+            os.remove(path)
+            await Snapshot.flush()
+        asyncio.run(shutdown())
+        assert os.path.exists(path) and Snapshot._reader is None
+        # too old to be restored
+        Snapshot.configure(path=path, max_age=0)
+        assert not Snapshot.restore()
+        with pytest.raises(ValueError):
+            Snapshot.configure()
+    finally:
+        for app_id in (kept, renewed, fresh):
+            if app_id in AppContext._instances:
+                asyncio.run(AppContext.delete(AppContext._instances[app_id]))
+        Snapshot.forget()
+        Snapshot.configure(enabled=False)
+        AppContext._restored = set()
+        AppContext._pool = None
@@ -0,0 +1,187 @@
+import asyncio
+from smartapp.api.smartapp import lanes, pool
+from smartapp.api.smartapp.task import AppTask
+
+Executor = lanes.KeyedExecutor
+
+
+async def record(log, item, delay=0.0):
+    await asyncio.sleep(delay)
+    log.append(item)
+    return item
+
+
+def test_lane_order_per_app():
+    async def run():
+        log = []
+        futs = [Executor.submit('app1', record, log, i, delay=0.01 * (3 - i))
+                for i in range(3)]
+        await asyncio.gather(*futs)
+        return log
+    assert asyncio.run(run()) == [0, 1, 2]
+
+
+def test_lanes_parallel_across_apps():
+    async def run():
+        log = []
+        slow = Executor.submit('app1', record, log, 'slow', delay=0.05)
+        fast = Executor.submit('app2', record, log, 'fast')
+        await asyncio.gather(slow, fast)
+        return log
+    assert asyncio.run(run()) == ['fast', 'slow']
+
+
+def test_device_lanes_wait_for_app_lane():
+    async def run():
+        log = []
+        update = Executor.submit('app1', record, log, 'update', delay=0.05)
+        dev1 = Executor.submit('app1', record, log, 'dev1', device_id='d1')
+        dev2 = Executor.submit('app1', record, log, 'dev2', device_id='d2', delay=0.02)
+        after = Executor.submit('app1', record, log, 'after')
+        await asyncio.gather(update, dev1, dev2, after)
+        return log
+    assert asyncio.run(run()) == ['update', 'dev1', 'dev2', 'after']
+    assert Executor.pending() == 0
+    assert not Executor._groups
+
+
+def test_priority_reserved_capacity():
+    from smartapp.api.smartapp.priority import PriorityLimiter, Priority
+
+    async def run():
+        limiter = PriorityLimiter(2, reserved=1)
+        order = []
+
+        async def work(name, prio):
+            async with limiter.slot(prio):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        low = [asyncio.create_task(work('low%d' % i, Priority.LOW)) for i in range(2)]
+        await asyncio.sleep(0)
+        assert limiter.stats()['LOW'] == {'active': 1, 'waiting': 1}
+        high = asyncio.create_task(work('high', Priority.HIGH))
+        await asyncio.gather(high, *low)
+        return order
+    assert asyncio.run(run()) == ['low0', 'high', 'low1']
+
+
+@AppTask.cpu_bound(timeout=30)
+def square_sum(values):
+    return sum(v * v for v in values)
+
+
+def test_cpu_bound_runs_in_pool():
+    async def run():
+        return await asyncio.gather(*[square_sum(range(n)) for n in (10, 100)])
+    try:
+        assert asyncio.run(run()) == [285, 328350]
+        stats = pool.ProcessPool.get().stats()
+        assert stats['completed'] == 2 and stats['in_flight'] == 0
+    finally:
+        pool.ProcessPool.shutdown()
+
+
+@AppTask.cpu_bound(timeout=30)
+def slow_sum(values, delay):
+    import time
+    time.sleep(delay)
+    return sum(values)
+
+
+def test_cpu_bound_cancelled_with_its_task():
+    from smartapp.api.smartapp.supervisor import TaskSupervisor
+
+    async def run():
+        # both workers started
+        assert await asyncio.gather(slow_sum([1], 0.5), slow_sum([2], 0.5)) == [1, 2]
+        first = TaskSupervisor.spawn(slow_sum([1, 2], 30), timeout=0.5)
+        second = TaskSupervisor.spawn(slow_sum([1, 2], 30), timeout=1.5)
+        await asyncio.wait([first])
+        # a single abandoned call keeps running, the pool is not recycled
+        kept = pool.ProcessPool.get().stats()
+        # queued behind the abandoned calls, killed by the recycle and run again
+        queued = await slow_sum([3, 4], 0)
+        await asyncio.wait([second])
+        return first, second, kept, queued
+    pool.ProcessPool._instance = pool.ProcessPool(2)
+    try:
+        first, second, kept, queued = asyncio.run(run())
+        assert isinstance(first.exception(), asyncio.TimeoutError)
+        assert isinstance(second.exception(), asyncio.TimeoutError)
+        assert kept['recycled'] == 0 and kept['abandoned'] == 1
+        assert queued == 7
+        stats = pool.ProcessPool.get().stats()
+        assert stats['cancelled'] == 2 and stats['recycled'] == 1 and stats['retried'] == 1
+        assert stats['abandoned'] == 0
+    finally:
+        pool.ProcessPool.shutdown()
+
+
+def test_supervisor_app_limit_and_nesting():
+    from smartapp.api.smartapp.supervisor import TaskSupervisor
+
+    async def child(log):
+        log.append('child')
+
+    async def parent(log):
+        log.append('parent')
+        await TaskSupervisor.spawn(child(log), app_id='app1', inherit=True)
+
+    async def run():
+        log = []
+        await asyncio.gather(*[TaskSupervisor.spawn(parent(log), app_id='app1')
+                               for _ in range(20)])
+        return log
+    log = asyncio.run(run())
+    assert log.count('child') == 20
+    assert not TaskSupervisor._apps and not TaskSupervisor._tasks
+
+
+def test_supervisor_detached_children_are_limited():
+    from types import SimpleNamespace
+    from smartapp.api.smartapp.supervisor import TaskSupervisor
+    from tests import test_config
+
+    app = SimpleNamespace(app_id='app1')
+    running, peak = [], []
+
+    async def child(app):
+        running.append(app)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    async def parent():
+        # fire-and-forget children outlive their parent: they do not
+        # run within its slot but count against the app limit
+        for _ in range(10):
+            AppTask(child, app)
+
+    async def run():
+        await TaskSupervisor.spawn(parent(), app_id='app1')
+        while TaskSupervisor._tasks:
+            await asyncio.sleep(0.01)
+
+    test_config.tasks = {'per_app': 2}
+    try:
+        asyncio.run(run())
+    finally:
+        del test_config.tasks
+    assert len(peak) == 10 and max(peak) == 2
+
+
+def test_supervisor_timeout_and_drain():
+    from smartapp.api.smartapp.supervisor import TaskSupervisor
+
+    async def run():
+        slow = TaskSupervisor.spawn(asyncio.sleep(10), name='slow', timeout=0.01)
+        stuck = TaskSupervisor.spawn(asyncio.sleep(10), name='stuck', timeout=None)
+        assert {t['name'] for t in TaskSupervisor.running()} == {'slow', 'stuck'}
+        await TaskSupervisor.drain(grace=0.05)
+        return slow, stuck
+    slow, stuck = asyncio.run(run())
+    assert isinstance(slow.exception(), asyncio.TimeoutError)
+    assert stuck.cancelled()
+    assert TaskSupervisor.timed_out()[-1]['name'] == 'slow'
+    assert not TaskSupervisor.running()
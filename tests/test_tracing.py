@@ -0,0 +1,134 @@
+import json
+import asyncio
+import threading
+import http.server
+
+import pytest
+
+from smartapp import tracing
+from smartapp.tracing import exporters
+from smartapp.api.smartapp import supervisor
+
+
+class Collect(object):
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(spans)
+
+
+@pytest.fixture
+def collected():
+    collect = Collect()
+    tracing.Tracer.enabled  = True
+    tracing.Tracer.rate     = 1.0
+    tracing.Tracer.exporter = collect
+    yield collect
+    tracing.Tracer.enabled  = False
+    tracing.Tracer.exporter = None
+
+
+def test_disabled_records_nothing():
+    assert tracing.trace('lifecycle') is tracing.tracing.NO_SPAN
+    assert tracing.span('parse') is tracing.tracing.NO_SPAN
+    with tracing.trace('lifecycle') as root:
+        root.set('lifecycle', 'EVENT')
+        assert tracing.span('parse') is tracing.tracing.NO_SPAN
+
+
+def test_sampling(collected):
+    tracing.Tracer.rate = 0.0
+    assert tracing.trace('lifecycle') is tracing.tracing.NO_SPAN
+    tracing.Tracer.rate = 1.0
+    assert tracing.trace('lifecycle') is not tracing.tracing.NO_SPAN
+
+
+def test_nested_spans(collected):
+    with tracing.trace('lifecycle', lifecycle='EVENT') as root:
+        with tracing.span('parse'):
+            pass
+        with pytest.raises(ValueError):
+            with tracing.span('handler'):
+                raise ValueError('bad')
+    assert tracing.current() is tracing.tracing.NO_SPAN
+    spans = {span.name: span for span in collected.traces[0]}
+    assert set(spans) == {'lifecycle', 'parse', 'handler'}
+    assert spans['parse'].parent_id == root.span_id
+    assert spans['handler'].error == 'ValueError: bad'
+    assert spans['lifecycle'].attributes == {'lifecycle': 'EVENT'}
+    assert len({span.trace.trace_id for span in spans.values()}) == 1
+
+
+def test_task_spans_join_the_trace(collected):
+    async def work():
+        with tracing.span('work'):
+            await asyncio.sleep(0.01)
+
+    async def run():
+        with tracing.trace('lifecycle'):
+            task = supervisor.TaskSupervisor.spawn(work(), name='work')
+        await task
+    asyncio.run(run())
+    spans = [span for trace in collected.traces for span in trace]
+    assert {span.name for span in spans} == {'lifecycle', 'task', 'work'}
+    task = next(span for span in spans if span.name == 'task')
+    assert task.attributes == {'task': 'work'}
+
+
+def test_file_exporter(collected, tmp_path):
+    path = tmp_path / 'traces.jsonl'
+    exporter = tracing.FileExporter(str(path))
+    tracing.Tracer.exporter = exporter
+    with tracing.trace('lifecycle'):
+        with tracing.span('parse'):
+            pass
+    exporter.stop()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line['name'] for line in lines] == ['parse', 'lifecycle']
+    assert lines[0]['parent_id'] == lines[1]['span_id']
+
+
+def test_otlp_exporter(collected):
+    received = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.handle_request, daemon=True).start()
+    exporter = tracing.OTLPExporter('http://127.0.0.1:{}/v1/traces'.format(server.server_port))
+    tracing.Tracer.exporter = exporter
+    with tracing.trace('lifecycle', status=200):
+        pass
+    exporter.stop()
+    server.server_close()
+    span = received[0]['resourceSpans'][0]['scopeSpans'][0]['spans'][0]
+    assert span['name'] == 'lifecycle'
+    assert len(span['traceId']) == 32 and len(span['spanId']) == 16
+    assert span['attributes'] == [{'key': 'status', 'value': {'intValue': '200'}}]
+    assert exporters.attribute('x', 'y') == {'key': 'x', 'value': {'stringValue': 'y'}}
+
+
+def test_failed_request_records_error(collected):
+    import aiohttp
+    from smartapp.api import http as api_http
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            client = api_http.RESTClient('127.0.0.1:1', '/', 'devices', session=session)
+            with tracing.trace('lifecycle'):
+                assert await client.do('GET', '') is None
+    asyncio.run(run())
+    spans = {span.name: span for span in collected.traces[0]}
+    assert spans['http'].error.startswith('ClientConnectorError')
+    assert spans['http'].attributes == {'verb': 'GET', 'resource': 'devices', 'status': 'error'}
+    assert ('devices', 'GET', 'error') in api_http.LATENCY.children
+    assert all(isinstance(status, str) for _, _, status in api_http.LATENCY.children)
@@ -0,0 +1,86 @@
+import pytest
+import pydantic
+
+from smartapp.api import models
+from smartapp.api.smartthings import validation
+from tests import test_config
+
+DEVICE = {
+    'deviceId': '5f7a2c6e-0000-4000-8000-000000000001',
+    'manufacturerName': 'SmartThingsCommunity',
+    'presentationId': 'SmartThings-smartthings-Dimmer',
+    'components': [{
+        'id': 'main',
+        'capabilities': [{'id': 'switch', 'version': 1}],
+        'categories': [{'name': 'Light', 'categoryType': 'manufacturer'}],
+    }],
+    'type': 'ZIGBEE',
+    'restrictionTier': 0,
+    'allowed': [],
+}
+
+
+def test_trusted_construct_is_recursive():
+    device = validation.construct(models.smartthings.Device, DEVICE)
+    assert device == models.smartthings.Device.parse_obj(DEVICE)
+    assert isinstance(device.components[0].capabilities[0], models.smartthings.CapabilityReference)
+    assert device.type == models.smartthings.DeviceIntegrationType.ZIGBEE
+    assert device.childDevices is None
+
+
+def test_sampled_validation():
+    invalid = dict(DEVICE, type='NOT_A_TYPE')
+    sampled = validation.Validator(validation.Policy.SAMPLED, rate=2)
+    # first response sampled: validation errors are logged, not raised
+    assert sampled.parse(models.smartthings.Device, invalid).type == 'NOT_A_TYPE'
+    assert sampled.parse(models.smartthings.Device, invalid).type == 'NOT_A_TYPE'
+    with pytest.raises(pydantic.ValidationError):
+        validation.Validator(validation.Policy.FULL).parse(models.smartthings.Device, invalid)
+
+
+def test_policy_per_resource():
+    from smartapp.api import Device, Scene
+    test_config.smartthings['validation'] = {'default': 'trusted', 'scenes': 'full'}
+    validation.reset()
+    try:
+        assert Device().validator.policy == validation.Policy.TRUSTED
+        assert Scene().validator.policy == validation.Policy.FULL
+        assert Scene(policy='sampled').validator.policy == validation.Policy.SAMPLED
+    finally:
+        del test_config.smartthings['validation']
+        validation.reset()
+
+
+def test_listings_are_trusted_by_default():
+    import asyncio
+    from smartapp.api import Device, Rule
+
+    page = {
+        'items': [DEVICE, dict(DEVICE, type='NEW_INTEGRATION', restrictionTier=None, newField=1)],
+        '_links': {'next': None, 'previous': None},
+    }
+    rules = {'items': [{'id': 'r1', 'name': 'rule', 'actions': [], 'newField': 1}],
+             '_links': {}}
+
+    async def listed(client, data, **kwargs):
+        async def do(*args, **kw):
+            return data
+        client.do = do
+        return [item async for item in client.list(**kwargs)]
+
+    validation.reset()
+    devices = asyncio.run(listed(Device(), page))
+    assert [device.type for device in devices] == [
+        models.smartthings.DeviceIntegrationType.ZIGBEE, 'NEW_INTEGRATION'
+    ]
+    assert asyncio.run(listed(Rule(), rules, location_id='l1'))[0].id == 'r1'
+    assert Device().validator.policy == validation.Policy.FULL
+
+    test_config.smartthings['validation'] = {'devices.list': 'full'}
+    validation.reset()
+    try:
+        with pytest.raises(pydantic.ValidationError):
+            asyncio.run(listed(Device(), page))
+    finally:
+        del test_config.smartthings['validation']
+        validation.reset()